@@ -8,6 +8,7 @@ Pure Python implementation with no external dependencies.
 Usage:
     python run-gates.py --config .quality-gates.json --phase implementation
     python run-gates.py --gate pre-deploy --verbose
+    python run-gates.py --phase implementation --parallel --max-workers 4
     python run-gates.py --list
 
 Exit Codes:
@@ -17,16 +18,27 @@ Exit Codes:
 """
 
 import argparse
+import hashlib
+import http.client
 import json
 import os
+import re
+import shlex
+import signal
 import subprocess
 import sys
+import threading
 import time
-from dataclasses import dataclass, field
+import xml.etree.ElementTree as ET
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, as_completed, wait
+from dataclasses import asdict, dataclass, field, fields, replace
 from datetime import datetime
 from enum import Enum
+from functools import lru_cache
 from pathlib import Path
 from typing import Optional
+from urllib.parse import urlsplit
 
 
 # =============================================================================
@@ -36,6 +48,33 @@ from typing import Optional
 VERSION = "1.0.0"
 DEFAULT_TIMEOUT = 300  # 5 minutes
 DEFAULT_CONFIG = ".quality-gates.json"
+DEFAULT_FLEET_ROOT = "~/SEO-Agents"
+DEFAULT_FLEET_JOBS = 4
+DEFAULT_STATE_DIR = ".quality-gates"
+DEFAULT_RETRY_DELAY = 1.0  # seconds before the first retry
+DEFAULT_RETRY_BACKOFF = 2.0  # delay multiplier per retry
+DEFAULT_RETRY_MAX_DELAY = 30.0
+DEFAULT_HISTORY_MAX_RUNS = 500  # runs kept in the timing history file
+DEFAULT_HISTORY_WINDOW = 20  # recent runs used for --history statistics
+DEFAULT_REGRESSION_THRESHOLD = 0.5  # flag checks >50% slower than their p50
+MIN_REGRESSION_DELTA = 0.5  # seconds; ignore regressions smaller than this
+MIN_HISTORY_SAMPLES = 3  # prior runs needed before flagging a regression
+DEFAULT_OUTPUT_HEAD_LINES = 50  # output lines kept from the start of a check
+DEFAULT_OUTPUT_TAIL_LINES = 200  # output lines kept from the end of a check
+MAX_CAPTURED_LINE = 4096  # characters kept per captured output line
+DEFAULT_HEALTH_INTERVAL = 2.0  # seconds between api_health probes
+DEFAULT_HEALTH_REQUEST_TIMEOUT = 10.0  # per-request timeout for api_health
+DEFAULT_CACHE_MAX_ENTRIES = 500
+DEFAULT_CACHE_MAX_AGE_DAYS = 7
+DEFAULT_MAX_WORKERS = 4
+POLL_INTERVAL = 0.1  # seconds between cancellation checks
+DEFAULT_WATCH_INTERVAL = 1.0  # seconds between working tree scans in --watch
+DEFAULT_WATCH_DEBOUNCE = 0.3  # quiet period before a --watch re-run
+WATCH_IGNORE_DIRS = {
+    '.git', DEFAULT_STATE_DIR, 'node_modules', '__pycache__', '.venv', 'venv',
+    '.tox', '.mypy_cache', '.pytest_cache', '.ruff_cache',
+}
+TERMINATE_GRACE = 5  # seconds between SIGTERM and SIGKILL
 
 
 class Severity(Enum):
@@ -72,6 +111,23 @@ class CheckResult:
     severity: Severity = Severity.CRITICAL
     remediation: list = field(default_factory=list)
     skip_reason: str = ""
+    cached: bool = False
+    attempts: list = field(default_factory=list)
+    max_attempts: int = 1
+    metrics: dict = field(default_factory=dict)
+    log_path: str = ""
+    resources: dict = field(default_factory=dict)
+    cancelled: bool = False
+
+    @property
+    def cpu_time(self) -> float:
+        """Child CPU time (user + system) in seconds."""
+        return self.resources.get('cpu_user', 0.0) + self.resources.get('cpu_system', 0.0)
+
+    @property
+    def flaky(self) -> bool:
+        """Whether the check passed only after one or more retries."""
+        return len(self.attempts) > 1 and self.status == CheckStatus.PASS
 
 
 @dataclass
@@ -87,6 +143,676 @@ class GateResult:
     passed: bool
     duration: float
     timestamp: str
+    parallel: bool = False
+    skip_reason: str = ""  # set when the gate did not run to completion
+    cancelled: bool = False
+
+    @property
+    def outcome(self) -> str:
+        """PASSED, FAILED, SKIPPED (failed dependency) or CANCELLED (fail-fast)."""
+        if self.cancelled:
+            return "CANCELLED"
+        if self.skip_reason:
+            return "SKIPPED"
+        return "PASSED" if self.passed else "FAILED"
+
+    @property
+    def check_time(self) -> float:
+        """Sum of individual check durations (serial-equivalent time)."""
+        return sum(c.duration for c in self.checks)
+
+
+class CancelToken:
+    """Shared fail-fast flag, set once with the reason for cancellation."""
+
+    def __init__(self):
+        self._event = threading.Event()
+        self._lock = threading.Lock()
+        self.reason = ""
+
+    def cancel(self, reason: str) -> None:
+        """Request cancellation; the first reason given wins."""
+        with self._lock:
+            if not self._event.is_set():
+                self.reason = reason
+                self._event.set()
+
+    def is_cancelled(self) -> bool:
+        """Whether cancellation has been requested."""
+        return self._event.is_set()
+
+    def wait(self, timeout: float) -> bool:
+        """Sleep up to timeout seconds; returns True early if cancelled."""
+        return self._event.wait(timeout)
+
+
+class CheckCancelled(Exception):
+    """Raised when an in-flight check is terminated by fail-fast."""
+
+    def __init__(self, reason: str, stdout: str = "", stderr: str = ""):
+        super().__init__(reason)
+        self.stdout = stdout
+        self.stderr = stderr
+
+
+def check_result_to_dict(result: CheckResult) -> dict:
+    """Serialize a CheckResult to a JSON-compatible dictionary."""
+    data = asdict(result)
+    data['status'] = result.status.value
+    data['severity'] = result.severity.value
+    return data
+
+
+def check_result_from_dict(data: dict) -> CheckResult:
+    """Rebuild a CheckResult from check_result_to_dict() output."""
+    known = {f.name for f in fields(CheckResult)}
+    data = {k: v for k, v in data.items() if k in known}
+    data['status'] = CheckStatus(data['status'])
+    data['severity'] = Severity(data['severity'])
+    return CheckResult(**data)
+
+
+# =============================================================================
+# Result Cache
+# =============================================================================
+
+class ResultCache:
+    """
+    Content-addressed on-disk cache of passing check results.
+
+    A check is cacheable only when it declares ``inputs`` globs. The key
+    covers the expanded command, working directory, the env values the
+    check depends on, and a hash of every file matched by its inputs, so
+    any change to those re-runs the check.
+    """
+
+    def __init__(self, cache_dir: str, max_entries: int = DEFAULT_CACHE_MAX_ENTRIES,
+                 max_age_days: float = DEFAULT_CACHE_MAX_AGE_DAYS):
+        self.cache_dir = Path(cache_dir)
+        self.max_entries = max_entries
+        self.max_age = max_age_days * 86400
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+
+    @classmethod
+    def from_options(cls, defaults: dict) -> Optional['ResultCache']:
+        """
+        Build a cache from the ``cache`` global option, if enabled.
+
+        Accepts ``"cache": true`` or a mapping with ``enabled``, ``dir``,
+        ``max_entries`` and ``max_age_days``.
+        """
+        options = defaults.get('cache', False)
+        if isinstance(options, bool):
+            options = {'enabled': options}
+        if not options or not options.get('enabled', True):
+            return None
+
+        return cls(
+            options.get('dir', os.path.join(DEFAULT_STATE_DIR, 'cache')),
+            max_entries=int(options.get('max_entries', DEFAULT_CACHE_MAX_ENTRIES)),
+            max_age_days=float(options.get('max_age_days', DEFAULT_CACHE_MAX_AGE_DAYS))
+        )
+
+    @staticmethod
+    def hash_inputs(patterns: list, working_dir: str) -> str:
+        """Hash the paths and contents of all files matching the input globs."""
+        root = Path(working_dir)
+        paths = set()
+        for pattern in patterns:
+            paths.update(p for p in root.glob(pattern) if p.is_file())
+
+        digest = hashlib.sha256()
+        for path in sorted(paths):
+            digest.update(str(path.relative_to(root)).encode('utf-8'))
+            digest.update(b'\0')
+            with open(path, 'rb') as f:
+                for chunk in iter(lambda: f.read(65536), b''):
+                    digest.update(chunk)
+            digest.update(b'\0')
+        return digest.hexdigest()
+
+    def make_key(self, check: dict, command: str, working_dir: str,
+                 env: dict, defaults: dict) -> Optional[str]:
+        """
+        Compute the cache key for a check, or None if it is not cacheable.
+
+        Args:
+            check: Check configuration dictionary
+            command: Expanded command string
+            working_dir: Directory the command runs in
+            env: Environment the command runs with
+            defaults: Default configuration values
+        """
+        inputs = check.get('inputs')
+        if not inputs:
+            return None
+        if isinstance(inputs, str):
+            inputs = [inputs]
+
+        payload = json.dumps({
+            'version': VERSION,
+            'command': command,
+            'working_dir': str(Path(working_dir).resolve()),
+            'env': get_relevant_env(check, env, defaults),
+            'inputs': self.hash_inputs(inputs, working_dir),
+        }, sort_keys=True)
+        return hashlib.sha256(payload.encode('utf-8')).hexdigest()
+
+    def _entry_path(self, key: str) -> Path:
+        return self.cache_dir / f"{key}.json"
+
+    def get(self, key: str) -> Optional[CheckResult]:
+        """Return the cached result for a key, refreshing its LRU timestamp."""
+        path = self._entry_path(key)
+        try:
+            if self.max_age and time.time() - path.stat().st_mtime > self.max_age:
+                path.unlink()
+                raise FileNotFoundError(path)
+            with open(path, 'r', encoding='utf-8') as f:
+                result = check_result_from_dict(json.load(f))
+            os.utime(path)
+        except (OSError, ValueError, KeyError, TypeError):
+            with self._lock:
+                self.misses += 1
+            return None
+
+        with self._lock:
+            self.hits += 1
+        result.cached = True
+        return result
+
+    def put(self, key: str, result: CheckResult) -> None:
+        """Store a passing result; other statuses are never cached."""
+        if result.status != CheckStatus.PASS:
+            return
+
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        path = self._entry_path(key)
+        tmp_path = path.with_suffix(f".{os.getpid()}.{threading.get_ident()}.tmp")
+        try:
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                json.dump(check_result_to_dict(result), f)
+            os.replace(tmp_path, path)
+        except OSError:
+            tmp_path.unlink(missing_ok=True)
+
+    def evict(self) -> int:
+        """
+        Apply the eviction policy: drop expired entries, then the least
+        recently used ones beyond max_entries.
+
+        Returns:
+            Number of entries removed
+        """
+        if not self.cache_dir.is_dir():
+            return 0
+
+        entries = []
+        for path in self.cache_dir.glob('*.json'):
+            try:
+                entries.append((path.stat().st_mtime, path))
+            except OSError:
+                continue
+        entries.sort(reverse=True)
+
+        now = time.time()
+        removed = 0
+        for index, (mtime, path) in enumerate(entries):
+            expired = self.max_age and now - mtime > self.max_age
+            if expired or index >= self.max_entries:
+                path.unlink(missing_ok=True)
+                removed += 1
+        return removed
+
+
+def get_relevant_env(check: dict, env: dict, defaults: dict) -> dict:
+    """
+    Env that can change a check's result: configured env, variables
+    referenced by the raw command, and any declared cache_env names.
+    """
+    env_names = set(defaults.get('env', {})) | set(check.get('env', {}))
+    env_names.update(re.findall(r'\$\{([A-Za-z_][A-Za-z0-9_]*)', check.get('command', '')))
+    env_names.update(check.get('cache_env', []))
+    return {name: env.get(name) for name in sorted(env_names)}
+
+
+def result_key(gate: GateResult, check: CheckResult) -> str:
+    """Stable identifier for a check across runs: ``<gate>/<check name>``."""
+    return f"{gate.gate_id}/{check.name}"
+
+
+class FlakeStats:
+    """
+    Per-check retry outcomes accumulated across runs.
+
+    Only checks configured with ``retry`` are tracked. A run is flaky when
+    the check failed at least once and then passed on a retry; the flake
+    rate is flaky runs divided by recorded runs.
+    """
+
+    def __init__(self, path: str):
+        self.path = Path(path)
+        self.checks = {}
+        try:
+            with open(self.path, 'r', encoding='utf-8') as f:
+                self.checks = json.load(f).get('checks', {})
+        except (OSError, ValueError, AttributeError):
+            self.checks = {}
+
+    @staticmethod
+    def key(gate: GateResult, check: CheckResult) -> str:
+        return result_key(gate, check)
+
+    def record(self, results: list) -> bool:
+        """
+        Record the retried checks of a run.
+
+        Returns:
+            True if anything was recorded
+        """
+        recorded = False
+        for gate in results:
+            for check in gate.checks:
+                if check.cached or check.max_attempts <= 1 or check.status == CheckStatus.SKIP:
+                    continue
+                entry = self.checks.setdefault(
+                    self.key(gate, check), {'runs': 0, 'flaky': 0, 'failed': 0, 'retries': 0}
+                )
+                entry['runs'] += 1
+                entry['retries'] += len(check.attempts) - 1
+                if check.flaky:
+                    entry['flaky'] += 1
+                elif check.status != CheckStatus.PASS:
+                    entry['failed'] += 1
+                recorded = True
+        return recorded
+
+    def flake_rate(self, key: str) -> float:
+        """Fraction of recorded runs that passed only after a retry."""
+        entry = self.checks.get(key)
+        if not entry or not entry['runs']:
+            return 0.0
+        return entry['flaky'] / entry['runs']
+
+    def save(self) -> None:
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = self.path.with_suffix('.tmp')
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump({'version': VERSION, 'checks': self.checks}, f, indent=2, sort_keys=True)
+        os.replace(tmp_path, self.path)
+
+
+# =============================================================================
+# Timing History
+# =============================================================================
+
+def append_history(path: str, results: list, wall_time: float,
+                   max_runs: int = DEFAULT_HISTORY_MAX_RUNS) -> None:
+    """
+    Append one compact JSON line describing a run to the history file.
+
+    Cached and skipped checks are not recorded since their durations say
+    nothing about the check's real cost. The file is trimmed to the last
+    ``max_runs`` runs once it grows 20% past that.
+
+    Args:
+        path: JSONL history file
+        results: List of GateResult objects
+        wall_time: Elapsed time for the whole run
+        max_runs: Number of runs to retain
+    """
+    run = {
+        'ts': datetime.now().isoformat(timespec='seconds'),
+        'wall': round(wall_time, 3),
+        'checks': {
+            result_key(gate, check): [check.status.value, round(check.duration, 3)]
+            for gate in results
+            for check in gate.checks
+            if not check.cached and check.status != CheckStatus.SKIP
+        },
+    }
+
+    history_path = Path(path)
+    history_path.parent.mkdir(parents=True, exist_ok=True)
+    with open(history_path, 'a', encoding='utf-8') as f:
+        f.write(json.dumps(run, separators=(',', ':')) + '\n')
+
+    with open(history_path, 'r', encoding='utf-8') as f:
+        lines = f.readlines()
+    if len(lines) > max_runs * 1.2:
+        tmp_path = history_path.with_suffix('.tmp')
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            f.writelines(lines[-max_runs:])
+        os.replace(tmp_path, history_path)
+
+
+def load_history(path: str, limit: Optional[int] = None) -> list:
+    """
+    Load recorded runs, oldest first.
+
+    Args:
+        path: JSONL history file
+        limit: Only return the most recent ``limit`` runs
+
+    Returns:
+        List of run dictionaries (malformed lines are ignored)
+    """
+    runs = []
+    try:
+        with open(path, 'r', encoding='utf-8') as f:
+            for line in f:
+                try:
+                    runs.append(json.loads(line))
+                except ValueError:
+                    continue
+    except OSError:
+        return []
+    return runs[-limit:] if limit else runs
+
+
+def analyze_history(runs: list,
+                    threshold: float = DEFAULT_REGRESSION_THRESHOLD) -> list:
+    """
+    Compute per-check duration statistics and flag regressions.
+
+    A check regressed when its latest duration exceeds the p50 of its
+    earlier runs by more than ``threshold`` (a fraction) and by at least
+    MIN_REGRESSION_DELTA seconds.
+
+    Args:
+        runs: Runs as returned by load_history(), oldest first
+        threshold: Allowed relative slowdown before flagging
+
+    Returns:
+        List of dicts (key, runs, p50, p95, latest, baseline, change,
+        regressed), slowest p50 first
+    """
+    durations = {}
+    for run in runs:
+        for key, (_status, duration) in run.get('checks', {}).items():
+            durations.setdefault(key, []).append(duration)
+
+    stats = []
+    for key, values in durations.items():
+        latest = values[-1]
+        previous = values[:-1]
+        baseline = percentile(previous, 50) if previous else None
+        change = (latest - baseline) / baseline if baseline else None
+        regressed = (
+            len(previous) >= MIN_HISTORY_SAMPLES
+            and baseline is not None
+            and latest > baseline * (1 + threshold)
+            and latest - baseline >= MIN_REGRESSION_DELTA
+        )
+        stats.append({
+            'key': key,
+            'runs': len(values),
+            'p50': percentile(values, 50),
+            'p95': percentile(values, 95),
+            'latest': latest,
+            'baseline': baseline,
+            'change': change,
+            'regressed': regressed,
+        })
+
+    stats.sort(key=lambda item: item['p50'], reverse=True)
+    return stats
+
+
+def format_history(stats: list, run_count: int) -> str:
+    """Format analyze_history() output for the --history view."""
+    lines = []
+    separator = "=" * 70
+
+    lines.append(separator)
+    lines.append(f"GATE TIMING HISTORY (last {run_count} run(s))")
+    lines.append(separator)
+
+    if not stats:
+        lines.append("")
+        lines.append("No recorded runs yet.")
+        return '\n'.join(lines)
+
+    lines.append("")
+    lines.append(f"{'Check':<40} {'Runs':>4} {'p50':>8} {'p95':>8} {'Latest':>8} {'Change':>8}")
+    lines.append("-" * 70)
+
+    for item in stats:
+        change = f"{item['change']:+.0%}" if item['change'] is not None else "-"
+        flag = "  REGRESSED" if item['regressed'] else ""
+        lines.append(
+            f"{item['key'][:40]:<40} {item['runs']:>4} "
+            f"{format_duration(item['p50']):>8} {format_duration(item['p95']):>8} "
+            f"{format_duration(item['latest']):>8} {change:>8}{flag}"
+        )
+
+    regressed = [item for item in stats if item['regressed']]
+    lines.append("")
+    lines.append(separator)
+    if regressed:
+        lines.append(f"{len(regressed)} check(s) regressed beyond their median runtime")
+    else:
+        lines.append("No runtime regressions detected")
+    lines.append(separator)
+
+    return '\n'.join(lines)
+
+
+# =============================================================================
+# HTTP Health Checks
+# =============================================================================
+
+class HTTPConnectionPool:
+    """
+    Thread-safe pool of keep-alive HTTP(S) connections keyed by origin.
+
+    Shared by every api_health check in a run so that probes, retries and
+    checks against the same host reuse established connections.
+    """
+
+    def __init__(self):
+        self._idle = {}
+        self._lock = threading.Lock()
+
+    def acquire(self, scheme: str, host: str, port: Optional[int],
+                timeout: float) -> tuple:
+        """
+        Get an idle connection for an origin, or open a new one.
+
+        Returns:
+            Tuple of (connection, reused: bool)
+        """
+        key = (scheme, host, port)
+        with self._lock:
+            idle = self._idle.get(key)
+            conn = idle.pop() if idle else None
+
+        if conn is not None:
+            conn.timeout = timeout
+            if conn.sock is not None:
+                conn.sock.settimeout(timeout)
+            return conn, True
+
+        if scheme == 'https':
+            return http.client.HTTPSConnection(host, port, timeout=timeout), False
+        return http.client.HTTPConnection(host, port, timeout=timeout), False
+
+    def release(self, scheme: str, host: str, port: Optional[int],
+                conn: http.client.HTTPConnection) -> None:
+        """Return a connection whose response has been fully read."""
+        with self._lock:
+            self._idle.setdefault((scheme, host, port), []).append(conn)
+
+    def close(self) -> None:
+        """Close every idle connection."""
+        with self._lock:
+            idle, self._idle = self._idle, {}
+        for connections in idle.values():
+            for conn in connections:
+                conn.close()
+
+
+HTTP_POOL = HTTPConnectionPool()
+
+
+def http_request(url: str, method: str = 'GET', headers: Optional[dict] = None,
+                 body: Optional[str] = None,
+                 timeout: float = DEFAULT_HEALTH_REQUEST_TIMEOUT) -> tuple:
+    """
+    Perform one HTTP request through the shared connection pool.
+
+    A pooled connection that the server has since closed is retried once
+    on a fresh connection.
+
+    Args:
+        url: Absolute http:// or https:// URL
+        method: HTTP method
+        headers: Optional request headers
+        body: Optional request body
+        timeout: Socket timeout in seconds
+
+    Returns:
+        Tuple of (status_code, body_text)
+
+    Raises:
+        ValueError: If the URL is not http(s)
+        OSError, http.client.HTTPException: On connection failures
+    """
+    parts = urlsplit(url)
+    if parts.scheme not in ('http', 'https') or not parts.hostname:
+        raise ValueError(f"Unsupported URL for api_health: {url!r}")
+
+    path = parts.path or '/'
+    if parts.query:
+        path += '?' + parts.query
+
+    while True:
+        conn, reused = HTTP_POOL.acquire(parts.scheme, parts.hostname, parts.port, timeout)
+        try:
+            conn.request(method, path, body=body, headers=headers or {})
+            response = conn.getresponse()
+            data = response.read()
+        except (OSError, http.client.HTTPException):
+            conn.close()
+            if reused:
+                continue
+            raise
+
+        if response.will_close:
+            conn.close()
+        else:
+            HTTP_POOL.release(parts.scheme, parts.hostname, parts.port, conn)
+
+        charset = response.headers.get_content_charset() or 'utf-8'
+        return response.status, data.decode(charset, errors='replace')
+
+
+def percentile(values: list, pct: float) -> float:
+    """Nearest-rank percentile of a non-empty list."""
+    ordered = sorted(values)
+    rank = max(1, -(-len(ordered) * pct // 100))
+    return ordered[int(rank) - 1]
+
+
+def evaluate_health_response(status: int, body: str, expected: dict) -> str:
+    """
+    Compare an HTTP response with the check's ``expected`` block.
+
+    Args:
+        status: HTTP status code
+        body: Response body
+        expected: Mapping with optional status, contains, not_contains
+
+    Returns:
+        Empty string if the response matches, otherwise the mismatch
+    """
+    expected_status = expected.get('status')
+    if expected_status is not None:
+        allowed = expected_status if isinstance(expected_status, list) else [expected_status]
+        if status not in allowed:
+            return f"HTTP {status}, expected {expected_status}"
+    elif not 200 <= status < 400:
+        return f"HTTP {status}"
+
+    contains = expected.get('contains')
+    if contains and contains not in body:
+        return f"Response does not contain {contains!r}"
+
+    not_contains = expected.get('not_contains')
+    if not_contains and not_contains in body:
+        return f"Response contains {not_contains!r}"
+
+    return ""
+
+
+def probe_health(url: str, check: dict, timeout: float,
+                 cancel: Optional[CancelToken] = None) -> tuple:
+    """
+    Poll a health endpoint until it matches expectations or the deadline.
+
+    Args:
+        url: Expanded health check URL
+        check: Check configuration (method, headers, body, expected,
+            interval, request_timeout)
+        timeout: Deadline for the whole poll in seconds
+        cancel: Optional fail-fast token
+
+    Returns:
+        Tuple of (ok: bool, last_status, last_body, message, latencies)
+
+    Raises:
+        CheckCancelled: If the cancel token is set while polling
+    """
+    expected = check.get('expected', {})
+    interval = float(check.get('interval', DEFAULT_HEALTH_INTERVAL))
+    request_timeout = float(check.get('request_timeout', DEFAULT_HEALTH_REQUEST_TIMEOUT))
+    deadline = time.time() + timeout
+    latencies = []
+    last_status, last_body, message = None, "", ""
+
+    while True:
+        remaining = deadline - time.time()
+        probe_start = time.time()
+        try:
+            last_status, last_body = http_request(
+                url,
+                method=check.get('method', 'GET'),
+                headers=check.get('headers'),
+                body=check.get('body'),
+                timeout=max(0.1, min(request_timeout, remaining))
+            )
+            latencies.append(time.time() - probe_start)
+            message = evaluate_health_response(last_status, last_body, expected)
+        except (OSError, http.client.HTTPException) as e:
+            message = f"Request failed: {e}"
+
+        if not message:
+            return True, last_status, last_body, "", latencies
+
+        remaining = deadline - time.time()
+        if remaining <= 0:
+            return False, last_status, last_body, message, latencies
+
+        delay = min(interval, remaining)
+        if cancel is not None:
+            if cancel.wait(delay):
+                raise CheckCancelled(cancel.reason, last_body)
+        else:
+            time.sleep(delay)
+
+
+def latency_metrics(latencies: list) -> dict:
+    """Summarize probe latencies (seconds) into percentile metrics."""
+    if not latencies:
+        return {'probes': 0}
+    return {
+        'probes': len(latencies),
+        'latency_p50': round(percentile(latencies, 50), 4),
+        'latency_p95': round(percentile(latencies, 95), 4),
+        'latency_max': round(max(latencies), 4),
+    }
 
 
 # =============================================================================
@@ -122,13 +848,265 @@ def load_gate_config(config_path: str) -> dict:
     if 'gates' not in config or not config['gates']:
         raise ValueError("Configuration missing required 'gates' array")
 
+    validate_dependencies(config)
+
     return config
 
 
+def resolve_needs(items: list, label: str, strict: bool = True) -> list:
+    """
+    Resolve ``needs`` references into dependency edges.
+
+    Items are referenced by ``id`` or ``name``.
+
+    Args:
+        items: Gate or check configuration dictionaries
+        label: "gate" or "check", for error messages
+        strict: Raise on unknown references instead of ignoring them
+
+    Returns:
+        List where entry i holds the indices item i depends on
+
+    Raises:
+        ValueError: If a reference is unknown (strict) or ambiguous
+    """
+    index = {}
+    for i, item in enumerate(items):
+        for key in {item.get('id'), item.get('name')} - {None}:
+            index.setdefault(key, []).append(i)
+
+    edges = []
+    for i, item in enumerate(items):
+        item_name = item.get('name', item.get('id', item.get('type', f'#{i}')))
+        needs = item.get('needs', [])
+        if isinstance(needs, str):
+            needs = [needs]
+
+        deps = []
+        for ref in needs:
+            matches = index.get(ref, [])
+            if not matches:
+                if strict:
+                    raise ValueError(f"{label.capitalize()} '{item_name}' needs unknown {label} '{ref}'")
+                continue
+            if len(matches) > 1:
+                raise ValueError(f"{label.capitalize()} '{item_name}' needs ambiguous {label} '{ref}'")
+            deps.append(matches[0])
+        edges.append(deps)
+
+    return edges
+
+
+def find_cycle(edges: list) -> Optional[list]:
+    """
+    Find a dependency cycle, if any.
+
+    Args:
+        edges: Adjacency list as returned by resolve_needs()
+
+    Returns:
+        Indices forming the cycle (first index repeated at the end), or None
+    """
+    WHITE, GREY, BLACK = 0, 1, 2
+    color = [WHITE] * len(edges)
+    stack = []
+
+    def visit(node: int) -> Optional[list]:
+        color[node] = GREY
+        stack.append(node)
+        for dep in edges[node]:
+            if color[dep] == GREY:
+                return stack[stack.index(dep):] + [dep]
+            if color[dep] == WHITE:
+                cycle = visit(dep)
+                if cycle:
+                    return cycle
+        stack.pop()
+        color[node] = BLACK
+        return None
+
+    for node in range(len(edges)):
+        if color[node] == WHITE:
+            cycle = visit(node)
+            if cycle:
+                return cycle
+    return None
+
+
+def validate_dependencies(config: dict) -> None:
+    """
+    Reject unknown or cyclic ``needs`` edges between gates and checks.
+
+    Raises:
+        ValueError: If a dependency is unknown, ambiguous, or cyclic
+    """
+    def names(items: list, cycle: list) -> str:
+        return ' -> '.join(
+            str(items[i].get('name', items[i].get('id', items[i].get('type')))) for i in cycle
+        )
+
+    gates = config.get('gates', [])
+    cycle = find_cycle(resolve_needs(gates, 'gate'))
+    if cycle:
+        raise ValueError(f"Dependency cycle between gates: {names(gates, cycle)}")
+
+    for gate in gates:
+        checks = gate.get('checks', [])
+        cycle = find_cycle(resolve_needs(checks, 'check'))
+        if cycle:
+            gate_name = gate.get('name', gate.get('id', 'unknown'))
+            raise ValueError(f"Dependency cycle in gate '{gate_name}': {names(checks, cycle)}")
+
+
+def get_changed_files(since: str, cwd: str = '.') -> list:
+    """
+    List files changed relative to a git ref.
+
+    Includes committed, staged and unstaged changes since ``since`` plus
+    untracked files, as paths relative to ``cwd``.
+
+    Args:
+        since: Git ref to compare against (branch, tag, or commit)
+        cwd: Directory inside the git work tree
+
+    Returns:
+        Sorted list of changed file paths
+
+    Raises:
+        RuntimeError: If git is unavailable or the ref is invalid
+    """
+    commands = [
+        ['git', 'diff', '--name-only', '--relative', since, '--'],
+        ['git', 'ls-files', '--others', '--exclude-standard'],
+    ]
+    changed = set()
+    for git_command in commands:
+        try:
+            result = subprocess.run(
+                git_command, cwd=cwd, capture_output=True, text=True, timeout=60
+            )
+        except (OSError, subprocess.TimeoutExpired) as e:
+            raise RuntimeError(f"Could not run git: {e}")
+        if result.returncode != 0:
+            raise RuntimeError(result.stderr.strip() or f"git exited with {result.returncode}")
+        changed.update(line for line in result.stdout.splitlines() if line)
+    return sorted(changed)
+
+
+@lru_cache(maxsize=256)
+def compile_path_glob(pattern: str):
+    """
+    Compile a path glob to a regex.
+
+    ``**`` matches across directories, ``*`` and ``?`` stay within one
+    path segment.
+    """
+    regex = ''
+    i = 0
+    while i < len(pattern):
+        if pattern.startswith('**/', i):
+            regex += '(?:.*/)?'
+            i += 3
+        elif pattern.startswith('**', i):
+            regex += '.*'
+            i += 2
+        elif pattern[i] == '*':
+            regex += '[^/]*'
+            i += 1
+        elif pattern[i] == '?':
+            regex += '[^/]'
+            i += 1
+        else:
+            regex += re.escape(pattern[i])
+            i += 1
+    return re.compile(regex + r'\Z')
+
+
+def filter_changed_files(changed: list, patterns: list) -> list:
+    """Return the changed files matching any of the path globs."""
+    compiled = [compile_path_glob(p[2:] if p.startswith('./') else p) for p in patterns]
+    return [path for path in changed if any(regex.match(path) for regex in compiled)]
+
+
+class SkipConditionCache:
+    """
+    Run-scoped memo of ``skip_if`` results keyed by (expression, env).
+
+    Identical conditions (e.g. "no package.json") across checks and gates
+    are evaluated once, and concurrent requests for the same key wait for
+    the first evaluation instead of forking another shell.
+    """
+
+    def __init__(self):
+        self._results = {}
+        self._lock = threading.Lock()
+        self.evaluations = 0
+
+    @staticmethod
+    def _key(skip_if: str, env: dict) -> tuple:
+        digest = hashlib.sha256()
+        for name, value in sorted(env.items()):
+            digest.update(f"{name}={value}\0".encode('utf-8', errors='replace'))
+        return skip_if, digest.hexdigest()
+
+    def evaluate(self, skip_if: str, env: dict) -> bool:
+        """Whether the skip_if command succeeds (exit code 0) in env."""
+        key = self._key(skip_if, env)
+        with self._lock:
+            future = self._results.get(key)
+            owner = future is None
+            if owner:
+                future = Future()
+                self._results[key] = future
+                self.evaluations += 1
+
+        if owner:
+            try:
+                result = subprocess.run(
+                    skip_if,
+                    shell=True,
+                    capture_output=True,
+                    timeout=30,
+                    env=env
+                )
+                future.set_result(result.returncode == 0)
+            except Exception:
+                future.set_result(False)
+
+        return future.result()
+
+    def clear(self) -> None:
+        """Forget all memoized results (e.g. between --watch runs)."""
+        with self._lock:
+            self._results.clear()
+
+    def prefetch(self, conditions: list, max_workers: int) -> None:
+        """
+        Evaluate (skip_if, env) pairs concurrently, deduplicated by key.
+
+        Args:
+            conditions: List of (skip_if, env) tuples
+            max_workers: Maximum shells running at once
+        """
+        unique = {}
+        for skip_if, env in conditions:
+            unique.setdefault(self._key(skip_if, env), (skip_if, env))
+        if not unique:
+            return
+
+        with ThreadPoolExecutor(max_workers=max(1, min(max_workers, len(unique)))) as executor:
+            list(executor.map(lambda item: self.evaluate(*item), unique.values()))
+
+
+SKIP_CONDITIONS = SkipConditionCache()
+
+
 def should_skip_check(check: dict, env: dict) -> tuple:
     """
     Determine if a check should be skipped based on skip_if condition.
 
+    Results are memoized for the run in SKIP_CONDITIONS.
+
     Args:
         check: Check configuration dictionary
         env: Environment variables for execution
@@ -140,24 +1118,129 @@ def should_skip_check(check: dict, env: dict) -> tuple:
     if not skip_if:
         return False, ""
 
-    try:
-        result = subprocess.run(
-            skip_if,
-            shell=True,
-            capture_output=True,
-            timeout=30,
-            env=env
-        )
-        if result.returncode == 0:
-            return True, f"Skip condition met: {skip_if}"
-    except subprocess.TimeoutExpired:
-        pass
-    except Exception:
-        pass
+    if SKIP_CONDITIONS.evaluate(skip_if, env):
+        return True, f"Skip condition met: {skip_if}"
 
     return False, ""
 
 
+def get_path_filters(check: dict) -> list:
+    """Path globs that gate a check in --since mode (paths, else inputs)."""
+    path_filters = check.get('paths', check.get('inputs')) or []
+    if isinstance(path_filters, str):
+        path_filters = [path_filters]
+    return path_filters
+
+
+def get_check_changed_files(check: dict, defaults: dict) -> Optional[list]:
+    """
+    Changed files relevant to a check in --since mode.
+
+    Returns:
+        Files matching the check's path filters (all changed files if it
+        declares none), or None when not running incrementally
+    """
+    changed_files = defaults.get('changed_files')
+    if changed_files is None:
+        return None
+    path_filters = get_path_filters(check)
+    if path_filters:
+        return filter_changed_files(changed_files, path_filters)
+    return changed_files
+
+
+def rebase_changed_files(changed: list, working_dir: str) -> list:
+    """
+    Re-express changed files relative to a check's working directory.
+
+    get_changed_files() reports paths relative to the runner's cwd, while
+    the check's command runs in working_dir. Files outside working_dir
+    and files that no longer exist are dropped.
+
+    Args:
+        changed: Changed file paths, relative to the runner's cwd
+        working_dir: Directory the check's command runs in
+
+    Returns:
+        Existing changed files, relative to working_dir
+    """
+    rebased = []
+    for path in changed:
+        relative = os.path.relpath(path, working_dir)
+        if relative == os.pardir or relative.startswith(os.pardir + os.sep):
+            continue
+        if os.path.exists(os.path.join(working_dir, relative)):
+            rebased.append(relative)
+    return rebased
+
+
+def build_check_env(check: dict, defaults: dict) -> dict:
+    """
+    Build the environment a check runs with.
+
+    In --since mode, CHANGED_FILES holds the check's matching changed
+    files that still exist, shell-quoted and relative to the check's
+    working_dir. Deleted files and files outside working_dir still count
+    as changes but are not passed on; if nothing remains,
+    ${CHANGED_FILES:-...} falls back to its default.
+    """
+    env = os.environ.copy()
+    env.update(defaults.get('env', {}))
+    env.update(check.get('env', {}))
+
+    changed_files = get_check_changed_files(check, defaults)
+    if changed_files is not None:
+        working_dir = check.get('working_dir', defaults.get('working_dir', '.'))
+        existing = rebase_changed_files(changed_files, working_dir)
+        if existing:
+            env['CHANGED_FILES'] = ' '.join(shlex.quote(path) for path in existing)
+        else:
+            env.pop('CHANGED_FILES', None)
+
+    return env
+
+
+def get_skip_reason(check: dict, defaults: dict, env: dict) -> str:
+    """
+    Decide up front whether a check will be skipped.
+
+    Args:
+        check: Check configuration dictionary
+        defaults: Default configuration values
+        env: Environment from build_check_env()
+
+    Returns:
+        Skip reason, or empty string if the check should run
+    """
+    path_filters = get_path_filters(check)
+    changed_files = get_check_changed_files(check, defaults)
+    if changed_files is not None and path_filters and not changed_files:
+        return f"No changed files match {', '.join(path_filters)}"
+
+    should_skip, reason = should_skip_check(check, env)
+    return reason if should_skip else ""
+
+
+def prefetch_skip_conditions(gates: list, defaults: dict) -> None:
+    """
+    Evaluate every skip_if of the selected gates in one concurrent pre-pass.
+
+    Checks already excluded by --since path filters are left out.
+    """
+    conditions = []
+    for gate in gates:
+        for check in gate.get('checks', []):
+            if not check.get('skip_if'):
+                continue
+            path_filters = get_path_filters(check)
+            changed_files = get_check_changed_files(check, defaults)
+            if changed_files is not None and path_filters and not changed_files:
+                continue
+            conditions.append((check['skip_if'], build_check_env(check, defaults)))
+
+    SKIP_CONDITIONS.prefetch(conditions, get_max_workers(defaults) * 2)
+
+
 def expand_env_vars(command: str, env: dict) -> str:
     """
     Expand environment variables in command string.
@@ -170,8 +1253,6 @@ def expand_env_vars(command: str, env: dict) -> str:
     Returns:
         Command with expanded variables
     """
-    import re
-
     def replace_var(match):
         var_expr = match.group(1)
         if ':-' in var_expr:
@@ -185,7 +1266,333 @@ def expand_env_vars(command: str, env: dict) -> str:
     return re.sub(pattern, replace_var, command)
 
 
-def run_check(check: dict, defaults: dict, verbose: bool = False) -> CheckResult:
+def terminate_process_group(proc: subprocess.Popen) -> None:
+    """
+    Terminate a check subprocess and every process it spawned, and reap it.
+
+    Sends SIGTERM to the whole process group and waits up to
+    TERMINATE_GRACE seconds for the command to exit, then SIGKILLs
+    whatever is left of the group. The group is signalled even if the
+    command itself already exited, so background processes it left
+    behind are stopped too.
+
+    Args:
+        proc: Process started with start_new_session=True
+    """
+    if os.name != 'posix':
+        if proc.poll() is None:
+            proc.kill()
+            proc.wait()
+        return
+
+    try:
+        os.killpg(proc.pid, signal.SIGTERM)
+    except ProcessLookupError:
+        # Nothing left in the group; the command exited and was reaped
+        proc.wait()
+        return
+
+    try:
+        proc.wait(timeout=TERMINATE_GRACE)
+    except subprocess.TimeoutExpired:
+        pass
+
+    try:
+        os.killpg(proc.pid, signal.SIGKILL)
+    except ProcessLookupError:
+        pass
+    proc.wait()
+
+
+class CommandResult(subprocess.CompletedProcess):
+    """CompletedProcess plus resource usage of the command's process tree."""
+
+    def __init__(self, args, returncode, stdout=None, stderr=None,
+                 resources: Optional[dict] = None):
+        super().__init__(args, returncode, stdout, stderr)
+        self.resources = resources or {}
+
+
+def rusage_to_dict(usage) -> dict:
+    """
+    Convert a struct_rusage into the CheckResult.resources mapping.
+
+    Peak RSS is normalized to kilobytes (macOS reports bytes). I/O is
+    counted in filesystem block operations.
+    """
+    max_rss = usage.ru_maxrss / 1024 if sys.platform == 'darwin' else usage.ru_maxrss
+    return {
+        'cpu_user': round(usage.ru_utime, 3),
+        'cpu_system': round(usage.ru_stime, 3),
+        'max_rss_kb': int(max_rss),
+        'io_read_blocks': usage.ru_inblock,
+        'io_write_blocks': usage.ru_oublock,
+        'ctx_voluntary': usage.ru_nvcsw,
+        'ctx_involuntary': usage.ru_nivcsw,
+    }
+
+
+def merge_resources(first: dict, second: dict) -> dict:
+    """Combine resource usage of two attempts (sums, peak RSS is max)."""
+    if not first:
+        return dict(second)
+    if not second:
+        return dict(first)
+    merged = {key: first.get(key, 0) + second.get(key, 0) for key in set(first) | set(second)}
+    merged['max_rss_kb'] = max(first.get('max_rss_kb', 0), second.get('max_rss_kb', 0))
+    for key in ('cpu_user', 'cpu_system'):
+        merged[key] = round(merged[key], 3)
+    return merged
+
+
+def wait_with_rusage(proc: subprocess.Popen, timeout: float) -> Optional[dict]:
+    """
+    Wait up to timeout seconds for a process to exit and reap it.
+
+    Uses os.wait4() where available so the resource usage of the process
+    and all of its waited-for descendants is captured per check, which
+    RUSAGE_CHILDREN cannot do when checks run concurrently.
+
+    Returns:
+        Resource usage dict ({} if unavailable) once the process exited,
+        None if it is still running after timeout
+    """
+    if not hasattr(os, 'wait4'):
+        try:
+            proc.wait(timeout=timeout)
+            return {}
+        except subprocess.TimeoutExpired:
+            return None
+
+    deadline = time.time() + timeout
+    delay = 0.0005
+    while True:
+        try:
+            pid, status, usage = os.wait4(proc.pid, os.WNOHANG)
+        except ChildProcessError:
+            proc.wait()
+            return {}
+        if pid == proc.pid:
+            proc.returncode = os.waitstatus_to_exitcode(status)
+            return rusage_to_dict(usage)
+
+        remaining = deadline - time.time()
+        if remaining <= 0:
+            return None
+        delay = min(delay * 2, remaining, 0.05)
+        time.sleep(delay)
+
+
+class OutputCapture:
+    """
+    Bounded capture of one output stream: the first ``head`` lines and a
+    ring buffer of the last ``tail`` lines, whatever the total volume.
+    """
+
+    def __init__(self, head: int = DEFAULT_OUTPUT_HEAD_LINES,
+                 tail: int = DEFAULT_OUTPUT_TAIL_LINES):
+        self.head_limit = head
+        self.head = []
+        self.tail = deque(maxlen=max(0, tail))
+        self.total_lines = 0
+
+    def add(self, line: str) -> None:
+        if len(line) > MAX_CAPTURED_LINE:
+            line = line[:MAX_CAPTURED_LINE] + "... [line truncated]\n"
+        self.total_lines += 1
+        if len(self.head) < self.head_limit:
+            self.head.append(line)
+        else:
+            self.tail.append(line)
+
+    def text(self) -> str:
+        omitted = self.total_lines - len(self.head) - len(self.tail)
+        if omitted <= 0:
+            return ''.join(self.head) + ''.join(self.tail)
+        return (
+            ''.join(self.head)
+            + f"... [{omitted} lines omitted, see log file] ...\n"
+            + ''.join(self.tail)
+        )
+
+
+def pump_stream(stream, capture: OutputCapture, log_file=None, log_lock=None,
+                echo_prefix: Optional[str] = None) -> None:
+    """
+    Read a subprocess stream line by line until EOF.
+
+    Each line is added to the bounded capture, appended to the log file
+    and, when echo_prefix is given, printed immediately.
+    """
+    for line in iter(lambda: stream.readline(65536), ''):
+        capture.add(line)
+        if log_file is not None:
+            with log_lock:
+                if log_file.closed:
+                    # A background process outlived the command and still
+                    # holds the pipe; the log has already been finalized.
+                    log_file = None
+                else:
+                    log_file.write(line)
+        if echo_prefix is not None:
+            try:
+                print(f"{echo_prefix}{line}", end='' if line.endswith('\n') else '\n', flush=True)
+            except (OSError, ValueError):
+                # Console went away (e.g. closed pipe); keep draining.
+                echo_prefix = None
+    stream.close()
+
+
+def execute_command(command: str, timeout: float, cwd: str, env: dict,
+                    cancel: Optional[CancelToken] = None,
+                    log_path: Optional[str] = None,
+                    echo_prefix: Optional[str] = None,
+                    output_limits: tuple = (DEFAULT_OUTPUT_HEAD_LINES,
+                                            DEFAULT_OUTPUT_TAIL_LINES)) -> CommandResult:
+    """
+    Run a shell command in its own process group.
+
+    Output is streamed rather than buffered: every line goes to the log
+    file (if any) and to the console (if echo_prefix is set), while only
+    a bounded head/tail of each stream is kept in memory. Polls for
+    cancellation while the command runs so that fail-fast can stop
+    in-flight checks. The whole group is terminated on timeout,
+    cancellation or interruption; after a normal exit the output is
+    only drained.
+
+    Args:
+        command: Shell command to run
+        timeout: Seconds before the command is killed
+        cwd: Working directory
+        env: Environment variables
+        cancel: Optional fail-fast token to poll
+        log_path: Optional file the full output is appended to
+        echo_prefix: Print output lines live with this prefix
+        output_limits: (head, tail) lines kept per stream
+
+    Returns:
+        CommandResult with the captured (possibly elided) stdout/stderr
+        and the resource usage of the command's process tree
+
+    Raises:
+        subprocess.TimeoutExpired: If the command exceeds its timeout
+        CheckCancelled: If the cancel token is set while running
+    """
+    log_file = None
+    if log_path:
+        Path(log_path).parent.mkdir(parents=True, exist_ok=True)
+        log_file = open(log_path, 'a', encoding='utf-8')
+        log_file.write(f"$ {command}\n")
+        log_file.flush()
+    log_lock = threading.Lock()
+
+    try:
+        proc = subprocess.Popen(
+            command,
+            shell=True,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.PIPE,
+            cwd=cwd,
+            env=env,
+            text=True,
+            encoding='utf-8',
+            errors='replace',
+            start_new_session=(os.name == 'posix')
+        )
+    except Exception:
+        if log_file is not None:
+            log_file.close()
+        raise
+
+    stdout_capture = OutputCapture(*output_limits)
+    stderr_capture = OutputCapture(*output_limits)
+    readers = [
+        threading.Thread(
+            target=pump_stream,
+            args=(stream, capture, log_file, log_lock, echo_prefix),
+            daemon=True
+        )
+        for stream, capture in ((proc.stdout, stdout_capture), (proc.stderr, stderr_capture))
+    ]
+    for reader in readers:
+        reader.start()
+
+    def finish() -> None:
+        for reader in readers:
+            reader.join(TERMINATE_GRACE)
+        if log_file is not None:
+            with log_lock:
+                log_file.close()
+
+    deadline = time.time() + timeout
+    resources = None
+
+    try:
+        while resources is None:
+            resources = wait_with_rusage(proc, POLL_INTERVAL)
+            if resources is None and cancel is not None and cancel.is_cancelled():
+                break
+            if resources is None and time.time() >= deadline:
+                break
+    finally:
+        # Timeout, cancellation or an exception such as KeyboardInterrupt:
+        # stop the whole group before draining the readers, which would
+        # otherwise block on their pipes. A command that exited on its own
+        # is left alone, together with any background processes it started.
+        if resources is None:
+            terminate_process_group(proc)
+        finish()
+
+    if resources is not None:
+        return CommandResult(
+            command, proc.returncode, stdout_capture.text(), stderr_capture.text(), resources
+        )
+    if cancel is not None and cancel.is_cancelled():
+        raise CheckCancelled(cancel.reason, stdout_capture.text(), stderr_capture.text())
+    raise subprocess.TimeoutExpired(command, timeout)
+
+
+def slugify(value: str) -> str:
+    """Make a string safe for use as a file name."""
+    slug = re.sub(r'[^A-Za-z0-9_.-]+', '-', value).strip('-.').lower()
+    return slug or 'unnamed'
+
+
+def make_skip_result(check: dict, reason: str) -> CheckResult:
+    """Build a SKIP result for a check that will not be executed."""
+    check_id = check.get('id', check.get('type', 'unknown'))
+    return CheckResult(
+        check_id=check_id,
+        name=check.get('name', check_id),
+        status=CheckStatus.SKIP,
+        command=check.get('command', ''),
+        duration=0.0,
+        severity=Severity(check.get('severity', 'critical')),
+        skip_reason=reason
+    )
+
+
+def failure_status(severity: Severity) -> CheckStatus:
+    """Map a failed check to its reported status based on severity."""
+    if severity == Severity.WARNING:
+        return CheckStatus.WARN
+    if severity == Severity.INFO:
+        return CheckStatus.PASS
+    return CheckStatus.FAIL
+
+
+def is_blocking_failure(result: CheckResult) -> bool:
+    """Whether a check result blocks its gate (failed CRITICAL check)."""
+    return (
+        result.status in (CheckStatus.FAIL, CheckStatus.ERROR)
+        and result.severity == Severity.CRITICAL
+    )
+
+
+def run_check(check: dict, defaults: dict, verbose: bool = False,
+              cancel: Optional[CancelToken] = None,
+              cache: Optional[ResultCache] = None,
+              log_dir: Optional[str] = None) -> CheckResult:
     """
     Execute a single check and return the result.
 
@@ -193,6 +1600,9 @@ def run_check(check: dict, defaults: dict, verbose: bool = False) -> CheckResult
         check: Check configuration dictionary
         defaults: Default configuration values
         verbose: Whether to print verbose output
+        cancel: Optional fail-fast token; a set token skips the check
+        cache: Optional result cache consulted for checks declaring inputs
+        log_dir: Optional directory for the check's full output log
 
     Returns:
         CheckResult with execution details
@@ -212,119 +1622,433 @@ def run_check(check: dict, defaults: dict, verbose: bool = False) -> CheckResult
     else:
         remediation = []
 
-    # Build environment
-    env = os.environ.copy()
-    env.update(defaults.get('env', {}))
-    env.update(check.get('env', {}))
+    env = build_check_env(check, defaults)
 
     # Check skip condition
-    should_skip, skip_reason = should_skip_check(check, env)
-    if should_skip:
-        return CheckResult(
-            check_id=check_id,
-            name=name,
-            status=CheckStatus.SKIP,
-            command=check.get('command', ''),
-            duration=0.0,
-            severity=severity,
-            skip_reason=skip_reason
-        )
+    if cancel is not None and cancel.is_cancelled():
+        return replace(make_skip_result(check, f"Cancelled: {cancel.reason}"), cancelled=True)
+
+    skip_reason = get_skip_reason(check, defaults, env)
+    if skip_reason:
+        return make_skip_result(check, skip_reason)
 
     # Expand command variables
-    command = expand_env_vars(check.get('command', ''), env)
+    is_health_check = check.get('type') == 'api_health'
+    if is_health_check:
+        url = expand_env_vars(check.get('url', ''), env)
+        command = f"{check.get('method', 'GET')} {url}"
+    else:
+        command = expand_env_vars(check.get('command', ''), env)
 
     # Determine working directory
     working_dir = check.get('working_dir', defaults.get('working_dir', '.'))
 
-    if verbose:
-        print(f"  Running: {command}")
-        print(f"  Timeout: {timeout}s")
-
     start_time = time.time()
 
-    try:
-        result = subprocess.run(
-            command,
-            shell=True,
-            capture_output=True,
-            timeout=timeout,
-            cwd=working_dir,
-            env=env,
-            text=True
-        )
+    cache_key = None
+    if cache is not None:
+        try:
+            cache_key = cache.make_key(check, command, working_dir, env, defaults)
+        except OSError:
+            cache_key = None
+        cached = cache.get(cache_key) if cache_key else None
+        if cached is not None:
+            if verbose:
+                print(f"  [{check_id}] Cache hit: {command}")
+            cached.duration = time.time() - start_time
+            return cached
 
-        duration = time.time() - start_time
+    if verbose:
+        print(f"  [{check_id}] Running: {command}")
+        print(f"  [{check_id}] Timeout: {timeout}s")
+
+    log_path = None
+    if log_dir and not is_health_check:
+        log_name = slugify(check_id if name == check_id else f"{check_id}-{name}")
+        log_path = os.path.join(log_dir, f"{log_name}.log")
+        try:
+            Path(log_dir).mkdir(parents=True, exist_ok=True)
+            open(log_path, 'w').close()
+        except OSError:
+            log_path = None
+
+    output_limits = (
+        int(defaults.get('output_head_lines', DEFAULT_OUTPUT_HEAD_LINES)),
+        int(defaults.get('output_tail_lines', DEFAULT_OUTPUT_TAIL_LINES))
+    )
 
-        if result.returncode == expected_exit:
-            status = CheckStatus.PASS
-        elif severity == Severity.WARNING:
-            status = CheckStatus.WARN
-        elif severity == Severity.INFO:
-            status = CheckStatus.PASS
-        else:
-            status = CheckStatus.FAIL
+    # timeout bounds the whole health check; retries poll for what is left
+    health_deadline = start_time + float(timeout)
+
+    def attempt_health() -> CheckResult:
+        attempt_start = time.time()
+        try:
+            ok, http_status, body, message, latencies = probe_health(
+                url, check, max(0.0, health_deadline - attempt_start), cancel
+            )
+        except CheckCancelled as e:
+            return CheckResult(
+                check_id=check_id,
+                name=name,
+                status=CheckStatus.SKIP,
+                command=command,
+                duration=time.time() - attempt_start,
+                output=e.stdout,
+                severity=severity,
+                skip_reason=f"Cancelled while running: {e}",
+                cancelled=True
+            )
+        except ValueError as e:
+            return CheckResult(
+                check_id=check_id,
+                name=name,
+                status=CheckStatus.ERROR,
+                command=command,
+                duration=time.time() - attempt_start,
+                error=str(e),
+                severity=severity,
+                remediation=["Set the check's url to an absolute http(s) URL"] + remediation
+            )
 
         return CheckResult(
             check_id=check_id,
             name=name,
-            status=status,
+            status=CheckStatus.PASS if ok else failure_status(severity),
             command=command,
-            duration=duration,
-            exit_code=result.returncode,
-            output=result.stdout,
-            error=result.stderr,
+            duration=time.time() - attempt_start,
+            exit_code=http_status,
+            output=body,
+            error="" if ok else f"{message} (gave up after {timeout}s)",
             severity=severity,
-            remediation=remediation
+            remediation=[] if ok else remediation,
+            metrics=latency_metrics(latencies)
         )
 
-    except subprocess.TimeoutExpired:
-        duration = time.time() - start_time
-        return CheckResult(
-            check_id=check_id,
-            name=name,
-            status=CheckStatus.ERROR,
-            command=command,
-            duration=duration,
-            error=f"Command timed out after {timeout} seconds",
-            severity=severity,
-            remediation=["Increase timeout or investigate slow execution"] + remediation
-        )
+    def attempt_once() -> CheckResult:
+        attempt_start = time.time()
+        try:
+            result = execute_command(
+                command, timeout, working_dir, env, cancel,
+                log_path=log_path,
+                echo_prefix=f"  [{check_id}] | " if verbose else None,
+                output_limits=output_limits
+            )
+
+            duration = time.time() - attempt_start
+
+            if result.returncode == expected_exit:
+                status = CheckStatus.PASS
+            else:
+                status = failure_status(severity)
+
+            return CheckResult(
+                check_id=check_id,
+                name=name,
+                status=status,
+                command=command,
+                duration=duration,
+                exit_code=result.returncode,
+                output=result.stdout,
+                error=result.stderr,
+                severity=severity,
+                remediation=remediation,
+                resources=result.resources
+            )
+
+        except CheckCancelled as e:
+            duration = time.time() - attempt_start
+            return CheckResult(
+                check_id=check_id,
+                name=name,
+                status=CheckStatus.SKIP,
+                command=command,
+                duration=duration,
+                output=e.stdout,
+                error=e.stderr,
+                severity=severity,
+                skip_reason=f"Cancelled while running: {e}",
+                cancelled=True
+            )
+
+        except subprocess.TimeoutExpired:
+            duration = time.time() - attempt_start
+            return CheckResult(
+                check_id=check_id,
+                name=name,
+                status=CheckStatus.ERROR,
+                command=command,
+                duration=duration,
+                error=f"Command timed out after {timeout} seconds",
+                severity=severity,
+                remediation=["Increase timeout or investigate slow execution"] + remediation
+            )
+
+        except FileNotFoundError as e:
+            duration = time.time() - attempt_start
+            return CheckResult(
+                check_id=check_id,
+                name=name,
+                status=CheckStatus.ERROR,
+                command=command,
+                duration=duration,
+                error=f"Command not found: {e}",
+                severity=severity,
+                remediation=["Verify command is installed and in PATH"] + remediation
+            )
+
+        except Exception as e:
+            duration = time.time() - attempt_start
+            return CheckResult(
+                check_id=check_id,
+                name=name,
+                status=CheckStatus.ERROR,
+                command=command,
+                duration=duration,
+                error=str(e),
+                severity=severity,
+                remediation=remediation
+            )
+
+    attempt = attempt_health if is_health_check else attempt_once
+    check_result = run_with_retry(attempt, check, defaults, cancel, verbose,
+                                  health_deadline if is_health_check else None)
+    check_result.duration = time.time() - start_time
+    if log_path:
+        check_result.log_path = log_path
+
+    if cache_key:
+        cache.put(cache_key, check_result)
+    return check_result
+
+
+def get_retry_delay(check: dict, defaults: dict, attempt: int) -> float:
+    """
+    Compute the exponential backoff delay before a retry.
 
-    except FileNotFoundError as e:
-        duration = time.time() - start_time
-        return CheckResult(
-            check_id=check_id,
-            name=name,
-            status=CheckStatus.ERROR,
-            command=command,
-            duration=duration,
-            error=f"Command not found: {e}",
-            severity=severity,
-            remediation=["Verify command is installed and in PATH"] + remediation
-        )
+    Uses ``retry_delay`` (initial seconds), ``retry_backoff`` (multiplier)
+    and ``retry_max_delay`` (cap), from the check or the defaults.
 
-    except Exception as e:
-        duration = time.time() - start_time
-        return CheckResult(
-            check_id=check_id,
-            name=name,
-            status=CheckStatus.ERROR,
-            command=command,
-            duration=duration,
-            error=str(e),
-            severity=severity,
-            remediation=remediation
-        )
+    Args:
+        check: Check configuration dictionary
+        defaults: Default configuration values
+        attempt: Number of the attempt that just failed (1-based)
+
+    Returns:
+        Seconds to wait before the next attempt
+    """
+    def option(key: str, default: float) -> float:
+        return float(check.get(key, defaults.get(key, default)))
+
+    delay = option('retry_delay', DEFAULT_RETRY_DELAY)
+    factor = option('retry_backoff', DEFAULT_RETRY_BACKOFF)
+    max_delay = option('retry_max_delay', DEFAULT_RETRY_MAX_DELAY)
+    return min(max_delay, delay * factor ** (attempt - 1))
+
+
+def run_with_retry(attempt_once, check: dict, defaults: dict,
+                   cancel: Optional[CancelToken] = None,
+                   verbose: bool = False,
+                   deadline: Optional[float] = None) -> CheckResult:
+    """
+    Run a check attempt, retrying FAIL/WARN/ERROR results with backoff.
+
+    Every attempt's status and timing is recorded in the returned
+    result's ``attempts`` list.
+
+    Args:
+        attempt_once: Callable() -> CheckResult for one attempt
+        check: Check configuration dictionary (reads ``retry``)
+        defaults: Default configuration values
+        cancel: Optional fail-fast token; stops further retries
+        verbose: Whether to print verbose output
+        deadline: Optional time.time() after which no retry is started
+
+    Returns:
+        Result of the last attempt
+    """
+    retries = max(0, int(check.get('retry', defaults.get('retry', 0))))
+    attempts = []
+    resources = {}
+
+    for attempt in range(1, retries + 2):
+        result = attempt_once()
+        resources = merge_resources(resources, result.resources)
+        attempts.append({
+            'attempt': attempt,
+            'status': result.status.value,
+            'exit_code': result.exit_code,
+            'duration': round(result.duration, 3),
+        })
+
+        retryable = (CheckStatus.FAIL, CheckStatus.WARN, CheckStatus.ERROR)
+        if result.status not in retryable or attempt > retries:
+            break
+
+        delay = get_retry_delay(check, defaults, attempt)
+        if deadline is not None and time.time() + delay >= deadline:
+            break
+        if verbose:
+            print(f"  [{result.check_id}] Attempt {attempt} {result.status.value}; "
+                  f"retrying in {delay:.1f}s")
+        if cancel is not None and cancel.wait(delay):
+            break
+        if cancel is None:
+            time.sleep(delay)
+
+    result.attempts = attempts
+    result.max_attempts = retries + 1
+    result.resources = resources
+    return result
+
+
+def get_max_workers(defaults: dict) -> int:
+    """
+    Resolve the worker pool size for parallel check execution.
+
+    Args:
+        defaults: Default configuration values
+
+    Returns:
+        Maximum number of concurrently running checks (at least 1)
+    """
+    try:
+        max_workers = int(defaults.get('max_workers', DEFAULT_MAX_WORKERS))
+    except (TypeError, ValueError):
+        max_workers = DEFAULT_MAX_WORKERS
+    return max(1, max_workers)
 
 
-def run_gate(gate: dict, defaults: dict, verbose: bool = False) -> GateResult:
+def run_dependency_graph(items: list, edges: list, execute, skip, failed,
+                         max_workers: int = 1, on_complete=None) -> list:
+    """
+    Run items in topological order on a bounded worker pool.
+
+    An item is scheduled once everything it needs has finished; ready
+    items are started in declared order. Dependants of a failed item, and
+    everything that transitively needs them, are not executed but passed
+    to ``skip`` together with the failed item.
+
+    Args:
+        items: Gate or check configuration dictionaries
+        edges: Dependency edges from resolve_needs()
+        execute: Callable(item) -> result
+        skip: Callable(item, failed_item) -> result
+        failed: Callable(result) -> bool, whether dependants must be skipped
+        max_workers: Maximum items running at once
+        on_complete: Optional callable(result), invoked as items finish
+
+    Returns:
+        Results in declared order
+    """
+    results = [None] * len(items)
+    pending = list(range(len(items)))
+    done = set()
+    blocked = {}  # skipped index -> index of the failed item behind it
+
+    def finish(index: int, result) -> None:
+        results[index] = result
+        done.add(index)
+        if on_complete is not None:
+            on_complete(result)
+
+    with ThreadPoolExecutor(max_workers=max(1, max_workers)) as executor:
+        running = {}
+
+        while pending or running:
+            for index in list(pending):
+                if len(running) >= max_workers:
+                    break
+                if not all(dep in done for dep in edges[index]):
+                    continue
+
+                pending.remove(index)
+                blocker = next(
+                    (d for d in edges[index] if d in blocked or failed(results[d])), None
+                )
+                if blocker is not None:
+                    blocked[index] = blocked.get(blocker, blocker)
+                    finish(index, skip(items[index], items[blocked[index]]))
+                else:
+                    running[executor.submit(execute, items[index])] = index
+
+            if not running:
+                continue
+
+            finished, _ = wait(running, return_when=FIRST_COMPLETED)
+            for future in finished:
+                finish(running.pop(future), future.result())
+
+    return results
+
+
+def run_checks(checks: list, defaults: dict, verbose: bool = False,
+               cancel: Optional[CancelToken] = None,
+               fail_fast: bool = False,
+               cache: Optional[ResultCache] = None,
+               log_dir: Optional[str] = None,
+               on_check=None) -> list:
+    """
+    Execute checks in dependency order, concurrently when parallel_checks
+    is enabled.
+
+    Checks may declare ``needs`` on other checks in the same gate; a check
+    whose dependency failed is skipped. Results are always returned in
+    declared order regardless of completion order.
+
+    Args:
+        checks: List of check configuration dictionaries
+        defaults: Default configuration values
+        verbose: Whether to print verbose output
+        cancel: Optional fail-fast token shared across the run
+        fail_fast: Whether a blocking failure here should set the token
+        cache: Optional result cache
+        log_dir: Optional directory for per-check output logs
+        on_check: Optional callable(CheckResult), invoked as checks finish
+
+    Returns:
+        List of CheckResult objects in declared order
+    """
+    def execute(check: dict) -> CheckResult:
+        result = run_check(check, defaults, verbose, cancel, cache, log_dir)
+        if fail_fast and cancel is not None and is_blocking_failure(result):
+            cancel.cancel(f"fail-fast after blocking check '{result.name}' failed")
+        return result
+
+    def skip(check: dict, dependency: dict) -> CheckResult:
+        dependency_name = dependency.get('name', dependency.get('id', 'unknown'))
+        return make_skip_result(check, f"Dependency '{dependency_name}' failed")
+
+    def failed(result: CheckResult) -> bool:
+        return result.status in (CheckStatus.FAIL, CheckStatus.ERROR)
+
+    max_workers = 1
+    if defaults.get('parallel_checks', False):
+        max_workers = min(get_max_workers(defaults), max(1, len(checks)))
+
+    edges = resolve_needs(checks, 'check')
+    return run_dependency_graph(checks, edges, execute, skip, failed, max_workers, on_check)
+
+
+def run_gate(gate: dict, defaults: dict, verbose: bool = False,
+             cancel: Optional[CancelToken] = None,
+             cache: Optional[ResultCache] = None,
+             on_check=None) -> GateResult:
     """
     Execute all checks in a gate and return the aggregate result.
 
+    Checks run serially unless the global ``parallel_checks`` option is
+    set, in which case up to ``max_workers`` checks run at once. With
+    ``fail_fast`` enabled, a failed CRITICAL check in a blocking gate
+    cancels every check that has not finished yet.
+
     Args:
         gate: Gate configuration dictionary
         defaults: Default configuration values
         verbose: Whether to print verbose output
+        cancel: Optional fail-fast token shared across gates
+        cache: Optional result cache shared across gates
+        on_check: Optional callable(gate_id, CheckResult), invoked as
+            each check finishes
 
     Returns:
         GateResult with all check results
@@ -337,24 +2061,34 @@ def run_gate(gate: dict, defaults: dict, verbose: bool = False) -> GateResult:
     blocking = gate.get('blocking', True)
 
     checks = gate.get('checks', [])
-    check_results = []
+    parallel = (
+        bool(defaults.get('parallel_checks', False))
+        and min(get_max_workers(defaults), len(checks)) > 1
+    )
 
     start_time = time.time()
 
-    for check in checks:
-        result = run_check(check, defaults, verbose)
-        check_results.append(result)
+    fail_fast = bool(defaults.get('fail_fast', False)) and blocking
+    log_root = defaults.get('log_dir', os.path.join(DEFAULT_STATE_DIR, 'logs'))
+    log_dir = os.path.join(log_root, slugify(gate_id)) if log_root else None
+    check_results = run_checks(
+        checks, defaults, verbose, cancel, fail_fast, cache, log_dir,
+        (lambda result: on_check(gate_id, result)) if on_check else None
+    )
 
     duration = time.time() - start_time
 
     # Gate passes if no blocking checks failed
-    blocking_failures = [
-        r for r in check_results
-        if r.status in (CheckStatus.FAIL, CheckStatus.ERROR)
-        and r.severity == Severity.CRITICAL
-    ]
+    blocking_failures = [r for r in check_results if is_blocking_failure(r)]
     passed = len(blocking_failures) == 0
 
+    # A passing gate whose remaining checks fail-fast stopped did not pass
+    cancelled = sum(1 for r in check_results if r.cancelled)
+    skip_reason = ""
+    if passed and cancelled:
+        skip_reason = (f"{cancelled} of {len(check_results)} check(s) cancelled: "
+                       f"{cancel.reason}")
+
     return GateResult(
         gate_id=gate_id,
         name=name,
@@ -365,7 +2099,75 @@ def run_gate(gate: dict, defaults: dict, verbose: bool = False) -> GateResult:
         checks=check_results,
         passed=passed,
         duration=duration,
-        timestamp=datetime.now().isoformat()
+        timestamp=datetime.now().isoformat(),
+        parallel=parallel,
+        skip_reason=skip_reason,
+        cancelled=bool(skip_reason)
+    )
+
+
+def run_gates(gates: list, defaults: dict, verbose: bool = False,
+              cancel: Optional[CancelToken] = None,
+              cache: Optional[ResultCache] = None,
+              on_check=None, on_gate=None, announce: bool = True) -> list:
+    """
+    Run gates in dependency order, concurrently when parallel_gates is set.
+
+    A gate whose needed gate failed is skipped; needs on gates outside the
+    selection are treated as satisfied.
+
+    Args:
+        gates: Selected gate configuration dictionaries
+        defaults: Default configuration values
+        verbose: Whether to print verbose output
+        cancel: Optional fail-fast token shared across gates
+        cache: Optional result cache shared across gates
+        on_check: Optional callable(gate_id, CheckResult)
+        on_gate: Optional callable(GateResult), invoked as gates finish
+        announce: Whether to print a line as each gate starts
+
+    Returns:
+        List of GateResult objects in declared order
+    """
+    def execute_gate(gate: dict) -> GateResult:
+        if announce:
+            print(f"\nRunning gate: {gate.get('name', gate.get('id'))}...\n")
+        return run_gate(gate, defaults, verbose, cancel, cache, on_check)
+
+    def skip_gate(gate: dict, dependency: dict) -> GateResult:
+        dependency_name = dependency.get('name', dependency.get('id', 'unknown'))
+        return make_skipped_gate_result(gate, f"Dependency gate '{dependency_name}' failed")
+
+    gate_workers = 1
+    if defaults.get('parallel_gates', False):
+        gate_workers = min(get_max_workers(defaults), len(gates))
+
+    return run_dependency_graph(
+        gates,
+        resolve_needs(gates, 'gate', strict=False),
+        execute_gate,
+        skip_gate,
+        lambda r: not r.passed,
+        gate_workers,
+        on_gate
+    )
+
+
+def make_skipped_gate_result(gate: dict, reason: str) -> GateResult:
+    """Build a GateResult for a gate that will not be executed."""
+    gate_id = gate.get('name', gate.get('id', 'unknown'))
+    return GateResult(
+        gate_id=gate_id,
+        name=gate.get('name', gate_id),
+        gate_type=gate.get('type', 'custom'),
+        phase=gate.get('phase', 'unknown'),
+        trigger=gate.get('trigger', 'manual'),
+        blocking=gate.get('blocking', True),
+        checks=[make_skip_result(check, reason) for check in gate.get('checks', [])],
+        passed=True,
+        duration=0.0,
+        timestamp=datetime.now().isoformat(),
+        skip_reason=reason
     )
 
 
@@ -397,16 +2199,90 @@ def get_status_emoji(status: CheckStatus) -> str:
     return emojis.get(status, "?")
 
 
-def format_duration(seconds: float) -> str:
-    """Format duration in human-readable form."""
-    if seconds < 1:
-        return f"{seconds*1000:.0f}ms"
-    elif seconds < 60:
-        return f"{seconds:.1f}s"
+def format_duration(seconds: float) -> str:
+    """Format duration in human-readable form."""
+    if seconds < 1:
+        return f"{seconds*1000:.0f}ms"
+    elif seconds < 60:
+        return f"{seconds:.1f}s"
+    else:
+        minutes = int(seconds // 60)
+        secs = seconds % 60
+        return f"{minutes}m {secs:.0f}s"
+
+
+def format_size_kb(kilobytes: float) -> str:
+    """Format a size given in kilobytes."""
+    if kilobytes < 1024:
+        return f"{kilobytes:.0f}KB"
+    if kilobytes < 1024 * 1024:
+        return f"{kilobytes / 1024:.1f}MB"
+    return f"{kilobytes / (1024 * 1024):.2f}GB"
+
+
+def format_resources(resources: dict) -> str:
+    """One-line summary of a check's resource usage."""
+    cpu = resources.get('cpu_user', 0.0) + resources.get('cpu_system', 0.0)
+    return (
+        f"CPU: {format_duration(cpu)} "
+        f"(user {format_duration(resources.get('cpu_user', 0.0))}, "
+        f"sys {format_duration(resources.get('cpu_system', 0.0))}) | "
+        f"Peak RSS: {format_size_kb(resources.get('max_rss_kb', 0))} | "
+        f"I/O blocks: {resources.get('io_read_blocks', 0)} in, "
+        f"{resources.get('io_write_blocks', 0)} out"
+    )
+
+
+def format_profile(results: list) -> str:
+    """
+    Format the --profile summary: checks ranked by CPU time, split into
+    CPU-bound work and time spent waiting (I/O, network, sleeps).
+
+    Checks that mostly wait are the ones that gain most from running in
+    parallel.
+    """
+    lines = []
+    separator = "=" * 70
+
+    rows = [
+        (gate, check) for gate in results for check in gate.checks
+        if check.resources and not check.cached
+    ]
+    rows.sort(key=lambda row: row[1].cpu_time, reverse=True)
+
+    total_cpu = sum(check.cpu_time for _, check in rows)
+    total_wall = sum(check.duration for _, check in rows)
+
+    lines.append(separator)
+    lines.append("GATE PROFILE")
+    lines.append(separator)
+    lines.append("")
+    lines.append(f"{'Check':<32} {'Wall':>8} {'CPU':>8} {'Wait':>8} {'CPU%':>5} {'Peak RSS':>9}  Profile")
+    lines.append("-" * 70)
+
+    for gate, check in rows:
+        cpu = check.cpu_time
+        wait_time = max(0.0, check.duration - cpu)
+        ratio = cpu / check.duration if check.duration else 0.0
+        profile = "cpu-bound" if ratio >= 0.5 else "waiting"
+        lines.append(
+            f"{result_key(gate, check)[:32]:<32} {format_duration(check.duration):>8} "
+            f"{format_duration(cpu):>8} {format_duration(wait_time):>8} {ratio:>5.0%} "
+            f"{format_size_kb(check.resources.get('max_rss_kb', 0)):>9}  {profile}"
+        )
+
+    lines.append("")
+    if total_wall:
+        lines.append(
+            f"Total: {format_duration(total_wall)} check time, {format_duration(total_cpu)} CPU "
+            f"({total_cpu / total_wall:.0%}); {format_duration(max(0.0, total_wall - total_cpu))} waiting"
+        )
+        lines.append("Waiting-dominated checks benefit most from parallel_checks.")
     else:
-        minutes = int(seconds // 60)
-        secs = seconds % 60
-        return f"{minutes}m {secs:.0f}s"
+        lines.append("No executed checks with resource data.")
+    lines.append(separator)
+
+    return '\n'.join(lines)
 
 
 def format_check_result(result: CheckResult, verbose: bool = False) -> str:
@@ -418,12 +2294,32 @@ def format_check_result(result: CheckResult, verbose: bool = False) -> str:
 
     lines.append(f"{icon} {result.name} ({result.check_id})")
     lines.append(f"       Command: {result.command}")
-    lines.append(f"       Duration: {duration}")
+    lines.append(f"       Duration: {duration}{' (cached)' if result.cached else ''}")
+
+    if result.resources:
+        lines.append(f"       {format_resources(result.resources)}")
+
+    if result.metrics.get('probes'):
+        m = result.metrics
+        lines.append(
+            f"       Latency: p50 {format_duration(m['latency_p50'])}, "
+            f"p95 {format_duration(m['latency_p95'])}, "
+            f"max {format_duration(m['latency_max'])} ({m['probes']} probe(s))"
+        )
+
+    if len(result.attempts) > 1:
+        timings = ', '.join(format_duration(a['duration']) for a in result.attempts)
+        note = " - flaky, passed on retry" if result.flaky else ""
+        lines.append(f"       Attempts: {len(result.attempts)}/{result.max_attempts} ({timings}){note}")
 
     if result.status == CheckStatus.SKIP:
         lines.append(f"       Reason: {result.skip_reason}")
     elif result.exit_code is not None and result.status != CheckStatus.PASS:
-        lines.append(f"       Exit Code: {result.exit_code}")
+        label = "HTTP Status" if 'probes' in result.metrics else "Exit Code"
+        lines.append(f"       {label}: {result.exit_code}")
+
+    if result.log_path and result.status in (CheckStatus.FAIL, CheckStatus.ERROR, CheckStatus.WARN):
+        lines.append(f"       Log: {result.log_path}")
 
     if result.status in (CheckStatus.FAIL, CheckStatus.ERROR) and result.remediation:
         lines.append("")
@@ -457,7 +2353,9 @@ def format_gate_result(result: GateResult, verbose: bool = False) -> str:
 
     lines.append(separator)
 
-    if result.passed:
+    if result.skip_reason:
+        lines.append(f"RESULT: {result.outcome} - {result.skip_reason}")
+    elif result.passed:
         lines.append(f"RESULT: PASSED - All checks completed successfully")
     else:
         failed_count = sum(
@@ -473,19 +2371,26 @@ def format_gate_result(result: GateResult, verbose: bool = False) -> str:
             lines.append(f"RESULT: WARNING - {failed_count} check(s) failed (non-blocking)")
 
     lines.append(f"")
-    lines.append(f"Total Duration: {format_duration(result.duration)}")
+    lines.append(f"Total Duration: {format_duration(result.duration)} (wall)")
+    lines.append(f"Check Time: {format_duration(result.check_time)} (sum of checks)")
+    if result.parallel:
+        lines.append(f"Execution: parallel")
     lines.append(separator)
 
     return '\n'.join(lines)
 
 
-def format_report(results: list, config: dict) -> str:
+def format_report(results: list, config: dict, wall_time: Optional[float] = None,
+                  flake_stats: Optional[FlakeStats] = None) -> str:
     """
     Format all gate results as markdown report for progress.md.
 
     Args:
         results: List of GateResult objects
         config: Original configuration
+        wall_time: Elapsed time for the whole run (defaults to the sum of
+            gate durations, which overstates it when gates run concurrently)
+        flake_stats: Optional cross-run retry statistics
 
     Returns:
         Markdown-formatted report string
@@ -498,22 +2403,34 @@ def format_report(results: list, config: dict) -> str:
 
     # Summary
     total_gates = len(results)
-    passed_gates = sum(1 for r in results if r.passed)
+    passed_gates = sum(1 for r in results if r.outcome == "PASSED")
+    skipped_gates = sum(1 for r in results if r.skip_reason)
     blocked = any(not r.passed and r.blocking for r in results)
 
     lines.append("### Summary")
     lines.append(f"- **Gates Executed**: {total_gates}")
     lines.append(f"- **Gates Passed**: {passed_gates}/{total_gates}")
+    if skipped_gates:
+        lines.append(f"- **Gates Skipped or Cancelled**: {skipped_gates}")
     lines.append(f"- **Status**: {'BLOCKED' if blocked else 'PASSED'}")
+    if wall_time is None:
+        wall_time = sum(r.duration for r in results)
+    lines.append(f"- **Wall Time**: {format_duration(wall_time)}")
+    lines.append(f"- **Check Time**: {format_duration(sum(r.check_time for r in results))}")
     lines.append("")
 
     # Individual gates
     for result in results:
-        status_icon = "PASS" if result.passed else "FAIL"
+        status_icon = {"PASSED": "PASS", "FAILED": "FAIL", "SKIPPED": "SKIP"}.get(
+            result.outcome, result.outcome)
         lines.append(f"### Gate: {result.name} [{status_icon}]")
+        if result.skip_reason:
+            lines.append(f"- **Reason**: {result.skip_reason}")
         lines.append(f"- **Type**: {result.gate_type}")
         lines.append(f"- **Phase**: {result.phase}")
-        lines.append(f"- **Duration**: {format_duration(result.duration)}")
+        lines.append(f"- **Duration**: {format_duration(result.duration)} (wall)")
+        lines.append(f"- **Check Time**: {format_duration(result.check_time)} (sum of checks)")
+        lines.append(f"- **Execution**: {'parallel' if result.parallel else 'serial'}")
         lines.append("")
 
         lines.append("| Check | Status | Duration |")
@@ -522,6 +2439,8 @@ def format_report(results: list, config: dict) -> str:
         for check in result.checks:
             status = get_status_emoji(check.status)
             duration = format_duration(check.duration)
+            if check.cached:
+                duration += " (cached)"
             lines.append(f"| {check.name} | {status} | {duration} |")
 
         lines.append("")
@@ -537,16 +2456,42 @@ def format_report(results: list, config: dict) -> str:
                         lines.append(f"  - {step}")
             lines.append("")
 
+        # Retried checks with cross-run flake rate
+        retried = [c for c in result.checks if len(c.attempts) > 1]
+        if retried:
+            lines.append("**Retried Checks:**")
+            for check in retried:
+                outcome = "passed on retry" if check.flaky else check.status.value
+                line = f"- **{check.name}**: {len(check.attempts)} attempts, {outcome}"
+                if flake_stats is not None:
+                    key = FlakeStats.key(result, check)
+                    rate = flake_stats.flake_rate(key)
+                    runs = flake_stats.checks.get(key, {}).get('runs', 0)
+                    line += f" (flake rate {rate:.0%} over {runs} run(s))"
+                lines.append(line)
+            lines.append("")
+
     return '\n'.join(lines)
 
 
-def list_gates(config: dict) -> str:
-    """Format gate listing for --list option."""
+def list_gates(config: dict, gates: Optional[list] = None,
+               defaults: Optional[dict] = None,
+               title: str = "Available Quality Gates:") -> str:
+    """
+    Format gate listing for --list and --dry-run.
+
+    Args:
+        config: Gate configuration
+        gates: Gates to list (all configured gates if not given)
+        defaults: When given, each check is listed with its up-front
+            skip decision (skip_if and --since path filters)
+        title: Heading line
+    """
     lines = []
-    lines.append("Available Quality Gates:")
+    lines.append(title)
     lines.append("")
 
-    for gate in config.get('gates', []):
+    for gate in config.get('gates', []) if gates is None else gates:
         gate_id = gate.get('name', gate.get('id', 'unknown'))
         name = gate.get('name', gate_id)
         gate_type = gate.get('type', 'custom')
@@ -560,11 +2505,730 @@ def list_gates(config: dict) -> str:
         lines.append(f"    Phase: {phase}")
         lines.append(f"    Mode: {blocking}")
         lines.append(f"    Checks: {check_count}")
+        needs = gate.get('needs')
+        if needs:
+            lines.append(f"    Needs: {', '.join([needs] if isinstance(needs, str) else needs)}")
+
+        if defaults is not None:
+            for check in gate.get('checks', []):
+                check_id = check.get('id', check.get('type', 'unknown'))
+                reason = get_skip_reason(check, defaults, build_check_env(check, defaults))
+                decision = f"SKIP ({reason})" if reason else "RUN"
+                lines.append(f"      - {check.get('name', check_id)}: {decision}")
+
+        lines.append("")
+
+    return '\n'.join(lines)
+
+
+# =============================================================================
+# Streaming Reporters
+# =============================================================================
+
+class JsonReporter:
+    """
+    JSON Lines reporter: one event object per line, flushed as soon as
+    each check or gate finishes so the stream can be tailed.
+
+    Events: ``run_start``, ``check``, ``gate``, ``run_end``.
+    """
+
+    def __init__(self, stream):
+        self.stream = stream
+        self._lock = threading.Lock()
+        self._reported = {}
+
+    def _emit(self, event: dict) -> None:
+        with self._lock:
+            self.stream.write(json.dumps(event) + '\n')
+            self.stream.flush()
+
+    def start(self, config: dict) -> None:
+        self._emit({
+            'event': 'run_start',
+            'timestamp': datetime.now().isoformat(),
+            'config': config.get('name', ''),
+            'version': VERSION,
+        })
+
+    def check(self, gate_id: str, result: CheckResult) -> None:
+        with self._lock:
+            self._reported[gate_id] = self._reported.get(gate_id, 0) + 1
+        self._emit({'event': 'check', 'gate': gate_id, **check_result_to_dict(result)})
+
+    def gate(self, result: GateResult) -> None:
+        # Gates skipped for a failed dependency never ran their checks
+        if not self._reported.get(result.gate_id):
+            for check in result.checks:
+                self.check(result.gate_id, check)
+        self._emit({
+            'event': 'gate',
+            'gate': result.gate_id,
+            'name': result.name,
+            'type': result.gate_type,
+            'phase': result.phase,
+            'trigger': result.trigger,
+            'blocking': result.blocking,
+            'passed': result.passed,
+            'outcome': result.outcome,
+            'skip_reason': result.skip_reason,
+            'parallel': result.parallel,
+            'duration': round(result.duration, 3),
+            'check_time': round(result.check_time, 3),
+            'timestamp': result.timestamp,
+        })
+
+    def finish(self, results: list, wall_time: float, exit_code: int) -> None:
+        self._emit({
+            'event': 'run_end',
+            'timestamp': datetime.now().isoformat(),
+            'gates': len(results),
+            'passed': sum(1 for r in results if r.outcome == "PASSED"),
+            'wall_time': round(wall_time, 3),
+            'exit_code': exit_code,
+        })
+        if self.stream is not sys.stdout:
+            self.stream.close()
+
+
+class JUnitReporter:
+    """
+    JUnit XML reporter: one testsuite per gate, one testcase per check.
+
+    When writing to a file the complete document is atomically rewritten
+    after every finished check, so the file is always valid XML that CI
+    dashboards can poll during a long run. On stdout the document is
+    written once at the end.
+    """
+
+    def __init__(self, path: Optional[str] = None):
+        self.path = path
+        self._lock = threading.Lock()
+        self._checks = {}
+        self._gates = {}
+
+    def start(self, config: dict) -> None:
+        self.name = config.get('name', 'quality-gates')
+        self._write()
+
+    def check(self, gate_id: str, result: CheckResult) -> None:
+        with self._lock:
+            self._checks.setdefault(gate_id, []).append(result)
+        self._write()
+
+    def gate(self, result: GateResult) -> None:
+        with self._lock:
+            self._checks[result.gate_id] = list(result.checks)
+            self._gates[result.gate_id] = result
+        self._write()
+
+    def finish(self, results: list, wall_time: float, exit_code: int) -> None:
+        self._write(wall_time, final=True)
+
+    @staticmethod
+    def _testcase(gate_id: str, check: CheckResult) -> ET.Element:
+        case = ET.Element('testcase', {
+            'classname': gate_id,
+            'name': check.name,
+            'time': f"{check.duration:.3f}",
+        })
+        if check.status == CheckStatus.FAIL:
+            failure = ET.SubElement(case, 'failure', {
+                'message': f"Exit code {check.exit_code}",
+                'type': check.severity.value,
+            })
+            failure.text = check.error or check.output
+        elif check.status == CheckStatus.ERROR:
+            error = ET.SubElement(case, 'error', {'message': check.error.split('\n')[0][:200]})
+            error.text = check.error
+        elif check.status == CheckStatus.SKIP:
+            ET.SubElement(case, 'skipped', {'message': check.skip_reason})
+        elif check.status == CheckStatus.WARN:
+            ET.SubElement(case, 'system-err').text = (
+                f"[WARN] exit code {check.exit_code}\n{check.error}"
+            )
+        return case
+
+    def _build(self, wall_time: Optional[float] = None) -> ET.ElementTree:
+        root = ET.Element('testsuites', {'name': getattr(self, 'name', 'quality-gates')})
+        totals = {'tests': 0, 'failures': 0, 'errors': 0, 'skipped': 0}
+
+        for gate_id, checks in self._checks.items():
+            gate = self._gates.get(gate_id)
+            counts = {
+                'tests': len(checks),
+                'failures': sum(1 for c in checks if c.status == CheckStatus.FAIL),
+                'errors': sum(1 for c in checks if c.status == CheckStatus.ERROR),
+                'skipped': sum(1 for c in checks if c.status == CheckStatus.SKIP),
+            }
+            for key, value in counts.items():
+                totals[key] += value
+
+            suite = ET.SubElement(root, 'testsuite', {
+                'name': gate_id,
+                'time': f"{(gate.duration if gate else sum(c.duration for c in checks)):.3f}",
+                **{key: str(value) for key, value in counts.items()},
+            })
+            if gate is not None:
+                suite.set('timestamp', gate.timestamp)
+            for check in checks:
+                suite.append(self._testcase(gate_id, check))
+
+        for key, value in totals.items():
+            root.set(key, str(value))
+        if wall_time is not None:
+            root.set('time', f"{wall_time:.3f}")
+        return ET.ElementTree(root)
+
+    def _write(self, wall_time: Optional[float] = None, final: bool = False) -> None:
+        if self.path is None and not final:
+            return
+        with self._lock:
+            tree = self._build(wall_time)
+            ET.indent(tree)
+            if self.path is None:
+                tree.write(sys.stdout, encoding='unicode', xml_declaration=True)
+                sys.stdout.write('\n')
+                return
+            tmp_path = f"{self.path}.tmp"
+            tree.write(tmp_path, encoding='utf-8', xml_declaration=True)
+            os.replace(tmp_path, self.path)
+
+
+def create_reporter(output_format: str, output_path: Optional[str] = None):
+    """
+    Create a streaming reporter for --format, or None for text output.
+
+    Args:
+        output_format: "text", "json" or "junit"
+        output_path: File to write to (stdout if not given)
+    """
+    if output_format == 'json':
+        stream = open(output_path, 'w', encoding='utf-8') if output_path else sys.stdout
+        return JsonReporter(stream)
+    if output_format == 'junit':
+        return JUnitReporter(output_path)
+    return None
+
+
+# =============================================================================
+# Watch Mode
+# =============================================================================
+
+def scan_tree(root: str = '.') -> dict:
+    """
+    Snapshot the working tree for change detection.
+
+    Directories in WATCH_IGNORE_DIRS are not descended into.
+
+    Returns:
+        Mapping of relative path to (mtime_ns, size)
+    """
+    snapshot = {}
+    pending = [root]
+    while pending:
+        directory = pending.pop()
+        try:
+            entries = list(os.scandir(directory))
+        except OSError:
+            continue
+        for entry in entries:
+            try:
+                if entry.is_dir(follow_symlinks=False):
+                    if entry.name not in WATCH_IGNORE_DIRS:
+                        pending.append(entry.path)
+                elif entry.is_file():
+                    stat = entry.stat()
+                    path = os.path.relpath(entry.path, root).replace(os.sep, '/')
+                    snapshot[path] = (stat.st_mtime_ns, stat.st_size)
+            except OSError:
+                continue
+    return snapshot
+
+
+def diff_snapshots(before: dict, after: dict) -> list:
+    """Sorted paths added, removed or modified between two snapshots."""
+    changed = set(before.keys() ^ after.keys())
+    changed.update(path for path, stat in after.items()
+                   if path in before and before[path] != stat)
+    return sorted(changed)
+
+
+class WarmResults:
+    """
+    In-memory result store for --watch, used in place of ResultCache.
+
+    A check is reusable only when it declares ``paths`` or ``inputs``.
+    Its key covers the expanded command, working directory, relevant env
+    and the (mtime, size) of every matching file in the current tree
+    snapshot, so it re-runs exactly when one of its files changes. Unlike
+    the on-disk cache, failures are kept too: an unchanged failing check
+    fails again without being re-run.
+    """
+
+    def __init__(self):
+        self.snapshot = {}
+        self.hits = 0
+        self.misses = 0
+        self._results = {}
+        self._live = set()
+        self._lock = threading.Lock()
+
+    def start_run(self, snapshot: dict) -> None:
+        """Begin a run against a new tree snapshot."""
+        self.snapshot = snapshot
+        self.hits = self.misses = 0
+        self._live = set()
+
+    def make_key(self, check: dict, command: str, working_dir: str,
+                 env: dict, defaults: dict) -> Optional[str]:
+        """Compute the warm key for a check, or None if it always re-runs."""
+        path_filters = get_path_filters(check)
+        if not path_filters:
+            return None
+
+        matched = filter_changed_files(list(self.snapshot), path_filters)
+        payload = json.dumps({
+            'command': command,
+            'working_dir': str(Path(working_dir).resolve()),
+            'env': get_relevant_env(check, env, defaults),
+            'files': [[path, *self.snapshot[path]] for path in sorted(matched)],
+        }, sort_keys=True)
+        key = hashlib.sha256(payload.encode('utf-8')).hexdigest()
+        with self._lock:
+            self._live.add(key)
+        return key
+
+    def get(self, key: str) -> Optional[CheckResult]:
+        """Return a copy of the stored result for a key."""
+        with self._lock:
+            result = self._results.get(key)
+            if result is None:
+                self.misses += 1
+                return None
+            self.hits += 1
+        return replace(result, cached=True)
+
+    def put(self, key: str, result: CheckResult) -> None:
+        """Keep a completed result; skips and errors are always re-run."""
+        if result.status in (CheckStatus.SKIP, CheckStatus.ERROR):
+            return
+        with self._lock:
+            self._results[key] = result
+
+    def finish_run(self) -> None:
+        """Drop results that the run just finished no longer refers to."""
+        with self._lock:
+            for key in set(self._results) - self._live:
+                del self._results[key]
+
+
+def wait_for_changes(baseline: dict, interval: float, debounce: float) -> tuple:
+    """
+    Poll the working tree until it differs from baseline and settles.
+
+    After the first change is seen, the tree is rescanned every
+    ``debounce`` seconds until two consecutive scans agree, so a burst of
+    saves (editor, formatter, git checkout) triggers a single run.
+
+    Returns:
+        Tuple of (settled snapshot, changed paths)
+    """
+    while True:
+        time.sleep(interval)
+        current = scan_tree()
+        if diff_snapshots(baseline, current):
+            break
+
+    while True:
+        time.sleep(debounce)
+        settled = scan_tree()
+        if settled == current:
+            return settled, diff_snapshots(baseline, settled)
+        current = settled
+
+
+def watch_gates(gates: list, defaults: dict, verbose: bool = False,
+                interval: float = DEFAULT_WATCH_INTERVAL,
+                debounce: float = DEFAULT_WATCH_DEBOUNCE) -> int:
+    """
+    Re-run gates whenever the working tree changes, until interrupted.
+
+    Each run reuses the warm in-memory result of every check whose paths
+    or inputs did not change. Timing history, flake statistics and the
+    on-disk cache are not updated in watch mode.
+
+    Files written while a run is in progress only trigger another run if
+    they match some check's paths or inputs, so build artifacts and
+    reports produced by the checks themselves do not loop.
+
+    Returns:
+        Exit code of the last completed run
+    """
+    path_filters = sorted({
+        pattern for gate in gates for check in gate.get('checks', [])
+        for pattern in get_path_filters(check)
+    })
+    warm = WarmResults()
+    exit_code = 0
+    snapshot = scan_tree()
+    changed = []
+
+    try:
+        while True:
+            if changed:
+                shown = ', '.join(changed[:5]) + (', ...' if len(changed) > 5 else '')
+                print(f"\n[{datetime.now():%H:%M:%S}] {len(changed)} file(s) changed: {shown}")
+
+            warm.start_run(snapshot)
+            SKIP_CONDITIONS.clear()
+            prefetch_skip_conditions(gates, defaults)
+
+            run_start = time.time()
+            results = run_gates(
+                gates, defaults, verbose, CancelToken(), warm,
+                on_gate=lambda result: print(format_gate_result(result, verbose)),
+                announce=verbose
+            )
+            wall_time = time.time() - run_start
+            warm.finish_run()
+
+            exit_code = 1 if any(not r.passed and r.blocking for r in results) else 0
+            executed = sum(
+                1 for gate in results for check in gate.checks
+                if not check.cached and check.status != CheckStatus.SKIP
+            )
+            print(f"\n{'PASS' if exit_code == 0 else 'BLOCKED'} in {format_duration(wall_time)}: "
+                  f"{executed} check(s) run, {warm.hits} reused. Watching for changes...")
+
+            after_run = scan_tree()
+            changed = filter_changed_files(diff_snapshots(snapshot, after_run), path_filters)
+            if changed:
+                snapshot = after_run
+            else:
+                snapshot, changed = wait_for_changes(after_run, interval, debounce)
+    except KeyboardInterrupt:
+        print("\nStopped watching.")
+    finally:
+        HTTP_POOL.close()
+
+    return exit_code
+
+
+# =============================================================================
+# Fleet Execution
+# =============================================================================
+
+@dataclass
+class WorkspaceResult:
+    """Result of running the gates of one fleet workspace."""
+    name: str
+    path: str
+    exit_code: Optional[int]
+    results: list
+    duration: float
+    error: str = ""
+    skip_reason: str = ""
+
+    @property
+    def status(self) -> str:
+        if self.skip_reason:
+            return "SKIP"
+        if self.exit_code == 0:
+            return "PASS"
+        if self.exit_code == 1:
+            return "BLOCKED"
+        return "ERROR"
+
+
+def load_fleet_registry(path: str) -> list:
+    """
+    Read workspaces from a fleet registry (seo-fleet-registry.yaml).
+
+    Like install-fleet.sh this is a registry-specific reader, not a general
+    YAML parser: it reads ``name``, ``workspace`` and ``tier`` from the
+    entries under ``repos:``. Entries with a tier other than ``active``
+    are ignored.
+
+    Args:
+        path: Registry file path
+
+    Returns:
+        List of {'name', 'path'} dicts
+
+    Raises:
+        FileNotFoundError: If the registry does not exist
+    """
+    entries = []
+    current = None
+    in_repos = False
+
+    with open(os.path.expanduser(path), 'r', encoding='utf-8') as f:
+        for raw in f:
+            line = raw.rstrip('\n')
+            if line.startswith('repos:'):
+                in_repos = True
+                continue
+            if not in_repos:
+                continue
+            if line and not line.startswith(' '):
+                break
+
+            match = re.match(r'^\s*(-\s+)?(\w+):\s*(.*)$', line)
+            if not match:
+                continue
+            is_new, key, value = match.groups()
+            value = value.strip().strip('"').strip("'")
+            if is_new:
+                current = {}
+                entries.append(current)
+            if current is not None:
+                current[key] = value
+
+    return [
+        {'name': entry.get('name', entry['workspace']), 'path': os.path.expanduser(entry['workspace'])}
+        for entry in entries
+        if entry.get('workspace') and entry.get('tier', 'active') == 'active'
+    ]
+
+
+def discover_workspaces(root: str, config_name: str) -> list:
+    """
+    Find workspaces directly under root that have a gate configuration.
+
+    Returns:
+        List of {'name', 'path'} dicts, sorted by name
+    """
+    root_path = Path(os.path.expanduser(root))
+    return [
+        {'name': child.name, 'path': str(child)}
+        for child in sorted(root_path.iterdir())
+        if child.is_dir() and (child / config_name).is_file()
+    ]
+
+
+def parse_json_events(stream: str) -> list:
+    """Rebuild GateResult objects from a --format json event stream."""
+    checks = {}
+    results = []
+    for line in stream.splitlines():
+        try:
+            event = json.loads(line)
+        except ValueError:
+            continue
+        kind = event.get('event')
+        if kind == 'check':
+            checks.setdefault(event['gate'], []).append(check_result_from_dict(event))
+        elif kind == 'gate':
+            results.append(GateResult(
+                gate_id=event['gate'],
+                name=event.get('name', event['gate']),
+                gate_type=event.get('type', 'custom'),
+                phase=event.get('phase', 'unknown'),
+                trigger=event.get('trigger', 'manual'),
+                blocking=event.get('blocking', True),
+                checks=checks.get(event['gate'], []),
+                passed=event.get('passed', False),
+                duration=event.get('duration', 0.0),
+                timestamp=event.get('timestamp', ''),
+                parallel=event.get('parallel', False),
+                skip_reason=event.get('skip_reason', ''),
+                cancelled=event.get('outcome') == 'CANCELLED'
+            ))
+    return results
+
+
+def run_workspace(workspace: dict, config_name: str, passthrough: list) -> WorkspaceResult:
+    """
+    Run one workspace's gates in a child runner.
+
+    The child runs with the workspace as its working directory (so
+    relative commands and the .quality-gates/ state resolve there) and
+    reports through the JSON event stream.
+    """
+    config_path = os.path.join(workspace['path'], config_name)
+    if not os.path.isfile(config_path):
+        return WorkspaceResult(
+            name=workspace['name'], path=workspace['path'], exit_code=None,
+            results=[], duration=0.0, skip_reason=f"No {config_name}"
+        )
+
+    command = [
+        sys.executable, os.path.abspath(__file__),
+        '--config', config_name, '--format', 'json',
+    ] + passthrough
+
+    start_time = time.time()
+    try:
+        proc = subprocess.run(
+            command, cwd=workspace['path'], capture_output=True, text=True,
+            encoding='utf-8', errors='replace'
+        )
+    except OSError as e:
+        return WorkspaceResult(
+            name=workspace['name'], path=workspace['path'], exit_code=2,
+            results=[], duration=time.time() - start_time, error=str(e)
+        )
+
+    return WorkspaceResult(
+        name=workspace['name'],
+        path=workspace['path'],
+        exit_code=proc.returncode,
+        results=parse_json_events(proc.stdout),
+        duration=time.time() - start_time,
+        error='\n'.join(proc.stderr.strip().splitlines()[-10:])
+    )
+
+
+def run_fleet(workspaces: list, config_name: str, passthrough: list,
+              jobs: int = DEFAULT_FLEET_JOBS, on_complete=None) -> list:
+    """
+    Run the gates of many workspaces concurrently.
+
+    Args:
+        workspaces: List of {'name', 'path'} dicts
+        config_name: Gate config file name inside each workspace
+        passthrough: Extra runner arguments for every workspace
+        jobs: Maximum workspaces running at once
+        on_complete: Optional callable(WorkspaceResult) as each finishes
+
+    Returns:
+        List of WorkspaceResult in workspace order
+    """
+    results = [None] * len(workspaces)
+    with ThreadPoolExecutor(max_workers=max(1, min(jobs, len(workspaces)))) as executor:
+        futures = {
+            executor.submit(run_workspace, workspace, config_name, passthrough): index
+            for index, workspace in enumerate(workspaces)
+        }
+        for future in as_completed(futures):
+            result = future.result()
+            results[futures[future]] = result
+            if on_complete is not None:
+                on_complete(result)
+    return results
+
+
+def format_fleet_report(workspace_results: list, wall_time: float) -> str:
+    """Format the aggregated fleet report as markdown."""
+    lines = []
+    timestamp = datetime.now().strftime("%Y-%m-%d %H:%M")
+
+    counts = {}
+    for result in workspace_results:
+        counts[result.status] = counts.get(result.status, 0) + 1
+    total_time = sum(result.duration for result in workspace_results)
+
+    lines.append(f"## Fleet Quality Gate Report - {timestamp}")
+    lines.append("")
+    lines.append("### Summary")
+    lines.append(f"- **Workspaces**: {len(workspace_results)}")
+    for status in ("PASS", "BLOCKED", "ERROR", "SKIP"):
+        if counts.get(status):
+            lines.append(f"- **{status.capitalize()}**: {counts[status]}")
+    lines.append(f"- **Wall Time**: {format_duration(wall_time)}")
+    lines.append(f"- **Workspace Time**: {format_duration(total_time)} (sum of workspaces)")
+    lines.append("")
+
+    lines.append("| Workspace | Status | Gates Passed | Failed Checks | Duration |")
+    lines.append("|-----------|--------|--------------|---------------|----------|")
+    for result in workspace_results:
+        passed = sum(1 for gate in result.results if gate.outcome == "PASSED")
+        failed = sum(
+            1 for gate in result.results for check in gate.checks
+            if check.status in (CheckStatus.FAIL, CheckStatus.ERROR)
+        )
+        gates = f"{passed}/{len(result.results)}" if result.results else "-"
+        lines.append(
+            f"| {result.name} | {result.status} | {gates} | {failed} | "
+            f"{format_duration(result.duration)} |"
+        )
+    lines.append("")
+
+    for result in workspace_results:
+        if result.status == "PASS":
+            continue
+        lines.append(f"### {result.name} [{result.status}]")
+        lines.append(f"- **Path**: {result.path}")
+        if result.skip_reason:
+            lines.append(f"- **Reason**: {result.skip_reason}")
+        for gate in result.results:
+            failed = [c for c in gate.checks if c.status in (CheckStatus.FAIL, CheckStatus.ERROR)]
+            for check in failed:
+                lines.append(f"- **{gate.name} / {check.name}**: {check.status.value}, exit code {check.exit_code}")
+        if result.status == "ERROR" and result.error:
+            lines.append("")
+            lines.append("```")
+            lines.append(result.error)
+            lines.append("```")
         lines.append("")
 
     return '\n'.join(lines)
 
 
+def build_fleet_passthrough(args) -> list:
+    """Runner arguments forwarded to every workspace in fleet mode."""
+    passthrough = []
+    for flag, value in (('--gate', args.gate), ('--phase', args.phase),
+                        ('--since', args.since), ('--max-workers', args.max_workers)):
+        if value is not None:
+            passthrough += [flag, str(value)]
+    for flag, enabled in (('--parallel', args.parallel), ('--fail-fast', args.fail_fast),
+                          ('--cache', args.cache), ('--no-cache', args.no_cache)):
+        if enabled:
+            passthrough.append(flag)
+    return passthrough
+
+
+def fleet_main(args) -> int:
+    """
+    Entry point for --fleet-root / --fleet-registry.
+
+    Returns:
+        0 if every workspace passed or was skipped, 1 if any workspace was
+        blocked, 2 if any workspace errored or the fleet could not be read
+    """
+    try:
+        if args.fleet_registry:
+            workspaces = load_fleet_registry(args.fleet_registry)
+        else:
+            workspaces = discover_workspaces(args.fleet_root, args.config)
+    except OSError as e:
+        print(f"Error: Cannot read fleet: {e}", file=sys.stderr)
+        return 2
+
+    if not workspaces:
+        print("Error: No workspaces found", file=sys.stderr)
+        return 2
+
+    def report_progress(result: WorkspaceResult) -> None:
+        if not args.report_only:
+            detail = result.skip_reason or format_duration(result.duration)
+            print(f"[{result.status:<7}] {result.name} ({detail})", flush=True)
+
+    if not args.report_only:
+        print(f"Running gates for {len(workspaces)} workspace(s), "
+              f"{args.fleet_jobs} at a time...\n")
+
+    start_time = time.time()
+    workspace_results = run_fleet(
+        workspaces, args.config, build_fleet_passthrough(args),
+        args.fleet_jobs, report_progress
+    )
+    wall_time = time.time() - start_time
+
+    if not args.report_only:
+        print("")
+    print(format_fleet_report(workspace_results, wall_time))
+
+    statuses = {result.status for result in workspace_results}
+    if "ERROR" in statuses:
+        return 2
+    if "BLOCKED" in statuses:
+        return 1
+    return 0
+
+
 # =============================================================================
 # Main Entry Point
 # =============================================================================
@@ -583,7 +3247,12 @@ def main() -> int:
 Examples:
   python run-gates.py --config .quality-gates.json --phase implementation
   python run-gates.py --gate pre-deploy --verbose
+  python run-gates.py --phase implementation --parallel --max-workers 4
+  python run-gates.py --phase foundation --since origin/main
   python run-gates.py --list
+  python run-gates.py --history
+  python run-gates.py --phase implementation --watch
+  python run-gates.py --fleet-root ~/SEO-Agents --fleet-jobs 6 --phase implementation
   python run-gates.py --report-only > gate-report.md
         """
     )
@@ -610,18 +3279,141 @@ Examples:
         help='List all available gates and exit'
     )
 
+    parser.add_argument(
+        '--profile',
+        action='store_true',
+        help='Print per-check CPU, wait time and peak memory after the run'
+    )
+
+    parser.add_argument(
+        '--dry-run',
+        action='store_true',
+        help='Show which checks of the selected gates would run or be skipped, then exit'
+    )
+
+    parser.add_argument(
+        '--watch',
+        action='store_true',
+        help='Re-run the selected gates whenever files change, reusing '
+             'unchanged check results'
+    )
+
+    parser.add_argument(
+        '--watch-interval',
+        type=float,
+        default=DEFAULT_WATCH_INTERVAL,
+        help=f'Seconds between working tree scans in --watch (default: {DEFAULT_WATCH_INTERVAL})'
+    )
+
+    parser.add_argument(
+        '--watch-debounce',
+        type=float,
+        default=DEFAULT_WATCH_DEBOUNCE,
+        help=f'Quiet period before a --watch re-run (default: {DEFAULT_WATCH_DEBOUNCE})'
+    )
+
+    parser.add_argument(
+        '--fleet-root',
+        nargs='?',
+        const=DEFAULT_FLEET_ROOT,
+        metavar='DIR',
+        help=f'Fleet mode: run every workspace under DIR that has a gate config '
+             f'(default DIR: {DEFAULT_FLEET_ROOT})'
+    )
+
+    parser.add_argument(
+        '--fleet-registry',
+        metavar='FILE',
+        help='Fleet mode: run the active workspaces listed in a fleet registry YAML'
+    )
+
+    parser.add_argument(
+        '--fleet-jobs',
+        type=int,
+        default=DEFAULT_FLEET_JOBS,
+        help=f'Maximum workspaces run concurrently in fleet mode (default: {DEFAULT_FLEET_JOBS})'
+    )
+
+    parser.add_argument(
+        '--history',
+        action='store_true',
+        help='Show per-check duration percentiles and regressions, then exit'
+    )
+
+    parser.add_argument(
+        '--history-window',
+        type=int,
+        default=DEFAULT_HISTORY_WINDOW,
+        help=f'Recent runs included in --history (default: {DEFAULT_HISTORY_WINDOW})'
+    )
+
+    parser.add_argument(
+        '--regression-threshold',
+        type=float,
+        default=DEFAULT_REGRESSION_THRESHOLD,
+        help='Relative slowdown flagged as a regression (default: 0.5 = 50%%)'
+    )
+
     parser.add_argument(
         '--verbose', '-v',
         action='store_true',
         help='Enable verbose output'
     )
 
+    parser.add_argument(
+        '--parallel',
+        action='store_true',
+        help='Run independent checks and gates concurrently (overrides parallel_checks/parallel_gates)'
+    )
+
+    parser.add_argument(
+        '--max-workers',
+        type=int,
+        help=f'Maximum concurrent checks when parallel (default: {DEFAULT_MAX_WORKERS})'
+    )
+
+    parser.add_argument(
+        '--fail-fast',
+        action='store_true',
+        help='Cancel remaining checks after the first blocking failure (overrides fail_fast)'
+    )
+
+    parser.add_argument(
+        '--since',
+        metavar='GIT_REF',
+        help='Incremental mode: only run checks whose paths changed since GIT_REF'
+    )
+
+    parser.add_argument(
+        '--cache',
+        action='store_true',
+        help='Reuse passing results of checks whose declared inputs are unchanged'
+    )
+
+    parser.add_argument(
+        '--no-cache',
+        action='store_true',
+        help='Disable the result cache even if enabled in the config'
+    )
+
     parser.add_argument(
         '--report-only',
         action='store_true',
         help='Output markdown report only (for progress.md)'
     )
 
+    parser.add_argument(
+        '--format', '-f',
+        choices=['text', 'json', 'junit'],
+        default='text',
+        help='Machine-readable output written as checks complete (default: text)'
+    )
+
+    parser.add_argument(
+        '--output', '-o',
+        help='Write --format json/junit output to this file instead of stdout'
+    )
+
     parser.add_argument(
         '--version',
         action='version',
@@ -630,6 +3422,24 @@ Examples:
 
     args = parser.parse_args()
 
+    # Machine-readable output on stdout replaces all console output
+    machine_stdout = args.format != 'text' and not args.output
+    quiet = args.report_only or machine_stdout
+    if machine_stdout:
+        args.verbose = False
+
+    # Fleet mode: --config names the config file inside each workspace
+    if args.fleet_root or args.fleet_registry:
+        return fleet_main(args)
+
+    history_path = os.path.join(DEFAULT_STATE_DIR, 'history.jsonl')
+
+    # History mode
+    if args.history:
+        runs = load_history(history_path, args.history_window)
+        print(format_history(analyze_history(runs, args.regression_threshold), len(runs)))
+        return 0
+
     # Load configuration
     try:
         config = load_gate_config(args.config)
@@ -644,14 +3454,40 @@ Examples:
         print(f"Error: Invalid configuration: {e}", file=sys.stderr)
         return 2
 
+    # Get defaults
+    defaults = dict(config.get('defaults', config.get('global_options', {})))
+
+    if args.parallel:
+        defaults['parallel_checks'] = True
+        defaults['parallel_gates'] = True
+    if args.max_workers is not None:
+        defaults['max_workers'] = args.max_workers
+    if args.fail_fast:
+        defaults['fail_fast'] = True
+    if args.cache:
+        cache_options = defaults.get('cache')
+        if isinstance(cache_options, dict):
+            defaults['cache'] = dict(cache_options, enabled=True)
+        else:
+            defaults['cache'] = True
+    if args.no_cache:
+        defaults['cache'] = False
+
+    if args.since:
+        try:
+            defaults['changed_files'] = get_changed_files(args.since)
+        except RuntimeError as e:
+            print(f"Error: Could not compute changes since '{args.since}': {e}", file=sys.stderr)
+            return 2
+        if not quiet:
+            print(f"Incremental mode: {len(defaults['changed_files'])} file(s) changed since {args.since}")
+
     # List mode
     if args.list:
-        print(list_gates(config))
+        prefetch_skip_conditions(config.get('gates', []), defaults)
+        print(list_gates(config, defaults=defaults))
         return 0
 
-    # Get defaults
-    defaults = config.get('defaults', config.get('global_options', {}))
-
     # Filter gates
     gates = config.get('gates', [])
 
@@ -671,22 +3507,76 @@ Examples:
         print("Error: No gates to run", file=sys.stderr)
         return 2
 
-    # Run gates
-    results = []
+    # Evaluate all skip conditions up front, concurrently and deduplicated
+    prefetch_skip_conditions(gates, defaults)
 
-    for gate in gates:
-        if not args.report_only:
-            print(f"\nRunning gate: {gate.get('name', gate.get('id'))}...\n")
+    # Dry-run mode
+    if args.dry_run:
+        print(list_gates(config, gates, defaults, title="Dry Run - planned checks:"))
+        return 0
 
-        result = run_gate(gate, defaults, args.verbose)
-        results.append(result)
+    if args.watch:
+        return watch_gates(gates, defaults, args.verbose, args.watch_interval,
+                           args.watch_debounce)
 
-        if not args.report_only:
+    cancel = CancelToken()
+    cache = ResultCache.from_options(defaults)
+
+    try:
+        reporter = create_reporter(args.format, args.output)
+    except OSError as e:
+        print(f"Error: Cannot write {args.format} output: {e}", file=sys.stderr)
+        return 2
+    if reporter is not None:
+        reporter.start(config)
+
+    def print_gate(result: GateResult) -> None:
+        if reporter is not None:
+            reporter.gate(result)
+        if not quiet:
             print(format_gate_result(result, args.verbose))
 
+    run_start = time.time()
+    results = run_gates(
+        gates, defaults, args.verbose, cancel, cache,
+        reporter.check if reporter is not None else None,
+        print_gate, announce=not quiet
+    )
+    wall_time = time.time() - run_start
+
+    flake_stats = FlakeStats(os.path.join(DEFAULT_STATE_DIR, 'flake-stats.json'))
+    if flake_stats.record(results):
+        try:
+            flake_stats.save()
+        except OSError as e:
+            print(f"Warning: Could not save flake statistics: {e}", file=sys.stderr)
+
+    if defaults.get('history', True):
+        try:
+            append_history(history_path, results, wall_time,
+                           int(defaults.get('history_max_runs', DEFAULT_HISTORY_MAX_RUNS)))
+            stats = analyze_history(load_history(history_path, args.history_window),
+                                    args.regression_threshold)
+            regressed = [item['key'] for item in stats if item['regressed']]
+            if regressed and not quiet:
+                print(f"\nRuntime regression in: {', '.join(regressed)} "
+                      f"(see --history)")
+        except OSError as e:
+            print(f"Warning: Could not update gate history: {e}", file=sys.stderr)
+
+    HTTP_POOL.close()
+
+    if cache is not None:
+        cache.evict()
+        if args.verbose and not quiet:
+            print(f"\nResult cache: {cache.hits} hit(s), {cache.misses} miss(es)")
+
+    if args.profile and not quiet:
+        print("\n" + format_profile(results))
+
     # Output report
-    if args.report_only or len(results) > 1:
-        report = format_report(results, config)
+    if (args.report_only or len(results) > 1) and not machine_stdout:
+        report = format_report(results, config, wall_time, flake_stats)
         if args.report_only:
             print(report)
         elif args.verbose:
@@ -700,11 +3590,12 @@ Examples:
         r for r in results
         if not r.passed and r.blocking
     ]
+    exit_code = 1 if blocking_failures else 0
 
-    if blocking_failures:
-        return 1
+    if reporter is not None:
+        reporter.finish(results, wall_time, exit_code)
 
-    return 0
+    return exit_code
 
 
 if __name__ == '__main__':
@@ -0,0 +1,89 @@
+"""Shared fixtures for the gate runner tests."""
+
+import importlib.util
+import json
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+RUNNER = Path(__file__).resolve().parent.parent / 'run-gates.py'
+
+
+def load_runner():
+    """Import run-gates.py (not a valid module name) as ``run_gates``."""
+    spec = importlib.util.spec_from_file_location('run_gates', RUNNER)
+    module = importlib.util.module_from_spec(spec)
+    sys.modules['run_gates'] = module
+    spec.loader.exec_module(module)
+    return module
+
+
+@pytest.fixture(scope='session')
+def rg():
+    return load_runner()
+
+
+@pytest.fixture(autouse=True)
+def fresh_skip_conditions(rg):
+    rg.SKIP_CONDITIONS.clear()
+    yield
+    rg.SKIP_CONDITIONS.clear()
+
+
+@pytest.fixture(autouse=True)
+def workspace(tmp_path, monkeypatch):
+    """Temporary working directory for every test; runner state lands in its .quality-gates/."""
+    monkeypatch.chdir(tmp_path)
+    return tmp_path
+
+
+def check(name: str, command: str, **options) -> dict:
+    """Check configuration with the given name and command."""
+    return {'id': name, 'name': name, 'type': 'custom', 'command': command, **options}
+
+
+def gate(name: str, checks: list, **options) -> dict:
+    """Gate configuration with the given checks."""
+    return {'name': name, 'phase': 'test', 'checks': checks, **options}
+
+
+@pytest.fixture
+def write_config(workspace):
+    """Write a gate config into the workspace and return its path."""
+    def write(gates: list, defaults: dict = None, name: str = '.quality-gates.json',
+              directory: Path = None) -> Path:
+        config = {'version': '1.0', 'name': 'test', 'gates': gates}
+        if defaults is not None:
+            config['defaults'] = defaults
+        path = (directory or workspace) / name
+        path.write_text(json.dumps(config), encoding='utf-8')
+        return path
+    return write
+
+
+@pytest.fixture
+def run_cli(workspace):
+    """Run run-gates.py in the workspace and return the CompletedProcess."""
+    def run(*args, cwd: Path = None, timeout: float = 60) -> subprocess.CompletedProcess:
+        return subprocess.run(
+            [sys.executable, str(RUNNER), *map(str, args)],
+            cwd=cwd or workspace, capture_output=True, text=True, timeout=timeout
+        )
+    return run
+
+
+@pytest.fixture
+def run_json(run_cli):
+    """Run with --format json and return (CompletedProcess, events)."""
+    def run(*args, **kwargs) -> tuple:
+        proc = run_cli('--format', 'json', *args, **kwargs)
+        events = [json.loads(line) for line in proc.stdout.splitlines() if line.strip()]
+        return proc, events
+    return run
+
+
+def check_events(events: list) -> dict:
+    """Map ``<gate>/<check name>`` to its check event."""
+    return {f"{e['gate']}/{e['name']}": e for e in events if e['event'] == 'check'}
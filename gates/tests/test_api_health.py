@@ -0,0 +1,113 @@
+"""api_health checks against a local stand-in HTTP server."""
+
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+
+class StandIn(BaseHTTPRequestHandler):
+    """Serves queued (status, body) responses, then repeats the last one."""
+
+    protocol_version = 'HTTP/1.1'  # keep-alive
+
+    def do_GET(self):
+        server = self.server
+        with server.lock:
+            server.clients.append(self.client_address)
+            status, body = server.responses[0] if len(server.responses) == 1 \
+                else server.responses.pop(0)
+        data = body.encode('utf-8')
+        self.send_response(status)
+        self.send_header('Content-Type', 'text/plain; charset=utf-8')
+        self.send_header('Content-Length', str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
+
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture
+def server(rg):
+    httpd = ThreadingHTTPServer(('127.0.0.1', 0), StandIn)
+    httpd.daemon_threads = True
+    httpd.lock = threading.Lock()
+    httpd.clients = []
+    httpd.responses = [(200, 'status: ok')]
+    httpd.url = f"http://127.0.0.1:{httpd.server_address[1]}/health"
+    thread = threading.Thread(target=httpd.serve_forever, daemon=True)
+    thread.start()
+    yield httpd
+    rg.HTTP_POOL.close()
+    httpd.shutdown()
+    httpd.server_close()
+
+
+def health_check(url: str, **options) -> dict:
+    return {'id': 'health', 'type': 'api_health', 'url': url, 'interval': 0.05,
+            'timeout': 5, **options}
+
+
+def test_passing_probe(rg, server):
+    result = rg.run_check(health_check(server.url, expected={'status': 200, 'contains': 'ok'}), {})
+    assert result.status == rg.CheckStatus.PASS
+    assert result.exit_code == 200
+    assert result.metrics['probes'] == 1
+    assert result.command == f"GET {server.url}"
+
+
+def test_body_contains_mismatch(rg, server):
+    server.responses = [(200, 'status: degraded')]
+    result = rg.run_check(health_check(server.url, expected={'contains': 'ok'}, timeout=0.5), {})
+    assert result.status == rg.CheckStatus.FAIL
+    assert "Response does not contain 'ok'" in result.error
+    assert result.metrics['probes'] > 1
+
+
+def test_recovers_after_initial_503(rg, server):
+    server.responses = [(503, 'starting'), (503, 'starting'), (200, 'ok')]
+    result = rg.run_check(health_check(server.url, expected={'status': 200}), {})
+    assert result.status == rg.CheckStatus.PASS
+    assert result.metrics['probes'] == 3
+
+
+def test_check_retry_after_503(rg, server, monkeypatch):
+    # One probe per attempt: check-level retries carry on past the 503s
+    server.responses = [(503, 'starting')] * 2 + [(200, 'ok')]
+    attempts = []
+    real_probe = rg.probe_health
+
+    def one_probe(url, check, timeout, cancel=None):
+        attempts.append(timeout)
+        return real_probe(url, check, 0, cancel)
+
+    monkeypatch.setattr(rg, 'probe_health', one_probe)
+    result = rg.run_check(health_check(server.url, retry=3, retry_delay=0.01), {})
+    assert result.status == rg.CheckStatus.PASS
+    assert [a['status'] for a in result.attempts] == ['fail', 'fail', 'pass']
+    assert attempts[0] > attempts[-1]  # retries only get the remaining time
+
+
+def test_connection_reused_across_polls(rg, server):
+    server.responses = [(503, 'starting')] * 4 + [(200, 'ok')]
+    rg.run_check(health_check(server.url), {})
+    rg.run_check(health_check(server.url), {})
+    assert len(server.clients) == 6
+    assert len(set(server.clients)) == 1
+
+
+def test_timeout_caps_retries(rg, server):
+    server.responses = [(503, 'down')]
+    start = time.time()
+    result = rg.run_check(health_check(server.url, timeout=0.5, retry=5, retry_delay=0.05), {})
+    assert result.status == rg.CheckStatus.FAIL
+    assert time.time() - start < 1.5
+    assert len(result.attempts) == 1
+
+
+def test_invalid_url_is_an_error(rg):
+    result = rg.run_check(health_check('ftp://example.invalid/'), {})
+    assert result.status == rg.CheckStatus.ERROR
+    assert "Unsupported URL" in result.error
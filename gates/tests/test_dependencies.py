@@ -0,0 +1,81 @@
+"""needs: dependency DAG between checks and between gates."""
+
+import pytest
+
+from conftest import check, check_events, gate
+
+
+def test_graph_skips_transitive_dependants(rg):
+    # a <- b <- c, and d independent
+    items = ['a', 'b', 'c', 'd']
+    edges = [[], [0], [1], []]
+    executed = []
+
+    def execute(item):
+        executed.append(item)
+        return 'fail' if item == 'a' else 'ok'
+
+    results = rg.run_dependency_graph(
+        items, edges, execute, lambda item, failed: f"skip:{failed}",
+        lambda result: result == 'fail'
+    )
+    assert results == ['fail', 'skip:a', 'skip:a', 'ok']
+    assert executed == ['a', 'd']
+
+
+def test_check_chain_stops_after_failure(rg):
+    checks = [
+        check('a', 'exit 1'),
+        check('b', 'echo b', needs=['a']),
+        check('c', 'echo c', needs=['b']),
+    ]
+    results = rg.run_checks(checks, {})
+    assert [r.status for r in results] == [rg.CheckStatus.FAIL] + [rg.CheckStatus.SKIP] * 2
+    assert results[2].skip_reason == "Dependency 'a' failed"
+
+
+def test_skip_if_skip_does_not_block_dependants(rg):
+    checks = [check('a', 'true', skip_if='true'), check('b', 'true', needs=['a'])]
+    results = rg.run_checks(checks, {})
+    assert [r.status for r in results] == [rg.CheckStatus.SKIP, rg.CheckStatus.PASS]
+
+
+def test_dependant_waits_for_all_needs(rg, workspace):
+    checks = [
+        check('slow', 'sleep 0.3; echo slow >> order'),
+        check('fast', 'echo fast >> order'),
+        check('last', 'echo last >> order', needs=['slow', 'fast']),
+    ]
+    rg.run_checks(checks, {'parallel_checks': True, 'max_workers': 3})
+    assert (workspace / 'order').read_text().split()[-1] == 'last'
+
+
+def test_gate_chain_stops_after_failure(write_config, run_json):
+    write_config([
+        gate('a', [check('x', 'exit 1')]),
+        gate('b', [check('x', 'true')], needs=['a']),
+        gate('c', [check('x', 'echo ran > c-ran')], needs=['b']),
+    ])
+    proc, events = run_json()
+    assert proc.returncode == 1
+    checks = check_events(events)
+    assert checks['b/x']['status'] == 'skip'
+    assert checks['c/x']['status'] == 'skip'
+    assert checks['c/x']['skip_reason'] == "Dependency gate 'a' failed"
+    outcomes = {e['gate']: e['outcome'] for e in events if e['event'] == 'gate'}
+    assert outcomes == {'a': 'FAILED', 'b': 'SKIPPED', 'c': 'SKIPPED'}
+
+
+def test_cycles_are_rejected(write_config, run_cli):
+    write_config([gate('g', [
+        check('a', 'true', needs=['b']),
+        check('b', 'true', needs=['a']),
+    ])])
+    proc = run_cli()
+    assert proc.returncode == 2
+    assert "Dependency cycle in gate 'g'" in proc.stderr
+
+
+def test_unknown_need_is_rejected(rg):
+    with pytest.raises(ValueError, match="needs unknown check 'missing'"):
+        rg.validate_dependencies({'gates': [gate('g', [check('a', 'true', needs='missing')])]})
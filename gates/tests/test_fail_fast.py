@@ -0,0 +1,173 @@
+"""fail_fast cancellation and process group cleanup."""
+
+import os
+import signal
+import subprocess
+import threading
+import time
+
+import pytest
+
+from conftest import check, gate
+
+
+def alive(pid: int) -> bool:
+    """Whether a process is running (zombies count as gone)."""
+    try:
+        with open(f"/proc/{pid}/stat", 'r') as f:
+            return f.read().rsplit(')', 1)[1].split()[0] != 'Z'
+    except FileNotFoundError:
+        return False
+    except OSError:
+        pass
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    return True
+
+
+def gone(pid: int, timeout: float = 2.0) -> bool:
+    """Whether a process exits within timeout (signals land asynchronously)."""
+    deadline = time.time() + timeout
+    while alive(pid):
+        if time.time() >= deadline:
+            return False
+        time.sleep(0.02)
+    return True
+
+
+def wait_for_file(path, timeout: float = 5.0) -> str:
+    deadline = time.time() + timeout
+    while time.time() < deadline:
+        if path.exists() and path.read_text().strip():
+            return path.read_text().strip()
+        time.sleep(0.02)
+    raise AssertionError(f"{path} was not written")
+
+
+def test_fail_fast_skips_pending_checks(rg):
+    cancel = rg.CancelToken()
+    checks = [check('broken', 'exit 1'), check('later', 'echo never')]
+    results = rg.run_checks(checks, {}, cancel=cancel, fail_fast=True)
+    assert results[0].status == rg.CheckStatus.FAIL
+    assert results[1].status == rg.CheckStatus.SKIP
+    assert results[1].cancelled
+    assert "fail-fast" in cancel.reason
+
+
+def test_fail_fast_stops_in_flight_check(rg):
+    cancel = rg.CancelToken()
+    checks = [check('slow', 'sleep 30'), check('broken', 'sleep 0.2; exit 1')]
+    start = time.time()
+    results = rg.run_checks(checks, {'parallel_checks': True, 'max_workers': 2},
+                            cancel=cancel, fail_fast=True)
+    assert time.time() - start < 10
+    assert results[0].status == rg.CheckStatus.SKIP
+    assert results[0].cancelled
+    assert results[0].skip_reason.startswith("Cancelled while running")
+
+
+def test_without_fail_fast_every_check_runs(rg):
+    results = rg.run_checks([check('broken', 'exit 1'), check('later', 'true')], {},
+                            cancel=rg.CancelToken())
+    assert [r.status for r in results] == [rg.CheckStatus.FAIL, rg.CheckStatus.PASS]
+
+
+def test_cancelled_gate_is_not_reported_passed(rg):
+    cancel = rg.CancelToken()
+    gates = [gate('first', [check('broken', 'exit 1')]), gate('second', [check('ok', 'true')])]
+    results = rg.run_gates(gates, {'fail_fast': True, 'log_dir': None}, cancel=cancel,
+                           announce=False)
+    assert results[0].outcome == "FAILED"
+    assert results[1].outcome == "CANCELLED"
+    assert "RESULT: CANCELLED" in rg.format_gate_result(results[1])
+    report = rg.format_report(results, {})
+    assert "### Gate: second [CANCELLED]" in report
+    assert "**Gates Passed**: 0/2" in report
+
+
+def test_cli_reports_cancelled_gate(write_config, run_cli):
+    write_config([gate('first', [check('broken', 'exit 1')]),
+                  gate('second', [check('ok', 'true')])])
+    proc = run_cli('--fail-fast')
+    assert proc.returncode == 1
+    assert "RESULT: CANCELLED" in proc.stdout
+    assert "RESULT: PASSED" not in proc.stdout
+
+
+def test_cancel_kills_background_children(rg, workspace):
+    pid_file = workspace / 'child.pid'
+    cancel = rg.CancelToken()
+    result = {}
+
+    def run():
+        try:
+            rg.execute_command(f"sleep 60 & echo $! > {pid_file}; wait", 30, str(workspace),
+                               dict(os.environ), cancel)
+        except rg.CheckCancelled:
+            result['cancelled'] = True
+
+    thread = threading.Thread(target=run)
+    thread.start()
+    child = int(wait_for_file(pid_file))
+    cancel.cancel("test")
+    thread.join(10)
+    assert result.get('cancelled')
+    assert gone(child)
+
+
+def test_background_process_survives_normal_exit(rg, workspace):
+    pid_file = workspace / 'child.pid'
+    start = time.time()
+    result = rg.execute_command(f"sleep 60 > /dev/null 2>&1 & echo $! > {pid_file}", 30,
+                                str(workspace), dict(os.environ))
+    assert result.returncode == 0
+    assert time.time() - start < rg.TERMINATE_GRACE
+    pid = int(pid_file.read_text())
+    try:
+        assert not gone(pid, timeout=0.5)
+    finally:
+        os.kill(pid, signal.SIGKILL)
+
+
+def test_background_process_holding_pipe_does_not_block(rg, workspace, monkeypatch):
+    monkeypatch.setattr(rg, 'TERMINATE_GRACE', 0.3)
+    pid_file = workspace / 'child.pid'
+    log = workspace / 'logs' / 'check.log'
+    result = rg.execute_command(f"echo done; sleep 60 & echo $! > {pid_file}", 30,
+                                str(workspace), dict(os.environ), log_path=str(log))
+    pid = int(pid_file.read_text())
+    try:
+        assert result.returncode == 0
+        assert result.stdout == "done\n"
+        assert "done" in log.read_text()
+    finally:
+        os.kill(pid, signal.SIGKILL)
+
+
+def test_interrupt_without_log_dir_cleans_up(rg, workspace, monkeypatch):
+    pid_file = workspace / 'child.pid'
+    real_wait = rg.wait_with_rusage
+
+    def interrupted(proc, timeout):
+        wait_for_file(pid_file)
+        raise KeyboardInterrupt
+
+    monkeypatch.setattr(rg, 'wait_with_rusage', interrupted)
+    with pytest.raises(KeyboardInterrupt):
+        rg.execute_command(f"sleep 60 & echo $! > {pid_file}; wait", 30, str(workspace),
+                           dict(os.environ), log_path=None)
+    monkeypatch.setattr(rg, 'wait_with_rusage', real_wait)
+    assert gone(int(pid_file.read_text()))
+
+
+def test_terminate_escalates_and_reaps(rg, monkeypatch):
+    monkeypatch.setattr(rg, 'TERMINATE_GRACE', 0.3)
+    proc = subprocess.Popen(["sh", "-c", "trap '' TERM; echo ready; sleep 60"],
+                            stdout=subprocess.PIPE, text=True, start_new_session=True)
+    assert proc.stdout.readline().strip() == 'ready'
+    rg.terminate_process_group(proc)
+    proc.stdout.close()
+    assert proc.returncode is not None
+    assert gone(proc.pid)
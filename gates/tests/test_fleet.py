@@ -0,0 +1,98 @@
+"""Fleet mode: running the gates of many workspaces in one invocation."""
+
+import pytest
+
+from conftest import check, gate
+
+
+@pytest.fixture
+def fleet(workspace, write_config):
+    """Fleet root with passing, blocked and unconfigured workspaces."""
+    root = workspace / 'fleet'
+    for name in ('alpha', 'beta', 'plain'):
+        (root / name).mkdir(parents=True)
+    write_config([gate('g', [check('ok', 'test -f marker || touch marker')])], directory=root / 'alpha')
+    write_config([gate('g', [check('bad', 'echo nope; exit 1')])], directory=root / 'beta')
+    (root / 'notes.txt').write_text('')
+    return root
+
+
+def test_discover_workspaces(rg, fleet):
+    workspaces = rg.discover_workspaces(str(fleet), '.quality-gates.json')
+    assert [w['name'] for w in workspaces] == ['alpha', 'beta']
+    assert workspaces[0]['path'] == str(fleet / 'alpha')
+
+
+def test_registry_reader(rg, workspace):
+    registry = workspace / 'registry.yaml'
+    registry.write_text(
+        "version: 1\n"
+        "repos:\n"
+        "  - name: alpha\n"
+        "    workspace: \"/srv/alpha\"\n"
+        "    tier: active\n"
+        "  - name: old\n"
+        "    workspace: /srv/old\n"
+        "    tier: archived\n"
+        "  - workspace: '~/gamma'\n"
+        "settings:\n"
+        "  - name: ignored\n"
+        "    workspace: /srv/ignored\n"
+    )
+    workspaces = rg.load_fleet_registry(str(registry))
+    assert [w['name'] for w in workspaces] == ['alpha', '~/gamma']
+    assert workspaces[0]['path'] == '/srv/alpha'
+    assert not workspaces[1]['path'].startswith('~')
+
+
+def test_run_workspace_parses_child_events(rg, fleet):
+    alpha = rg.run_workspace({'name': 'alpha', 'path': str(fleet / 'alpha')},
+                             '.quality-gates.json', [])
+    assert alpha.status == 'PASS'
+    assert [g.outcome for g in alpha.results] == ['PASSED']
+    assert (fleet / 'alpha' / 'marker').exists()  # ran with the workspace as cwd
+
+    beta = rg.run_workspace({'name': 'beta', 'path': str(fleet / 'beta')},
+                            '.quality-gates.json', [])
+    assert beta.status == 'BLOCKED'
+    assert beta.results[0].checks[0].status == rg.CheckStatus.FAIL
+
+    plain = rg.run_workspace({'name': 'plain', 'path': str(fleet / 'plain')},
+                             '.quality-gates.json', [])
+    assert plain.status == 'SKIP'
+
+
+def test_fleet_root_report_and_exit_code(run_cli, fleet):
+    proc = run_cli('--fleet-root', fleet, '--fleet-jobs', '2')
+    assert proc.returncode == 1
+    assert "Running gates for 2 workspace(s), 2 at a time" in proc.stdout
+    assert "| alpha | PASS | 1/1 | 0 |" in proc.stdout
+    assert "| beta | BLOCKED | 0/1 | 1 |" in proc.stdout
+    assert "**g / bad**: fail, exit code 1" in proc.stdout
+
+
+def test_fleet_passes_when_all_pass(run_cli, fleet):
+    proc = run_cli('--fleet-root', fleet, '--report-only')
+    assert "| alpha |" in proc.stdout
+    assert "Running gates" not in proc.stdout
+
+    (fleet / 'beta' / '.quality-gates.json').unlink()
+    proc = run_cli('--fleet-root', fleet)
+    assert proc.returncode == 0
+    assert "Workspaces**: 1" in proc.stdout
+
+
+def test_fleet_errors(run_cli, workspace, fleet):
+    (workspace / 'empty').mkdir()
+    proc = run_cli('--fleet-root', workspace / 'empty')
+    assert proc.returncode == 2
+    assert "No workspaces found" in proc.stderr
+
+    proc = run_cli('--fleet-registry', workspace / 'missing.yaml')
+    assert proc.returncode == 2
+    assert "Cannot read fleet" in proc.stderr
+
+    (fleet / 'beta' / '.quality-gates.json').write_text('{not json')
+    proc = run_cli('--fleet-root', fleet)
+    assert proc.returncode == 2
+    assert "| beta | ERROR |" in proc.stdout
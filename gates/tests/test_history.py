@@ -0,0 +1,84 @@
+"""JSONL timing history, regression flagging and the --history view."""
+
+import json
+
+from conftest import check, gate
+
+
+def run_record(**durations) -> dict:
+    return {'ts': '2026-01-01T00:00:00', 'wall': 1.0,
+            'checks': {key: ['pass', value] for key, value in durations.items()}}
+
+
+def test_cli_run_appends_history(write_config, run_cli, workspace):
+    write_config([gate('g', [check('fast', 'true'), check('skipped', 'true', skip_if='true')])])
+    assert run_cli().returncode == 0
+    assert run_cli().returncode == 0
+
+    lines = (workspace / '.quality-gates' / 'history.jsonl').read_text().splitlines()
+    assert len(lines) == 2
+    run = json.loads(lines[-1])
+    assert set(run) == {'ts', 'wall', 'checks'}
+    assert list(run['checks']) == ['g/fast']
+    assert run['checks']['g/fast'][0] == 'pass'
+
+
+def test_history_can_be_disabled(write_config, run_cli, workspace):
+    write_config([gate('g', [check('c', 'true')])], defaults={'history': False})
+    assert run_cli().returncode == 0
+    assert not (workspace / '.quality-gates' / 'history.jsonl').exists()
+
+
+def test_history_is_trimmed(rg, workspace):
+    path = workspace / 'history.jsonl'
+    for _ in range(13):
+        rg.append_history(str(path), [], 1.0, max_runs=10)
+    assert len(path.read_text().splitlines()) == 10
+
+
+def test_malformed_lines_are_ignored(rg, workspace):
+    path = workspace / 'history.jsonl'
+    path.write_text(json.dumps(run_record(a=1)) + '\n{broken\n' + json.dumps(run_record(a=2)) + '\n')
+    assert [run['checks']['a'][1] for run in rg.load_history(str(path))] == [1, 2]
+    assert len(rg.load_history(str(path), limit=1)) == 1
+    assert rg.load_history(str(workspace / 'missing.jsonl')) == []
+
+
+def test_regression_is_flagged(rg):
+    runs = [run_record(slow=1.0, steady=2.0) for _ in range(4)]
+    runs.append(run_record(slow=3.0, steady=2.1))
+    stats = {item['key']: item for item in rg.analyze_history(runs, threshold=0.5)}
+    assert stats['slow']['regressed']
+    assert stats['slow']['baseline'] == 1.0
+    assert stats['slow']['change'] == 2.0
+    assert not stats['steady']['regressed']
+
+
+def test_too_few_samples_or_small_delta_not_flagged(rg):
+    few = [run_record(c=1.0), run_record(c=1.0), run_record(c=5.0)]
+    assert not rg.analyze_history(few)[0]['regressed']
+    tiny = [run_record(c=0.1) for _ in range(5)] + [run_record(c=0.4)]
+    assert not rg.analyze_history(tiny)[0]['regressed']
+
+
+def test_history_view(write_config, run_cli, workspace):
+    path = workspace / '.quality-gates' / 'history.jsonl'
+    path.parent.mkdir()
+    runs = [run_record(**{'g/c': 1.0}) for _ in range(4)] + [run_record(**{'g/c': 4.0})]
+    path.write_text(''.join(json.dumps(run) + '\n' for run in runs))
+
+    proc = run_cli('--history')
+    assert proc.returncode == 0
+    assert "GATE TIMING HISTORY (last 5 run(s))" in proc.stdout
+    assert "REGRESSED" in proc.stdout
+    assert "1 check(s) regressed beyond their median runtime" in proc.stdout
+
+    proc = run_cli('--history', '--history-window', '2')
+    assert "last 2 run(s)" in proc.stdout
+    assert "No runtime regressions detected" in proc.stdout
+
+
+def test_empty_history_view(run_cli):
+    proc = run_cli('--history')
+    assert proc.returncode == 0
+    assert "No recorded runs yet." in proc.stdout
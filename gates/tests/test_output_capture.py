@@ -0,0 +1,66 @@
+"""Streamed check output with bounded in-memory capture and log files."""
+
+import os
+
+from conftest import check, gate
+
+
+def test_capture_keeps_head_and_tail(rg):
+    capture = rg.OutputCapture(head=3, tail=2)
+    for i in range(100):
+        capture.add(f"line {i}\n")
+    text = capture.text()
+    assert text.startswith("line 0\nline 1\nline 2\n")
+    assert text.endswith("line 98\nline 99\n")
+    assert "[95 lines omitted, see log file]" in text
+
+
+def test_short_output_is_kept_whole(rg):
+    capture = rg.OutputCapture(head=3, tail=2)
+    for i in range(5):
+        capture.add(f"line {i}\n")
+    assert capture.text() == ''.join(f"line {i}\n" for i in range(5))
+
+
+def test_long_lines_are_truncated(rg):
+    capture = rg.OutputCapture()
+    capture.add("x" * (rg.MAX_CAPTURED_LINE * 2) + "\n")
+    assert len(capture.text()) < rg.MAX_CAPTURED_LINE + 50
+    assert "[line truncated]" in capture.text()
+
+
+def test_log_file_has_full_output(rg, workspace):
+    log_path = workspace / 'logs' / 'big.log'
+    result = rg.execute_command(
+        "seq 1 20000; echo oops >&2", 30, str(workspace), dict(os.environ),
+        log_path=str(log_path), output_limits=(10, 10)
+    )
+    assert result.returncode == 0
+    assert "[19980 lines omitted, see log file]" in result.stdout
+    assert result.stdout.rstrip().endswith("20000")
+    assert result.stderr == "oops\n"
+    log = log_path.read_text().splitlines()
+    assert log[0] == "$ seq 1 20000; echo oops >&2"
+    assert len(log) == 20002
+    assert "oops" in log
+
+
+def test_verbose_echoes_lines_live(rg, workspace, capsys):
+    rg.execute_command("echo hello", 30, str(workspace), dict(os.environ),
+                       echo_prefix="  [c] | ")
+    assert "  [c] | hello" in capsys.readouterr().out
+
+
+def test_gate_writes_per_check_logs(rg, workspace):
+    result = rg.run_gate(gate('My Gate', [check('lint', 'echo linting; exit 1')]), {})
+    check_result = result.checks[0]
+    assert check_result.log_path == os.path.join('.quality-gates', 'logs', 'my-gate', 'lint.log')
+    assert "linting" in (workspace / check_result.log_path).read_text()
+    assert f"Log: {check_result.log_path}" in rg.format_check_result(check_result)
+
+
+def test_log_dir_can_be_disabled(rg, workspace):
+    result = rg.run_gate(gate('g', [check('c', 'echo hi')]), {'log_dir': None})
+    assert result.checks[0].log_path == ""
+    assert result.checks[0].output == "hi\n"
+    assert not (workspace / '.quality-gates').exists()
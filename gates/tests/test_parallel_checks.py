@@ -0,0 +1,53 @@
+"""parallel_checks: bounded worker pool, results in declared order."""
+
+import time
+
+from conftest import check, check_events, gate
+
+
+def test_serial_by_default(rg):
+    checks = [check(f"c{i}", "sleep 0.2") for i in range(3)]
+    start = time.time()
+    results = rg.run_checks(checks, {})
+    assert time.time() - start >= 0.6
+    assert [r.name for r in results] == ['c0', 'c1', 'c2']
+
+
+def test_parallel_checks_run_concurrently(rg):
+    checks = [check(f"c{i}", "sleep 0.5") for i in range(4)]
+    start = time.time()
+    results = rg.run_checks(checks, {'parallel_checks': True, 'max_workers': 4})
+    assert time.time() - start < 1.5
+    assert all(r.status == rg.CheckStatus.PASS for r in results)
+
+
+def test_max_workers_bounds_concurrency(rg, workspace):
+    # Each check records how many checks are running when it starts
+    command = (
+        "mkdir -p running && touch running/$$ && ls running | wc -l >> counts "
+        "&& sleep 0.3 && rm running/$$"
+    )
+    checks = [check(f"c{i}", command) for i in range(6)]
+    rg.run_checks(checks, {'parallel_checks': True, 'max_workers': 2})
+    counts = [int(line) for line in (workspace / 'counts').read_text().split()]
+    assert len(counts) == 6
+    assert max(counts) <= 2
+
+
+def test_results_keep_declared_order(rg):
+    checks = [check("slow", "sleep 0.4"), check("fast", "true"), check("failing", "exit 3")]
+    results = rg.run_checks(checks, {'parallel_checks': True, 'max_workers': 3})
+    assert [r.name for r in results] == ['slow', 'fast', 'failing']
+    assert results[2].status == rg.CheckStatus.FAIL
+    assert results[2].exit_code == 3
+
+
+def test_cli_parallel_flag(write_config, run_json):
+    write_config([gate('g', [check('a', 'sleep 0.5'), check('b', 'sleep 0.5')])])
+    start = time.time()
+    proc, events = run_json('--parallel')
+    assert proc.returncode == 0, proc.stderr
+    assert time.time() - start < 2.5
+    gate_event = next(e for e in events if e['event'] == 'gate')
+    assert gate_event['parallel'] is True
+    assert set(check_events(events)) == {'g/a', 'g/b'}
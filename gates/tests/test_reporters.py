@@ -0,0 +1,93 @@
+"""--format json (JSON Lines) and --format junit reporters."""
+
+import json
+import xml.etree.ElementTree as ET
+
+from conftest import check, check_events, gate
+
+
+def test_json_event_stream(write_config, run_json):
+    write_config([gate('g', [
+        check('ok', 'echo hi'),
+        check('bad', 'exit 3'),
+        check('skipped', 'true', skip_if='true'),
+    ], blocking=True)])
+    proc, events = run_json()
+    assert proc.returncode == 1
+
+    kinds = [event['event'] for event in events]
+    assert kinds[0] == 'run_start'
+    assert kinds[-1] == 'run_end'
+    assert kinds.count('check') == 3
+    assert kinds.index('gate') > max(i for i, kind in enumerate(kinds) if kind == 'check')
+
+    checks = check_events(events)
+    assert checks['g/ok']['status'] == 'pass'
+    assert checks['g/ok']['output'] == 'hi\n'
+    assert checks['g/bad']['status'] == 'fail'
+    assert checks['g/bad']['exit_code'] == 3
+    assert checks['g/skipped']['status'] == 'skip'
+
+    gate_event = next(event for event in events if event['event'] == 'gate')
+    assert gate_event['passed'] is False
+    assert gate_event['outcome'] == 'FAILED'
+    assert events[-1]['gates'] == 1
+    assert events[-1]['passed'] == 0
+    assert events[-1]['exit_code'] == 1
+
+
+def test_json_to_file_keeps_stdout_free(write_config, run_cli, workspace):
+    write_config([gate('g', [check('ok', 'true')])])
+    proc = run_cli('--format', 'json', '--output', 'events.jsonl')
+    assert proc.returncode == 0
+    events = [json.loads(line) for line in (workspace / 'events.jsonl').read_text().splitlines()]
+    assert events[0]['event'] == 'run_start'
+    assert events[-1]['event'] == 'run_end'
+    assert '"event"' not in proc.stdout
+
+
+def test_junit_file(write_config, run_cli, workspace):
+    write_config([
+        gate('first', [check('ok', 'true'), check('bad', 'echo broken >&2; exit 1'),
+                       check('skipped', 'true', skip_if='true')]),
+        gate('second', [check('ok', 'true')]),
+    ])
+    proc = run_cli('--format', 'junit', '--output', 'report.xml')
+    assert proc.returncode == 1
+
+    root = ET.parse(workspace / 'report.xml').getroot()
+    assert root.tag == 'testsuites'
+    assert (root.get('tests'), root.get('failures'), root.get('errors'), root.get('skipped')) \
+        == ('4', '1', '0', '1')
+    assert root.get('time') is not None
+
+    suites = {suite.get('name'): suite for suite in root.findall('testsuite')}
+    assert set(suites) == {'first', 'second'}
+    assert suites['first'].get('tests') == '3'
+    cases = {case.get('name'): case for case in suites['first'].findall('testcase')}
+    failure = cases['bad'].find('failure')
+    assert failure.get('message') == 'Exit code 1'
+    assert 'broken' in failure.text
+    assert cases['skipped'].find('skipped').get('message') == 'Skip condition met: true'
+    assert cases['ok'].find('failure') is None
+    assert not (workspace / 'report.xml.tmp').exists()
+
+
+def test_junit_on_stdout(write_config, run_cli):
+    write_config([gate('g', [check('ok', 'true')])])
+    proc = run_cli('--format', 'junit')
+    assert proc.returncode == 0
+    root = ET.fromstring(proc.stdout.strip().split('\n', 1)[1])
+    assert root.get('tests') == '1'
+    assert root.find('testsuite/testcase').get('classname') == 'g'
+
+
+def test_junit_file_is_valid_mid_run(rg, workspace):
+    path = workspace / 'partial.xml'
+    reporter = rg.create_reporter('junit', str(path))
+    reporter.start({'name': 'cfg'})
+    reporter.check('g', rg.CheckResult('c', 'c', rg.CheckStatus.ERROR, 'x', 0.1, error='boom'))
+    root = ET.parse(path).getroot()
+    assert root.get('name') == 'cfg'
+    assert root.get('errors') == '1'
+    assert root.find('testsuite/testcase/error').get('message') == 'boom'
@@ -0,0 +1,77 @@
+"""Per-check resource usage (rusage) and the --profile summary."""
+
+import os
+import resource
+import sys
+
+import pytest
+
+from conftest import check, check_events, gate
+
+BURN = f"{sys.executable} -c 'sum(i * i for i in range(3_000_000))'"
+
+pytestmark = pytest.mark.skipif(not hasattr(os, 'wait4'), reason="needs os.wait4")
+
+
+def test_cpu_of_grandchildren_is_attributed(rg):
+    result = rg.run_check(check('burn', f"{BURN}; sleep 0.05"), {})
+    assert result.status == rg.CheckStatus.PASS
+    assert set(result.resources) >= {'cpu_user', 'cpu_system', 'max_rss_kb',
+                                     'io_read_blocks', 'io_write_blocks'}
+    assert result.cpu_time > 0.05
+    assert result.cpu_time <= result.duration + 0.1
+    assert result.resources['max_rss_kb'] > 1000
+
+
+def test_sleeping_check_uses_little_cpu(rg):
+    result = rg.run_check(check('sleep', 'sleep 0.3'), {})
+    assert result.duration >= 0.3
+    assert result.cpu_time < 0.1
+
+
+def test_rusage_to_dict(rg):
+    data = rg.rusage_to_dict(resource.getrusage(resource.RUSAGE_SELF))
+    assert data['cpu_user'] > 0
+    assert isinstance(data['max_rss_kb'], int)
+
+
+def test_merge_resources_sums_and_keeps_peak(rg):
+    first = {'cpu_user': 1.0, 'cpu_system': 0.25, 'max_rss_kb': 100, 'io_read_blocks': 2}
+    second = {'cpu_user': 0.5, 'cpu_system': 0.25, 'max_rss_kb': 300, 'io_read_blocks': 3}
+    assert rg.merge_resources(first, second) == {
+        'cpu_user': 1.5, 'cpu_system': 0.5, 'max_rss_kb': 300, 'io_read_blocks': 5,
+    }
+    assert rg.merge_resources({}, second) == second
+    assert rg.merge_resources(first, {}) == first
+
+
+def test_retried_check_accumulates_resources(rg):
+    single = rg.run_check(check('c', f"{BURN}; exit 1"), {})
+    retried = rg.run_check(check('c', f"{BURN}; exit 1", retry=1, retry_delay=0.01), {})
+    assert len(retried.attempts) == 2
+    assert retried.cpu_time > single.cpu_time * 1.3
+
+
+def test_format_profile_classifies_checks(rg):
+    burn = rg.run_check(check('burn', BURN), {})
+    sleep = rg.run_check(check('sleep', 'sleep 0.3'), {})
+    cached = rg.CheckResult('cached', 'cached', rg.CheckStatus.PASS, 'x', 0.0, cached=True,
+                            resources={'cpu_user': 9.0})
+    gate_result = rg.GateResult('g', 'g', 'custom', 'test', 'manual', True,
+                                [sleep, cached, burn], True, 1.0, '')
+    rows = [line for line in rg.format_profile([gate_result]).splitlines()
+            if line.startswith('g/')]
+    assert [row.split()[0] for row in rows] == ['g/burn', 'g/sleep']
+    assert rows[0].endswith('cpu-bound')
+    assert rows[1].endswith('waiting')
+
+
+def test_profile_and_json_resources(write_config, run_cli, run_json):
+    write_config([gate('g', [check('burn', BURN)])])
+    proc = run_cli('--profile')
+    assert proc.returncode == 0
+    assert "GATE PROFILE" in proc.stdout
+    assert "Peak RSS:" in proc.stdout
+
+    _, events = run_json()
+    assert check_events(events)['g/burn']['resources']['cpu_user'] > 0
@@ -0,0 +1,92 @@
+"""Content-addressed result cache."""
+
+import os
+import time
+
+from conftest import check, check_events, gate
+
+
+def cached_config(write_config, workspace, command="echo run >> runs.log", **options):
+    (workspace / 'src').mkdir(exist_ok=True)
+    (workspace / 'src' / 'a.txt').write_text('one')
+    write_config([gate('g', [check('c', command, inputs=['src/*.txt'], **options)])],
+                 defaults={'cache': True})
+
+
+def runs(workspace) -> int:
+    path = workspace / 'runs.log'
+    return len(path.read_text().splitlines()) if path.exists() else 0
+
+
+def test_unchanged_inputs_hit_the_cache(write_config, run_json, workspace):
+    cached_config(write_config, workspace)
+    proc, _ = run_json()
+    assert proc.returncode == 0, proc.stderr
+    proc, events = run_json()
+    assert proc.returncode == 0
+    assert runs(workspace) == 1
+    assert check_events(events)['g/c']['cached'] is True
+
+
+def test_changed_input_reruns(write_config, run_json, workspace):
+    cached_config(write_config, workspace)
+    run_json()
+    (workspace / 'src' / 'a.txt').write_text('two')
+    run_json()
+    (workspace / 'src' / 'b.txt').write_text('new file')
+    _, events = run_json()
+    assert runs(workspace) == 3
+    assert check_events(events)['g/c']['cached'] is False
+
+
+def test_failures_are_not_cached(write_config, run_json, workspace):
+    cached_config(write_config, workspace, command="echo run >> runs.log; exit 1")
+    run_json()
+    proc, _ = run_json()
+    assert proc.returncode == 1
+    assert runs(workspace) == 2
+
+
+def test_checks_without_inputs_always_run(write_config, run_json, workspace):
+    write_config([gate('g', [check('c', "echo run >> runs.log")])], defaults={'cache': True})
+    run_json()
+    run_json()
+    assert runs(workspace) == 2
+
+
+def test_no_cache_flag_overrides_config(write_config, run_json, workspace):
+    cached_config(write_config, workspace)
+    run_json()
+    run_json('--no-cache')
+    assert runs(workspace) == 2
+
+
+def test_key_covers_command_and_env(rg, workspace):
+    (workspace / 'in.txt').write_text('x')
+    cache = rg.ResultCache(str(workspace / 'cache'))
+    base = check('c', 'lint ${MODE}', inputs=['in.txt'], cache_env=['EXTRA'])
+    key = cache.make_key(base, 'lint a', '.', {'MODE': 'a'}, {})
+    assert key == cache.make_key(base, 'lint a', '.', {'MODE': 'a', 'OTHER': '1'}, {})
+    assert key != cache.make_key(base, 'lint b', '.', {'MODE': 'b'}, {})
+    assert key != cache.make_key(base, 'lint a', '.', {'MODE': 'a', 'EXTRA': '1'}, {})
+    assert cache.make_key(check('c', 'lint'), 'lint', '.', {}, {}) is None
+
+
+def test_eviction_keeps_most_recent_entries(rg, workspace):
+    cache = rg.ResultCache(str(workspace / 'cache'), max_entries=2)
+    result = rg.CheckResult('c', 'c', rg.CheckStatus.PASS, 'true', 0.1)
+    for i, key in enumerate(['old', 'mid', 'new']):
+        cache.put(key, result)
+        os.utime(cache.cache_dir / f"{key}.json", (time.time() + i, time.time() + i))
+    assert cache.evict() == 1
+    assert cache.get('old') is None
+    assert cache.get('new').cached
+
+
+def test_expired_entries_are_dropped(rg, workspace):
+    cache = rg.ResultCache(str(workspace / 'cache'), max_age_days=1)
+    cache.put('k', rg.CheckResult('c', 'c', rg.CheckStatus.PASS, 'true', 0.1))
+    old = time.time() - 2 * 86400
+    os.utime(cache.cache_dir / 'k.json', (old, old))
+    assert cache.get('k') is None
+    assert not (cache.cache_dir / 'k.json').exists()
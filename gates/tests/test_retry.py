@@ -0,0 +1,76 @@
+"""retry with exponential backoff and cross-run flake statistics."""
+
+import json
+
+from conftest import check, gate
+
+# Fails on the first run in a directory, passes afterwards
+FLAKY = "n=$(cat attempts 2>/dev/null || echo 0); n=$((n+1)); echo $n > attempts; [ $n -ge 2 ]"
+
+
+def test_flaky_check_passes_on_retry(rg):
+    result = rg.run_check(check('c', FLAKY, retry=2, retry_delay=0.01), {})
+    assert result.status == rg.CheckStatus.PASS
+    assert [a['status'] for a in result.attempts] == ['fail', 'pass']
+    assert result.max_attempts == 3
+    assert result.flaky
+
+
+def test_retries_are_exhausted(rg):
+    result = rg.run_check(check('c', 'exit 1', retry=2, retry_delay=0.01), {})
+    assert result.status == rg.CheckStatus.FAIL
+    assert len(result.attempts) == 3
+    assert not result.flaky
+
+
+def test_no_retry_by_default(rg):
+    result = rg.run_check(check('c', 'exit 1'), {})
+    assert len(result.attempts) == 1
+    assert result.max_attempts == 1
+
+
+def test_backoff_is_exponential_and_capped(rg):
+    options = {'retry_delay': 1, 'retry_backoff': 2, 'retry_max_delay': 3}
+    delays = [rg.get_retry_delay({}, options, attempt) for attempt in range(1, 5)]
+    assert delays == [1, 2, 3, 3]
+    assert rg.get_retry_delay({'retry_delay': 0.5}, options, 1) == 0.5
+
+
+def test_cancellation_stops_retrying(rg):
+    cancel = rg.CancelToken()
+    cancel.cancel("test")
+    attempts = []
+
+    def attempt():
+        attempts.append(1)
+        return rg.CheckResult('c', 'c', rg.CheckStatus.FAIL, 'false', 0.0)
+
+    result = rg.run_with_retry(attempt, {'retry': 5, 'retry_delay': 10}, {}, cancel)
+    assert len(attempts) == 1
+    assert result.status == rg.CheckStatus.FAIL
+
+
+def test_flake_stats_accumulate_across_runs(write_config, run_cli, workspace):
+    write_config([gate('g', [
+        check('flaky', FLAKY, retry=1, retry_delay=0.01),
+        check('steady', 'true'),
+    ])], defaults={'retry_delay': 0.01})
+    assert run_cli().returncode == 0
+    assert run_cli().returncode == 0
+
+    stats = json.loads((workspace / '.quality-gates' / 'flake-stats.json').read_text())
+    assert stats['checks'] == {'g/flaky': {'runs': 2, 'flaky': 1, 'failed': 0, 'retries': 1}}
+
+
+def test_report_shows_flake_rate(rg, workspace):
+    stats = rg.FlakeStats(str(workspace / 'flake-stats.json'))
+    result = rg.run_check(check('c', FLAKY, retry=1, retry_delay=0.01), {})
+    gate_result = rg.GateResult('g', 'g', 'custom', 'test', 'manual', True, [result], True,
+                                result.duration, '')
+    assert stats.record([gate_result])
+    stats.save()
+
+    reloaded = rg.FlakeStats(str(workspace / 'flake-stats.json'))
+    assert reloaded.flake_rate('g/c') == 1.0
+    report = rg.format_report([gate_result], {}, flake_stats=reloaded)
+    assert "2 attempts, passed on retry (flake rate 100% over 1 run(s))" in report
@@ -0,0 +1,95 @@
+"""--since incremental mode against a temporary git repository."""
+
+import subprocess
+
+import pytest
+
+from conftest import check, check_events, gate
+
+
+def git(*args, cwd):
+    subprocess.run(['git', *args], cwd=cwd, check=True, capture_output=True)
+
+
+@pytest.fixture
+def repo(workspace):
+    """Git repository with one commit containing src/app.py and docs/index.md."""
+    (workspace / 'src').mkdir()
+    (workspace / 'docs').mkdir()
+    (workspace / 'src' / 'app.py').write_text('print(1)\n')
+    (workspace / 'docs' / 'index.md').write_text('# docs\n')
+    (workspace / '.gitignore').write_text('.quality-gates/\n')
+    git('init', '-q', cwd=workspace)
+    git('add', '.', cwd=workspace)
+    git('-c', 'user.name=t', '-c', 'user.email=t@example.com',
+        'commit', '-q', '-m', 'base', cwd=workspace)
+    return workspace
+
+
+def test_changed_files_include_untracked_and_deleted(rg, repo):
+    (repo / 'src' / 'app.py').write_text('print(2)\n')
+    (repo / 'src' / 'new.py').write_text('')
+    (repo / 'docs' / 'index.md').unlink()
+    assert rg.get_changed_files('HEAD', str(repo)) == ['docs/index.md', 'src/app.py', 'src/new.py']
+
+
+def test_invalid_ref_raises(rg, repo):
+    with pytest.raises(RuntimeError):
+        rg.get_changed_files('no-such-ref', str(repo))
+
+
+def test_path_globs(rg):
+    changed = ['src/app.py', 'src/pkg/mod.py', 'docs/index.md', 'setup.py']
+    assert rg.filter_changed_files(changed, ['src/*.py']) == ['src/app.py']
+    assert rg.filter_changed_files(changed, ['**/*.py']) == ['src/app.py', 'src/pkg/mod.py', 'setup.py']
+    assert rg.filter_changed_files(changed, ['./docs/**']) == ['docs/index.md']
+    assert rg.filter_changed_files(changed, ['?etup.py']) == ['setup.py']
+
+
+def test_changed_files_env_is_quoted_and_skips_deleted(rg, workspace):
+    (workspace / 'a b.py').write_text('')
+    defaults = {'changed_files': ['a b.py', 'gone.py', 'notes.md']}
+    env = rg.build_check_env({'paths': ['*.py']}, defaults)
+    assert env['CHANGED_FILES'] == "'a b.py'"
+    env = rg.build_check_env({'paths': ['*.txt']}, defaults)
+    assert 'CHANGED_FILES' not in env
+
+
+def test_changed_files_are_relative_to_working_dir(rg, workspace):
+    (workspace / 'web' / 'src').mkdir(parents=True)
+    (workspace / 'web' / 'src' / 'app.js').write_text('')
+    (workspace / 'setup.py').write_text('')
+    defaults = {'changed_files': ['setup.py', 'web/gone.js', 'web/src/app.js']}
+    env = rg.build_check_env({'working_dir': 'web'}, defaults)
+    assert env['CHANGED_FILES'] == 'src/app.js'
+    env = rg.build_check_env({'working_dir': 'web', 'paths': ['*.py']}, defaults)
+    assert 'CHANGED_FILES' not in env
+
+    result = rg.run_check(check('ls', 'ls $CHANGED_FILES', working_dir='web'), defaults)
+    assert result.status == rg.CheckStatus.PASS
+    assert result.output.strip() == 'src/app.js'
+
+
+def test_since_runs_only_affected_checks(write_config, run_json, repo):
+    write_config([gate('g', [
+        check('python', 'echo "$CHANGED_FILES"', paths=['src/**/*.py']),
+        check('docs', 'true', paths=['docs/**']),
+        check('always', 'true'),
+    ])])
+    (repo / 'src' / 'app.py').write_text('print(2)\n')
+
+    proc, events = run_json('--since', 'HEAD')
+    assert proc.returncode == 0, proc.stderr
+    checks = check_events(events)
+    assert checks['g/python']['status'] == 'pass'
+    assert checks['g/python']['output'].strip() == 'src/app.py'
+    assert checks['g/docs']['status'] == 'skip'
+    assert checks['g/docs']['skip_reason'] == 'No changed files match docs/**'
+    assert checks['g/always']['status'] == 'pass'
+
+
+def test_since_with_bad_ref_exits_2(write_config, run_cli, repo):
+    write_config([gate('g', [check('c', 'true')])])
+    proc = run_cli('--since', 'no-such-ref')
+    assert proc.returncode == 2
+    assert "Could not compute changes since 'no-such-ref'" in proc.stderr
@@ -0,0 +1,68 @@
+"""Run-scoped memoization and prefetch of skip_if conditions."""
+
+import os
+from concurrent.futures import ThreadPoolExecutor
+
+from conftest import check, check_events, gate
+
+# Appends a line every time the condition is evaluated, then fails (do not skip)
+COUNTED = "echo x >> evaluations; false"
+
+
+def test_identical_conditions_evaluate_once(rg):
+    cache = rg.SkipConditionCache()
+    env = dict(os.environ)
+    assert cache.evaluate('true', env)
+    assert cache.evaluate('true', dict(env))
+    assert not cache.evaluate('false', env)
+    assert cache.evaluations == 2
+
+
+def test_env_is_part_of_the_key(rg):
+    cache = rg.SkipConditionCache()
+    command = 'test "$MODE" = fast'
+    assert cache.evaluate(command, {'MODE': 'fast'})
+    assert not cache.evaluate(command, {'MODE': 'slow'})
+    assert cache.evaluations == 2
+
+
+def test_concurrent_requests_share_one_evaluation(rg, workspace):
+    cache = rg.SkipConditionCache()
+    env = dict(os.environ)
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        results = list(executor.map(lambda _: cache.evaluate('sleep 0.2; ' + COUNTED, env), range(8)))
+    assert results == [False] * 8
+    assert cache.evaluations == 1
+    assert (workspace / 'evaluations').read_text() == 'x\n'
+
+
+def test_clear_forces_reevaluation(rg):
+    cache = rg.SkipConditionCache()
+    cache.evaluate('true', {})
+    cache.clear()
+    cache.evaluate('true', {})
+    assert cache.evaluations == 2
+
+
+def test_prefetch_skips_path_filtered_checks(rg):
+    gates = [gate('g', [
+        check('a', 'true', skip_if='true'),
+        check('b', 'true', skip_if='true'),
+        check('filtered', 'true', skip_if='false', paths=['docs/**']),
+        check('plain', 'true'),
+    ])]
+    before = rg.SKIP_CONDITIONS.evaluations
+    rg.prefetch_skip_conditions(gates, {'changed_files': ['src/app.py']})
+    assert rg.SKIP_CONDITIONS.evaluations - before == 1
+
+
+def test_shared_condition_runs_once_per_run(write_config, run_json, workspace):
+    write_config([
+        gate('one', [check('a', 'true', skip_if=COUNTED), check('b', 'true', skip_if=COUNTED)]),
+        gate('two', [check('c', 'true', skip_if=COUNTED), check('d', 'true', skip_if='true')]),
+    ])
+    proc, events = run_json()
+    assert proc.returncode == 0
+    assert (workspace / 'evaluations').read_text() == 'x\n'
+    statuses = {key: event['status'] for key, event in check_events(events).items()}
+    assert statuses == {'one/a': 'pass', 'one/b': 'pass', 'two/c': 'pass', 'two/d': 'skip'}
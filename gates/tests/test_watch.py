@@ -0,0 +1,146 @@
+"""--watch: tree snapshots, warm result reuse and the re-run loop."""
+
+import os
+import queue
+import signal
+import subprocess
+import sys
+import threading
+import time
+
+import pytest
+
+from conftest import RUNNER, check, gate
+
+
+def touch(path, content):
+    """Rewrite a file and make sure its mtime moves even on coarse clocks."""
+    path.write_text(content)
+    stat = path.stat()
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+
+
+@pytest.fixture
+def tree(workspace):
+    (workspace / 'src').mkdir()
+    (workspace / 'src' / 'app.py').write_text('print(1)\n')
+    (workspace / 'docs.md').write_text('# docs\n')
+    (workspace / 'node_modules' / 'pkg').mkdir(parents=True)
+    (workspace / 'node_modules' / 'pkg' / 'index.js').write_text('')
+    return workspace
+
+
+def test_scan_tree_skips_ignored_dirs(rg, tree):
+    snapshot = rg.scan_tree()
+    assert sorted(snapshot) == ['docs.md', 'src/app.py']
+    assert snapshot['src/app.py'][1] == len('print(1)\n')
+
+
+def test_diff_snapshots(rg):
+    before = {'a': (1, 1), 'b': (1, 1), 'c': (1, 1)}
+    after = {'a': (1, 1), 'b': (2, 1), 'd': (1, 1)}
+    assert rg.diff_snapshots(before, after) == ['b', 'c', 'd']
+    assert rg.diff_snapshots(after, dict(after)) == []
+
+
+def test_warm_results_reuse_and_invalidate(rg, tree):
+    warm = rg.WarmResults()
+    config = check('lint', 'lint src', paths=['src/**'])
+    env = {}
+
+    warm.start_run(rg.scan_tree())
+    assert warm.make_key(check('all', 'true'), 'true', '.', env, {}) is None
+    key = warm.make_key(config, 'lint src', '.', env, {})
+    assert warm.get(key) is None
+    warm.put(key, rg.CheckResult('lint', 'lint', rg.CheckStatus.FAIL, 'lint src', 1.0))
+    warm.finish_run()
+
+    # Unrelated change: the failing result is reused
+    touch(tree / 'docs.md', '# more docs\n')
+    warm.start_run(rg.scan_tree())
+    assert warm.make_key(config, 'lint src', '.', env, {}) == key
+    reused = warm.get(key)
+    assert reused.cached and reused.status == rg.CheckStatus.FAIL
+    assert warm.hits == 1
+    warm.finish_run()
+
+    # Matching change: new key, and the stale result is dropped
+    touch(tree / 'src' / 'app.py', 'print(2)\n')
+    warm.start_run(rg.scan_tree())
+    new_key = warm.make_key(config, 'lint src', '.', env, {})
+    assert new_key != key
+    assert warm.get(new_key) is None
+    warm.finish_run()
+    assert warm.get(key) is None
+
+
+def test_skips_and_errors_are_not_kept(rg):
+    warm = rg.WarmResults()
+    warm.put('skip', rg.CheckResult('c', 'c', rg.CheckStatus.SKIP, 'x', 0.0))
+    warm.put('error', rg.CheckResult('c', 'c', rg.CheckStatus.ERROR, 'x', 0.0))
+    assert warm.get('skip') is None
+    assert warm.get('error') is None
+
+
+def test_wait_for_changes_debounces_a_burst(rg, tree):
+    baseline = rg.scan_tree()
+
+    def edit():
+        time.sleep(0.1)
+        touch(tree / 'src' / 'app.py', 'print(2)\n')
+        time.sleep(0.05)
+        (tree / 'src' / 'new.py').write_text('')
+
+    editor = threading.Thread(target=edit)
+    editor.start()
+    snapshot, changed = rg.wait_for_changes(baseline, interval=0.05, debounce=0.3)
+    editor.join()
+    assert changed == ['src/app.py', 'src/new.py']
+    assert 'src/new.py' in snapshot
+
+
+def read_until(lines: queue.Queue, marker: str, timeout: float = 20) -> list:
+    """Collect output lines until one contains marker."""
+    seen = []
+    deadline = time.time() + timeout
+    while time.time() < deadline:
+        try:
+            line = lines.get(timeout=0.1)
+        except queue.Empty:
+            continue
+        seen.append(line)
+        if marker in line:
+            return seen
+    raise AssertionError(f"{marker!r} not seen in output:\n{''.join(seen)}")
+
+
+def test_watch_reruns_only_changed_checks(write_config, tree):
+    write_config([gate('g', [
+        check('src', 'echo ran >> src-runs', paths=['src/**']),
+        check('docs', 'echo ran >> docs-runs', paths=['docs.md']),
+    ])])
+    proc = subprocess.Popen(
+        [sys.executable, str(RUNNER), '--watch', '--watch-interval', '0.05',
+         '--watch-debounce', '0.1'],
+        cwd=tree, stdout=subprocess.PIPE, stderr=subprocess.STDOUT, text=True,
+        env={**os.environ, 'PYTHONUNBUFFERED': '1'}
+    )
+    lines = queue.Queue()
+    threading.Thread(target=lambda: [lines.put(line) for line in proc.stdout], daemon=True).start()
+
+    try:
+        first = read_until(lines, 'Watching for changes')
+        assert any('2 check(s) run, 0 reused' in line for line in first)
+
+        touch(tree / 'src' / 'app.py', 'print(2)\n')
+        second = read_until(lines, 'Watching for changes')
+        assert any('1 file(s) changed: src/app.py' in line for line in second)
+        assert any('1 check(s) run, 1 reused' in line for line in second)
+    finally:
+        proc.send_signal(signal.SIGINT)
+        proc.wait(timeout=10)
+
+    assert proc.returncode == 0
+    assert read_until(lines, 'Stopped watching.')
+    assert (tree / 'src-runs').read_text() == 'ran\nran\n'
+    assert (tree / 'docs-runs').read_text() == 'ran\n'
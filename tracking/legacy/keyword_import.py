@@ -0,0 +1,514 @@
+#!/usr/bin/env python3
+"""
+SEO Agent Library - Keyword Export Import
+Streams GSC/GA4 keyword exports into snapshot ranking metrics and a columnar sidecar.
+"""
+
+import csv
+import gzip
+import json
+import os
+import re
+import shutil
+import sys
+from array import array
+from datetime import date, datetime
+from pathlib import Path
+from typing import Dict, List, Any, Iterator, Optional, Tuple, Union
+
+from snapshot_catalog import SnapshotCatalog
+from snapshot_archive import split_member_path
+
+SIDECAR_VERSION = 1
+MANIFEST_FILENAME = "manifest.json"
+CHUNK_ROWS = 65536
+EPOCH = date(1970, 1, 1)
+
+# Cumulative position buckets of ranking_metrics.keyword_distribution
+# (top_10 includes top_3, so top_20 - top_10 is "ranking 11-20")
+BUCKETS = [3, 10, 20, 50, 100]
+
+# Export column names (lower-cased, GA4's "Organic Google Search " prefix
+# removed) mapped to the importer's fields
+COLUMN_ALIASES = {
+    'query': 'query', 'queries': 'query', 'top queries': 'query', 'keyword': 'query',
+    'search query': 'query', 'search term': 'query',
+    'date': 'date', 'day': 'date',
+    'clicks': 'clicks', 'url clicks': 'clicks',
+    'impressions': 'impressions',
+    'position': 'position', 'average position': 'position', 'avg. position': 'position',
+    'avg position': 'position',
+}
+GA4_PREFIX = "organic google search "
+
+# Sidecar columns: name -> (array typecode, dtype recorded in the manifest)
+COLUMNS = {
+    'date': ('i', '<i4'),         # days since 1970-01-01, -1 if the export has no date
+    'clicks': ('I', '<u4'),
+    'impressions': ('I', '<u4'),
+    'position': ('f', '<f4'),     # NaN if the export has no position
+    'query_offsets': ('Q', '<u8'),  # end offset of each query in query.utf8
+}
+QUERY_TEXT_FILE = "query.utf8"
+
+class KeywordImportError(Exception):
+    """Raised when an export cannot be read or imported."""
+
+def _number(value: Any) -> Optional[float]:
+    """Parse '1,234', '5.2%' or a JSON number; None if empty."""
+    if value is None:
+        return None
+    if isinstance(value, (int, float)) and not isinstance(value, bool):
+        return float(value)
+    text = str(value).strip().replace(',', '').rstrip('%')
+    if not text:
+        return None
+    return float(text)
+
+def _day(value: Any) -> int:
+    """Export date ('2025-08-23' or GA4's '20250823') as days since 1970-01-01."""
+    text = str(value).strip()
+    if re.fullmatch(r'\d{8}', text):
+        text = f"{text[:4]}-{text[4:6]}-{text[6:]}"
+    return (date.fromisoformat(text[:10]) - EPOCH).days
+
+def day_to_date(day: int) -> Optional[date]:
+    """Inverse of the sidecar date encoding."""
+    return None if day < 0 else date.fromordinal(EPOCH.toordinal() + day)
+
+def _open_text(path: Path):
+    if path.suffix == '.gz':
+        return gzip.open(path, 'rt', encoding='utf-8-sig', newline='')
+    return open(path, 'r', encoding='utf-8-sig', newline='')
+
+def _export_format(path: Path) -> str:
+    suffixes = [s for s in path.suffixes if s != '.gz']
+    suffix = suffixes[-1].lower() if suffixes else ''
+    if suffix in ('.jsonl', '.ndjson', '.json'):
+        return 'jsonl'
+    if suffix == '.tsv':
+        return 'tsv'
+    return 'csv'
+
+def _normalise_columns(names: List[str]) -> Tuple[Dict[str, str], str]:
+    """Map export column names to fields; also report the source ('gsc' or 'ga4')."""
+    mapping = {}
+    source = 'gsc'
+    for name in names:
+        key = str(name).strip().lower().replace('_', ' ')
+        if key.startswith(GA4_PREFIX):
+            key = key[len(GA4_PREFIX):]
+            source = 'ga4'
+        field = COLUMN_ALIASES.get(key)
+        if field and field not in mapping.values():
+            mapping[name] = field
+    return mapping, source
+
+def iter_export_rows(path: Union[str, Path]) -> Iterator[Dict[str, Any]]:
+    """
+    Stream normalised rows from a GSC or GA4 export.
+
+    CSV, TSV and JSONL (optionally gzipped) are read one row at a time.
+    GA4 CSV comment lines ('#...') are skipped. Each row has 'query',
+    'date' (days since epoch or -1), 'clicks', 'impressions' and 'position'
+    (None if absent); rows without a query are skipped.
+
+    Raises:
+        KeywordImportError: If there is no query column or a value is malformed
+    """
+    path = Path(path)
+    export_format = _export_format(path)
+
+    with _open_text(path) as f:
+        if export_format == 'jsonl':
+            records = (json.loads(line) for line in f if line.strip())
+        else:
+            lines = (line for line in f if line.strip() and not line.startswith('#'))
+            records = csv.DictReader(lines, delimiter='\t' if export_format == 'tsv' else ',')
+
+        mapping = None
+        for line_number, record in enumerate(records, 1):
+            if mapping is None:
+                mapping, _ = _normalise_columns(list(record))
+                if 'query' not in mapping.values():
+                    raise KeywordImportError(f"{path}: no query/keyword column in {list(record)}")
+            row = {field: record.get(name) for name, field in mapping.items()}
+            query = str(row.get('query') or '').strip()
+            if not query:
+                continue
+            try:
+                clicks = _number(row.get('clicks'))
+                impressions = _number(row.get('impressions'))
+                yield {
+                    'query': query,
+                    'date': _day(row['date']) if row.get('date') else -1,
+                    'clicks': int(clicks or 0),
+                    'impressions': int(impressions or 0),
+                    'position': _number(row.get('position'))
+                }
+            except ValueError as e:
+                raise KeywordImportError(f"{path}: row {line_number}: {e}")
+
+def detect_source(path: Union[str, Path]) -> str:
+    """'ga4' if the export uses GA4's Search Console column names, else 'gsc'."""
+    path = Path(path)
+    with _open_text(path) as f:
+        for line in f:
+            if not line.strip() or line.startswith('#'):
+                continue
+            if _export_format(path) == 'jsonl':
+                names = list(json.loads(line))
+            else:
+                names = next(csv.reader([line], delimiter='\t' if _export_format(path) == 'tsv' else ','))
+            return _normalise_columns(names)[1]
+    return 'gsc'
+
+class KeywordAggregator:
+    """
+    Incremental ranking metrics over a stream of keyword rows.
+
+    Memory is proportional to the number of distinct dates, not rows or
+    keywords. Visibility (impressions, clicks, CTR and the
+    impression-weighted average position) covers the whole export; the
+    keyword distribution is the ranking state on the export's last date,
+    counting one row per keyword per date.
+    """
+
+    def __init__(self):
+        self.rows = 0
+        self.impressions = 0
+        self.clicks = 0
+        self.weighted_position = 0.0
+        self.position_weight = 0
+        self.first_day: Optional[int] = None
+        self.last_day: Optional[int] = None
+        # day -> [keywords, top_3, top_10, top_20, top_50, top_100]
+        self.distribution: Dict[int, List[int]] = {}
+
+    def add(self, day: int, clicks: int, impressions: int, position: Optional[float]):
+        """Account for one keyword row."""
+        self.rows += 1
+        self.clicks += clicks
+        self.impressions += impressions
+        if day >= 0:
+            self.first_day = day if self.first_day is None else min(self.first_day, day)
+            self.last_day = day if self.last_day is None else max(self.last_day, day)
+
+        counts = self.distribution.get(day)
+        if counts is None:
+            counts = self.distribution[day] = [0] * (len(BUCKETS) + 1)
+        counts[0] += 1
+
+        if position is None or position != position:
+            return
+        weight = max(impressions, 1)
+        self.weighted_position += position * weight
+        self.position_weight += weight
+        for i, limit in enumerate(BUCKETS, 1):
+            if position <= limit:
+                counts[i] += 1
+
+    def ranking_metrics(self) -> Dict[str, Any]:
+        """Snapshot ``ranking_metrics`` section for the rows seen so far."""
+        latest = self.distribution.get(self.last_day if self.last_day is not None else -1,
+                                       [0] * (len(BUCKETS) + 1))
+        average_position = (self.weighted_position / self.position_weight
+                            if self.position_weight else 0.0)
+        ctr = self.clicks / self.impressions * 100 if self.impressions else 0.0
+
+        distribution = {'total_keywords': latest[0]}
+        for limit, count in zip(BUCKETS, latest[1:]):
+            distribution[f'top_{limit}'] = count
+
+        return {
+            'visibility': {
+                'average_position': round(max(average_position, 1.0), 2) if self.position_weight else 0.0,
+                'impressions': self.impressions,
+                'clicks': self.clicks,
+                'ctr': round(ctr, 2)
+            },
+            'keyword_distribution': distribution
+        }
+
+class KeywordSidecarWriter:
+    """
+    Streams keyword rows into a columnar sidecar directory.
+
+    Numeric columns are little-endian fixed-width files; query text is one
+    UTF-8 blob plus an end-offset column, so rows are appended in chunks of
+    ``CHUNK_ROWS`` and memory stays bounded. Rows go to a temporary
+    directory under ``parent_dir`` that ``close()`` renames into place, as
+    the final name depends on the dates seen.
+    """
+
+    def __init__(self, parent_dir: Path):
+        self.tmp_dir = Path(parent_dir) / f".import.{os.getpid()}.tmp"
+        if self.tmp_dir.exists():
+            shutil.rmtree(self.tmp_dir)
+        self.tmp_dir.mkdir(parents=True)
+        self.rows = 0
+        self.text_bytes = 0
+        self._buffers = {name: array(typecode) for name, (typecode, _) in COLUMNS.items()}
+        self._text = bytearray()
+        self._files = {name: open(self.tmp_dir / f"{name}.bin", 'wb') for name in COLUMNS}
+        self._text_file = open(self.tmp_dir / QUERY_TEXT_FILE, 'wb')
+
+    def add(self, query: str, day: int, clicks: int, impressions: int, position: Optional[float]):
+        """Buffer one row, flushing a chunk when full."""
+        encoded = query.encode('utf-8')
+        self._text += encoded
+        self.text_bytes += len(encoded)
+        buffers = self._buffers
+        buffers['date'].append(day)
+        buffers['clicks'].append(min(clicks, 0xFFFFFFFF))
+        buffers['impressions'].append(min(impressions, 0xFFFFFFFF))
+        buffers['position'].append(float('nan') if position is None else position)
+        buffers['query_offsets'].append(self.text_bytes)
+        self.rows += 1
+        if len(buffers['date']) >= CHUNK_ROWS:
+            self._flush()
+
+    def _flush(self):
+        for name, values in self._buffers.items():
+            if sys.byteorder != 'little':
+                values.byteswap()
+            values.tofile(self._files[name])
+            del values[:]
+        self._text_file.write(self._text)
+        self._text.clear()
+
+    def close(self, directory: Path, metadata: Dict[str, Any]) -> Path:
+        """Flush, write the manifest and move the sidecar to directory, replacing it."""
+        self._flush()
+        for f in [*self._files.values(), self._text_file]:
+            f.close()
+
+        manifest = {
+            'version': SIDECAR_VERSION,
+            'rows': self.rows,
+            'columns': {name: {'file': f"{name}.bin", 'dtype': dtype}
+                        for name, (_, dtype) in COLUMNS.items()},
+            'query_text': QUERY_TEXT_FILE,
+            **metadata
+        }
+        with open(self.tmp_dir / MANIFEST_FILENAME, 'w') as f:
+            json.dump(manifest, f, indent=2)
+
+        directory = Path(directory)
+        if directory.exists():
+            shutil.rmtree(directory)
+        os.replace(self.tmp_dir, directory)
+        return directory
+
+    def abort(self):
+        """Discard a partially written sidecar."""
+        for f in [*self._files.values(), self._text_file]:
+            f.close()
+        shutil.rmtree(self.tmp_dir, ignore_errors=True)
+
+class KeywordSidecar:
+    """Reader for a sidecar written by KeywordSidecarWriter."""
+
+    def __init__(self, directory: Union[str, Path]):
+        self.directory = Path(directory)
+        with open(self.directory / MANIFEST_FILENAME, 'r') as f:
+            self.manifest = json.load(f)
+        if self.manifest.get('version') != SIDECAR_VERSION:
+            raise ValueError(f"{self.directory}: unsupported sidecar version")
+        self.rows = self.manifest['rows']
+
+    def column(self, name: str) -> array:
+        """Load one numeric column."""
+        typecode = COLUMNS[name][0]
+        values = array(typecode)
+        with open(self.directory / self.manifest['columns'][name]['file'], 'rb') as f:
+            values.fromfile(f, self.rows)
+        if sys.byteorder != 'little':
+            values.byteswap()
+        return values
+
+    def iter_rows(self) -> Iterator[Tuple[str, Optional[date], int, int, Optional[float]]]:
+        """Stream (query, date, clicks, impressions, position) in chunks."""
+        names = ['date', 'clicks', 'impressions', 'position', 'query_offsets']
+        files = {name: open(self.directory / self.manifest['columns'][name]['file'], 'rb')
+                 for name in names}
+        text_file = open(self.directory / self.manifest['query_text'], 'rb')
+        try:
+            start = 0
+            remaining = self.rows
+            while remaining:
+                count = min(CHUNK_ROWS, remaining)
+                chunk = {}
+                for name in names:
+                    values = array(COLUMNS[name][0])
+                    values.fromfile(files[name], count)
+                    if sys.byteorder != 'little':
+                        values.byteswap()
+                    chunk[name] = values
+                text = text_file.read(chunk['query_offsets'][-1] - start)
+                base = start
+                for i in range(count):
+                    end = chunk['query_offsets'][i]
+                    position = chunk['position'][i]
+                    yield (text[start - base:end - base].decode('utf-8'),
+                           day_to_date(chunk['date'][i]), chunk['clicks'][i],
+                           chunk['impressions'][i], None if position != position else position)
+                    start = end
+                remaining -= count
+        finally:
+            for f in [*files.values(), text_file]:
+                f.close()
+
+class KeywordImporter:
+    """
+    Imports keyword-by-date exports into a tracking directory.
+
+    One pass over the export feeds both a KeywordAggregator, whose result
+    replaces ``ranking_metrics.visibility`` and
+    ``ranking_metrics.keyword_distribution`` in the target snapshot, and
+    a KeywordSidecarWriter writing the raw rows to
+    ``<tracking_dir>/keywords/<domain>/<first-date>_<last-date>/``, whose
+    positions are then added to the domain's rank history
+    (see rank_history.py).
+    """
+
+    def __init__(self, tracking_dir: Path = None):
+        self.tracking_dir = Path(tracking_dir or "tracking")
+        self.keywords_dir = self.tracking_dir / "keywords"
+        self.catalog = SnapshotCatalog(self.tracking_dir)
+
+    def sidecar_dir(self, domain: str, first_day: Optional[int], last_day: Optional[int]) -> Path:
+        """Sidecar directory for a domain and export date range."""
+        safe_domain = re.sub(r'[^A-Za-z0-9_.-]', '_', domain or '_')
+        if first_day is None:
+            period = "undated"
+        else:
+            period = f"{day_to_date(first_day):%Y%m%d}_{day_to_date(last_day):%Y%m%d}"
+        return self.keywords_dir / safe_domain / period
+
+    def import_file(self, source: Union[str, Path], domain: str, snapshot_type: str = "weekly",
+                    into: Union[str, Path] = None, new: bool = False,
+                    record_history: bool = True) -> Dict[str, Any]:
+        """
+        Stream an export into a snapshot and a sidecar.
+
+        Args:
+            source: GSC or GA4 export (.csv, .tsv, .jsonl, optionally .gz)
+            domain: Domain the export belongs to
+            snapshot_type: Snapshot series to update
+            into: Snapshot file to update (default: the latest snapshot of
+                the domain and type)
+            new: Write a new snapshot holding only the ranking metrics
+            record_history: Also add the positions to the domain's rank history
+
+        Returns:
+            Import summary with 'snapshot', 'sidecar', 'rows' and 'ranking_metrics'
+        """
+        source = Path(source)
+        aggregator = KeywordAggregator()
+        writer = KeywordSidecarWriter(self.sidecar_dir(domain, None, None).parent)
+        try:
+            for row in iter_export_rows(source):
+                aggregator.add(row['date'], row['clicks'], row['impressions'], row['position'])
+                writer.add(row['query'], row['date'], row['clicks'], row['impressions'], row['position'])
+        except BaseException:
+            writer.abort()
+            raise
+
+        ranking = aggregator.ranking_metrics()
+        import_info = {
+            'source': source.name,
+            'source_format': detect_source(source),
+            'domain': domain,
+            'rows': aggregator.rows,
+            'start_date': day_to_date(aggregator.first_day).isoformat() if aggregator.first_day is not None else None,
+            'end_date': day_to_date(aggregator.last_day).isoformat() if aggregator.last_day is not None else None,
+            'imported_at': datetime.now().isoformat()
+        }
+        target_dir = writer.close(self.sidecar_dir(domain, aggregator.first_day, aggregator.last_day),
+                                  import_info)
+        if record_history:
+            from rank_history import RankHistory
+            RankHistory(self.tracking_dir, domain).ingest_sidecar(target_dir)
+
+        snapshot_path = self._write_snapshot(domain, snapshot_type, into, new, ranking, {
+            **import_info, 'sidecar': target_dir.relative_to(self.tracking_dir).as_posix()
+        })
+        return {'snapshot': snapshot_path, 'sidecar': target_dir, 'rows': aggregator.rows,
+                'ranking_metrics': ranking}
+
+    def _write_snapshot(self, domain: str, snapshot_type: str, into: Optional[Path], new: bool,
+                        ranking: Dict[str, Any], import_info: Dict[str, Any]) -> Path:
+        """Merge ranking metrics into a snapshot (or create one) and re-index it."""
+        if new:
+            timestamp = (f"{import_info['end_date']}T23:59:59" if import_info['end_date']
+                         else datetime.now().isoformat())
+            snapshot = {
+                'metadata': {
+                    'timestamp': timestamp,
+                    'domain': domain,
+                    'baseline_type': 'current',
+                    'created_by': 'keyword_import',
+                    'version': '1.0'
+                },
+                'technical_metrics': {},
+                'traffic_metrics': {},
+                'ranking_metrics': {}
+            }
+            safe_domain = domain.replace('/', '_') or 'unknown'
+            stamp = (import_info['end_date'] or datetime.now().strftime('%Y-%m-%d')).replace('-', '')
+            path = self.tracking_dir / "snapshots" / snapshot_type / f"{snapshot_type}_{safe_domain}_{stamp}_keywords.json"
+        else:
+            if into is None:
+                self.catalog.ensure_fresh()
+                entry = self.catalog.latest(snapshot_type, domain)
+                if entry is None:
+                    raise KeywordImportError(f"no {snapshot_type} snapshot for {domain}; use --new or --into")
+                into = self.catalog.resolve(entry)
+            path = Path(into)
+            if split_member_path(path):
+                raise KeywordImportError(f"{path} is archived; use --new or --into a loose snapshot")
+            with open(path, 'r') as f:
+                snapshot = json.load(f)
+
+        ranking_metrics = snapshot.setdefault('ranking_metrics', {})
+        ranking_metrics.update(ranking)
+        snapshot.setdefault('metadata', {})['keyword_import'] = import_info
+
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = path.with_suffix(f".{os.getpid()}.tmp")
+        with open(tmp_path, 'w') as f:
+            json.dump(snapshot, f, indent=2)
+        os.replace(tmp_path, path)
+        self.catalog.record(path, snapshot_type)
+        return path
+
+def main():
+    """Import a GSC or GA4 keyword export."""
+    import argparse
+
+    parser = argparse.ArgumentParser(description="SEO Agent Keyword Export Import")
+    parser.add_argument("export", help="GSC/GA4 export (.csv, .tsv, .jsonl, optionally .gz)")
+    parser.add_argument("--domain", required=True, help="Domain the export belongs to")
+    parser.add_argument("--type", default="weekly", help="Snapshot type to update")
+    parser.add_argument("--into", help="Snapshot file to update (default: latest of the type)")
+    parser.add_argument("--new", action="store_true", help="Write a new ranking-only snapshot")
+    parser.add_argument("--tracking-dir", default="tracking", help="Tracking data directory")
+    args = parser.parse_args()
+
+    try:
+        result = KeywordImporter(Path(args.tracking_dir)).import_file(
+            args.export, args.domain, args.type, args.into, args.new)
+    except (KeywordImportError, OSError) as e:
+        print(f"❌ {e}")
+        return 1
+
+    distribution = result['ranking_metrics']['keyword_distribution']
+    print(f"🔑 Imported {result['rows']:,} keyword rows into {result['snapshot']}")
+    print(f"  Keywords: {distribution['total_keywords']:,}  Top 10: {distribution['top_10']:,}  "
+          f"Top 100: {distribution['top_100']:,}")
+    print(f"  Sidecar: {result['sidecar']}")
+    return 0
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -4,6 +4,7 @@ SEO Agent Library - Marketing Automation Integration
 Orchestrates all marketing tools for seamless case study and presentation generation.
 """
 
+import copy
 import json
 import yaml
 import os
@@ -11,6 +12,7 @@ import sys
 from datetime import datetime, timedelta
 from pathlib import Path
 from typing import Dict, List, Any, Optional, Union
+from snapshot_catalog import SnapshotCatalog
 
 # Import marketing components
 try:
@@ -32,6 +34,7 @@ class MarketingAutomationOrchestrator:
         self.tracking_dir = Path("tracking")
         self.marketing_dir = self.tracking_dir / "marketing"
         self.output_dir = self.marketing_dir / "generated"
+        self.catalog = SnapshotCatalog(self.tracking_dir)
         
         # Initialize components
         try:
@@ -84,13 +87,10 @@ class MarketingAutomationOrchestrator:
                 return json.load(f)
         
         # Try to load latest snapshot
-        snapshots_dir = self.tracking_dir / "snapshots" / "weekly"
-        if snapshots_dir.exists():
-            snapshot_files = list(snapshots_dir.glob("*.json"))
-            if snapshot_files:
-                latest_file = max(snapshot_files, key=lambda f: f.stat().st_mtime)
-                with open(latest_file, 'r') as f:
-                    return json.load(f)
+        self.catalog.ensure_fresh()
+        latest = self.catalog.latest("weekly")
+        if latest:
+            return self.catalog.load(latest)
         
         # Fallback to mock data
         return self._generate_mock_data()
@@ -256,7 +256,8 @@ class MarketingAutomationOrchestrator:
     
     def _create_baseline_from_current(self, current_data: Dict[str, Any]) -> Dict[str, Any]:
         """Create baseline data from current data (for demo purposes)."""
-        baseline = current_data.copy()
+        # Deep copy: the nested metrics are shared (and read-only when cached)
+        baseline = copy.deepcopy(current_data)
         
         # Reduce metrics to simulate baseline
         if 'traffic_metrics' in baseline:
@@ -0,0 +1,314 @@
+#!/usr/bin/env python3
+"""
+SEO Agent Library - Columnar Metric Store
+Flattens snapshot metrics into per-column time series for fast trend queries.
+"""
+
+import bisect
+import json
+import math
+import mmap
+import os
+import re
+import shutil
+import sys
+from array import array
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Dict, List, Any, Optional
+
+from snapshot_catalog import SnapshotCatalog, CatalogEntry
+from snapshot_metadata import parse_timestamp
+from snapshot_archive import ArchiveError
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+STORE_VERSION = 1
+MANIFEST_FILENAME = "manifest.json"
+TIMESTAMP_COLUMN = "_timestamp"
+
+def flatten_metrics(data: Dict[str, Any], prefix: str = "") -> Dict[str, Any]:
+    """
+    Flatten nested numeric snapshot fields into dotted paths.
+
+    ``{'traffic_metrics': {'organic_traffic': {'sessions': 1200}}}`` becomes
+    ``{'traffic_metrics.organic_traffic.sessions': 1200}``. Metadata,
+    strings, booleans and lists are not metrics and are skipped.
+    """
+    metrics = {}
+    for key, value in data.items():
+        if not prefix and key == 'metadata':
+            continue
+        path = f"{prefix}.{key}" if prefix else key
+        if isinstance(value, dict):
+            metrics.update(flatten_metrics(value, path))
+        elif isinstance(value, (int, float)) and not isinstance(value, bool):
+            metrics[path] = value
+    return metrics
+
+def _column_filename(metric: str) -> str:
+    """File name of a column file for a metric path."""
+    return re.sub(r'[^A-Za-z0-9_.-]', '_', metric) + ".f64"
+
+class ColumnReader:
+    """Memory-mapped read-only view of one float64 column file."""
+
+    def __init__(self, path: Path, length: int):
+        self.path = path
+        self.length = length
+        self._file = None
+        self._mmap = None
+        self.values = None
+
+        if length == 0:
+            self.values = np.empty(0) if np is not None else []
+        elif np is not None:
+            self.values = np.memmap(path, dtype='<f8', mode='r', shape=(length,))
+        else:
+            self._file = open(path, 'rb')
+            self._mmap = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+            view = memoryview(self._mmap).cast('d')
+            if sys.byteorder == 'little':
+                self.values = view
+            else:
+                self.values = array('d', view)
+                self.values.byteswap()
+                view.release()
+
+    def close(self):
+        """Release the mapping."""
+        if isinstance(self.values, memoryview):
+            self.values.release()
+        self.values = None
+        if self._mmap is not None:
+            self._mmap.close()
+            self._file.close()
+
+class MetricStore:
+    """
+    Columnar time-series store for snapshot metrics.
+
+    Each (domain, snapshot type) series lives in
+    ``<tracking_dir>/metrics/<domain>/<type>/`` as one little-endian float64
+    file per metric path plus a ``_timestamp`` column, with a manifest that
+    records the column kinds and the content hash of every source snapshot.
+    Missing values are NaN. Columns are memory-mapped on read (with NumPy
+    when installed, otherwise ``mmap``), so a query only pages in the
+    columns and rows it asks for.
+
+    ``sync()`` keeps the store in step with the snapshot catalog: new
+    snapshots at the end of a series are appended, and any other change
+    (an edited or removed snapshot) rebuilds that series.
+    """
+
+    def __init__(self, tracking_dir: Path = None):
+        self.tracking_dir = Path(tracking_dir or "tracking")
+        self.store_dir = self.tracking_dir / "metrics"
+
+    def _series_dir(self, domain: str, snapshot_type: str) -> Path:
+        return self.store_dir / re.sub(r'[^A-Za-z0-9_.-]', '_', domain or '_') / snapshot_type
+
+    def _load_manifest(self, series_dir: Path) -> Optional[Dict[str, Any]]:
+        try:
+            with open(series_dir / MANIFEST_FILENAME, 'r') as f:
+                manifest = json.load(f)
+        except (FileNotFoundError, json.JSONDecodeError):
+            return None
+        return manifest if manifest.get('version') == STORE_VERSION else None
+
+    def _save_manifest(self, series_dir: Path, manifest: Dict[str, Any]):
+        tmp_path = series_dir / f"{MANIFEST_FILENAME}.{os.getpid()}.tmp"
+        with open(tmp_path, 'w') as f:
+            json.dump(manifest, f)
+        os.replace(tmp_path, series_dir / MANIFEST_FILENAME)
+
+    def sync(self, catalog: SnapshotCatalog, snapshot_types: List[str] = None) -> int:
+        """
+        Bring every catalogued series up to date.
+
+        Args:
+            catalog: Refreshed snapshot catalog
+            snapshot_types: Types to sync (default: all snapshot types)
+
+        Returns:
+            Number of snapshot rows written
+        """
+        written = 0
+        for snapshot_type in snapshot_types or ["daily", "weekly", "monthly"]:
+            for domain in catalog.domains(snapshot_type):
+                entries = catalog.last_n(snapshot_type, catalog.count(snapshot_type, domain), domain)
+                written += self._sync_series(catalog, domain, snapshot_type, entries)
+        return written
+
+    def _sync_series(self, catalog: SnapshotCatalog, domain: str, snapshot_type: str,
+                     entries: List[CatalogEntry]) -> int:
+        """Append new rows to one series, or rebuild it if history changed."""
+        series_dir = self._series_dir(domain, snapshot_type)
+        manifest = self._load_manifest(series_dir)
+        hashes = [entry.content_hash for entry in entries]
+
+        if manifest and manifest['sources'] == hashes:
+            return 0
+
+        if (manifest and hashes[:len(manifest['sources'])] == manifest['sources']
+                and self._columns_intact(series_dir, manifest)):
+            new_entries = entries[len(manifest['sources']):]
+        else:
+            if series_dir.exists():
+                shutil.rmtree(series_dir)
+            manifest = {'version': STORE_VERSION, 'domain': domain,
+                        'snapshot_type': snapshot_type, 'rows': 0,
+                        'columns': {}, 'sources': []}
+            new_entries = entries
+
+        rows = []
+        for entry in new_entries:
+            try:
+                data = catalog.load(entry)
+            except (OSError, json.JSONDecodeError, ArchiveError) as e:
+                print(f"Warning: skipping snapshot {entry.path}: {e}")
+                data = {}
+            metrics = flatten_metrics(data)
+            metrics[TIMESTAMP_COLUMN] = entry.position
+            rows.append(metrics)
+
+        series_dir.mkdir(parents=True, exist_ok=True)
+        self._append_rows(series_dir, manifest, rows)
+        manifest['sources'] = hashes
+        self._save_manifest(series_dir, manifest)
+        return len(rows)
+
+    def _columns_intact(self, series_dir: Path, manifest: Dict[str, Any]) -> bool:
+        """Whether every column file holds exactly the manifest's row count."""
+        expected = manifest['rows'] * 8
+        for info in manifest['columns'].values():
+            try:
+                if (series_dir / info['file']).stat().st_size != expected:
+                    return False
+            except FileNotFoundError:
+                return False
+        return True
+
+    def _append_rows(self, series_dir: Path, manifest: Dict[str, Any],
+                     rows: List[Dict[str, Any]]):
+        """Append rows column by column, backfilling new columns with NaN."""
+        old_rows = manifest['rows']
+        columns = manifest['columns']
+
+        for row in rows:
+            for metric, value in row.items():
+                if metric not in columns:
+                    columns[metric] = {'file': _column_filename(metric), 'kind': 'int'}
+                if isinstance(value, float):
+                    columns[metric]['kind'] = 'float'
+
+        for metric, info in columns.items():
+            column_path = series_dir / info['file']
+            backfill = 0 if column_path.exists() else old_rows
+            values = array('d', [float('nan')] * backfill)
+            values.extend(float(row.get(metric, float('nan'))) for row in rows)
+            if sys.byteorder != 'little':
+                values.byteswap()
+            with open(column_path, 'ab') as f:
+                values.tofile(f)
+
+        manifest['rows'] = old_rows + len(rows)
+
+    def query(self, metrics: List[str], domain: str, snapshot_type: str = "weekly",
+              last: int = None, start: datetime = None,
+              end: datetime = None) -> Dict[str, List[Any]]:
+        """
+        Read metric columns for one domain's series.
+
+        Args:
+            metrics: Dotted metric paths, e.g. 'traffic_metrics.organic_traffic.sessions'
+            domain: Domain to read
+            snapshot_type: Series type ('daily', 'weekly', 'monthly')
+            last: Only the most recent N periods
+            start: Only periods at or after this time (naive = UTC)
+            end: Only periods at or before this time (naive = UTC)
+
+        Returns:
+            Mapping with 'timestamps' (UTC datetimes) and one list per metric, in
+            chronological order; missing values are None, unknown metrics
+            are all None
+        """
+        series_dir = self._series_dir(domain, snapshot_type)
+        manifest = self._load_manifest(series_dir)
+        if not manifest or manifest['rows'] == 0:
+            return {'timestamps': [], **{metric: [] for metric in metrics}}
+
+        length = manifest['rows']
+        columns = manifest['columns']
+
+        timestamps = ColumnReader(series_dir / columns[TIMESTAMP_COLUMN]['file'], length)
+        try:
+            ts_values = timestamps.values
+            lo = 0 if start is None else bisect.bisect_left(ts_values, parse_timestamp(start.isoformat()))
+            hi = length if end is None else bisect.bisect_right(ts_values, parse_timestamp(end.isoformat()))
+            if last is not None:
+                lo = max(lo, hi - last)
+            result = {'timestamps': [datetime.fromtimestamp(ts, timezone.utc) for ts in ts_values[lo:hi]]}
+        finally:
+            timestamps.close()
+
+        for metric in metrics:
+            info = columns.get(metric)
+            if info is None:
+                result[metric] = [None] * (hi - lo)
+                continue
+            reader = ColumnReader(series_dir / info['file'], length)
+            try:
+                cast = int if info['kind'] == 'int' else float
+                result[metric] = [None if math.isnan(v) else cast(v) for v in reader.values[lo:hi]]
+            finally:
+                reader.close()
+
+        return result
+
+    def list_metrics(self, domain: str, snapshot_type: str = "weekly") -> List[str]:
+        """Metric paths stored for a series."""
+        manifest = self._load_manifest(self._series_dir(domain, snapshot_type))
+        if not manifest:
+            return []
+        return sorted(m for m in manifest['columns'] if m != TIMESTAMP_COLUMN)
+
+def main():
+    """Sync the metric store and print a metric series."""
+    import argparse
+
+    parser = argparse.ArgumentParser(description="SEO Agent Columnar Metric Store")
+    parser.add_argument("--tracking-dir", default="tracking", help="Tracking data directory")
+    parser.add_argument("--domain", help="Domain to query (default: first indexed domain)")
+    parser.add_argument("--type", default="weekly", help="Snapshot type")
+    parser.add_argument("--last", type=int, help="Only the most recent N periods")
+    parser.add_argument("metrics", nargs="*", help="Dotted metric paths to print")
+    args = parser.parse_args()
+
+    catalog = SnapshotCatalog(Path(args.tracking_dir))
+    catalog.refresh()
+    store = MetricStore(Path(args.tracking_dir))
+    written = store.sync(catalog)
+    print(f"📦 Metric store synced ({written} new rows)")
+
+    domains = catalog.domains(args.type)
+    domain = args.domain or (domains[0] if domains else None)
+    if not domain:
+        print("No snapshots indexed")
+        return
+
+    if not args.metrics:
+        for metric in store.list_metrics(domain, args.type):
+            print(f"  {metric}")
+        return
+
+    series = store.query(args.metrics, domain, args.type, last=args.last)
+    for i, timestamp in enumerate(series['timestamps']):
+        values = "  ".join(str(series[m][i]) for m in args.metrics)
+        print(f"  {timestamp:%Y-%m-%d %H:%M}  {values}")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,299 @@
+#!/usr/bin/env python3
+"""
+SEO Agent Library - Keyword Rank History
+Compact per-keyword daily positions with mover, striking-distance and new/lost queries.
+"""
+
+import bisect
+import os
+import re
+from datetime import date, datetime
+from pathlib import Path
+from typing import Dict, List, Any, Optional, Union
+
+from keyword_import import KeywordSidecar
+
+DAY_SUFFIX = ".u8"
+KEYWORDS_FILENAME = "keywords.txt"
+NOT_RANKED = 0
+MAX_POSITION = 255  # stored positions saturate here ("255 or worse")
+
+def encode_position(position: Optional[float]) -> int:
+    """Pack an average position into one byte; 0 means not ranked."""
+    if position is None or position != position or position <= 0:
+        return NOT_RANKED
+    return max(1, min(MAX_POSITION, int(position + 0.5)))
+
+def _as_date(value: Union[date, datetime, str]) -> date:
+    if isinstance(value, datetime):
+        return value.date()
+    if isinstance(value, date):
+        return value
+    return date.fromisoformat(str(value)[:10])
+
+class RankHistory:
+    """
+    Daily keyword positions for one domain.
+
+    Stored in ``<tracking_dir>/rank-history/<domain>/``: ``keywords.txt``
+    interns every keyword to an id (its line number), and each day is one
+    ``YYYY-MM-DD.u8`` file holding one byte per keyword id, the rounded
+    position (1-254, 255 for anything worse) or 0 if the keyword did not
+    rank. 100k keywords cost 100 KB per day, and comparing two days is a
+    single pass over two byte arrays.
+    """
+
+    def __init__(self, tracking_dir: Path = None, domain: str = ""):
+        self.tracking_dir = Path(tracking_dir or "tracking")
+        self.domain = domain
+        self.directory = (self.tracking_dir / "rank-history" /
+                          re.sub(r'[^A-Za-z0-9_.-]', '_', domain or '_'))
+        self._keywords: Optional[List[str]] = None
+        self._ids: Optional[Dict[str, int]] = None
+        self._new_keywords: List[str] = []
+
+    def keywords(self) -> List[str]:
+        """Interned keywords; the index is the keyword id."""
+        if self._keywords is None:
+            try:
+                with open(self.directory / KEYWORDS_FILENAME, 'r', encoding='utf-8') as f:
+                    self._keywords = f.read().split('\n')[:-1]
+            except FileNotFoundError:
+                self._keywords = []
+            self._ids = {keyword: i for i, keyword in enumerate(self._keywords)}
+        return self._keywords
+
+    def _intern(self, keyword: str) -> int:
+        self.keywords()
+        keyword = keyword.replace('\n', ' ').replace('\r', ' ')
+        keyword_id = self._ids.get(keyword)
+        if keyword_id is None:
+            keyword_id = len(self._keywords)
+            self._keywords.append(keyword)
+            self._ids[keyword] = keyword_id
+            self._new_keywords.append(keyword)
+        return keyword_id
+
+    def _save_keywords(self):
+        if not self._new_keywords:
+            return
+        self.directory.mkdir(parents=True, exist_ok=True)
+        with open(self.directory / KEYWORDS_FILENAME, 'a', encoding='utf-8') as f:
+            f.write(''.join(keyword + '\n' for keyword in self._new_keywords))
+        self._new_keywords = []
+
+    def days(self) -> List[date]:
+        """Days with stored positions, oldest first."""
+        if not self.directory.exists():
+            return []
+        return sorted(date.fromisoformat(path.name[:-len(DAY_SUFFIX)])
+                      for path in self.directory.glob(f"*{DAY_SUFFIX}"))
+
+    def resolve_day(self, when: Union[date, datetime, str]) -> Optional[date]:
+        """Latest stored day on or before ``when``, or None."""
+        days = self.days()
+        index = bisect.bisect_right(days, _as_date(when))
+        return days[index - 1] if index else None
+
+    def positions(self, day: Union[date, datetime, str]) -> bytearray:
+        """Packed positions of a stored day, one byte per keyword id."""
+        path = self.directory / f"{_as_date(day).isoformat()}{DAY_SUFFIX}"
+        try:
+            values = bytearray(path.read_bytes())
+        except FileNotFoundError:
+            values = bytearray()
+        # Keywords interned after the day was written did not rank on it
+        values.extend(bytes(len(self.keywords()) - len(values)))
+        return values
+
+    def _write_day(self, day: date, values: bytearray):
+        path = self.directory / f"{day.isoformat()}{DAY_SUFFIX}"
+        tmp_path = path.with_suffix(f".{os.getpid()}.tmp")
+        tmp_path.write_bytes(values)
+        os.replace(tmp_path, path)
+
+    def ingest_sidecar(self, sidecar: Union[KeywordSidecar, str, Path]) -> int:
+        """
+        Record the positions of a keyword import sidecar.
+
+        Rows for a keyword appearing more than once on a day keep the best
+        position. Days already in the store are merged, with the sidecar's
+        positions winning, so re-importing an export is idempotent. Undated
+        exports are recorded on the day they were imported.
+
+        Returns:
+            Number of days written
+        """
+        if not isinstance(sidecar, KeywordSidecar):
+            sidecar = KeywordSidecar(sidecar)
+        fallback_day = _as_date(sidecar.manifest.get('imported_at') or date.today())
+
+        updates: Dict[date, bytearray] = {}
+        for keyword, day, _, _, position in sidecar.iter_rows():
+            packed = encode_position(position)
+            if packed == NOT_RANKED:
+                continue
+            keyword_id = self._intern(keyword)
+            values = updates.get(day or fallback_day)
+            if values is None:
+                values = updates[day or fallback_day] = bytearray()
+            if keyword_id >= len(values):
+                values.extend(bytes(keyword_id + 1 - len(values)))
+            current = values[keyword_id]
+            if current == NOT_RANKED or packed < current:
+                values[keyword_id] = packed
+
+        self.directory.mkdir(parents=True, exist_ok=True)
+        self._save_keywords()
+        for day, values in updates.items():
+            merged = self.positions(day)
+            for keyword_id, packed in enumerate(values):
+                if packed:
+                    merged[keyword_id] = packed
+            self._write_day(day, merged)
+        return len(updates)
+
+    def history(self, keyword: str) -> List[Dict[str, Any]]:
+        """Stored positions of one keyword, oldest first (days it ranked)."""
+        self.keywords()
+        keyword_id = self._ids.get(keyword)
+        if keyword_id is None:
+            return []
+        result = []
+        for day in self.days():
+            packed = self.positions(day)[keyword_id]
+            if packed:
+                result.append({'date': day, 'position': packed})
+        return result
+
+    def _pair(self, start: Union[date, datetime, str],
+              end: Union[date, datetime, str]) -> Optional[tuple]:
+        start_day, end_day = self.resolve_day(start), self.resolve_day(end)
+        if start_day is None or end_day is None:
+            return None
+        return start_day, end_day, self.positions(start_day), self.positions(end_day)
+
+    def movers(self, start: Union[date, datetime, str], end: Union[date, datetime, str],
+               limit: Optional[int] = 20, min_change: int = 1,
+               max_position: int = MAX_POSITION) -> Dict[str, List[Dict[str, Any]]]:
+        """
+        Keywords ranked on both days whose position changed the most.
+
+        Only keywords within the top ``max_position`` on at least one of the
+        days are considered; ``limit=None`` returns every mover.
+
+        Returns:
+            'improved' and 'declined' lists of {keyword, before, after, change}
+            (change = places gained, negative when declining), biggest first
+        """
+        pair = self._pair(start, end)
+        if pair is None:
+            return {'improved': [], 'declined': []}
+        _, _, before, after = pair
+
+        changes = [(old - new, keyword_id)
+                   for keyword_id, (old, new) in enumerate(zip(before, after))
+                   if old and new and abs(old - new) >= min_change
+                   and min(old, new) <= max_position]
+        improved = sorted((c for c in changes if c[0] > 0), key=lambda c: -c[0])[:limit]
+        declined = sorted((c for c in changes if c[0] < 0), key=lambda c: c[0])[:limit]
+
+        keywords = self.keywords()
+        describe = lambda c: {'keyword': keywords[c[1]], 'before': before[c[1]],
+                              'after': after[c[1]], 'change': c[0]}
+        return {'improved': [describe(c) for c in improved],
+                'declined': [describe(c) for c in declined]}
+
+    def striking_distance(self, day: Union[date, datetime, str], low: int = 11, high: int = 20,
+                          limit: int = None) -> List[Dict[str, Any]]:
+        """Keywords ranking between ``low`` and ``high`` on a day, best position first."""
+        resolved = self.resolve_day(day)
+        if resolved is None:
+            return []
+        positions = self.positions(resolved)
+        keywords = self.keywords()
+        matches = sorted((packed, keyword_id) for keyword_id, packed in enumerate(positions)
+                         if low <= packed <= high)
+        if limit is not None:
+            matches = matches[:limit]
+        return [{'keyword': keywords[keyword_id], 'position': packed}
+                for packed, keyword_id in matches]
+
+    def new_and_lost(self, start: Union[date, datetime, str], end: Union[date, datetime, str],
+                     max_position: int = 100) -> Dict[str, List[Dict[str, Any]]]:
+        """
+        Keywords that entered or dropped out of the top ``max_position``.
+
+        Returns:
+            'new' (ranked at end only) and 'lost' (ranked at start only)
+            lists of {keyword, position}, best position first
+        """
+        pair = self._pair(start, end)
+        if pair is None:
+            return {'new': [], 'lost': []}
+        _, _, before, after = pair
+        keywords = self.keywords()
+
+        def ranked(packed: int) -> bool:
+            return NOT_RANKED < packed <= max_position
+
+        new = sorted((new, keyword_id) for keyword_id, (old, new) in enumerate(zip(before, after))
+                     if ranked(new) and not ranked(old))
+        lost = sorted((old, keyword_id) for keyword_id, (old, new) in enumerate(zip(before, after))
+                      if ranked(old) and not ranked(new))
+        return {'new': [{'keyword': keywords[i], 'position': p} for p, i in new],
+                'lost': [{'keyword': keywords[i], 'position': p} for p, i in lost]}
+
+def main():
+    """Ingest keyword sidecars or query a domain's rank history."""
+    import argparse
+
+    parser = argparse.ArgumentParser(description="SEO Agent Keyword Rank History")
+    parser.add_argument("--tracking-dir", default="tracking", help="Tracking data directory")
+    parser.add_argument("--domain", required=True, help="Domain")
+    subparsers = parser.add_subparsers(dest='command')
+
+    ingest_parser = subparsers.add_parser('ingest', help='Record keyword import sidecars')
+    ingest_parser.add_argument('sidecars', nargs='+', help='Sidecar directories')
+
+    movers_parser = subparsers.add_parser('movers', help='Biggest position changes')
+    movers_parser.add_argument('start', help='Start date (YYYY-MM-DD)')
+    movers_parser.add_argument('end', help='End date (YYYY-MM-DD)')
+    movers_parser.add_argument('--limit', type=int, default=20)
+
+    striking_parser = subparsers.add_parser('striking', help='Keywords ranking 11-20')
+    striking_parser.add_argument('date', help='Date (YYYY-MM-DD)')
+    striking_parser.add_argument('--limit', type=int, default=50)
+
+    changes_parser = subparsers.add_parser('new-lost', help='Keywords entering or leaving the top 100')
+    changes_parser.add_argument('start', help='Start date (YYYY-MM-DD)')
+    changes_parser.add_argument('end', help='End date (YYYY-MM-DD)')
+
+    args = parser.parse_args()
+    history = RankHistory(Path(args.tracking_dir), args.domain)
+
+    if args.command == 'ingest':
+        for sidecar in args.sidecars:
+            print(f"📈 {sidecar}: {history.ingest_sidecar(sidecar)} days recorded")
+    elif args.command == 'movers':
+        result = history.movers(args.start, args.end, args.limit)
+        for label in ('improved', 'declined'):
+            print(f"{label.title()}:")
+            for row in result[label]:
+                print(f"  {row['keyword']}: {row['before']} → {row['after']} ({row['change']:+d})")
+    elif args.command == 'striking':
+        for row in history.striking_distance(args.date, limit=args.limit):
+            print(f"  #{row['position']}  {row['keyword']}")
+    elif args.command == 'new-lost':
+        result = history.new_and_lost(args.start, args.end)
+        for label in ('new', 'lost'):
+            print(f"{label.title()} ({len(result[label])}):")
+            for row in result[label][:50]:
+                print(f"  #{row['position']}  {row['keyword']}")
+    else:
+        parser.print_help()
+        return 1
+    return 0
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -11,19 +11,17 @@ from datetime import datetime, timedelta
 from pathlib import Path
 from typing import Dict, List, Any, Optional, Union
 import statistics
-from dataclasses import dataclass, asdict
+from dataclasses import asdict
 from collections import defaultdict
 import re
-
-@dataclass
-class MetricChange:
-    """Represents a metric change with percentage and trend."""
-    previous: Union[int, float]
-    current: Union[int, float]
-    change_percent: float
-    change_absolute: Union[int, float]
-    trend: str  # 'up', 'down', 'stable'
-    status: str  # 'good', 'warning', 'critical'
+from snapshot_catalog import SnapshotCatalog, BASELINE_TYPE
+from metric_store import MetricStore
+from snapshot_archive import load_snapshot_file, ArchiveError
+from snapshot_cache import SNAPSHOT_CACHE
+from warehouse import Warehouse
+from schema_validator import BASELINE_SCHEMA, Violation, validate_files
+from rank_history import RankHistory
+from trend_engine import MetricChange, TrendAnalysis, TrendEngine, ROLLING_WINDOW, calculate_change
 
 class ReportEngine:
     """Core report generation engine for SEO Agent Library."""
@@ -36,6 +34,14 @@ class ReportEngine:
         self.snapshots_dir = self.tracking_dir / "snapshots"
         self.reports_dir = self.tracking_dir / "reports"
         self.templates_dir = self.tracking_dir / "templates"
+        self.catalog = SnapshotCatalog(self.tracking_dir)
+        self.metric_store = MetricStore(self.tracking_dir)
+        self.warehouse = Warehouse(self.tracking_dir)
+        self.snapshot_cache = SNAPSHOT_CACHE
+        self.trend_engine = TrendEngine(self.config.get('reporting', {}).get('trend_window', ROLLING_WINDOW))
+        cache_mb = self.config.get('reporting', {}).get('snapshot_cache_mb')
+        if cache_mb is not None:
+            self.snapshot_cache.max_bytes = int(float(cache_mb) * 1024 * 1024)
         
         # Create directories if they don't exist
         for dir_path in [self.reports_dir / "automated", 
@@ -70,94 +76,111 @@ class ReportEngine:
                         current: Union[int, float], 
                         reverse_trend: bool = False) -> MetricChange:
         """Calculate metric change with trend and status."""
-        if previous == 0:
-            change_percent = 100.0 if current > 0 else 0.0
-            change_absolute = current
-        else:
-            change_percent = ((current - previous) / previous) * 100
-            change_absolute = current - previous
-        
-        # Determine trend
-        if abs(change_percent) < 2:
-            trend = 'stable'
-        elif change_percent > 0:
-            trend = 'down' if reverse_trend else 'up'
-        else:
-            trend = 'up' if reverse_trend else 'down'
-        
-        # Determine status
-        if abs(change_percent) < 5:
-            status = 'good'
-        elif abs(change_percent) < 15:
-            status = 'warning'
-        else:
-            status = 'critical'
-        
-        return MetricChange(
-            previous=previous,
-            current=current,
-            change_percent=change_percent,
-            change_absolute=change_absolute,
-            trend=trend,
-            status=status
-        )
+        return calculate_change(previous, current, reverse_trend)
     
     def load_snapshot_data(self, filepath: str) -> Optional[Dict[str, Any]]:
-        """Load data from a snapshot file."""
+        """
+        Load data from a snapshot file or an 'archive.snaparc!member' path.
+        
+        Snapshots come from the process-wide parsed-snapshot cache and are
+        read-only; use copy.deepcopy() before modifying one.
+        """
         try:
-            with open(filepath, 'r') as f:
-                return json.load(f)
-        except (FileNotFoundError, json.JSONDecodeError) as e:
+            return self.snapshot_cache.get(filepath, load_snapshot_file)
+        except (FileNotFoundError, json.JSONDecodeError, ArchiveError) as e:
             print(f"Error loading snapshot {filepath}: {e}")
             return None
     
     def get_latest_snapshot(self, snapshot_type: str = "weekly") -> Optional[Dict[str, Any]]:
         """Get the most recent snapshot of specified type."""
-        snapshot_dir = self.snapshots_dir / snapshot_type
-        if not snapshot_dir.exists():
-            return None
-        
-        snapshot_files = list(snapshot_dir.glob("*.json"))
-        if not snapshot_files:
+        self.catalog.ensure_fresh()
+        entry = self.catalog.latest(snapshot_type)
+        if not entry:
             return None
         
-        latest_file = max(snapshot_files, key=lambda f: f.stat().st_mtime)
-        return self.load_snapshot_data(str(latest_file))
+        return self.load_snapshot_data(str(self.catalog.resolve(entry)))
     
     def get_baseline_data(self) -> Optional[Dict[str, Any]]:
         """Get baseline data for comparison."""
-        baseline_dir = self.tracking_dir / "baselines"
-        if not baseline_dir.exists():
-            return None
-        
-        baseline_files = list(baseline_dir.glob("*.json"))
-        if not baseline_files:
-            return None
-        
         # Use the most recent baseline
-        latest_baseline = max(baseline_files, key=lambda f: f.stat().st_mtime)
-        return self.load_snapshot_data(str(latest_baseline))
+        return self.get_latest_snapshot(BASELINE_TYPE)
     
     def get_snapshot_series(self, snapshot_type: str = "weekly", 
                            count: int = 8) -> List[Dict[str, Any]]:
         """Get a series of snapshots for trend analysis."""
-        snapshot_dir = self.snapshots_dir / snapshot_type
-        if not snapshot_dir.exists():
-            return []
-        
-        snapshot_files = sorted(
-            snapshot_dir.glob("*.json"),
-            key=lambda f: f.stat().st_mtime,
-            reverse=True
-        )
+        self.catalog.ensure_fresh()
         
         snapshots = []
-        for file_path in snapshot_files[:count]:
-            data = self.load_snapshot_data(str(file_path))
+        for entry in self.catalog.last_n(snapshot_type, count):
+            data = self.load_snapshot_data(str(self.catalog.resolve(entry)))
             if data:
                 snapshots.append(data)
         
-        return list(reversed(snapshots))  # Return chronological order
+        return snapshots  # Chronological order
+    
+    def validate_snapshots(self, snapshot_types: List[str],
+                           count: int = 8) -> Dict[str, List[Violation]]:
+        """
+        Check the most recent snapshots of each type against baseline.schema.json.
+        
+        Returns:
+            Violations of every invalid snapshot, keyed by path (empty if all valid)
+        """
+        self.catalog.ensure_fresh()
+        schema = self.tracking_dir.parent / BASELINE_SCHEMA
+        jobs = [(self.catalog.resolve(entry), schema)
+                for snapshot_type in snapshot_types
+                for entry in self.catalog.last_n(snapshot_type, count)]
+        return validate_files(jobs)
+    
+    def get_metric_series(self, metrics: List[str], snapshot_type: str = "weekly",
+                          last: int = None, start: datetime = None, end: datetime = None,
+                          domain: str = None) -> Dict[str, List[Any]]:
+        """
+        Query metric time series from the columnar store.
+        
+        Reads only the requested columns instead of loading whole snapshots,
+        e.g. sessions over the last 52 weeks:
+        
+            engine.get_metric_series(['traffic_metrics.organic_traffic.sessions'], last=52)
+        
+        Returns a mapping with 'timestamps' and one chronological list per
+        metric path (None where a snapshot lacks the metric).
+        """
+        self.catalog.ensure_fresh()
+        self.metric_store.sync(self.catalog, [snapshot_type])
+        domain = domain or self.config.get('domain', 'example.com')
+        return self.metric_store.query(metrics, domain, snapshot_type, last, start, end)
+    
+    def get_metric_trends(self, metrics: List[str], snapshot_type: str = "weekly",
+                          last: int = 8, domain: str = None) -> TrendAnalysis:
+        """Trend statistics of metric columns from the columnar store."""
+        return self.trend_engine.analyze_series(
+            self.get_metric_series(metrics, snapshot_type, last=last, domain=domain))
+    
+    def get_domain_comparison(self, metrics: List[str],
+                              snapshot_type: str = "weekly") -> Dict[str, Dict[str, float]]:
+        """
+        Latest value of each metric for every tracked domain, from the warehouse.
+        
+        Run ``/track ingest`` (or ``Warehouse.ingest()``) first to load new files.
+        """
+        return self.warehouse.latest_metrics(metrics, snapshot_type)
+    
+    def get_cross_period_series(self, metric: str, snapshot_type: str = "weekly",
+                                domain: str = None, start: datetime = None,
+                                end: datetime = None) -> List[Dict[str, Any]]:
+        """One metric over time from the warehouse, for one domain or all domains."""
+        return self.warehouse.metric_series(metric, snapshot_type, domain, start, end)
+    
+    def get_mission_history(self, domain: str = None) -> List[Dict[str, Any]]:
+        """Mission runs with AI-readiness and traditional SEO totals, newest first."""
+        return self.warehouse.missions(domain or self.config.get('domain'))
+    
+    def get_top_fixes(self, limit: int = 10, category: str = None,
+                      domain: str = None) -> List[Dict[str, Any]]:
+        """Highest-ROI fixes recorded by mission runs."""
+        return self.warehouse.top_fixes(domain or self.config.get('domain'), category, limit)
     
     def calculate_roi_metrics(self, current_data: Dict[str, Any], 
                              baseline_data: Dict[str, Any]) -> Dict[str, Any]:
@@ -169,14 +192,13 @@ class ReportEngine:
         hourly_rate = roi_config.get('seo_hourly_rate', 150)
         
         # Extract traffic metrics
-        current_traffic = current_data.get('traffic_metrics', {}).get('organic_traffic', {})
-        baseline_traffic = baseline_data.get('traffic_metrics', {}).get('organic_traffic', {})
-        
-        current_sessions = current_traffic.get('sessions', 0)
-        baseline_sessions = baseline_traffic.get('sessions', 0)
+        sessions_change = self.compare_snapshots(baseline_data, current_data, [
+            'traffic_metrics.organic_traffic.sessions'
+        ]).change('traffic_metrics.organic_traffic.sessions', default=0)
+        current_sessions = sessions_change.current
         
         # Calculate traffic value
-        session_increase = current_sessions - baseline_sessions
+        session_increase = sessions_change.change_absolute
         traffic_value = session_increase * session_value
         
         # Calculate conversion impact
@@ -231,13 +253,9 @@ class ReportEngine:
         
         # Traffic trend analysis
         if previous_data:
-            current_traffic = data.get('traffic_metrics', {}).get('organic_traffic', {})
-            previous_traffic = previous_data.get('traffic_metrics', {}).get('organic_traffic', {})
-            
-            traffic_change = self.calculate_change(
-                previous_traffic.get('sessions', 0),
-                current_traffic.get('sessions', 0)
-            )
+            traffic_change = self.compare_snapshots(previous_data, data, [
+                'traffic_metrics.organic_traffic.sessions'
+            ]).change('traffic_metrics.organic_traffic.sessions', default=0)
             
             if traffic_change.change_percent < self.config.get('alerts', {}).get('traffic_drop', -15):
                 issues.append({
@@ -248,14 +266,18 @@ class ReportEngine:
                     'owner': '@seo-analyst'
                 })
         
-        # Ranking opportunities
+        # Ranking opportunities, named keyword by keyword when rank history exists
         ranking_metrics = data.get('ranking_metrics', {})
         keyword_dist = ranking_metrics.get('keyword_distribution', {})
         
         top_20_keywords = keyword_dist.get('top_20', 0)
         top_10_keywords = keyword_dist.get('top_10', 0)
         
-        if top_20_keywords > top_10_keywords * 2:
+        keyword_findings = self._detect_keyword_changes(data, previous_data)
+        if keyword_findings is not None:
+            issues.extend(keyword_findings['issues'])
+            opportunities.extend(keyword_findings['opportunities'])
+        elif top_20_keywords > top_10_keywords * 2:
             opportunities.append({
                 'opportunity': 'Keywords Ready for Top 10 Push',
                 'description': f'{top_20_keywords - top_10_keywords} keywords ranking 11-20 could be optimized',
@@ -265,63 +287,120 @@ class ReportEngine:
         
         return {'issues': issues, 'opportunities': opportunities}
     
+    @staticmethod
+    def _snapshot_day(data: Dict[str, Any]) -> Optional[str]:
+        """Date a snapshot's rankings refer to: its keyword import's end date, else its timestamp."""
+        metadata = data.get('metadata', {})
+        day = metadata.get('keyword_import', {}).get('end_date') or metadata.get('timestamp')
+        return str(day)[:10] if day else None
+    
+    def _detect_keyword_changes(self, data: Dict[str, Any], previous_data: Dict[str, Any] = None,
+                                shown: int = 5) -> Optional[Dict[str, List[Dict[str, Any]]]]:
+        """
+        Keyword-level issues and opportunities from the domain's rank history.
+        
+        Returns None when no rank history covers the snapshot, so callers can
+        fall back to the aggregate keyword distribution.
+        """
+        day = self._snapshot_day(data)
+        if not day:
+            return None
+        history = RankHistory(self.tracking_dir, data.get('metadata', {}).get('domain', ''))
+        try:
+            current_day = history.resolve_day(day)
+        except ValueError:
+            return None
+        if current_day is None:
+            return None
+        
+        def names(rows: List[Dict[str, Any]], key: str = 'position') -> str:
+            listed = ", ".join(f"'{row['keyword']}' (#{row[key]})" for row in rows[:shown])
+            more = len(rows) - shown
+            return listed + (f" and {more:,} more" if more > 0 else "")
+        
+        issues, opportunities = [], []
+        striking = history.striking_distance(current_day)
+        if striking:
+            opportunities.append({
+                'opportunity': 'Keywords Ready for Top 10 Push',
+                'description': f"{len(striking):,} keywords ranking 11-20 could be optimized: {names(striking)}",
+                'impact': 'High - significant traffic increase potential',
+                'effort': 'Medium - content optimization and link building',
+                'keywords': [row['keyword'] for row in striking]
+            })
+        
+        previous_day = None
+        if previous_data and self._snapshot_day(previous_data):
+            try:
+                previous_day = history.resolve_day(self._snapshot_day(previous_data))
+            except ValueError:
+                previous_day = None
+        if previous_day is None or previous_day == current_day:
+            return {'issues': issues, 'opportunities': opportunities}
+        
+        drop_threshold = self.config.get('alerts', {}).get('ranking_drop', 3)
+        movers = history.movers(previous_day, current_day, limit=None,
+                                min_change=drop_threshold, max_position=100)
+        declined = [dict(row, position=f"{row['before']}→{row['after']}") for row in movers['declined']]
+        if declined:
+            issues.append({
+                'title': f"Ranking Drops on {len(declined):,} Keywords",
+                'severity': 'high',
+                'impact': 'Organic visibility for affected queries',
+                'action': f"Review content and internal links for {names(declined)}",
+                'owner': '@seo-analyst',
+                'keywords': [row['keyword'] for row in declined]
+            })
+        
+        changes = history.new_and_lost(previous_day, current_day)
+        if changes['lost']:
+            issues.append({
+                'title': f"{len(changes['lost']):,} Keywords Dropped Out of the Top 100",
+                'severity': 'medium',
+                'impact': 'Lost search visibility',
+                'action': f"Check indexing and relevance for {names(changes['lost'])}",
+                'owner': '@seo-analyst',
+                'keywords': [row['keyword'] for row in changes['lost']]
+            })
+        improved = [dict(row, position=f"{row['before']}→{row['after']}") for row in movers['improved']]
+        if improved or changes['new']:
+            gains = improved or changes['new']
+            opportunities.append({
+                'opportunity': 'Build on Ranking Gains',
+                'description': (f"{len(improved):,} keywords improved and {len(changes['new']):,} "
+                                f"entered the top 100, including {names(gains)}"),
+                'impact': 'Medium - reinforce pages that are gaining',
+                'effort': 'Low - internal links and content refreshes',
+                'keywords': [row['keyword'] for row in gains]
+            })
+        
+        return {'issues': issues, 'opportunities': opportunities}
+    
     def generate_trend_analysis(self, snapshots: List[Dict[str, Any]]) -> Dict[str, Any]:
         """Generate trend analysis from snapshot series."""
         if len(snapshots) < 2:
             return {}
         
-        # Extract time series data
-        sessions_data = []
-        rankings_data = []
-        performance_data = []
-        
-        for snapshot in snapshots:
-            # Traffic data
-            traffic = snapshot.get('traffic_metrics', {}).get('organic_traffic', {})
-            sessions_data.append(traffic.get('sessions', 0))
-            
-            # Ranking data
-            rankings = snapshot.get('ranking_metrics', {}).get('visibility', {})
-            rankings_data.append(rankings.get('average_position', 100))
-            
-            # Performance data
-            tech = snapshot.get('technical_metrics', {}).get('lighthouse_scores', {})
-            performance_data.append(tech.get('performance', 50))
-        
-        # Calculate trends
-        def calculate_trend(data_series):
-            if len(data_series) < 2:
-                return 'stable'
-            
-            # Simple linear regression slope
-            n = len(data_series)
-            x = list(range(n))
-            y = data_series
-            
-            sum_x = sum(x)
-            sum_y = sum(y)
-            sum_xy = sum(x[i] * y[i] for i in range(n))
-            sum_x2 = sum(x[i] ** 2 for i in range(n))
-            
-            if n * sum_x2 - sum_x ** 2 == 0:
-                return 'stable'
-                
-            slope = (n * sum_xy - sum_x * sum_y) / (n * sum_x2 - sum_x ** 2)
-            
-            if abs(slope) < 0.1:
-                return 'stable'
-            elif slope > 0:
-                return 'improving'
-            else:
-                return 'declining'
+        analysis = self.trend_engine.analyze(snapshots)
         
         return {
-            'sessions_trend': calculate_trend(sessions_data),
-            'rankings_trend': calculate_trend(rankings_data),
-            'performance_trend': calculate_trend(performance_data),
-            'data_points': len(snapshots)
+            'sessions_trend': analysis.direction_of('traffic_metrics.organic_traffic.sessions'),
+            'rankings_trend': analysis.direction_of('ranking_metrics.visibility.average_position'),
+            'performance_trend': analysis.direction_of('technical_metrics.lighthouse_scores.performance'),
+            'data_points': len(snapshots),
+            'metrics': analysis.to_dict()
         }
     
+    def compare_snapshots(self, previous: Optional[Dict[str, Any]], current: Dict[str, Any],
+                          metrics: List[str]) -> TrendAnalysis:
+        """
+        Previous-to-current changes of the given metrics in one pass.
+        
+        Call ``change(metric, default=...)`` on the result for each metric
+        a report displays.
+        """
+        return self.trend_engine.analyze([previous or {}, current], metrics)
+    
     def format_number(self, value: Union[int, float], format_type: str = 'default') -> str:
         """Format numbers for display in reports."""
         if format_type == 'currency':
@@ -376,13 +455,9 @@ class ReportEngine:
         roi_metrics = self.calculate_roi_metrics(current_data, baseline_data)
         
         # Calculate key changes
-        current_traffic = current_data.get('traffic_metrics', {}).get('organic_traffic', {})
-        baseline_traffic = baseline_data.get('traffic_metrics', {}).get('organic_traffic', {})
-        
-        traffic_change = self.calculate_change(
-            baseline_traffic.get('sessions', 0),
-            current_traffic.get('sessions', 0)
-        )
+        traffic_change = self.compare_snapshots(baseline_data, current_data, [
+            'traffic_metrics.organic_traffic.sessions'
+        ]).change('traffic_metrics.organic_traffic.sessions', default=0)
         
         summary_parts = []
         
@@ -117,14 +117,15 @@ class WeeklyProgressReport(BaseReport):
             'timestamp': self.generated_at.strftime('%Y-%m-%d %H:%M:%S')
         }
         
-        # Traffic metrics
-        current_traffic = current.get('traffic_metrics', {}).get('organic_traffic', {})
-        previous_traffic = previous.get('traffic_metrics', {}).get('organic_traffic', {}) if previous else {}
+        # Shown metrics, compared in one pass
+        changes = self.engine.compare_snapshots(previous, current, [
+            'traffic_metrics.organic_traffic.sessions',
+            'traffic_metrics.organic_traffic.users',
+            'ranking_metrics.visibility.average_position'
+        ])
         
-        sessions_change = self.engine.calculate_change(
-            previous_traffic.get('sessions', 0),
-            current_traffic.get('sessions', 0)
-        )
+        # Traffic metrics
+        sessions_change = changes.change('traffic_metrics.organic_traffic.sessions', default=0)
         
         data.update({
             'prev_sessions': self.engine.format_number(sessions_change.previous, 'integer'),
@@ -134,10 +135,7 @@ class WeeklyProgressReport(BaseReport):
         })
         
         # Users metrics
-        users_change = self.engine.calculate_change(
-            previous_traffic.get('users', 0),
-            current_traffic.get('users', 0)
-        )
+        users_change = changes.change('traffic_metrics.organic_traffic.users', default=0)
         
         data.update({
             'prev_users': self.engine.format_number(users_change.previous, 'integer'),
@@ -146,15 +144,8 @@ class WeeklyProgressReport(BaseReport):
             'users_trend': self.format_trend_emoji(users_change.trend)
         })
         
-        # Ranking metrics
-        current_rankings = current.get('ranking_metrics', {}).get('visibility', {})
-        previous_rankings = previous.get('ranking_metrics', {}).get('visibility', {}) if previous else {}
-        
-        position_change = self.engine.calculate_change(
-            previous_rankings.get('average_position', 100),
-            current_rankings.get('average_position', 100),
-            reverse_trend=True  # Lower position is better
-        )
+        # Ranking metrics (lower position is better)
+        position_change = changes.change('ranking_metrics.visibility.average_position', default=100)
         
         data.update({
             'prev_position': self.engine.format_number(position_change.previous, 'decimal'),
@@ -0,0 +1,318 @@
+#!/usr/bin/env python3
+"""
+SEO Agent Library - Snapshot Retention
+Enforces tracking.retention_policy by rolling up expiring snapshots.
+"""
+
+import copy
+import json
+import os
+import statistics
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+from typing import Dict, List, Any, Tuple
+
+from snapshot_catalog import SnapshotCatalog, CatalogEntry
+from metric_store import flatten_metrics
+from snapshot_archive import SnapshotArchive, archive_name_for, split_member_path
+
+DEFAULT_RETENTION = {'daily': 30, 'weekly': 52, 'monthly': 24}
+
+# Per-metric aggregation used when rolling snapshots up into a longer period.
+# Keys match a full dotted metric path or, failing that, its last component;
+# anything not listed uses 'last'. Generic leaf names such as 'value' are only
+# listed by full path. Override or extend with
+# tracking.retention_policy.aggregation, keyed by metric name or full path.
+#   sum  - volumes that accumulate over the period (sessions, clicks, revenue)
+#   mean - positions, rates and durations
+#   last - scores and point-in-time state (lighthouse, keyword counts)
+DEFAULT_AGGREGATION = {
+    'sessions': 'sum',
+    'users': 'sum',
+    'new_users': 'sum',
+    'pageviews': 'sum',
+    'total_conversions': 'sum',
+    'ecommerce_transactions': 'sum',
+    'revenue': 'sum',
+    'impressions': 'sum',
+    'clicks': 'sum',
+    'average_position': 'mean',
+    'ctr': 'mean',
+    'bounce_rate': 'mean',
+    'conversion_rate': 'mean',
+    'pages_per_session': 'mean',
+    'avg_session_duration': 'mean',
+    'technical_metrics.core_web_vitals.lcp.value': 'mean',
+    'technical_metrics.core_web_vitals.fid.value': 'mean',
+    'technical_metrics.core_web_vitals.cls.value': 'mean',
+}
+
+@dataclass
+class RollupPlan:
+    """Snapshots of one domain and period that will be rolled up together."""
+    source_type: str
+    target_type: str
+    domain: str
+    period: str  # e.g. '2025-W03' or '2025-01'
+    entries: List[CatalogEntry] = field(default_factory=list)
+    existing_target: bool = False
+
+def _as_datetime(position: float) -> datetime:
+    return datetime.fromtimestamp(position, timezone.utc)
+
+def week_period(position: float) -> Tuple[str, datetime]:
+    """ISO week label and the end of that week (exclusive) for a position."""
+    moment = _as_datetime(position)
+    year, week, weekday = moment.isocalendar()
+    start = (moment - timedelta(days=weekday - 1)).replace(hour=0, minute=0, second=0, microsecond=0)
+    return f"{year}-W{week:02d}", start + timedelta(days=7)
+
+def month_period(position: float) -> Tuple[str, datetime]:
+    """Calendar month label and the end of that month (exclusive) for a position."""
+    moment = _as_datetime(position)
+    if moment.month == 12:
+        end = moment.replace(year=moment.year + 1, month=1, day=1)
+    else:
+        end = moment.replace(month=moment.month + 1, day=1)
+    end = end.replace(hour=0, minute=0, second=0, microsecond=0)
+    return f"{moment.year}-{moment.month:02d}", end
+
+class RetentionManager:
+    """
+    Applies the retention policy to a tracking directory.
+
+    Daily snapshots older than ``daily`` days are aggregated into one weekly
+    snapshot per ISO week, weekly snapshots older than ``weekly`` weeks into
+    one monthly snapshot per calendar month, and monthly snapshots older
+    than ``monthly`` months are retired. A period is rolled up only once it
+    has entirely expired, so a rollup never needs to be merged with later
+    data. If a snapshot of the target type already exists for a period, no
+    rollup is written and the originals are only retired.
+
+    Retired originals are packed into compressed per-domain archives under
+    ``<tracking_dir>/archive/<type>/``, or deleted when ``delete=True``.
+    """
+
+    def __init__(self, tracking_dir: Path = None, policy: Dict[str, Any] = None):
+        self.tracking_dir = Path(tracking_dir or "tracking")
+        self.catalog = SnapshotCatalog(self.tracking_dir)
+        policy = policy or {}
+        self.limits = {key: int(policy.get(key, default))
+                       for key, default in DEFAULT_RETENTION.items()}
+        self.aggregation = dict(DEFAULT_AGGREGATION)
+        self.aggregation.update(policy.get('aggregation', {}))
+
+    @classmethod
+    def from_config(cls, config: Dict[str, Any], tracking_dir: Path = None) -> 'RetentionManager':
+        """Build a manager from a loaded tracking.yml."""
+        policy = config.get('tracking', {}).get('retention_policy', {})
+        return cls(tracking_dir, policy)
+
+    def aggregation_for(self, metric: str) -> str:
+        """Aggregation rule for a dotted metric path."""
+        if metric in self.aggregation:
+            return self.aggregation[metric]
+        return self.aggregation.get(metric.rsplit('.', 1)[-1], 'last')
+
+    def _cutoffs(self, now: datetime) -> Dict[str, datetime]:
+        year, month = now.year, now.month - self.limits['monthly']
+        while month < 1:
+            month += 12
+            year -= 1
+        monthly_cutoff = now.replace(year=year, month=month, day=1,
+                                     hour=0, minute=0, second=0, microsecond=0)
+        return {
+            'daily': now - timedelta(days=self.limits['daily']),
+            'weekly': now - timedelta(weeks=self.limits['weekly']),
+            'monthly': monthly_cutoff,
+        }
+
+    def plan(self, now: datetime = None) -> Tuple[List[RollupPlan], List[CatalogEntry]]:
+        """
+        Work out what compaction would do.
+
+        Returns:
+            Tuple of (rollups to perform, monthly snapshots to retire)
+        """
+        now = now or datetime.now(timezone.utc)
+        cutoffs = self._cutoffs(now)
+        self.catalog.refresh()
+
+        rollups = []
+        for source_type, target_type, period_of in (('daily', 'weekly', week_period),
+                                                     ('weekly', 'monthly', month_period)):
+            cutoff = cutoffs[source_type]
+            for domain in self.catalog.domains(source_type):
+                entries = self.catalog.last_n(source_type, self.catalog.count(source_type, domain), domain)
+                periods: Dict[str, RollupPlan] = {}
+                for entry in entries:
+                    period, period_end = period_of(entry.position)
+                    if period_end > cutoff:
+                        continue
+                    plan = periods.setdefault(period, RollupPlan(source_type, target_type, domain, period))
+                    plan.entries.append(entry)
+
+                if periods:
+                    targets = self.catalog.last_n(target_type, self.catalog.count(target_type, domain), domain)
+                    existing = {period_of(entry.position)[0] for entry in targets}
+                    for plan in periods.values():
+                        plan.existing_target = plan.period in existing
+                    rollups.extend(periods.values())
+
+        expired_monthly = []
+        for domain in self.catalog.domains('monthly'):
+            for entry in self.catalog.last_n('monthly', self.catalog.count('monthly', domain), domain):
+                if month_period(entry.position)[1] <= cutoffs['monthly']:
+                    expired_monthly.append(entry)
+
+        return rollups, expired_monthly
+
+    def aggregate(self, snapshots: List[Dict[str, Any]]) -> Dict[str, Any]:
+        """
+        Combine chronological snapshots into one.
+
+        The latest snapshot provides the structure and all non-numeric
+        fields; every numeric field is replaced by its aggregate.
+        """
+        result = copy.deepcopy(snapshots[-1])
+        series: Dict[str, List[Any]] = {}
+        for snapshot in snapshots:
+            for metric, value in flatten_metrics(snapshot).items():
+                series.setdefault(metric, []).append(value)
+
+        for metric, values in series.items():
+            rule = self.aggregation_for(metric)
+            if rule == 'sum':
+                value = sum(values)
+            elif rule == 'mean':
+                value = round(statistics.fmean(values), 2)
+            else:
+                value = values[-1]
+            self._set_path(result, metric, value)
+
+        return result
+
+    @staticmethod
+    def _set_path(data: Dict[str, Any], metric: str, value: Any):
+        keys = metric.split('.')
+        for key in keys[:-1]:
+            data = data.setdefault(key, {})
+        data[keys[-1]] = value
+
+    def _retire(self, entries: List[CatalogEntry], delete: bool):
+        """
+        Remove snapshots from the live series.
+
+        Unless deleting, they are first added to the per-domain archive
+        ``<tracking_dir>/archive/<type>/<domain>.snaparc``. Loose files are
+        unlinked; archive members are removed from their source archive.
+        """
+        if not delete:
+            retired: Dict[Path, Dict[str, bytes]] = {}
+            for entry in entries:
+                archive_path = (self.tracking_dir / "archive" / entry.snapshot_type /
+                                archive_name_for(entry.domain))
+                source = self.catalog.resolve(entry)
+                member = split_member_path(source)
+                if member:
+                    content = SnapshotArchive(member[0]).read_bytes(member[1])
+                    name = member[1]
+                else:
+                    content = source.read_bytes()
+                    name = source.name
+                retired.setdefault(archive_path, {})[name] = content
+            for archive_path, members in retired.items():
+                SnapshotArchive(archive_path).add(members)
+
+        packed: Dict[Path, List[str]] = {}
+        for entry in entries:
+            source = self.catalog.resolve(entry)
+            member = split_member_path(source)
+            if member:
+                packed.setdefault(member[0], []).append(member[1])
+            else:
+                source.unlink(missing_ok=True)
+        for archive_path, names in packed.items():
+            SnapshotArchive(archive_path).remove(names)
+
+    def compact(self, now: datetime = None, delete: bool = False,
+                dry_run: bool = False) -> Dict[str, int]:
+        """
+        Enforce the retention policy.
+
+        Args:
+            now: Reference time (default: current UTC time)
+            delete: Delete retired originals instead of archiving them
+            dry_run: Only report what would change
+
+        Returns:
+            Counts of 'rollups' written and 'retired' snapshots
+        """
+        rollups, expired_monthly = self.plan(now)
+        stats = {'rollups': 0, 'retired': 0}
+
+        for plan in rollups:
+            if not plan.existing_target:
+                stats['rollups'] += 1
+            stats['retired'] += len(plan.entries)
+        stats['retired'] += len(expired_monthly)
+
+        if dry_run:
+            return stats
+
+        for plan in rollups:
+            if not plan.existing_target:
+                snapshots = [self.catalog.load(entry) for entry in plan.entries]
+
+                rollup = self.aggregate(snapshots)
+                metadata = rollup.setdefault('metadata', {})
+                metadata['baseline_type'] = 'rollup'
+                metadata['rollup'] = {
+                    'source_type': plan.source_type,
+                    'period': plan.period,
+                    'snapshots': len(snapshots),
+                    'first_timestamp': plan.entries[0].timestamp,
+                    'last_timestamp': plan.entries[-1].timestamp
+                }
+
+                safe_domain = plan.domain.replace('/', '_') or 'unknown'
+                target_path = (self.tracking_dir / "snapshots" / plan.target_type /
+                               f"{plan.target_type}_{safe_domain}_{plan.period}.json")
+                target_path.parent.mkdir(parents=True, exist_ok=True)
+                tmp_path = target_path.with_suffix(f".{os.getpid()}.tmp")
+                with open(tmp_path, 'w') as f:
+                    json.dump(rollup, f, indent=2)
+                os.replace(tmp_path, target_path)
+
+        self._retire([entry for plan in rollups for entry in plan.entries] + expired_monthly,
+                     delete)
+
+        self.catalog.refresh()
+        return stats
+
+def main():
+    """Apply the retention policy from tracking.yml."""
+    import argparse
+    import yaml
+
+    parser = argparse.ArgumentParser(description="SEO Agent Snapshot Retention")
+    parser.add_argument("--config", default="tracking/config/tracking.yml", help="Tracking configuration")
+    parser.add_argument("--tracking-dir", default="tracking", help="Tracking data directory")
+    parser.add_argument("--delete", action="store_true", help="Delete originals instead of archiving")
+    parser.add_argument("--dry-run", action="store_true", help="Show what would change")
+    args = parser.parse_args()
+
+    try:
+        with open(args.config, 'r') as f:
+            config = yaml.safe_load(f) or {}
+    except FileNotFoundError:
+        config = {}
+
+    manager = RetentionManager.from_config(config, Path(args.tracking_dir))
+    stats = manager.compact(delete=args.delete, dry_run=args.dry_run)
+    prefix = "Would write" if args.dry_run else "Wrote"
+    print(f"🗜️ {prefix} {stats['rollups']} rollups, retiring {stats['retired']} snapshots")
+
+if __name__ == "__main__":
+    main()
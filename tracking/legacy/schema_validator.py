@@ -0,0 +1,519 @@
+#!/usr/bin/env python3
+"""
+SEO Agent Library - Schema Validator
+Compiles JSON Schemas once into reusable checkers and validates files in batches.
+"""
+
+import json
+import math
+import os
+import re
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+from datetime import date, datetime
+from functools import lru_cache
+from pathlib import Path
+from typing import Dict, List, Any, Callable, Optional, Tuple, Union
+
+from snapshot_archive import load_snapshot_file, ArchiveError
+
+BASELINE_SCHEMA = Path("tracking/schemas/baseline.schema.json")
+MISSION_SCHEMA = Path("templates/deliverables/aimpactscanner-data.schema.json")
+
+# Below this many files a batch is validated in-process; starting worker
+# processes costs more than it saves.
+PARALLEL_THRESHOLD = 32
+
+# Keywords that carry no validation rule
+ANNOTATIONS = {'$schema', '$id', '$comment', 'title', 'description', 'default',
+               'examples', '$defs', 'definitions', 'readOnly', 'writeOnly'}
+
+HOSTNAME = re.compile(r'^(?=.{1,253}\.?$)[A-Za-z0-9](?:[A-Za-z0-9-]{0,61}[A-Za-z0-9])?'
+                      r'(?:\.[A-Za-z0-9](?:[A-Za-z0-9-]{0,61}[A-Za-z0-9])?)*\.?$')
+DATE_TIME = re.compile(r'^\d{4}-\d{2}-\d{2}[Tt ]\d{2}:\d{2}')
+EMAIL = re.compile(r'^[^@\s]+@[^@\s]+$')
+URI = re.compile(r'^[A-Za-z][A-Za-z0-9+.-]*:\S*$')
+
+class SchemaError(Exception):
+    """Raised when a schema cannot be compiled."""
+
+@dataclass
+class Violation:
+    """One schema violation at a JSON path such as ``$.fixes[2].roi``."""
+    path: str
+    message: str
+
+    def __str__(self) -> str:
+        return f"{self.path}: {self.message}"
+
+Check = Callable[[Any, str, List[Violation]], None]
+
+def _is_date_time(value: str) -> bool:
+    # Naive timestamps are accepted, as every tracking writer produces them
+    if not DATE_TIME.match(value):
+        return False
+    try:
+        datetime.fromisoformat(value.replace('Z', '+00:00').replace('z', '+00:00'))
+    except ValueError:
+        return False
+    return True
+
+def _is_date(value: str) -> bool:
+    try:
+        date.fromisoformat(value)
+    except ValueError:
+        return False
+    return True
+
+FORMATS: Dict[str, Callable[[str], bool]] = {
+    'date-time': _is_date_time,
+    'date': _is_date,
+    'hostname': lambda value: bool(HOSTNAME.match(value)),
+    'email': lambda value: bool(EMAIL.match(value)),
+    'uri': lambda value: bool(URI.match(value)),
+}
+
+def _type_check(name: str) -> Callable[[Any], bool]:
+    """Predicate for a JSON Schema type name (booleans are not numbers)."""
+    checks = {
+        'object': lambda v: isinstance(v, dict),
+        'array': lambda v: isinstance(v, list),
+        'string': lambda v: isinstance(v, str),
+        'boolean': lambda v: isinstance(v, bool),
+        'null': lambda v: v is None,
+        'number': lambda v: isinstance(v, (int, float)) and not isinstance(v, bool),
+        'integer': lambda v: (isinstance(v, int) and not isinstance(v, bool))
+                             or (isinstance(v, float) and v.is_integer()),
+    }
+    if name not in checks:
+        raise SchemaError(f"unknown type {name!r}")
+    return checks[name]
+
+def _child(path: str, key: Union[str, int]) -> str:
+    if isinstance(key, int):
+        return f"{path}[{key}]"
+    if re.match(r'^[A-Za-z_][A-Za-z0-9_]*$', key):
+        return f"{path}.{key}"
+    return f"{path}[{json.dumps(key)}]"
+
+class SchemaCompiler:
+    """
+    Turns a JSON Schema (draft-07 subset) into a tree of check closures.
+
+    Supported: type, enum, const, required, properties,
+    additionalProperties, patternProperties, items, min/maxItems,
+    uniqueItems, minimum, maximum, exclusiveMinimum/Maximum, multipleOf,
+    min/maxLength, pattern, format (date-time, date, hostname, email, uri),
+    allOf, anyOf, oneOf, not and $ref. A ``$ref`` may point into the same
+    document (``#/$defs/x``) or at another schema file, found relative to
+    the referring schema's directory or any of its parents. Unsupported
+    keywords raise SchemaError at compile time rather than being ignored.
+    """
+
+    def __init__(self):
+        self._documents: Dict[Path, Dict[str, Any]] = {}
+        self._compiled: Dict[Tuple[Path, str], Check] = {}
+
+    def compile_file(self, path: Union[str, Path]) -> Check:
+        """Compile the schema stored at path."""
+        return self._ref(Path(path).resolve(), '#')
+
+    def _document(self, path: Path) -> Dict[str, Any]:
+        if path not in self._documents:
+            try:
+                with open(path, 'r') as f:
+                    self._documents[path] = json.load(f)
+            except (OSError, json.JSONDecodeError) as e:
+                raise SchemaError(f"cannot load schema {path}: {e}")
+        return self._documents[path]
+
+    def _resolve_file(self, base: Path, ref_path: str) -> Path:
+        for directory in [base.parent, *base.parent.parents]:
+            candidate = directory / ref_path
+            if candidate.exists():
+                return candidate.resolve()
+        raise SchemaError(f"cannot resolve $ref {ref_path!r} from {base}")
+
+    def _ref(self, document: Path, pointer: str) -> Check:
+        """Compiled check for a JSON pointer within a schema file (memoised, recursion-safe)."""
+        key = (document, pointer)
+        if key in self._compiled:
+            return self._compiled[key]
+
+        target: List[Check] = []
+        self._compiled[key] = lambda value, path, errors: target[0](value, path, errors)
+
+        node: Any = self._document(document)
+        for part in filter(None, pointer.lstrip('#').split('/')):
+            part = part.replace('~1', '/').replace('~0', '~')
+            try:
+                node = node[int(part)] if isinstance(node, list) else node[part]
+            except (KeyError, IndexError, ValueError):
+                raise SchemaError(f"$ref {pointer!r} not found in {document}")
+
+        target.append(self.compile(node, document))
+        self._compiled[key] = target[0]
+        return target[0]
+
+    def compile(self, schema: Any, document: Path) -> Check:
+        """Compile one schema node."""
+        if schema is True or schema == {}:
+            return lambda value, path, errors: None
+        if schema is False:
+            return lambda value, path, errors: errors.append(Violation(path, "no value is allowed"))
+        if not isinstance(schema, dict):
+            raise SchemaError(f"schema must be an object, got {schema!r}")
+
+        checks: List[Check] = []
+        keywords = set(schema) - ANNOTATIONS
+
+        if '$ref' in schema:
+            ref = schema['$ref']
+            ref_path, _, pointer = ref.partition('#')
+            target = self._resolve_file(document, ref_path) if ref_path else document
+            checks.append(self._ref(target, '#' + pointer))
+            keywords.discard('$ref')
+
+        for keyword in sorted(keywords):
+            builder = getattr(self, '_kw_' + keyword.replace('$', '').replace('-', '_'), None)
+            if builder is None:
+                # Keywords consumed by a sibling's builder
+                if keyword in ('exclusiveMinimum', 'exclusiveMaximum', 'additionalProperties',
+                               'patternProperties', 'minItems', 'maxItems', 'uniqueItems',
+                               'minLength', 'maxLength', 'multipleOf'):
+                    continue
+                raise SchemaError(f"unsupported schema keyword {keyword!r} in {document}")
+            checks.append(builder(schema, document))
+
+        # Object/array/string keywords that only apply with their type
+        checks.extend(self._object_checks(schema, document))
+        checks.extend(self._array_checks(schema))
+        checks.extend(self._scalar_checks(schema))
+
+        if len(checks) == 1:
+            return checks[0]
+
+        def check(value, path, errors):
+            for item in checks:
+                item(value, path, errors)
+        return check
+
+    def _kw_type(self, schema, document) -> Check:
+        names = schema['type'] if isinstance(schema['type'], list) else [schema['type']]
+        predicates = [_type_check(name) for name in names]
+        expected = " or ".join(names)
+
+        def check(value, path, errors):
+            if not any(predicate(value) for predicate in predicates):
+                errors.append(Violation(path, f"expected {expected}, got {type(value).__name__}"))
+        return check
+
+    def _kw_enum(self, schema, document) -> Check:
+        allowed = schema['enum']
+
+        def check(value, path, errors):
+            if not any(value == option and type(value) is type(option)
+                       or (isinstance(value, (int, float)) and not isinstance(value, bool)
+                           and isinstance(option, (int, float)) and value == option)
+                       for option in allowed):
+                errors.append(Violation(path, f"{value!r} is not one of {allowed}"))
+        return check
+
+    def _kw_const(self, schema, document) -> Check:
+        expected = schema['const']
+
+        def check(value, path, errors):
+            if value != expected or type(value) is not type(expected):
+                errors.append(Violation(path, f"must be {expected!r}, got {value!r}"))
+        return check
+
+    def _kw_required(self, schema, document) -> Check:
+        required = schema['required']
+
+        def check(value, path, errors):
+            if isinstance(value, dict):
+                for key in required:
+                    if key not in value:
+                        errors.append(Violation(path, f"missing required property {key!r}"))
+        return check
+
+    def _kw_properties(self, schema, document) -> Check:
+        properties = {key: self.compile(sub, document) for key, sub in schema['properties'].items()}
+
+        def check(value, path, errors):
+            if isinstance(value, dict):
+                for key, sub in properties.items():
+                    if key in value:
+                        sub(value[key], _child(path, key), errors)
+        return check
+
+    def _object_checks(self, schema, document) -> List[Check]:
+        checks = []
+        known = set(schema.get('properties', {}))
+        patterns = [(re.compile(p), self.compile(sub, document))
+                    for p, sub in schema.get('patternProperties', {}).items()]
+        if patterns:
+            def check_patterns(value, path, errors):
+                if isinstance(value, dict):
+                    for key, item in value.items():
+                        for regex, sub in patterns:
+                            if regex.search(key):
+                                sub(item, _child(path, key), errors)
+            checks.append(check_patterns)
+
+        if 'additionalProperties' in schema:
+            extra = schema['additionalProperties']
+            sub = None if extra is False else self.compile(extra, document)
+
+            def check_additional(value, path, errors):
+                if not isinstance(value, dict):
+                    return
+                for key, item in value.items():
+                    if key in known or any(regex.search(key) for regex, _ in patterns):
+                        continue
+                    if sub is None:
+                        errors.append(Violation(path, f"unexpected property {key!r}"))
+                    else:
+                        sub(item, _child(path, key), errors)
+            checks.append(check_additional)
+        return checks
+
+    def _kw_items(self, schema, document) -> Check:
+        items = schema['items']
+        if isinstance(items, list):
+            positional = [self.compile(sub, document) for sub in items]
+
+            def check(value, path, errors):
+                if isinstance(value, list):
+                    for i, (item, sub) in enumerate(zip(value, positional)):
+                        sub(item, _child(path, i), errors)
+            return check
+
+        sub = self.compile(items, document)
+
+        def check(value, path, errors):
+            if isinstance(value, list):
+                for i, item in enumerate(value):
+                    sub(item, _child(path, i), errors)
+        return check
+
+    def _array_checks(self, schema) -> List[Check]:
+        checks = []
+        min_items, max_items = schema.get('minItems'), schema.get('maxItems')
+        if min_items is not None or max_items is not None:
+            def check_length(value, path, errors):
+                if isinstance(value, list):
+                    if min_items is not None and len(value) < min_items:
+                        errors.append(Violation(path, f"needs at least {min_items} items"))
+                    if max_items is not None and len(value) > max_items:
+                        errors.append(Violation(path, f"allows at most {max_items} items"))
+            checks.append(check_length)
+
+        if schema.get('uniqueItems'):
+            def check_unique(value, path, errors):
+                if isinstance(value, list):
+                    seen = [json.dumps(item, sort_keys=True) for item in value]
+                    if len(set(seen)) != len(seen):
+                        errors.append(Violation(path, "items must be unique"))
+            checks.append(check_unique)
+        return checks
+
+    def _kw_minimum(self, schema, document) -> Check:
+        return self._bound(schema['minimum'], lambda v, b: v >= b, "must be >= {}")
+
+    def _kw_maximum(self, schema, document) -> Check:
+        return self._bound(schema['maximum'], lambda v, b: v <= b, "must be <= {}")
+
+    @staticmethod
+    def _bound(bound, ok, message) -> Check:
+        def check(value, path, errors):
+            if isinstance(value, (int, float)) and not isinstance(value, bool) and not ok(value, bound):
+                errors.append(Violation(path, message.format(bound) + f", got {value}"))
+        return check
+
+    def _scalar_checks(self, schema) -> List[Check]:
+        checks = []
+        if 'exclusiveMinimum' in schema:
+            checks.append(self._bound(schema['exclusiveMinimum'], lambda v, b: v > b, "must be > {}"))
+        if 'exclusiveMaximum' in schema:
+            checks.append(self._bound(schema['exclusiveMaximum'], lambda v, b: v < b, "must be < {}"))
+        if 'multipleOf' in schema:
+            step = schema['multipleOf']
+            checks.append(self._bound(step, lambda v, b: math.isclose(v / b, round(v / b)),
+                                      "must be a multiple of {}"))
+
+        min_length, max_length = schema.get('minLength'), schema.get('maxLength')
+        if min_length is not None or max_length is not None:
+            def check_length(value, path, errors):
+                if isinstance(value, str):
+                    if min_length is not None and len(value) < min_length:
+                        errors.append(Violation(path, f"must be at least {min_length} characters"))
+                    if max_length is not None and len(value) > max_length:
+                        errors.append(Violation(path, f"must be at most {max_length} characters"))
+            checks.append(check_length)
+        return checks
+
+    def _kw_pattern(self, schema, document) -> Check:
+        regex = re.compile(schema['pattern'])
+
+        def check(value, path, errors):
+            if isinstance(value, str) and not regex.search(value):
+                errors.append(Violation(path, f"{value!r} does not match {schema['pattern']!r}"))
+        return check
+
+    def _kw_format(self, schema, document) -> Check:
+        name = schema['format']
+        predicate = FORMATS.get(name)
+        if predicate is None:
+            # Unknown formats are annotations in draft-07
+            return lambda value, path, errors: None
+
+        def check(value, path, errors):
+            if isinstance(value, str) and not predicate(value):
+                errors.append(Violation(path, f"{value!r} is not a valid {name}"))
+        return check
+
+    def _kw_allOf(self, schema, document) -> Check:
+        subs = [self.compile(sub, document) for sub in schema['allOf']]
+
+        def check(value, path, errors):
+            for sub in subs:
+                sub(value, path, errors)
+        return check
+
+    def _kw_anyOf(self, schema, document) -> Check:
+        subs = [self.compile(sub, document) for sub in schema['anyOf']]
+
+        def check(value, path, errors):
+            if not any(_passes(sub, value) for sub in subs):
+                errors.append(Violation(path, "does not match any allowed schema"))
+        return check
+
+    def _kw_oneOf(self, schema, document) -> Check:
+        subs = [self.compile(sub, document) for sub in schema['oneOf']]
+
+        def check(value, path, errors):
+            matches = sum(1 for sub in subs if _passes(sub, value))
+            if matches != 1:
+                errors.append(Violation(path, f"must match exactly one schema, matched {matches}"))
+        return check
+
+    def _kw_not(self, schema, document) -> Check:
+        sub = self.compile(schema['not'], document)
+
+        def check(value, path, errors):
+            if _passes(sub, value):
+                errors.append(Violation(path, "matches a disallowed schema"))
+        return check
+
+def _passes(check: Check, value: Any) -> bool:
+    errors: List[Violation] = []
+    check(value, "$", errors)
+    return not errors
+
+class CompiledSchema:
+    """A schema file compiled once into a reusable checker."""
+
+    def __init__(self, path: Union[str, Path]):
+        self.path = Path(path)
+        self._check = SchemaCompiler().compile_file(self.path)
+
+    def validate(self, data: Any) -> List[Violation]:
+        """Every violation in a parsed document (empty if valid)."""
+        errors: List[Violation] = []
+        self._check(data, "$", errors)
+        return errors
+
+    def is_valid(self, data: Any) -> bool:
+        """Whether a parsed document conforms to the schema."""
+        return not self.validate(data)
+
+@lru_cache(maxsize=None)
+def load_schema(path: Union[str, Path]) -> CompiledSchema:
+    """Compiled schema for a file, compiled once per process."""
+    return CompiledSchema(Path(path).resolve())
+
+def validate_file(path: Union[str, Path], schema_path: Union[str, Path]) -> List[Violation]:
+    """Validate a snapshot, archive member or data.json file against a schema."""
+    try:
+        data = load_snapshot_file(path)
+    except (OSError, ArchiveError) as e:
+        return [Violation("$", f"cannot read file: {e}")]
+    except json.JSONDecodeError as e:
+        return [Violation("$", f"invalid JSON: {e}")]
+    return load_schema(schema_path).validate(data)
+
+def _validate_job(job: Tuple[str, str]) -> Tuple[str, List[Violation]]:
+    path, schema_path = job
+    return path, validate_file(path, schema_path)
+
+def validate_files(jobs: List[Tuple[Union[str, Path], Union[str, Path]]],
+                   max_workers: Optional[int] = None) -> Dict[str, List[Violation]]:
+    """
+    Validate many (file, schema) pairs, in parallel for large batches.
+
+    Each worker process compiles a schema the first time it needs it and
+    reuses it for the rest of its share of the batch.
+
+    Returns:
+        Violations of every invalid file, keyed by path (valid files omitted)
+    """
+    jobs = [(str(path), str(Path(schema).resolve())) for path, schema in jobs]
+    for schema in {schema for _, schema in jobs}:
+        load_schema(schema)  # fail fast on a broken schema
+
+    if len(jobs) < PARALLEL_THRESHOLD or max_workers == 1:
+        results = map(_validate_job, jobs)
+        return {path: errors for path, errors in results if errors}
+
+    workers = max_workers or min(os.cpu_count() or 1, 8)
+    chunksize = max(1, len(jobs) // (workers * 4))
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        results = pool.map(_validate_job, jobs, chunksize=chunksize)
+        return {path: errors for path, errors in results if errors}
+
+def print_violations(invalid: Dict[str, List[Violation]], limit: int = 10):
+    """Print each invalid file with up to ``limit`` of its violations."""
+    for path, errors in sorted(invalid.items()):
+        print(f"❌ {path}: {len(errors)} schema violation{'s' if len(errors) != 1 else ''}")
+        for error in errors[:limit]:
+            print(f"    {error}")
+        if len(errors) > limit:
+            print(f"    ... and {len(errors) - limit} more")
+
+def main():
+    """Validate tracking snapshots and mission data.json files."""
+    import argparse
+    from snapshot_catalog import SnapshotCatalog, BASELINE_TYPE, SNAPSHOT_TYPES
+
+    parser = argparse.ArgumentParser(description="SEO Agent Schema Validator")
+    parser.add_argument("files", nargs="*", help="Files to validate (default: all tracking data)")
+    parser.add_argument("--schema", help="Schema for the given files (default: by file name)")
+    parser.add_argument("--tracking-dir", default="tracking", help="Tracking data directory")
+    parser.add_argument("--runs-dir", default="runs", help="Mission runs directory")
+    parser.add_argument("--jobs", type=int, help="Worker processes")
+    args = parser.parse_args()
+
+    if args.files:
+        jobs = [(f, args.schema or (MISSION_SCHEMA if Path(f).name == "data.json" else BASELINE_SCHEMA))
+                for f in args.files]
+    else:
+        catalog = SnapshotCatalog(Path(args.tracking_dir))
+        catalog.refresh()
+        jobs = [(catalog.resolve(entry), BASELINE_SCHEMA)
+                for snapshot_type in [BASELINE_TYPE] + SNAPSHOT_TYPES
+                for entry in catalog.last_n(snapshot_type, catalog.count(snapshot_type))]
+        jobs += [(path, MISSION_SCHEMA) for path in sorted(Path(args.runs_dir).glob("*/data.json"))]
+
+    try:
+        invalid = validate_files(jobs, args.jobs)
+    except SchemaError as e:
+        print(f"❌ Schema error: {e}")
+        return 2
+
+    print_violations(invalid)
+    print(f"{'✅' if not invalid else '⚠️'} {len(jobs) - len(invalid)}/{len(jobs)} files valid")
+    return 1 if invalid else 0
+
+if __name__ == "__main__":
+    raise SystemExit(main())
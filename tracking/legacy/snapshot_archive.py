@@ -0,0 +1,317 @@
+#!/usr/bin/env python3
+"""
+SEO Agent Library - Snapshot Archive
+Compressed multi-snapshot container with a footer index for random access.
+"""
+
+import hashlib
+import json
+import os
+import struct
+import zlib
+from pathlib import Path
+from typing import Dict, List, Any, Optional, Tuple, Union
+
+from snapshot_metadata import read_metadata
+
+ARCHIVE_MAGIC = b'SNPA'
+ARCHIVE_VERSION = 1
+ARCHIVE_SUFFIX = ".snaparc"
+MEMBER_SEPARATOR = "!"
+COMPRESSION_LEVEL = 6
+COPY_CHUNK = 1 << 20
+
+# Header: magic, version. Trailer: footer offset, footer length, magic.
+HEADER = struct.Struct('<4sB')
+TRAILER = struct.Struct('<QQ4s')
+
+class ArchiveError(Exception):
+    """Raised when an archive is missing, truncated or corrupt."""
+
+class SnapshotArchive:
+    """
+    Container holding many snapshot JSON documents in one file.
+
+    Layout::
+
+        header | member 1 (zlib) | member 2 (zlib) | ... | footer (zlib JSON) | trailer
+
+    Each member is compressed on its own and the footer maps member names
+    to offset, compressed length, uncompressed size, sha256 and the
+    snapshot's metadata (domain, timestamp). Reading one snapshot costs a
+    trailer read, a footer read and one member decompression, however many
+    snapshots the archive holds.
+
+    Members are stored byte-for-byte as the original files, so a member's
+    sha256 equals the loose file's content hash. Adding a member with an
+    existing name replaces it; the old bytes stay in the file until
+    ``repack()``. Every write builds a new file next to the archive and
+    moves it into place, so a crash leaves the previous archive intact.
+    The price is that every write, ``add()`` included, copies the whole
+    archive: O(archive size) I/O per call, not O(new members). Batch
+    members into one ``add()`` rather than adding them one at a time.
+    Writers must not run concurrently on the same archive.
+    """
+
+    def __init__(self, path: Union[str, Path]):
+        self.path = Path(path)
+        self._index: Optional[Dict[str, Dict[str, Any]]] = None
+        self._footer_offset = HEADER.size
+        self._stat_key = None
+
+    def _read_index(self) -> Dict[str, Dict[str, Any]]:
+        """Load the footer index, re-reading it if the file changed."""
+        try:
+            stat = self.path.stat()
+        except FileNotFoundError:
+            self._index, self._footer_offset, self._stat_key = {}, HEADER.size, None
+            return self._index
+
+        stat_key = (stat.st_mtime_ns, stat.st_size)
+        if self._index is not None and stat_key == self._stat_key:
+            return self._index
+
+        with open(self.path, 'rb') as f:
+            magic, version = HEADER.unpack(f.read(HEADER.size))
+            if magic != ARCHIVE_MAGIC or version != ARCHIVE_VERSION:
+                raise ArchiveError(f"{self.path} is not a snapshot archive")
+            if stat.st_size < HEADER.size + TRAILER.size:
+                raise ArchiveError(f"{self.path} is truncated")
+
+            f.seek(-TRAILER.size, os.SEEK_END)
+            footer_offset, footer_length, magic = TRAILER.unpack(f.read(TRAILER.size))
+            if magic != ARCHIVE_MAGIC:
+                raise ArchiveError(f"{self.path} has no valid trailer")
+
+            f.seek(footer_offset)
+            try:
+                index = json.loads(zlib.decompress(f.read(footer_length)))
+            except (zlib.error, ValueError) as e:
+                raise ArchiveError(f"{self.path} has a corrupt index: {e}")
+
+        self._index = index
+        self._footer_offset = footer_offset
+        self._stat_key = stat_key
+        return index
+
+    def names(self) -> List[str]:
+        """Member names in the archive."""
+        return sorted(self._read_index())
+
+    def info(self, name: str) -> Dict[str, Any]:
+        """Index record of a member (offset, length, size, sha256, metadata)."""
+        index = self._read_index()
+        if name not in index:
+            raise KeyError(f"{name} not in {self.path}")
+        return index[name]
+
+    def read_bytes(self, name: str) -> bytes:
+        """Decompress one member."""
+        record = self.info(name)
+        with open(self.path, 'rb') as f:
+            f.seek(record['offset'])
+            return zlib.decompress(f.read(record['length']))
+
+    def read(self, name: str) -> Dict[str, Any]:
+        """Parse one member as JSON."""
+        return json.loads(self.read_bytes(name))
+
+    def add(self, members: Dict[str, bytes], metadata: Dict[str, Dict[str, Any]] = None):
+        """
+        Append members, replacing any with the same name.
+
+        The existing members are copied into the new file unchanged (no
+        recompression), but the copy still costs O(archive size) I/O.
+
+        Args:
+            members: Mapping of member name to raw JSON bytes
+            metadata: Optional per-member 'domain'/'timestamp' to keep in the
+                index; read from the document if omitted
+        """
+        self._write(dict(self._read_index()), members, metadata, keep=True)
+
+    def remove(self, names: List[str]):
+        """Drop members from the archive by rewriting it."""
+        keep = {name: self.read_bytes(name) for name in self.names() if name not in names}
+        self._rewrite(keep)
+
+    def repack(self):
+        """Rewrite the archive without the space left by replaced members."""
+        self._rewrite({name: self.read_bytes(name) for name in self.names()})
+
+    def _rewrite(self, members: Dict[str, bytes]):
+        index = self._read_index()
+        self._write({}, members, {name: index[name] for name in members}, keep=False)
+
+    def _write(self, index: Dict[str, Dict[str, Any]], members: Dict[str, bytes],
+               metadata: Optional[Dict[str, Dict[str, Any]]], keep: bool):
+        """
+        Write a new archive to a temporary file and move it over the old one.
+
+        With ``keep``, the existing members (everything before the old
+        footer) are copied over first and ``index`` must be their index.
+        """
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = self.path.with_suffix(f".{os.getpid()}.tmp")
+        try:
+            with open(tmp_path, 'wb') as f:
+                if keep and index:
+                    with open(self.path, 'rb') as source:
+                        remaining = self._footer_offset
+                        while remaining:
+                            chunk = source.read(min(remaining, COPY_CHUNK))
+                            if not chunk:
+                                raise ArchiveError(f"{self.path} is truncated")
+                            f.write(chunk)
+                            remaining -= len(chunk)
+                else:
+                    f.write(HEADER.pack(ARCHIVE_MAGIC, ARCHIVE_VERSION))
+
+                for name, content in members.items():
+                    meta = (metadata or {}).get(name)
+                    if meta is None:
+                        try:
+                            meta = read_metadata(content.decode('utf-8'))
+                        except ValueError:
+                            meta = {}
+                    compressed = zlib.compress(content, COMPRESSION_LEVEL)
+                    index[name] = {
+                        'offset': f.tell(),
+                        'length': len(compressed),
+                        'size': len(content),
+                        'sha256': hashlib.sha256(content).hexdigest(),
+                        'domain': str(meta.get('domain', '')),
+                        'timestamp': str(meta.get('timestamp', ''))
+                    }
+                    f.write(compressed)
+
+                footer = zlib.compress(json.dumps(index).encode('utf-8'), COMPRESSION_LEVEL)
+                footer_offset = f.tell()
+                f.write(footer)
+                f.write(TRAILER.pack(footer_offset, len(footer), ARCHIVE_MAGIC))
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(tmp_path, self.path)
+        except BaseException:
+            tmp_path.unlink(missing_ok=True)
+            raise
+
+        self._index = None
+
+def split_member_path(path: Union[str, Path]) -> Optional[Tuple[Path, str]]:
+    """Split 'dir/x.snaparc!member.json' into (archive path, member name)."""
+    path = str(path)
+    marker = ARCHIVE_SUFFIX + MEMBER_SEPARATOR
+    if marker not in path:
+        return None
+    archive_path, member = path.split(marker, 1)
+    return Path(archive_path + ARCHIVE_SUFFIX), member
+
+def member_path(archive_path: Union[str, Path], name: str) -> str:
+    """Path string that addresses one member of an archive."""
+    return f"{archive_path}{MEMBER_SEPARATOR}{name}"
+
+def load_snapshot_file(path: Union[str, Path]) -> Dict[str, Any]:
+    """
+    Load a snapshot from a loose JSON file or an archive member path.
+
+    Raises:
+        FileNotFoundError: If the file, archive or member does not exist
+        json.JSONDecodeError: If the document is not valid JSON
+        ArchiveError: If the archive is corrupt
+    """
+    member = split_member_path(path)
+    if member is None:
+        with open(path, 'r') as f:
+            return json.load(f)
+
+    archive_path, name = member
+    if not archive_path.exists():
+        raise FileNotFoundError(f"No such archive: {archive_path}")
+    try:
+        return SnapshotArchive(archive_path).read(name)
+    except KeyError as e:
+        raise FileNotFoundError(str(e))
+
+def archive_name_for(domain: str) -> str:
+    """Archive file name for a domain's snapshots."""
+    return (domain.replace('/', '_') or 'unknown') + ARCHIVE_SUFFIX
+
+def pack_directory(directory: Union[str, Path], remove: bool = True) -> Dict[str, int]:
+    """
+    Pack loose snapshot files into one archive per domain, in place.
+
+    Args:
+        directory: Snapshot directory, e.g. tracking/snapshots/daily
+        remove: Delete loose files once they are in an archive
+
+    Returns:
+        Number of files packed per archive name
+    """
+    directory = Path(directory)
+    by_archive: Dict[str, Dict[str, bytes]] = {}
+    metadata: Dict[str, Dict[str, Any]] = {}
+    sources: Dict[str, List[Path]] = {}
+
+    for path in sorted(directory.glob("*.json")):
+        content = path.read_bytes()
+        try:
+            meta = read_metadata(content.decode('utf-8'))
+        except ValueError as e:
+            print(f"Warning: not packing invalid snapshot {path}: {e}")
+            continue
+        name = archive_name_for(str(meta.get('domain', '')))
+        by_archive.setdefault(name, {})[path.name] = content
+        metadata[path.name] = meta
+        sources.setdefault(name, []).append(path)
+
+    counts = {}
+    for name, members in by_archive.items():
+        SnapshotArchive(directory / name).add(members, metadata)
+        counts[name] = len(members)
+        if remove:
+            for path in sources[name]:
+                path.unlink()
+
+    return counts
+
+def main():
+    """Pack, list or extract snapshot archives."""
+    import argparse
+
+    parser = argparse.ArgumentParser(description="SEO Agent Snapshot Archive")
+    subparsers = parser.add_subparsers(dest='command')
+
+    pack_parser = subparsers.add_parser('pack', help='Pack loose snapshots into per-domain archives')
+    pack_parser.add_argument('directory', help='Snapshot directory to pack')
+    pack_parser.add_argument('--keep', action='store_true', help='Keep the loose files')
+
+    list_parser = subparsers.add_parser('list', help='List archive members')
+    list_parser.add_argument('archive', help='Archive file')
+
+    cat_parser = subparsers.add_parser('cat', help='Print one member')
+    cat_parser.add_argument('archive', help='Archive file')
+    cat_parser.add_argument('member', help='Member name')
+
+    args = parser.parse_args()
+
+    if args.command == 'pack':
+        counts = pack_directory(args.directory, remove=not args.keep)
+        for name, count in counts.items():
+            print(f"📦 {name}: {count} snapshots")
+        if not counts:
+            print("No snapshots to pack")
+    elif args.command == 'list':
+        archive = SnapshotArchive(args.archive)
+        for name in archive.names():
+            record = archive.info(name)
+            print(f"  {name}  {record['timestamp']}  {record['size']:,} → {record['length']:,} bytes")
+    elif args.command == 'cat':
+        print(SnapshotArchive(args.archive).read_bytes(args.member).decode('utf-8'))
+    else:
+        parser.print_help()
+        return 1
+    return 0
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,142 @@
+#!/usr/bin/env python3
+"""
+SEO Agent Library - Parsed Snapshot Cache
+Process-wide LRU cache of parsed snapshots, shared as read-only views.
+"""
+
+import copy
+import os
+import threading
+from collections import OrderedDict
+from pathlib import Path
+from typing import Dict, Any, Callable, Tuple, Union
+
+from snapshot_archive import split_member_path
+
+DEFAULT_CACHE_MAX_MB = 64
+# Parsed JSON takes several times the memory of its source text; entries
+# are charged source size times this factor against the cap.
+PARSED_SIZE_FACTOR = 8
+
+def _read_only(*args, **kwargs):
+    raise TypeError("cached snapshots are read-only; use copy.deepcopy() for a mutable copy")
+
+class FrozenDict(dict):
+    """dict that refuses mutation; deepcopy returns a plain mutable dict."""
+    __setitem__ = __delitem__ = _read_only
+    clear = pop = popitem = setdefault = update = _read_only
+    __ior__ = _read_only
+
+    def __deepcopy__(self, memo):
+        return {copy.deepcopy(k, memo): copy.deepcopy(v, memo) for k, v in self.items()}
+
+    def copy(self) -> Dict[str, Any]:
+        """Shallow mutable copy; nested values stay read-only."""
+        return dict(self)
+
+    def __reduce__(self):
+        return (dict, (dict(self),))
+
+class FrozenList(list):
+    """list that refuses mutation; deepcopy returns a plain mutable list."""
+    __setitem__ = __delitem__ = __iadd__ = __imul__ = _read_only
+    append = extend = insert = pop = remove = clear = sort = reverse = _read_only
+
+    def __deepcopy__(self, memo):
+        return [copy.deepcopy(v, memo) for v in self]
+
+    def copy(self) -> list:
+        """Shallow mutable copy; nested values stay read-only."""
+        return list(self)
+
+    def __reduce__(self):
+        return (list, (list(self),))
+
+def freeze(value: Any) -> Any:
+    """Recursively convert parsed JSON into read-only containers."""
+    if isinstance(value, dict):
+        return FrozenDict((k, freeze(v)) for k, v in value.items())
+    if isinstance(value, list):
+        return FrozenList(freeze(v) for v in value)
+    return value
+
+class SnapshotCache:
+    """
+    LRU cache of parsed snapshots keyed by (path, mtime, size).
+
+    A changed file gets a new key, so stale entries are never served; they
+    simply age out. Archive members are keyed by the member path and the
+    archive's mtime and size. Cached snapshots are frozen: callers that need
+    to modify one must ``copy.deepcopy()`` it first, so nobody can corrupt
+    the shared copy.
+    """
+
+    def __init__(self, max_mb: float = DEFAULT_CACHE_MAX_MB):
+        self.max_bytes = int(max_mb * 1024 * 1024)
+        self.current_bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self._entries: "OrderedDict[Tuple[str, int, int], Tuple[Any, int]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def _key(path: Union[str, Path]) -> Tuple[Tuple[str, int, int], int]:
+        """Cache key and source size for a file or archive member path."""
+        member = split_member_path(path)
+        stat = os.stat(member[0] if member else path)
+        size = stat.st_size
+        return (os.path.abspath(str(path)), stat.st_mtime_ns, size), size
+
+    def get(self, path: Union[str, Path], loader: Callable[[str], Any]) -> Any:
+        """
+        Return the parsed snapshot at path, loading it on a miss.
+
+        Args:
+            path: Snapshot file or archive member path
+            loader: Parses the path; its exceptions propagate uncached
+
+        Returns:
+            Read-only parsed snapshot
+        """
+        key, size = self._key(path)
+        with self._lock:
+            cached = self._entries.get(key)
+            if cached is not None:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return cached[0]
+            self.misses += 1
+
+        value = freeze(loader(str(path)))
+        cost = size * PARSED_SIZE_FACTOR
+        if cost > self.max_bytes:
+            return value
+
+        with self._lock:
+            if key not in self._entries:
+                self._entries[key] = (value, cost)
+                self.current_bytes += cost
+            while self.current_bytes > self.max_bytes:
+                _, (_, evicted_cost) = self._entries.popitem(last=False)
+                self.current_bytes -= evicted_cost
+        return value
+
+    def clear(self):
+        """Drop every cached snapshot."""
+        with self._lock:
+            self._entries.clear()
+            self.current_bytes = 0
+
+    def stats(self) -> Dict[str, Any]:
+        """Hit/miss counters and current usage."""
+        with self._lock:
+            return {
+                'entries': len(self._entries),
+                'hits': self.hits,
+                'misses': self.misses,
+                'bytes': self.current_bytes,
+                'max_bytes': self.max_bytes
+            }
+
+# Shared by every ReportEngine in the process (a /track run creates several)
+SNAPSHOT_CACHE = SnapshotCache()
@@ -0,0 +1,361 @@
+#!/usr/bin/env python3
+"""
+SEO Agent Library - Snapshot Catalog
+Persistent index of baseline and snapshot files for fast latest/range lookups.
+"""
+
+import bisect
+import hashlib
+import json
+import os
+from dataclasses import dataclass, asdict
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, List, Any, Optional, Tuple
+
+from snapshot_archive import (SnapshotArchive, ArchiveError, ARCHIVE_SUFFIX,
+                              member_path, load_snapshot_file)
+from snapshot_metadata import read_metadata, parse_timestamp
+
+CATALOG_VERSION = 4
+CATALOG_FILENAME = ".snapshot-catalog.json"
+BASELINE_TYPE = "baseline"
+SNAPSHOT_TYPES = ["daily", "weekly", "monthly", "mission-based"]
+
+@dataclass
+class CatalogEntry:
+    """One indexed snapshot file."""
+    path: str  # relative to the tracking directory
+    snapshot_type: str
+    domain: str
+    timestamp: str  # metadata.timestamp as written in the file
+    size: int
+    mtime_ns: int
+    content_hash: str
+    position: float  # metadata timestamp as epoch seconds, or mtime if missing
+
+class SnapshotCatalog:
+    """
+    Index of every baseline and snapshot file under a tracking directory,
+    including the members of snapshot archives (see snapshot_archive.py).
+
+    The catalog is stored in ``<tracking_dir>/.snapshot-catalog.json`` and
+    refreshed incrementally: every refresh stats each file, and only files
+    whose size or mtime_ns changed (including in-place rewrites) are re-read
+    and re-hashed. ``refresh(full=True)`` re-reads every file regardless.
+
+    Lookups use per-(type, domain) lists kept sorted by metadata timestamp
+    (file name breaks ties), so latest is O(1), range is O(log n) and
+    last-N is O(N). Indexing decodes only each file's ``metadata`` object.
+
+    Lookups read the in-memory index only. Long-lived callers use
+    ``ensure_fresh()``, which refreshes once per catalog instance; files
+    written through ``record()`` are indexed as they are written, and
+    ``refresh()`` picks up changes made by other processes.
+    """
+
+    def __init__(self, tracking_dir: Path = None):
+        self.tracking_dir = Path(tracking_dir or "tracking")
+        self.index_path = self.tracking_dir / CATALOG_FILENAME
+        self.entries: Dict[str, CatalogEntry] = {}
+        self.archive_stats: Dict[str, List[int]] = {}
+        self._groups: Optional[Dict[Tuple[str, Optional[str]], List[CatalogEntry]]] = None
+        self._keys: Dict[Tuple[str, Optional[str]], List[float]] = {}
+        self._dirty = False
+        self.refreshed = False
+        self._load()
+
+    def _load(self):
+        """Load the persisted catalog, starting empty if missing or stale."""
+        try:
+            with open(self.index_path, 'r') as f:
+                data = json.load(f)
+        except (FileNotFoundError, json.JSONDecodeError):
+            return
+
+        if data.get('version') != CATALOG_VERSION:
+            return
+
+        self.archive_stats = data.get('archives', {})
+        for item in data.get('entries', []):
+            try:
+                entry = CatalogEntry(**item)
+            except TypeError:
+                continue
+            self.entries[entry.path] = entry
+
+    def save(self):
+        """Write the catalog atomically if it changed."""
+        if not self._dirty:
+            return
+
+        data = {
+            'version': CATALOG_VERSION,
+            'archives': self.archive_stats,
+            'entries': [asdict(entry) for entry in self.entries.values()]
+        }
+        tmp_path = self.index_path.with_suffix(f".{os.getpid()}.tmp")
+        try:
+            self.tracking_dir.mkdir(parents=True, exist_ok=True)
+            with open(tmp_path, 'w') as f:
+                json.dump(data, f)
+            os.replace(tmp_path, self.index_path)
+            self._dirty = False
+        except OSError as e:
+            print(f"Warning: could not save snapshot catalog: {e}")
+            tmp_path.unlink(missing_ok=True)
+
+    def _source_dirs(self) -> Dict[str, Path]:
+        """Directories indexed by the catalog, keyed by snapshot type."""
+        dirs = {BASELINE_TYPE: self.tracking_dir / "baselines"}
+        for snapshot_type in SNAPSHOT_TYPES:
+            dirs[snapshot_type] = self.tracking_dir / "snapshots" / snapshot_type
+        return dirs
+
+    def _read_metadata(self, path: Path) -> Tuple[Dict[str, Any], str, int]:
+        """Read a snapshot's metadata object, content hash and size."""
+        with open(path, 'rb') as f:
+            content = f.read()
+        metadata = read_metadata(content.decode('utf-8'))
+        return metadata, hashlib.sha256(content).hexdigest(), len(content)
+
+    def _index_file(self, path: Path, snapshot_type: str,
+                    stat: os.stat_result) -> Optional[CatalogEntry]:
+        """Build a catalog entry for a file, or None if it is not valid JSON."""
+        try:
+            metadata, content_hash, size = self._read_metadata(path)
+        except (OSError, ValueError) as e:
+            print(f"Warning: skipping unreadable snapshot {path}: {e}")
+            return None
+
+        position = parse_timestamp(metadata.get('timestamp'))
+        return CatalogEntry(
+            path=path.relative_to(self.tracking_dir).as_posix(),
+            snapshot_type=snapshot_type,
+            domain=str(metadata.get('domain', '')),
+            timestamp=str(metadata.get('timestamp', '')),
+            size=size,
+            mtime_ns=stat.st_mtime_ns,
+            content_hash=content_hash,
+            position=stat.st_mtime if position is None else position
+        )
+
+    def refresh(self, full: bool = False) -> bool:
+        """
+        Bring the catalog up to date with the files on disk.
+
+        Args:
+            full: Re-read every file even if its size and mtime are unchanged
+
+        Returns:
+            True if any entry was added, updated or removed
+        """
+        changed = False
+
+        for snapshot_type, directory in self._source_dirs().items():
+            if self._rescan_dir(directory, snapshot_type, full):
+                changed = True
+
+        if changed:
+            self._groups = None
+            self._dirty = True
+        self.save()
+        self.refreshed = True
+        return changed
+
+    def ensure_fresh(self):
+        """Refresh the catalog unless this instance has already been refreshed."""
+        if not self.refreshed:
+            self.refresh()
+
+    def _rescan_dir(self, directory: Path, snapshot_type: str, full: bool = False) -> bool:
+        """Re-index one directory, reusing entries whose size and mtime_ns match."""
+        changed = False
+        seen = set()
+
+        if directory.exists():
+            with os.scandir(directory) as it:
+                for dir_entry in it:
+                    if dir_entry.name.endswith(ARCHIVE_SUFFIX) and dir_entry.is_file():
+                        if self._rescan_archive(Path(dir_entry.path), snapshot_type,
+                                                dir_entry.stat(), seen, full):
+                            changed = True
+                        continue
+                    if not dir_entry.name.endswith('.json') or not dir_entry.is_file():
+                        continue
+                    path = Path(dir_entry.path)
+                    rel_path = path.relative_to(self.tracking_dir).as_posix()
+                    seen.add(rel_path)
+
+                    stat = dir_entry.stat()
+                    existing = self.entries.get(rel_path)
+                    if (not full and existing and existing.size == stat.st_size
+                            and existing.mtime_ns == stat.st_mtime_ns):
+                        continue
+
+                    entry = self._index_file(path, snapshot_type, stat)
+                    if entry:
+                        self.entries[rel_path] = entry
+                    else:
+                        self.entries.pop(rel_path, None)
+                    changed = True
+
+        for rel_path, entry in list(self.entries.items()):
+            if entry.snapshot_type == snapshot_type and rel_path not in seen:
+                del self.entries[rel_path]
+                changed = True
+
+        dir_prefix = directory.relative_to(self.tracking_dir).as_posix() + "/"
+        for rel_path in list(self.archive_stats):
+            if rel_path.startswith(dir_prefix) and member_path(rel_path, "") not in seen:
+                del self.archive_stats[rel_path]
+                self._dirty = True
+
+        return changed
+
+    def _rescan_archive(self, path: Path, snapshot_type: str,
+                        stat: os.stat_result, seen: set, full: bool = False) -> bool:
+        """
+        Index every member of a snapshot archive from its footer index.
+
+        Members are addressed as '<archive>!<member>' paths. Nothing is
+        decompressed: hash, size and metadata come from the index.
+        """
+        rel_archive = path.relative_to(self.tracking_dir).as_posix()
+        prefix = member_path(rel_archive, "")
+        seen.add(prefix)
+        archive_stat = [stat.st_mtime_ns, stat.st_size]
+
+        if not full and self.archive_stats.get(rel_archive) == archive_stat:
+            seen.update(p for p in self.entries if p.startswith(prefix))
+            return False
+
+        try:
+            archive = SnapshotArchive(path)
+            records = {name: archive.info(name) for name in archive.names()}
+        except ArchiveError as e:
+            print(f"Warning: skipping unreadable archive {path}: {e}")
+            return False
+
+        for name, record in records.items():
+            position = parse_timestamp(record.get('timestamp'))
+            entry = CatalogEntry(
+                path=prefix + name,
+                snapshot_type=snapshot_type,
+                domain=record.get('domain', ''),
+                timestamp=record.get('timestamp', ''),
+                size=record['size'],
+                mtime_ns=stat.st_mtime_ns,
+                content_hash=record['sha256'],
+                position=stat.st_mtime if position is None else position
+            )
+            self.entries[entry.path] = entry
+            seen.add(entry.path)
+
+        self.archive_stats[rel_archive] = archive_stat
+        return True
+
+    def record(self, path: Path, snapshot_type: str = None) -> Optional[CatalogEntry]:
+        """
+        Index a file that was just written.
+
+        Args:
+            path: Snapshot or baseline file path
+            snapshot_type: Type of the file; inferred from its directory if omitted
+
+        Returns:
+            The new catalog entry, or None if the file could not be indexed
+        """
+        path = Path(path)
+        if snapshot_type is None:
+            snapshot_type = (BASELINE_TYPE if path.parent.name == "baselines"
+                             else path.parent.name)
+
+        entry = self._index_file(path, snapshot_type, path.stat())
+        if entry:
+            self.entries[entry.path] = entry
+            self._groups = None
+            self._dirty = True
+            self.save()
+        return entry
+
+    def _group(self, snapshot_type: str,
+               domain: Optional[str] = None) -> Tuple[List[CatalogEntry], List[Any]]:
+        """
+        Entries of one type (and optionally domain) in series order.
+
+        Series are ordered by metadata timestamp (``position``), so checkouts
+        and copies that reset file mtimes do not reorder them.
+        """
+        if self._groups is None:
+            groups = {}
+            for entry in self.entries.values():
+                groups.setdefault((entry.snapshot_type, None), []).append(entry)
+                groups.setdefault((entry.snapshot_type, entry.domain), []).append(entry)
+            for entries in groups.values():
+                entries.sort(key=lambda e: (e.position, e.path))
+            self._groups = groups
+            self._keys = {key: [e.position for e in entries]
+                          for key, entries in groups.items()}
+
+        key = (snapshot_type, domain)
+        return self._groups.get(key, []), self._keys.get(key, [])
+
+    def latest(self, snapshot_type: str = "weekly",
+               domain: str = None) -> Optional[CatalogEntry]:
+        """Most recent entry of a type, or None."""
+        entries, _ = self._group(snapshot_type, domain)
+        return entries[-1] if entries else None
+
+    def last_n(self, snapshot_type: str = "weekly", count: int = 8,
+               domain: str = None) -> List[CatalogEntry]:
+        """Up to ``count`` most recent entries, in chronological order."""
+        entries, _ = self._group(snapshot_type, domain)
+        return entries[-count:] if count > 0 else []
+
+    def range(self, snapshot_type: str, start: datetime = None, end: datetime = None,
+              domain: str = None) -> List[CatalogEntry]:
+        """Entries whose metadata timestamp falls within [start, end] (naive = UTC)."""
+        entries, keys = self._group(snapshot_type, domain)
+        lo = bisect.bisect_left(keys, parse_timestamp(start.isoformat())) if start else 0
+        hi = bisect.bisect_right(keys, parse_timestamp(end.isoformat())) if end else len(keys)
+        return entries[lo:hi]
+
+    def count(self, snapshot_type: str, domain: str = None) -> int:
+        """Number of indexed files of a type."""
+        return len(self._group(snapshot_type, domain)[0])
+
+    def domains(self, snapshot_type: str = None) -> List[str]:
+        """Domains that have at least one indexed file."""
+        return sorted({e.domain for e in self.entries.values()
+                       if snapshot_type is None or e.snapshot_type == snapshot_type})
+
+    def resolve(self, entry: CatalogEntry) -> Path:
+        """Path of an entry; archive members resolve to '<archive>!<member>'."""
+        return self.tracking_dir / entry.path
+
+    def load(self, entry: CatalogEntry) -> Dict[str, Any]:
+        """Parse an entry's snapshot, whether loose or inside an archive."""
+        return load_snapshot_file(self.resolve(entry))
+
+def main():
+    """Rebuild or inspect the snapshot catalog."""
+    import argparse
+
+    parser = argparse.ArgumentParser(description="SEO Agent Snapshot Catalog")
+    parser.add_argument("--tracking-dir", default="tracking", help="Tracking data directory")
+    parser.add_argument("--rebuild", action="store_true",
+                       help="Re-read every file, even those whose size and mtime are unchanged")
+    args = parser.parse_args()
+
+    catalog = SnapshotCatalog(Path(args.tracking_dir))
+    catalog.refresh(full=args.rebuild)
+
+    print(f"📇 Snapshot catalog: {catalog.index_path}")
+    for snapshot_type in [BASELINE_TYPE] + SNAPSHOT_TYPES:
+        latest = catalog.latest(snapshot_type)
+        latest_info = f" (latest: {latest.path})" if latest else ""
+        print(f"  {snapshot_type}: {catalog.count(snapshot_type)} files{latest_info}")
+
+if __name__ == "__main__":
+    main()
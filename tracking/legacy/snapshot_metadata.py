@@ -0,0 +1,44 @@
+#!/usr/bin/env python3
+"""
+SEO Agent Library - Snapshot Metadata
+Fast metadata extraction and timestamp parsing shared by the catalog and archives.
+"""
+
+import json
+import re
+from datetime import datetime, timezone
+from typing import Dict, Any, Optional
+
+# Every writer puts "metadata" first, so its value can be decoded on its own
+METADATA_HEADER = re.compile(r'\A\s*\{\s*"metadata"\s*:\s*')
+_decoder = json.JSONDecoder()
+
+def read_metadata(text: str) -> Dict[str, Any]:
+    """
+    Extract the top-level ``metadata`` object of a snapshot document.
+
+    Only the metadata value is decoded when it is the first key (as written
+    by every exporter); otherwise the whole document is parsed.
+
+    Raises:
+        ValueError: If the document is not valid JSON
+    """
+    match = METADATA_HEADER.match(text)
+    if match:
+        metadata, _ = _decoder.raw_decode(text, match.end())
+    else:
+        data = json.loads(text)
+        metadata = data.get('metadata', {}) if isinstance(data, dict) else {}
+    return metadata if isinstance(metadata, dict) else {}
+
+def parse_timestamp(value: Any) -> Optional[float]:
+    """Metadata timestamp as epoch seconds; naive timestamps are taken as UTC."""
+    if not isinstance(value, str) or not value:
+        return None
+    try:
+        parsed = datetime.fromisoformat(value)
+    except ValueError:
+        return None
+    if parsed.tzinfo is None:
+        parsed = parsed.replace(tzinfo=timezone.utc)
+    return parsed.timestamp()
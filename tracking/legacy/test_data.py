@@ -10,6 +10,7 @@ from datetime import datetime, timedelta
 from pathlib import Path
 from typing import Dict, Any
 import random
+from snapshot_catalog import SnapshotCatalog
 
 class TestDataGenerator:
     """Generates realistic test data for SEO tracking."""
@@ -254,6 +255,8 @@ class TestDataGenerator:
             json.dump(mission_snapshot, f, indent=2)
         print(f"✅ Mission snapshot saved: {mission_path}")
         
+        SnapshotCatalog(self.tracking_dir).refresh()
+        
         print("\n📊 Test data generation complete!")
         print("Ready to test report generation with realistic SEO data.")
 
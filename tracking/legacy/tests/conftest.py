@@ -0,0 +1,84 @@
+"""Shared fixtures for the tracking module tests."""
+
+import json
+import os
+import shutil
+import sys
+from pathlib import Path
+
+import pytest
+
+LEGACY_DIR = Path(__file__).resolve().parent.parent
+REPO_ROOT = LEGACY_DIR.parent.parent
+
+# The tracking modules import each other by bare module name
+sys.path.insert(0, str(LEGACY_DIR))
+
+
+@pytest.fixture
+def tracking_dir(tmp_path, monkeypatch):
+    """Empty tracking directory; the test runs from its parent."""
+    monkeypatch.chdir(tmp_path)
+    path = tmp_path / 'tracking'
+    path.mkdir()
+    return path
+
+
+@pytest.fixture
+def schemas(tracking_dir):
+    """Copy the repo's baseline and mission schemas next to tracking_dir."""
+    from schema_validator import BASELINE_SCHEMA, MISSION_SCHEMA
+    for schema in (BASELINE_SCHEMA, MISSION_SCHEMA):
+        target = tracking_dir.parent / schema
+        target.parent.mkdir(parents=True, exist_ok=True)
+        shutil.copyfile(REPO_ROOT / schema, target)
+    return tracking_dir.parent
+
+
+def snapshot(timestamp: str = '2026-01-05T00:00:00', domain: str = 'example.com',
+             sessions: float = 100, **sections) -> dict:
+    """Snapshot document with metadata first, as every exporter writes it."""
+    data = {
+        'metadata': {'timestamp': timestamp, 'domain': domain,
+                     'baseline_type': 'current', 'created_by': 'tests', 'version': '1.0'},
+        'traffic_metrics': {'organic_traffic': {'sessions': sessions}},
+    }
+    data.update(sections)
+    return data
+
+
+def write_snapshot(tracking_dir: Path, snapshot_type: str, name: str, data: dict,
+                   mtime: float = None) -> Path:
+    """Write a snapshot file (or baseline, for type 'baseline') and return its path."""
+    if snapshot_type == 'baseline':
+        directory = tracking_dir / 'baselines'
+    else:
+        directory = tracking_dir / 'snapshots' / snapshot_type
+    directory.mkdir(parents=True, exist_ok=True)
+    path = directory / name
+    path.write_text(json.dumps(data))
+    if mtime is not None:
+        os.utime(path, (mtime, mtime))
+    return path
+
+
+def mission_data(domain: str = 'example.com', timestamp: str = '2026-01-05T00:00:00Z',
+                 name: str = 'site-audit', ai_total: int = 30, fixes: list = None) -> dict:
+    """Minimal mission data.json that satisfies the AImpactScanner schema."""
+    return {
+        'schema_version': '1.0',
+        'mission': {'name': name, 'timestamp': timestamp, 'mode': 'lite',
+                    'run_directory': f'runs/{name}-{domain}/'},
+        'site': {'domain': domain},
+        'scorecards': {'ai_search_readiness': {'total': ai_total},
+                       'traditional_seo': {'total': 40}},
+        'fixes': fixes or [],
+    }
+
+
+def write_mission(runs_dir: Path, run: str, data: dict) -> Path:
+    """Write runs/<run>/data.json and return its path."""
+    path = runs_dir / run / 'data.json'
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(json.dumps(data))
+    return path
@@ -0,0 +1,158 @@
+"""Keyword export import: parsing, aggregation, the columnar sidecar and snapshot merges."""
+
+import gzip
+import json
+from datetime import date
+
+import pytest
+
+import keyword_import
+from conftest import snapshot, write_snapshot
+from keyword_import import (KeywordAggregator, KeywordImporter, KeywordImportError, KeywordSidecar,
+                            KeywordSidecarWriter, detect_source, iter_export_rows)
+from snapshot_archive import pack_directory
+
+GSC_CSV = """Top queries,Date,Clicks,Impressions,CTR,Position
+seo tools,2026-01-05,"1,200","10,000",12%,2.5
+,2026-01-05,1,1,100%,1
+rank checker,2026-01-05,10,400,2.5%,14
+seo tools,2026-01-06,900,8000,11.25%,4
+rank checker,2026-01-06,5,100,5%,60
+ünïcode,2026-01-06,0,50,0%,
+"""
+
+GA4_CSV = """# ----------------------------------------
+# Queries
+# ----------------------------------------
+Organic Google Search query,Date,Organic Google Search clicks,Organic Google Search impressions,Organic Google Search average position
+seo tools,20260105,3,30,1.5
+"""
+
+
+def export(tmp_path, name, text):
+    path = tmp_path / name
+    if name.endswith('.gz'):
+        with gzip.open(path, 'wt', encoding='utf-8') as f:
+            f.write(text)
+    else:
+        path.write_text(text, encoding='utf-8')
+    return path
+
+
+def days(*isodates):
+    return [(date.fromisoformat(d) - keyword_import.EPOCH).days for d in isodates]
+
+
+def test_gsc_csv_rows(tmp_path):
+    rows = list(iter_export_rows(export(tmp_path, 'gsc.csv', GSC_CSV)))
+    assert len(rows) == 5  # the row without a query is skipped
+    assert rows[0] == {'query': 'seo tools', 'date': days('2026-01-05')[0], 'clicks': 1200,
+                       'impressions': 10000, 'position': 2.5}
+    assert rows[-1]['query'] == 'ünïcode' and rows[-1]['position'] is None
+    assert detect_source(tmp_path / 'gsc.csv') == 'gsc'
+
+
+def test_ga4_tsv_and_jsonl_exports(tmp_path):
+    ga4 = export(tmp_path, 'ga4.csv', GA4_CSV)
+    assert list(iter_export_rows(ga4)) == [
+        {'query': 'seo tools', 'date': days('2026-01-05')[0], 'clicks': 3, 'impressions': 30,
+         'position': 1.5}]
+    assert detect_source(ga4) == 'ga4'
+
+    tsv = export(tmp_path, 'export.tsv.gz', "Keyword\tClicks\nseo tools\t7\n")
+    assert list(iter_export_rows(tsv)) == [
+        {'query': 'seo tools', 'date': -1, 'clicks': 7, 'impressions': 0, 'position': None}]
+
+    lines = [{'query': 'a', 'date': '2026-01-05', 'clicks': 1, 'impressions': 2, 'position': 3}]
+    jsonl = export(tmp_path, 'export.jsonl', '\n'.join(json.dumps(line) for line in lines) + '\n\n')
+    assert [row['position'] for row in iter_export_rows(jsonl)] == [3.0]
+
+
+def test_malformed_exports_raise(tmp_path):
+    with pytest.raises(KeywordImportError, match='no query/keyword column'):
+        list(iter_export_rows(export(tmp_path, 'a.csv', "Page,Clicks\n/,1\n")))
+    with pytest.raises(KeywordImportError, match='row 2'):
+        list(iter_export_rows(export(tmp_path, 'b.csv', "Query,Clicks\na,1\nb,many\n")))
+
+
+def test_aggregator_uses_last_date_for_distribution():
+    aggregator = KeywordAggregator()
+    first, second = days('2026-01-05', '2026-01-06')
+    aggregator.add(first, 10, 100, 2.0)
+    aggregator.add(first, 0, 0, 150.0)
+    aggregator.add(second, 5, 300, 4.0)
+    aggregator.add(second, 0, 100, 15.0)
+    aggregator.add(second, 0, 0, None)
+    metrics = aggregator.ranking_metrics()
+    assert metrics['visibility'] == {
+        'average_position': round((2 * 100 + 150 * 1 + 4 * 300 + 15 * 100) / 501, 2),
+        'impressions': 500, 'clicks': 15, 'ctr': 3.0}
+    assert metrics['keyword_distribution'] == {
+        'total_keywords': 3, 'top_3': 0, 'top_10': 1, 'top_20': 2, 'top_50': 2, 'top_100': 2}
+    assert KeywordAggregator().ranking_metrics()['visibility']['average_position'] == 0.0
+
+
+def test_sidecar_round_trip_across_chunks(tmp_path, monkeypatch):
+    monkeypatch.setattr(keyword_import, 'CHUNK_ROWS', 2)
+    rows = [('seo tools', date(2026, 1, 5), 12, 100, 2.5), ('ünïcode', None, 0, 5, None),
+            ('x' * 300, date(2026, 1, 6), 2**33, 1, 99.0)]
+    writer = KeywordSidecarWriter(tmp_path)
+    for query, day, clicks, impressions, position in rows:
+        writer.add(query, days(day.isoformat())[0] if day else -1, clicks, impressions, position)
+    directory = writer.close(tmp_path / 'sidecar', {'domain': 'example.com'})
+
+    sidecar = KeywordSidecar(directory)
+    assert sidecar.rows == 3 and sidecar.manifest['domain'] == 'example.com'
+    assert list(sidecar.iter_rows()) == [rows[0], rows[1], rows[2][:2] + (0xFFFFFFFF, 1, 99.0)]
+    assert list(sidecar.column('impressions')) == [100, 5, 1]
+    assert not list(tmp_path.glob('.import.*'))
+
+
+def test_import_merges_into_the_latest_snapshot(tracking_dir, tmp_path):
+    write_snapshot(tracking_dir, 'weekly', 'old.json', snapshot('2025-12-29T00:00:00'))
+    latest = write_snapshot(tracking_dir, 'weekly', 'latest.json',
+                            snapshot(ranking_metrics={'domain_rating': {'value': 30}}))
+    source = export(tmp_path, 'gsc.csv', GSC_CSV)
+
+    result = KeywordImporter(tracking_dir).import_file(source, 'example.com', record_history=False)
+    assert result['snapshot'] == latest and result['rows'] == 5
+    assert result['sidecar'] == tracking_dir / 'keywords' / 'example.com' / '20260105_20260106'
+
+    data = json.loads(latest.read_text())
+    assert data['traffic_metrics']['organic_traffic']['sessions'] == 100
+    assert data['ranking_metrics']['domain_rating'] == {'value': 30}
+    assert data['ranking_metrics']['keyword_distribution']['total_keywords'] == 3
+    info = data['metadata']['keyword_import']
+    assert (info['start_date'], info['end_date'], info['source_format']) == (
+        '2026-01-05', '2026-01-06', 'gsc')
+    assert info['sidecar'] == 'keywords/example.com/20260105_20260106'
+    assert KeywordSidecar(result['sidecar']).rows == 5
+
+    # A re-import of the same period replaces the sidecar
+    KeywordImporter(tracking_dir).import_file(source, 'example.com', record_history=False)
+    assert len(list((tracking_dir / 'keywords' / 'example.com').iterdir())) == 1
+
+
+def test_import_new_snapshot_and_refusals(tracking_dir, tmp_path):
+    source = export(tmp_path, 'gsc.csv', GSC_CSV)
+    importer = KeywordImporter(tracking_dir)
+    with pytest.raises(KeywordImportError, match='no weekly snapshot'):
+        importer.import_file(source, 'example.com', record_history=False)
+
+    result = importer.import_file(source, 'example.com', new=True, record_history=False)
+    assert result['snapshot'].name == 'weekly_example.com_20260106_keywords.json'
+    data = json.loads(result['snapshot'].read_text())
+    assert data['metadata']['timestamp'] == '2026-01-06T23:59:59'
+    assert importer.catalog.latest('weekly', 'example.com').path.endswith('_keywords.json')
+
+    pack_directory(tracking_dir / 'snapshots' / 'weekly')
+    with pytest.raises(KeywordImportError, match='archived'):
+        KeywordImporter(tracking_dir).import_file(source, 'example.com', record_history=False)
+
+
+def test_failed_import_leaves_no_partial_sidecar(tracking_dir, tmp_path):
+    source = export(tmp_path, 'bad.csv', "Query,Clicks\na,1\nb,many\n")
+    with pytest.raises(KeywordImportError):
+        KeywordImporter(tracking_dir).import_file(source, 'example.com', new=True)
+    assert list((tracking_dir / 'keywords' / 'example.com').iterdir()) == []
+    assert not (tracking_dir / 'snapshots').exists()
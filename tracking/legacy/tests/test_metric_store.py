@@ -0,0 +1,94 @@
+"""Columnar metric store: flattening, appends, rebuilds and queries."""
+
+from datetime import datetime, timezone
+
+import pytest
+
+from conftest import snapshot, write_snapshot
+from metric_store import MetricStore, flatten_metrics
+from report_engine import ReportEngine
+from snapshot_catalog import SnapshotCatalog
+
+SESSIONS = 'traffic_metrics.organic_traffic.sessions'
+
+
+@pytest.fixture
+def series(tracking_dir):
+    """Three weekly snapshots with 10, 20 and 30 sessions."""
+    for week in range(1, 4):
+        write_snapshot(tracking_dir, 'weekly', f'w{week}.json',
+                       snapshot(f'2026-01-{week * 7:02d}T00:00:00', sessions=week * 10))
+    return tracking_dir
+
+
+def synced(tracking_dir):
+    catalog = SnapshotCatalog(tracking_dir)
+    catalog.refresh()
+    store = MetricStore(tracking_dir)
+    return catalog, store, store.sync(catalog, ['weekly'])
+
+
+def test_flatten_metrics_keeps_numbers_only():
+    data = {
+        'metadata': {'version': 1},
+        'traffic_metrics': {'organic_traffic': {'sessions': 10, 'bounce_rate': 0.4}},
+        'ranking_metrics': {'top': ['a'], 'tracked': True, 'note': 'x'},
+    }
+    assert flatten_metrics(data) == {
+        'traffic_metrics.organic_traffic.sessions': 10,
+        'traffic_metrics.organic_traffic.bounce_rate': 0.4,
+    }
+
+
+def test_sync_and_query(series):
+    _, store, written = synced(series)
+    assert written == 3
+    result = store.query([SESSIONS, 'missing.metric'], 'example.com')
+    assert result[SESSIONS] == [10, 20, 30]
+    assert all(isinstance(value, int) for value in result[SESSIONS])
+    assert result['missing.metric'] == [None, None, None]
+    assert result['timestamps'][0] == datetime(2026, 1, 7, tzinfo=timezone.utc)
+
+    assert store.query([SESSIONS], 'example.com', last=2)[SESSIONS] == [20, 30]
+    window = store.query([SESSIONS], 'example.com', start=datetime(2026, 1, 10),
+                         end=datetime(2026, 1, 14))
+    assert window[SESSIONS] == [20]
+    assert store.query([SESSIONS], 'nobody.org') == {'timestamps': [], SESSIONS: []}
+    assert store.list_metrics('example.com') == [SESSIONS]
+
+
+def test_new_snapshots_are_appended_and_new_columns_backfilled(series):
+    catalog, store, _ = synced(series)
+    extra = snapshot('2026-01-28T00:00:00', sessions=40.5,
+                     ranking_metrics={'visibility': {'average_position': 12.5}})
+    catalog.record(write_snapshot(series, 'weekly', 'w4.json', extra))
+    assert store.sync(catalog, ['weekly']) == 1
+
+    result = store.query([SESSIONS, 'ranking_metrics.visibility.average_position'], 'example.com')
+    assert result[SESSIONS] == [10.0, 20.0, 30.0, 40.5]
+    assert result['ranking_metrics.visibility.average_position'] == [None, None, None, 12.5]
+    assert store.sync(catalog, ['weekly']) == 0
+
+
+def test_edited_history_rebuilds_the_series(series):
+    catalog, store, _ = synced(series)
+    write_snapshot(series, 'weekly', 'w2.json', snapshot('2026-01-14T00:00:00', sessions=25))
+    catalog.refresh()
+    assert store.sync(catalog, ['weekly']) == 3
+    assert store.query([SESSIONS], 'example.com')[SESSIONS] == [10, 25, 30]
+
+
+def test_truncated_column_rebuilds_instead_of_appending(series):
+    catalog, store, _ = synced(series)
+    column = next((series / 'metrics' / 'example.com' / 'weekly').glob('traffic_metrics*.f64'))
+    column.write_bytes(column.read_bytes()[:8])
+    catalog.record(write_snapshot(series, 'weekly', 'w4.json',
+                                  snapshot('2026-01-28T00:00:00', sessions=40)))
+    assert store.sync(catalog, ['weekly']) == 4
+    assert store.query([SESSIONS], 'example.com')[SESSIONS] == [10, 20, 30, 40]
+
+
+def test_report_engine_metric_series(series):
+    engine = ReportEngine()
+    result = engine.get_metric_series([SESSIONS], last=2)
+    assert result[SESSIONS] == [20, 30]
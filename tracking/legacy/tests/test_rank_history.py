@@ -0,0 +1,111 @@
+"""Keyword rank history: packed daily positions and the comparisons over them."""
+
+from datetime import date, datetime
+
+import pytest
+
+from keyword_import import EPOCH, KeywordImporter, KeywordSidecarWriter
+from rank_history import KEYWORDS_FILENAME, MAX_POSITION, NOT_RANKED, RankHistory, encode_position
+
+JAN_5, JAN_12 = date(2026, 1, 5), date(2026, 1, 12)
+
+
+def sidecar(tmp_path, rows, name='sidecar', **metadata):
+    """Write (query, day or None, position) rows as a keyword import sidecar."""
+    writer = KeywordSidecarWriter(tmp_path)
+    for query, day, position in rows:
+        writer.add(query, (day - EPOCH).days if day else -1, 1, 10, position)
+    return writer.close(tmp_path / name, metadata)
+
+
+@pytest.fixture
+def history(tracking_dir, tmp_path):
+    history = RankHistory(tracking_dir, 'example.com')
+    history.ingest_sidecar(sidecar(tmp_path, [
+        ('climber', JAN_5, 30), ('climber', JAN_12, 8),
+        ('faller', JAN_5, 3), ('faller', JAN_12, 25),
+        ('steady', JAN_5, 12), ('steady', JAN_12, 12),
+        ('dropped', JAN_5, 40),
+        ('newcomer', JAN_12, 15),
+        ('deep', JAN_5, 300), ('deep', JAN_12, 90),
+    ]))
+    return history
+
+
+def test_encode_position():
+    assert encode_position(None) == NOT_RANKED
+    assert encode_position(float('nan')) == NOT_RANKED
+    assert encode_position(0) == NOT_RANKED
+    assert encode_position(0.4) == 1
+    assert encode_position(2.5) == 3
+    assert encode_position(1000) == MAX_POSITION
+
+
+def test_ingest_stores_one_byte_per_keyword_per_day(history):
+    assert history.days() == [JAN_5, JAN_12]
+    assert (history.directory / KEYWORDS_FILENAME).read_text().split('\n')[:-1] == [
+        'climber', 'faller', 'steady', 'dropped', 'newcomer', 'deep']
+    assert (history.directory / '2026-01-05.u8').read_bytes() == bytes([30, 3, 12, 40, 0, 255])
+    assert history.history('climber') == [{'date': JAN_5, 'position': 30},
+                                          {'date': JAN_12, 'position': 8}]
+    assert history.history('newcomer') == [{'date': JAN_12, 'position': 15}]
+    assert history.history('unknown') == []
+
+    assert history.resolve_day('2026-01-11') == JAN_5
+    assert history.resolve_day(datetime(2026, 2, 1, 9)) == JAN_12
+    assert history.resolve_day('2026-01-01') is None
+
+
+def test_reingest_keeps_best_position_and_merges_days(history, tmp_path):
+    written = history.ingest_sidecar(sidecar(tmp_path, [
+        ('climber', JAN_12, 9), ('climber', JAN_12, 6), ('late', JAN_12, 2),
+        ('unranked', JAN_12, None)], name='second'))
+    assert written == 1
+    reloaded = RankHistory(history.tracking_dir, 'example.com')
+    assert reloaded.keywords()[-1] == 'late'
+    assert 'unranked' not in reloaded.keywords()
+    assert reloaded.history('climber')[-1]['position'] == 6
+    assert reloaded.history('faller')[-1]['position'] == 25  # untouched by the merge
+    # Days written before a keyword was interned read as not ranked
+    assert reloaded.positions(JAN_5)[reloaded.keywords().index('late')] == NOT_RANKED
+
+
+def test_undated_rows_use_the_import_day(tracking_dir, tmp_path):
+    history = RankHistory(tracking_dir, 'example.com')
+    history.ingest_sidecar(sidecar(tmp_path, [('q', None, 4)],
+                                   imported_at='2026-03-01T10:00:00'))
+    assert history.history('q') == [{'date': date(2026, 3, 1), 'position': 4}]
+
+
+def test_movers(history):
+    result = history.movers(JAN_5, JAN_12)
+    assert result['improved'] == [
+        {'keyword': 'deep', 'before': 255, 'after': 90, 'change': 165},
+        {'keyword': 'climber', 'before': 30, 'after': 8, 'change': 22}]
+    assert result['declined'] == [{'keyword': 'faller', 'before': 3, 'after': 25, 'change': -22}]
+    assert history.movers(JAN_5, JAN_12, max_position=50)['improved'][0]['keyword'] == 'climber'
+    assert history.movers(JAN_5, JAN_12, limit=1, min_change=100)['improved'][0]['keyword'] == 'deep'
+    assert history.movers('2025-01-01', JAN_12) == {'improved': [], 'declined': []}
+
+
+def test_striking_distance_and_new_and_lost(history):
+    assert history.striking_distance(JAN_12) == [{'keyword': 'steady', 'position': 12},
+                                                 {'keyword': 'newcomer', 'position': 15}]
+    assert history.striking_distance(JAN_12, limit=1) == [{'keyword': 'steady', 'position': 12}]
+    assert history.striking_distance('2025-12-31') == []
+
+    result = history.new_and_lost(JAN_5, JAN_12)
+    assert result['new'] == [{'keyword': 'newcomer', 'position': 15},
+                             {'keyword': 'deep', 'position': 90}]
+    assert result['lost'] == [{'keyword': 'dropped', 'position': 40}]
+    assert history.new_and_lost(JAN_5, JAN_12, max_position=20)['lost'] == [
+        {'keyword': 'faller', 'position': 3}]
+
+
+def test_keyword_import_records_history(tracking_dir, tmp_path):
+    export = tmp_path / 'gsc.csv'
+    export.write_text("Query,Date,Clicks,Impressions,Position\n"
+                      "a,2026-01-05,1,10,4\na,2026-01-06,1,10,2\n")
+    KeywordImporter(tracking_dir).import_file(export, 'example.com', new=True)
+    assert RankHistory(tracking_dir, 'example.com').history('a') == [
+        {'date': date(2026, 1, 5), 'position': 4}, {'date': date(2026, 1, 6), 'position': 2}]
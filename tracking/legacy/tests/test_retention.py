@@ -0,0 +1,125 @@
+"""Retention policy: rollup planning, aggregation and compaction."""
+
+import json
+from datetime import datetime, timezone
+
+import pytest
+
+from conftest import snapshot, write_snapshot
+from retention import RetentionManager, month_period, week_period
+from snapshot_archive import SnapshotArchive
+from snapshot_metadata import parse_timestamp
+
+NOW = datetime(2026, 2, 1, tzinfo=timezone.utc)
+POLICY = {'daily': 7, 'weekly': 52, 'monthly': 24}
+
+
+def daily(tracking_dir, day, sessions, **sections):
+    return write_snapshot(tracking_dir, 'daily', f'daily_example.com_202601{day:02d}.json',
+                          snapshot(f'2026-01-{day:02d}T12:00:00', sessions=sessions, **sections))
+
+
+@pytest.fixture
+def days(tracking_dir):
+    """Two expired days in ISO week 2026-W02 and one recent day."""
+    cwv = {'core_web_vitals': {'lcp': {'value': 2.0, 'status': 'good'}},
+           'lighthouse_scores': {'performance': 80}}
+    daily(tracking_dir, 5, 100, technical_metrics=cwv,
+          ranking_metrics={'domain_rating': {'value': 30}})
+    cwv = {'core_web_vitals': {'lcp': {'value': 3.0, 'status': 'poor'}},
+           'lighthouse_scores': {'performance': 90}}
+    daily(tracking_dir, 7, 50, technical_metrics=cwv,
+          ranking_metrics={'domain_rating': {'value': 40}})
+    daily(tracking_dir, 30, 70)
+    return tracking_dir
+
+
+def test_periods():
+    label, end = week_period(parse_timestamp('2026-01-07T12:00:00'))
+    assert label == '2026-W02'
+    assert end == datetime(2026, 1, 12, tzinfo=timezone.utc)
+    label, end = month_period(parse_timestamp('2025-12-31T23:00:00'))
+    assert label == '2025-12'
+    assert end == datetime(2026, 1, 1, tzinfo=timezone.utc)
+
+
+def test_aggregation_rules():
+    manager = RetentionManager(policy={'aggregation': {
+        'domain_rating': 'mean', 'ranking_metrics.custom.value': 'sum'}})
+    assert manager.aggregation_for('traffic_metrics.organic_traffic.sessions') == 'sum'
+    assert manager.aggregation_for('ranking_metrics.visibility.average_position') == 'mean'
+    assert manager.aggregation_for('technical_metrics.core_web_vitals.lcp.value') == 'mean'
+    # A generic leaf name only aggregates where a full path says so
+    assert manager.aggregation_for('ranking_metrics.domain_rating.value') == 'last'
+    assert manager.aggregation_for('ranking_metrics.custom.value') == 'sum'
+    assert manager.aggregation_for('ranking_metrics.domain_rating') == 'mean'
+    assert manager.aggregation_for('technical_metrics.lighthouse_scores.performance') == 'last'
+
+
+def test_aggregate_combines_numbers_and_keeps_latest_structure():
+    manager = RetentionManager()
+    first = snapshot('2026-01-05T00:00:00', sessions=100,
+                     technical_metrics={'core_web_vitals': {'lcp': {'value': 2.0, 'status': 'good'}}})
+    second = snapshot('2026-01-06T00:00:00', sessions=50,
+                      technical_metrics={'core_web_vitals': {'lcp': {'value': 2.5, 'status': 'poor'}}})
+    rollup = manager.aggregate([first, second])
+    assert rollup['traffic_metrics']['organic_traffic']['sessions'] == 150
+    assert rollup['technical_metrics']['core_web_vitals']['lcp'] == {'value': 2.25, 'status': 'poor'}
+    assert rollup['metadata']['timestamp'] == '2026-01-06T00:00:00'
+    assert first['traffic_metrics']['organic_traffic']['sessions'] == 100  # inputs untouched
+
+
+def test_plan_and_dry_run(days):
+    manager = RetentionManager(days, POLICY)
+    rollups, expired = manager.plan(NOW)
+    assert [(p.source_type, p.target_type, p.period, len(p.entries)) for p in rollups] == [
+        ('daily', 'weekly', '2026-W02', 2)]
+    assert expired == []
+    assert manager.compact(NOW, dry_run=True) == {'rollups': 1, 'retired': 2}
+    assert len(list((days / 'snapshots' / 'daily').glob('*.json'))) == 3
+    assert not (days / 'snapshots' / 'weekly').exists()
+
+
+def test_compact_writes_rollup_and_archives_originals(days):
+    manager = RetentionManager(days, POLICY)
+    assert manager.compact(NOW) == {'rollups': 1, 'retired': 2}
+
+    weekly_dir = days / 'snapshots' / 'weekly'
+    assert [p.name for p in weekly_dir.iterdir()] == ['weekly_example.com_2026-W02.json']
+    rollup = json.loads((weekly_dir / 'weekly_example.com_2026-W02.json').read_text())
+    assert rollup['traffic_metrics']['organic_traffic']['sessions'] == 150
+    assert rollup['technical_metrics']['core_web_vitals']['lcp']['value'] == 2.5
+    assert rollup['technical_metrics']['lighthouse_scores']['performance'] == 90
+    assert rollup['ranking_metrics']['domain_rating']['value'] == 40
+    assert rollup['metadata']['baseline_type'] == 'rollup'
+    assert rollup['metadata']['rollup']['snapshots'] == 2
+
+    assert [p.name for p in (days / 'snapshots' / 'daily').iterdir()] == [
+        'daily_example.com_20260130.json']
+    archive = SnapshotArchive(days / 'archive' / 'daily' / 'example.com.snaparc')
+    assert archive.names() == ['daily_example.com_20260105.json', 'daily_example.com_20260107.json']
+
+    assert manager.catalog.count('weekly') == 1
+    assert manager.catalog.count('daily') == 1
+    # Nothing left to do on a second run
+    assert manager.compact(NOW) == {'rollups': 0, 'retired': 0}
+
+
+def test_existing_target_is_kept_and_delete_drops_originals(days):
+    existing = write_snapshot(days, 'weekly', 'weekly_manual.json',
+                              snapshot('2026-01-08T00:00:00', sessions=999))
+    manager = RetentionManager(days, POLICY)
+    assert manager.compact(NOW, delete=True) == {'rollups': 0, 'retired': 2}
+    assert [p.name for p in (days / 'snapshots' / 'weekly').iterdir()] == [existing.name]
+    assert not (days / 'archive').exists()
+    assert len(list((days / 'snapshots' / 'daily').iterdir())) == 1
+
+
+def test_expired_monthly_snapshots_are_retired(tracking_dir):
+    write_snapshot(tracking_dir, 'monthly', 'monthly_old.json', snapshot('2023-06-15T00:00:00'))
+    write_snapshot(tracking_dir, 'monthly', 'monthly_new.json', snapshot('2025-06-15T00:00:00'))
+    manager = RetentionManager(tracking_dir, POLICY)
+    assert manager.compact(NOW) == {'rollups': 0, 'retired': 1}
+    assert [p.name for p in (tracking_dir / 'snapshots' / 'monthly').iterdir()] == ['monthly_new.json']
+    assert SnapshotArchive(tracking_dir / 'archive' / 'monthly' / 'example.com.snaparc').names() == [
+        'monthly_old.json']
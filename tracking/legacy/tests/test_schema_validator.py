@@ -0,0 +1,144 @@
+"""Schema validator: compiled keyword checks, $ref resolution and batch validation."""
+
+import json
+
+import pytest
+
+from conftest import REPO_ROOT, mission_data, snapshot, write_snapshot
+from schema_validator import (BASELINE_SCHEMA, MISSION_SCHEMA, PARALLEL_THRESHOLD, CompiledSchema,
+                              SchemaError, validate_file, validate_files)
+from snapshot_archive import SnapshotArchive
+
+
+def compiled(tmp_path, schema, name='schema.json'):
+    path = tmp_path / name
+    path.write_text(json.dumps(schema))
+    return CompiledSchema(path)
+
+
+def messages(schema, data):
+    return [str(violation) for violation in schema.validate(data)]
+
+
+def test_keywords(tmp_path):
+    schema = compiled(tmp_path, {
+        'type': 'object',
+        'required': ['id', 'tags'],
+        'additionalProperties': False,
+        'patternProperties': {'^x-': {'type': 'string'}},
+        'properties': {
+            'id': {'type': 'integer', 'minimum': 1, 'multipleOf': 2},
+            'ratio': {'type': 'number', 'exclusiveMaximum': 1},
+            'kind': {'enum': ['a', 'b']},
+            'name': {'type': 'string', 'minLength': 2, 'pattern': '^[a-z]+$'},
+            'host': {'type': 'string', 'format': 'hostname'},
+            'when': {'type': 'string', 'format': 'date-time'},
+            'tags': {'type': 'array', 'items': {'type': 'string'}, 'minItems': 1,
+                     'uniqueItems': True},
+            'flag': {'type': 'boolean'},
+            'either': {'anyOf': [{'type': 'string'}, {'type': 'null'}]},
+            'one': {'oneOf': [{'type': 'integer'}, {'type': 'number'}]},
+            'not_zero': {'not': {'const': 0}},
+        },
+    })
+    valid = {'id': 2, 'ratio': 0.5, 'kind': 'a', 'name': 'ab', 'host': 'example.com',
+             'when': '2026-01-05T00:00:00', 'tags': ['x'], 'flag': True, 'either': None,
+             'one': 1.5, 'not_zero': 1, 'x-note': 'ok'}
+    assert schema.is_valid(valid)
+    assert schema.is_valid(dict(valid, id=4.0, when='2026-01-05T00:00:00Z'))
+
+    errors = messages(schema, {
+        'id': True, 'ratio': 1, 'kind': 'c', 'name': 'A', 'host': 'bad host',
+        'when': 'yesterday', 'tags': ['x', 'x'], 'either': 1, 'one': 1, 'not_zero': 0,
+        'x-note': 3, 'extra': 1})
+    assert sorted(errors) == sorted([
+        "$: unexpected property 'extra'",
+        '$.id: expected integer, got bool',
+        '$.ratio: must be < 1, got 1',
+        "$.kind: 'c' is not one of ['a', 'b']",
+        '$.name: must be at least 2 characters',
+        "$.name: 'A' does not match '^[a-z]+$'",
+        "$.host: 'bad host' is not a valid hostname",
+        "$.when: 'yesterday' is not a valid date-time",
+        '$.tags: items must be unique',
+        '$.either: does not match any allowed schema',
+        '$.one: must match exactly one schema, matched 2',
+        '$.not_zero: matches a disallowed schema',
+        '$["x-note"]: expected string, got int',
+    ])
+    assert messages(schema, []) == ['$: expected object, got list']
+    assert messages(schema, {'id': 3, 'tags': []}) == [
+        '$.id: must be a multiple of 2, got 3', '$.tags: needs at least 1 items']
+
+
+def test_refs_across_files_and_recursion(tmp_path):
+    (tmp_path / 'shared').mkdir()
+    (tmp_path / 'shared' / 'score.json').write_text(json.dumps(
+        {'type': 'integer', 'minimum': 0, 'maximum': 50}))
+    nested = tmp_path / 'nested'
+    nested.mkdir()
+    schema = compiled(nested, {
+        '$defs': {'node': {'type': 'object',
+                           'properties': {'score': {'$ref': 'shared/score.json'},
+                                          'children': {'type': 'array',
+                                                       'items': {'$ref': '#/$defs/node'}}}}},
+        '$ref': '#/$defs/node',
+    })
+    assert schema.is_valid({'score': 1, 'children': [{'score': 2, 'children': []}]})
+    assert messages(schema, {'children': [{'children': [{'score': 51}]}]}) == [
+        '$.children[0].children[0].score: must be <= 50, got 51']
+
+
+@pytest.mark.parametrize('schema, error', [
+    ({'type': 'object', 'dependencies': {}}, "unsupported schema keyword 'dependencies'"),
+    ({'type': 'decimal'}, "unknown type 'decimal'"),
+    ({'$ref': '#/$defs/missing'}, "not found"),
+    ({'$ref': 'nowhere.json'}, "cannot resolve $ref"),
+])
+def test_broken_schemas_fail_at_compile_time(tmp_path, schema, error):
+    with pytest.raises(SchemaError, match=error.replace('$', r'\$')):
+        compiled(tmp_path, schema)
+
+
+def test_repo_schemas_accept_real_documents():
+    baseline = CompiledSchema(REPO_ROOT / BASELINE_SCHEMA)
+    assert baseline.is_valid(snapshot(technical_metrics={}, ranking_metrics={}))
+    assert messages(baseline, snapshot()) == ["$: missing required property 'technical_metrics'",
+                                              "$: missing required property 'ranking_metrics'"]
+
+    mission = CompiledSchema(REPO_ROOT / MISSION_SCHEMA)
+    assert mission.is_valid(mission_data())
+    fix = {'id': 'f1', 'title': 't', 'category': 'ai-search', 'impact': 11, 'effort': 1,
+           'roi': 11, 'min_diff': 'yes'}
+    assert messages(mission, mission_data(fixes=[fix])) == [
+        '$.fixes[0].impact: must be <= 10, got 11', '$.fixes[0].min_diff: expected boolean, got str']
+
+
+def test_validate_files_reports_only_invalid_files(tracking_dir, schemas):
+    good = write_snapshot(tracking_dir, 'weekly', 'good.json',
+                          snapshot(technical_metrics={}, ranking_metrics={}))
+    bad = write_snapshot(tracking_dir, 'weekly', 'bad.json', snapshot(domain='not a host'))
+    broken = tracking_dir / 'broken.json'
+    broken.write_text('{')
+    archive = SnapshotArchive(tracking_dir / 'a.snaparc')
+    archive.add({'member.json': good.read_bytes()})
+
+    invalid = validate_files([(path, BASELINE_SCHEMA) for path in
+                              (good, bad, broken, tracking_dir / 'missing.json',
+                               f"{archive.path}!member.json")])
+    assert sorted(invalid) == sorted(str(p) for p in (bad, broken, tracking_dir / 'missing.json'))
+    assert "$.metadata.domain: 'not a host' is not a valid hostname" in map(str, invalid[str(bad)])
+    assert str(invalid[str(broken)][0]).startswith('$: invalid JSON')
+    assert str(invalid[str(tracking_dir / 'missing.json')][0]).startswith('$: cannot read file')
+    assert validate_file(good, schemas / BASELINE_SCHEMA) == []
+
+
+def test_large_batches_match_in_process_results(tracking_dir, schemas):
+    paths = [write_snapshot(tracking_dir, 'daily', f'd{i}.json',
+                            snapshot(technical_metrics={}, ranking_metrics={})
+                            if i % 3 else snapshot())
+             for i in range(PARALLEL_THRESHOLD + 4)]
+    jobs = [(path, BASELINE_SCHEMA) for path in paths]
+    parallel = validate_files(jobs, max_workers=2)
+    assert parallel == validate_files(jobs, max_workers=1)
+    assert sorted(parallel) == sorted(str(p) for i, p in enumerate(paths) if i % 3 == 0)
@@ -0,0 +1,121 @@
+"""Snapshot archives: footer index, replacement, removal and catalog integration."""
+
+import hashlib
+import json
+
+import pytest
+
+from conftest import snapshot, write_snapshot
+from snapshot_archive import (HEADER, TRAILER, ArchiveError, SnapshotArchive, load_snapshot_file,
+                              pack_directory, split_member_path)
+from snapshot_catalog import SnapshotCatalog
+
+
+def member(day, sessions=1, domain='example.com'):
+    return json.dumps(snapshot(f'2026-01-{day:02d}T00:00:00', domain, sessions=sessions)).encode()
+
+
+def test_add_read_and_footer_index(tmp_path):
+    archive = SnapshotArchive(tmp_path / 'a.snaparc')
+    content = member(1, 10)
+    archive.add({'one.json': content, 'two.json': member(2, 20)})
+
+    assert archive.names() == ['one.json', 'two.json']
+    record = archive.info('one.json')
+    assert record['sha256'] == hashlib.sha256(content).hexdigest()
+    assert record['size'] == len(content)
+    assert (record['domain'], record['timestamp']) == ('example.com', '2026-01-01T00:00:00')
+    assert archive.read_bytes('one.json') == content
+    assert archive.read('two.json')['traffic_metrics']['organic_traffic']['sessions'] == 20
+
+    # The trailer points at a footer that holds the same index
+    raw = archive.path.read_bytes()
+    footer_offset, footer_length, magic = TRAILER.unpack(raw[-TRAILER.size:])
+    assert magic == b'SNPA'
+    assert footer_offset + footer_length + TRAILER.size == len(raw)
+    assert SnapshotArchive(archive.path).info('one.json') == record
+    with pytest.raises(KeyError):
+        archive.info('three.json')
+
+
+def test_add_keeps_existing_members_and_replaces_by_name(tmp_path):
+    archive = SnapshotArchive(tmp_path / 'a.snaparc')
+    archive.add({'one.json': member(1, 10)})
+    archive.add({'two.json': member(2, 20)})
+    archive.add({'one.json': member(1, 11)})
+    assert archive.names() == ['one.json', 'two.json']
+    assert archive.read('one.json')['traffic_metrics']['organic_traffic']['sessions'] == 11
+
+    size = archive.path.stat().st_size
+    archive.repack()
+    assert archive.path.stat().st_size < size
+    assert archive.read('two.json')['traffic_metrics']['organic_traffic']['sessions'] == 20
+
+    archive.remove(['one.json'])
+    assert archive.names() == ['two.json']
+    assert not list(tmp_path.glob('*.tmp'))
+
+
+def test_failed_write_leaves_archive_intact(tmp_path):
+    archive = SnapshotArchive(tmp_path / 'a.snaparc')
+    archive.add({'one.json': member(1)})
+    before = archive.path.read_bytes()
+    with pytest.raises(AttributeError):
+        archive.add({'bad.json': None})
+    assert archive.path.read_bytes() == before
+    assert not list(tmp_path.glob('*.tmp'))
+
+
+def test_corrupt_archives_raise(tmp_path):
+    path = tmp_path / 'a.snaparc'
+    path.write_bytes(b'nope' + b'\0' * 40)
+    with pytest.raises(ArchiveError):
+        SnapshotArchive(path).names()
+
+    path.write_bytes(HEADER.pack(b'SNPA', 1) + b'\0' * 3)
+    with pytest.raises(ArchiveError):
+        SnapshotArchive(path).names()
+
+    path.unlink()
+    SnapshotArchive(path).add({'one.json': member(1)})
+    raw = bytearray(path.read_bytes())
+    footer_offset = TRAILER.unpack(raw[-TRAILER.size:])[0]
+    raw[footer_offset:footer_offset + 4] = b'XXXX'
+    path.write_bytes(bytes(raw))
+    with pytest.raises(ArchiveError):
+        SnapshotArchive(path).names()
+
+
+def test_member_paths(tmp_path):
+    archive = SnapshotArchive(tmp_path / 'x.snaparc')
+    archive.add({'one.json': member(1, 5)})
+    path = f"{archive.path}!one.json"
+    assert split_member_path(path) == (archive.path, 'one.json')
+    assert split_member_path(tmp_path / 'loose.json') is None
+    assert load_snapshot_file(path)['traffic_metrics']['organic_traffic']['sessions'] == 5
+    with pytest.raises(FileNotFoundError):
+        load_snapshot_file(f"{archive.path}!missing.json")
+    with pytest.raises(FileNotFoundError):
+        load_snapshot_file(f"{tmp_path / 'none.snaparc'}!one.json")
+
+
+def test_pack_directory_and_catalog_members(tracking_dir):
+    for day in (1, 2):
+        write_snapshot(tracking_dir, 'daily', f'a_{day}.json', snapshot(f'2026-01-0{day}T00:00:00'))
+    write_snapshot(tracking_dir, 'daily', 'b_1.json', snapshot('2026-01-03T00:00:00', 'other.org'))
+    directory = tracking_dir / 'snapshots' / 'daily'
+    assert pack_directory(directory) == {'example.com.snaparc': 2, 'other.org.snaparc': 1}
+    assert not list(directory.glob('*.json'))
+
+    catalog = SnapshotCatalog(tracking_dir)
+    catalog.refresh()
+    latest = catalog.latest('daily', 'example.com')
+    assert latest.path == 'snapshots/daily/example.com.snaparc!a_2.json'
+    assert catalog.load(latest)['metadata']['timestamp'] == '2026-01-02T00:00:00'
+
+    SnapshotArchive(directory / 'example.com.snaparc').remove(['a_2.json'])
+    catalog.refresh()
+    assert catalog.latest('daily', 'example.com').path.endswith('!a_1.json')
+    (directory / 'other.org.snaparc').unlink()
+    catalog.refresh()
+    assert catalog.domains('daily') == ['example.com']
@@ -0,0 +1,118 @@
+"""Parsed-snapshot cache: hits, invalidation, eviction and read-only views."""
+
+import copy
+import json
+import os
+import pickle
+
+import pytest
+
+from conftest import snapshot, write_snapshot
+from report_engine import ReportEngine
+from snapshot_archive import SnapshotArchive, load_snapshot_file
+from snapshot_cache import PARSED_SIZE_FACTOR, SnapshotCache, freeze
+
+
+class CountingLoader:
+    def __init__(self):
+        self.calls = 0
+
+    def __call__(self, path):
+        self.calls += 1
+        return load_snapshot_file(path)
+
+
+def test_hits_and_invalidation_on_change(tracking_dir):
+    path = write_snapshot(tracking_dir, 'weekly', 'w.json', snapshot(sessions=1))
+    cache, loader = SnapshotCache(), CountingLoader()
+    first = cache.get(path, loader)
+    assert cache.get(str(path), loader) is first
+    assert loader.calls == 1
+    assert cache.stats()['hits'] == 1
+
+    stat = path.stat()
+    path.write_text(json.dumps(snapshot(sessions=2)))
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+    assert cache.get(path, loader)['traffic_metrics']['organic_traffic']['sessions'] == 2
+    assert loader.calls == 2
+
+
+def test_archive_members_follow_the_archive(tmp_path):
+    archive = SnapshotArchive(tmp_path / 'a.snaparc')
+    archive.add({'one.json': json.dumps(snapshot(sessions=1)).encode()})
+    cache, loader = SnapshotCache(), CountingLoader()
+    path = f"{archive.path}!one.json"
+    assert cache.get(path, loader)['traffic_metrics']['organic_traffic']['sessions'] == 1
+    cache.get(path, loader)
+    assert loader.calls == 1
+
+    archive.add({'one.json': json.dumps(snapshot(sessions=5)).encode()})
+    assert cache.get(path, loader)['traffic_metrics']['organic_traffic']['sessions'] == 5
+    assert loader.calls == 2
+
+
+def test_lru_eviction_and_oversized_entries(tracking_dir):
+    paths = [write_snapshot(tracking_dir, 'weekly', f'w{i}.json', snapshot(sessions=i))
+             for i in range(3)]
+    cost = paths[0].stat().st_size * PARSED_SIZE_FACTOR
+    cache, loader = SnapshotCache(), CountingLoader()
+    cache.max_bytes = cost * 2
+    for path in paths[:2]:
+        cache.get(path, loader)
+    cache.get(paths[0], loader)  # most recently used now
+    cache.get(paths[2], loader)  # evicts w1
+    assert cache.stats()['entries'] == 2
+    assert cache.stats()['bytes'] <= cache.max_bytes
+    cache.get(paths[0], loader)
+    assert loader.calls == 3
+    cache.get(paths[1], loader)
+    assert loader.calls == 4
+
+    cache.max_bytes = cost - 1
+    cache.clear()
+    cache.get(paths[0], loader)
+    assert cache.stats()['entries'] == 0
+
+
+def test_errors_are_not_cached(tracking_dir):
+    path = tracking_dir / 'broken.json'
+    path.write_text('{')
+    cache, loader = SnapshotCache(), CountingLoader()
+    for _ in range(2):
+        with pytest.raises(json.JSONDecodeError):
+            cache.get(path, loader)
+    assert loader.calls == 2
+    with pytest.raises(FileNotFoundError):
+        cache.get(tracking_dir / 'missing.json', loader)
+
+
+def test_frozen_snapshots_are_read_only_but_copyable():
+    frozen = freeze({'a': {'b': [1, {'c': 2}]}})
+    with pytest.raises(TypeError):
+        frozen['x'] = 1
+    with pytest.raises(TypeError):
+        frozen['a'].update({'y': 1})
+    with pytest.raises(TypeError):
+        frozen['a']['b'].append(3)
+    with pytest.raises(TypeError):
+        frozen['a']['b'][1]['c'] = 3
+
+    mutable = copy.deepcopy(frozen)
+    mutable['a']['b'][1]['c'] = 3
+    assert type(mutable) is dict and type(mutable['a']['b']) is list
+    assert frozen['a']['b'][1]['c'] == 2
+    assert json.loads(json.dumps(frozen)) == {'a': {'b': [1, {'c': 2}]}}
+    assert type(pickle.loads(pickle.dumps(frozen))) is dict
+    shallow = frozen.copy()
+    shallow['x'] = 1
+    assert 'x' not in frozen
+
+
+def test_report_engines_share_frozen_snapshots(tracking_dir, capsys):
+    path = str(write_snapshot(tracking_dir, 'weekly', 'w.json', snapshot(sessions=3)))
+    first = ReportEngine().load_snapshot_data(path)
+    assert ReportEngine().load_snapshot_data(path) is first
+    with pytest.raises(TypeError):
+        first['traffic_metrics']['organic_traffic']['sessions'] = 4
+    assert ReportEngine().load_snapshot_data(str(tracking_dir / 'missing.json')) is None
+    assert 'Error loading snapshot' in capsys.readouterr().out
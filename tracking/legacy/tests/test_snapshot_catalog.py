@@ -0,0 +1,139 @@
+"""Snapshot catalog: incremental refresh, persistence and lookups."""
+
+import json
+import os
+from datetime import datetime
+
+from conftest import snapshot, write_snapshot
+from snapshot_catalog import CATALOG_FILENAME, SnapshotCatalog
+from snapshot_metadata import parse_timestamp, read_metadata
+
+
+def weekly_series(tracking_dir, count=3, domain='example.com'):
+    return [write_snapshot(tracking_dir, 'weekly', f'weekly_{domain}_{day:02d}.json',
+                           snapshot(f'2026-01-{day:02d}T00:00:00', domain, sessions=day))
+            for day in range(1, count + 1)]
+
+
+def test_refresh_indexes_files_and_lookups(tracking_dir):
+    weekly_series(tracking_dir)
+    weekly_series(tracking_dir, 2, domain='other.org')
+    write_snapshot(tracking_dir, 'baseline', 'baseline.json', snapshot('2025-12-01T00:00:00'))
+
+    catalog = SnapshotCatalog(tracking_dir)
+    assert catalog.refresh()
+    assert catalog.count('weekly') == 5
+    assert catalog.count('weekly', 'other.org') == 2
+    assert catalog.count('baseline') == 1
+    assert catalog.domains('weekly') == ['example.com', 'other.org']
+    assert catalog.latest('weekly', 'example.com').timestamp == '2026-01-03T00:00:00'
+    assert [e.path for e in catalog.last_n('weekly', 2, 'example.com')] == [
+        'snapshots/weekly/weekly_example.com_02.json',
+        'snapshots/weekly/weekly_example.com_03.json',
+    ]
+    assert catalog.last_n('weekly', 0) == []
+    in_range = catalog.range('weekly', datetime(2026, 1, 2), datetime(2026, 1, 3), 'example.com')
+    assert [e.timestamp[:10] for e in in_range] == ['2026-01-02', '2026-01-03']
+    assert catalog.load(catalog.latest('weekly', 'example.com'))['traffic_metrics'] == {
+        'organic_traffic': {'sessions': 3}}
+
+
+def test_invalid_files_are_skipped(tracking_dir, capsys):
+    weekly_series(tracking_dir, 1)
+    (tracking_dir / 'snapshots' / 'weekly' / 'broken.json').write_text('{"metadata": ')
+    (tracking_dir / 'snapshots' / 'weekly' / 'notes.txt').write_text('')
+    catalog = SnapshotCatalog(tracking_dir)
+    catalog.refresh()
+    assert catalog.count('weekly') == 1
+    assert 'skipping unreadable snapshot' in capsys.readouterr().out
+
+
+def test_index_persists_and_unchanged_refresh_does_not_rewrite(tracking_dir):
+    weekly_series(tracking_dir)
+    SnapshotCatalog(tracking_dir).refresh()
+    index = tracking_dir / CATALOG_FILENAME
+    assert json.loads(index.read_text())['entries']
+    written = index.stat().st_mtime_ns
+
+    reloaded = SnapshotCatalog(tracking_dir)
+    assert reloaded.count('weekly') == 3  # served from the saved index
+    assert not reloaded.refresh()
+    assert index.stat().st_mtime_ns == written
+
+
+def test_refresh_detects_in_place_rewrites_and_deletions(tracking_dir):
+    paths = weekly_series(tracking_dir)
+    catalog = SnapshotCatalog(tracking_dir)
+    catalog.refresh()
+
+    # Same size, new content and mtime: the directory mtime does not move
+    stat = paths[0].stat()
+    paths[0].write_text(paths[0].read_text().replace('"sessions": 1', '"sessions": 7'))
+    os.utime(paths[0], ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+    old_hash = catalog.entries['snapshots/weekly/weekly_example.com_01.json'].content_hash
+    assert catalog.refresh()
+    assert catalog.entries['snapshots/weekly/weekly_example.com_01.json'].content_hash != old_hash
+
+    paths[2].unlink()
+    assert catalog.refresh()
+    assert catalog.latest('weekly').timestamp == '2026-01-02T00:00:00'
+
+
+def test_ensure_fresh_refreshes_once_and_record_indexes_new_files(tracking_dir):
+    weekly_series(tracking_dir, 2)
+    catalog = SnapshotCatalog(tracking_dir)
+    catalog.ensure_fresh()
+    assert catalog.count('weekly') == 2
+
+    # Written behind the catalog's back: not seen until an explicit refresh
+    weekly_series(tracking_dir, 3)
+    catalog.ensure_fresh()
+    assert catalog.count('weekly') == 2
+
+    path = write_snapshot(tracking_dir, 'weekly', 'weekly_new.json', snapshot('2026-02-01T00:00:00'))
+    entry = catalog.record(path)
+    assert entry.snapshot_type == 'weekly'
+    assert catalog.latest('weekly').path == 'snapshots/weekly/weekly_new.json'
+    catalog.refresh()
+    assert catalog.count('weekly') == 4
+
+
+def test_full_refresh_rereads_every_file(tracking_dir):
+    weekly_series(tracking_dir)
+    catalog = SnapshotCatalog(tracking_dir)
+    catalog.refresh()
+    assert not catalog.refresh()
+    assert catalog.refresh(full=True)
+
+
+def test_series_follow_metadata_timestamps_not_mtimes(tracking_dir):
+    # A checkout gave the oldest snapshot the newest mtime
+    write_snapshot(tracking_dir, 'weekly', 'b.json', snapshot('2026-01-01T00:00:00'), mtime=3_000)
+    write_snapshot(tracking_dir, 'weekly', 'a.json', snapshot('2026-01-08T00:00:00'), mtime=2_000)
+    write_snapshot(tracking_dir, 'weekly', 'c.json', snapshot('2026-01-15T00:00:00+00:00'), mtime=1_000)
+    catalog = SnapshotCatalog(tracking_dir)
+    catalog.refresh()
+    assert [e.path.rsplit('/', 1)[1] for e in catalog.last_n('weekly', 3)] == ['b.json', 'a.json', 'c.json']
+    assert catalog.latest('weekly').path.endswith('c.json')
+
+
+def test_missing_timestamp_falls_back_to_mtime_and_name_breaks_ties(tracking_dir):
+    untimed = snapshot()
+    del untimed['metadata']['timestamp']
+    write_snapshot(tracking_dir, 'daily', 'untimed.json', untimed, mtime=1_767_225_600)  # 2026-01-01
+    write_snapshot(tracking_dir, 'daily', 'y.json', snapshot('2026-01-02T00:00:00'))
+    write_snapshot(tracking_dir, 'daily', 'x.json', snapshot('2026-01-02T00:00:00'))
+    catalog = SnapshotCatalog(tracking_dir)
+    catalog.refresh()
+    assert [e.path.rsplit('/', 1)[1] for e in catalog.last_n('daily', 3)] == [
+        'untimed.json', 'x.json', 'y.json']
+
+
+def test_read_metadata_decodes_only_the_header():
+    text = '{"metadata": {"domain": "example.com", "timestamp": "2026-01-01"}, "rest": [tru'
+    assert read_metadata(text) == {'domain': 'example.com', 'timestamp': '2026-01-01'}
+    assert read_metadata('{"rest": 1, "metadata": {"domain": "late.org"}}') == {'domain': 'late.org'}
+    assert read_metadata('[1, 2]') == {}
+    assert parse_timestamp('2026-01-01T00:00:00') == parse_timestamp('2026-01-01T00:00:00+00:00')
+    assert parse_timestamp('yesterday') is None
+    assert parse_timestamp(None) is None
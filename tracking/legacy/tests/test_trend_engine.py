@@ -0,0 +1,114 @@
+"""Trend engine: one-pass changes, slopes and rolling statistics over snapshot series."""
+
+import math
+
+import pytest
+
+import trend_engine
+from conftest import snapshot
+from report_engine import ReportEngine
+from trend_engine import TrendEngine, calculate_change, lower_is_better
+
+SESSIONS = 'traffic_metrics.organic_traffic.sessions'
+POSITION = 'ranking_metrics.visibility.average_position'
+LCP = 'technical_metrics.core_web_vitals.lcp.value'
+
+
+@pytest.fixture(params=['python', 'numpy'])
+def engine(request, monkeypatch):
+    """A TrendEngine on each available backend; both must agree."""
+    if request.param == 'numpy':
+        monkeypatch.setattr(trend_engine, 'np', pytest.importorskip('numpy'))
+    else:
+        monkeypatch.setattr(trend_engine, 'np', None)
+    return TrendEngine(window=2)
+
+
+def series(*rows):
+    """Weekly snapshots from (sessions, average position) pairs; None leaves a metric out."""
+    snapshots = []
+    for week, (sessions, position) in enumerate(rows, 1):
+        data = snapshot(f'2026-01-{week * 7:02d}T00:00:00', sessions=sessions)
+        if sessions is None:
+            del data['traffic_metrics']['organic_traffic']['sessions']
+        if position is not None:
+            data['ranking_metrics'] = {'visibility': {'average_position': position}}
+        snapshots.append(data)
+    return snapshots
+
+
+def test_calculate_change():
+    change = calculate_change(100, 110)
+    assert (change.change_percent, change.change_absolute, change.trend, change.status) == (
+        10.0, 10, 'up', 'warning')
+    assert calculate_change(100, 101).trend == 'stable'
+    assert calculate_change(10, 5, reverse_trend=True).trend == 'up'
+    assert calculate_change(0, 5).change_percent == 100.0
+    assert calculate_change(0, 0).status == 'good'
+    assert calculate_change(100, 70).status == 'critical'
+
+
+def test_lower_is_better():
+    assert lower_is_better(POSITION)
+    assert lower_is_better(LCP)
+    assert not lower_is_better(SESSIONS)
+
+
+def test_analyze_named_metrics(engine):
+    analysis = engine.analyze(series((100, 20.0), (120, 15.0), (150, 10.0)), [SESSIONS, POSITION])
+    sessions = analysis.change(SESSIONS)
+    assert (sessions.previous, sessions.current, sessions.change_absolute) == (120, 150, 30)
+    assert isinstance(sessions.current, int)
+    assert sessions.change_percent == pytest.approx(25.0)
+    assert (sessions.trend, sessions.status) == ('up', 'critical')
+
+    # Position falling is an improvement
+    position = analysis.change(POSITION)
+    assert (position.trend, analysis.direction_of(POSITION)) == ('up', 'improving')
+    assert analysis.direction_of(SESSIONS) == 'improving'
+    assert analysis.change(POSITION, reverse_trend=False).trend == 'down'
+
+    summary = analysis.summary(SESSIONS)
+    assert summary['slope'] == pytest.approx(25.0)
+    assert summary['total_change_percent'] == pytest.approx(50.0)
+    assert summary['rolling_mean'] == pytest.approx(135.0)
+    assert summary['rolling_std'] == pytest.approx(15.0)
+    assert analysis.summary('unknown') is None
+    assert analysis.direction_of('unknown') == 'stable'
+
+
+def test_missing_values(engine):
+    analysis = engine.analyze(series((None, 10.0), (80, None), (90, None)), [SESSIONS, POSITION])
+    summary = analysis.summary(SESSIONS)
+    assert summary['slope'] == pytest.approx(10.0)
+    assert summary['total_change_percent'] == pytest.approx(12.5)
+
+    # A metric missing from either period falls back to the default
+    position = analysis.change(POSITION, default=0)
+    assert (position.previous, position.current, position.trend) == (0, 0, 'stable')
+    assert analysis.summary(POSITION)['current'] is None
+    assert analysis.summary(POSITION)['slope'] is None
+    assert analysis.direction_of(POSITION) == 'stable'
+    unknown = analysis.change('traffic_metrics.missing', default=5)
+    assert (unknown.previous, unknown.current) == (5, 5)
+
+
+def test_every_numeric_field_and_store_series(engine):
+    analysis = engine.analyze(series((100, 12.0), (110, None)))
+    assert analysis.metrics == [SESSIONS, POSITION]
+    assert analysis.change(SESSIONS).change_absolute == 10
+
+    from_store = engine.analyze_series({'timestamps': [1, 2, 3], SESSIONS: [10, None, 30]})
+    assert from_store.change(SESSIONS, default=0).previous == 0
+    assert from_store.summary(SESSIONS)['slope'] == pytest.approx(10.0)
+    assert math.isnan(engine.analyze([], [SESSIONS]).current[0])
+
+
+def test_report_engine_compare_snapshots(tracking_dir):
+    engine = ReportEngine()
+    change = engine.compare_snapshots(None, snapshot(sessions=40), [SESSIONS]).change(SESSIONS, default=0)
+    assert (change.previous, change.current, change.change_percent) == (0, 40, 100.0)
+
+    roi = engine.calculate_roi_metrics(snapshot(sessions=150), snapshot(sessions=100))
+    assert roi['session_increase'] == 50
+    assert roi['traffic_value'] == 50 * engine.config.get('roi', {}).get('organic_session_value', 2.50)
@@ -0,0 +1,122 @@
+"""Tracking warehouse: source identity, idempotent ingest and queries."""
+
+import pytest
+
+from conftest import mission_data, snapshot, write_mission, write_snapshot
+from snapshot_archive import pack_directory
+from warehouse import Warehouse
+
+SESSIONS = 'traffic_metrics.organic_traffic.sessions'
+
+
+@pytest.fixture
+def warehouse(tracking_dir):
+    warehouse = Warehouse(tracking_dir)
+    yield warehouse
+    warehouse.close()
+
+
+def ingest(warehouse, **kwargs):
+    kwargs.setdefault('validate', False)
+    return warehouse.ingest(**kwargs)
+
+
+def test_identical_files_stay_separate_sources(tracking_dir, warehouse):
+    data = snapshot('2026-01-05T00:00:00', sessions=10)
+    for snapshot_type in ('daily', 'weekly', 'baseline'):
+        write_snapshot(tracking_dir, snapshot_type, 'same.json', data)
+    write_snapshot(tracking_dir, 'weekly', 'copy.json', data)
+
+    stats = ingest(warehouse)
+    assert stats['added'] == 4
+    assert warehouse.counts()['sources'] == 4
+    assert [row['value'] for row in warehouse.metric_series(SESSIONS, 'weekly')] == [10, 10]
+    assert len(warehouse.metric_series(SESSIONS, 'daily')) == 1
+
+
+def test_reingest_is_idempotent_and_mirrors_changes(tracking_dir, warehouse):
+    first = write_snapshot(tracking_dir, 'weekly', 'w1.json', snapshot('2026-01-05T00:00:00', sessions=10))
+    second = write_snapshot(tracking_dir, 'weekly', 'w2.json', snapshot('2026-01-12T00:00:00', sessions=20))
+    assert ingest(warehouse)['added'] == 2
+    assert ingest(warehouse) == {'added': 0, 'moved': 0, 'removed': 0, 'unchanged': 2,
+                                 'invalid': 0, 'failed': 0}
+
+    first.write_text(first.read_text().replace('"sessions": 10', '"sessions": 15'))
+    second.unlink()
+    stats = ingest(warehouse)
+    assert (stats['added'], stats['removed'], stats['unchanged']) == (1, 1, 0)
+    assert [row['value'] for row in warehouse.metric_series(SESSIONS)] == [15]
+    assert warehouse.counts()['metrics'] == 1
+
+    assert ingest(warehouse, rebuild=True)['added'] == 1
+
+
+def test_files_packed_into_an_archive_are_moved(tracking_dir, warehouse):
+    for day in (5, 6):
+        write_snapshot(tracking_dir, 'daily', f'd{day}.json', snapshot(f'2026-01-0{day}T00:00:00'))
+    ingest(warehouse)
+    source_ids = [row['source_id'] for row in warehouse.query("SELECT source_id FROM sources")]
+
+    pack_directory(tracking_dir / 'snapshots' / 'daily')
+    stats = ingest(warehouse)
+    assert (stats['moved'], stats['added'], stats['removed']) == (2, 0, 0)
+    rows = warehouse.query("SELECT source_id, path FROM sources ORDER BY path")
+    assert sorted(row['source_id'] for row in rows) == sorted(source_ids)
+    assert all(row['path'].endswith(('!d5.json', '!d6.json')) for row in rows)
+
+
+def test_domains_and_latest_metrics(tracking_dir, warehouse):
+    write_snapshot(tracking_dir, 'weekly', 'a1.json', snapshot('2026-01-05T00:00:00', sessions=1))
+    write_snapshot(tracking_dir, 'weekly', 'a2.json', snapshot('2026-01-12T00:00:00', sessions=2))
+    write_snapshot(tracking_dir, 'weekly', 'b1.json',
+                   snapshot('2026-01-05T00:00:00', 'other.org', sessions=7))
+    ingest(warehouse)
+    assert warehouse.latest_metrics([SESSIONS]) == {
+        'example.com': {SESSIONS: 2}, 'other.org': {SESSIONS: 7}}
+    series = warehouse.metric_series(SESSIONS, domain='example.com')
+    assert [(row['timestamp'], row['value']) for row in series] == [
+        ('2026-01-05T00:00:00', 1), ('2026-01-12T00:00:00', 2)]
+
+
+def test_missions_scorecards_and_fixes(tracking_dir, warehouse):
+    runs = tracking_dir.parent / 'runs'
+    fix = {'id': 'f1', 'title': 'Add llms.txt', 'category': 'ai-search', 'impact': 8,
+           'effort': 2, 'roi': 4.0, 'min_diff': True,
+           'estimated_traffic_lift': {'value': 120, 'unit': 'sessions_per_month'}}
+    write_mission(runs, 'old', mission_data(timestamp='2026-01-05T00:00:00Z', ai_total=20))
+    write_mission(runs, 'new', mission_data(timestamp='2026-02-05T00:00:00Z', ai_total=35,
+                                            fixes=[fix, dict(fix, id='f2', roi=1.5)]))
+    write_mission(runs, 'other', mission_data('other.org', name='content-gap'))
+    assert ingest(warehouse)['added'] == 3
+
+    missions = warehouse.missions('example.com')
+    assert [(m['ai_search_readiness'], m['traditional_seo']) for m in missions] == [(35, 40), (20, 40)]
+    assert [m['name'] for m in warehouse.missions(name='content-gap')] == ['content-gap']
+    assert [row['score'] for row in warehouse.scorecard_history('example.com')] == [20, 35]
+
+    fixes = warehouse.top_fixes(category='ai-search')
+    assert [(f['fix_id'], f['roi'], f['mission']) for f in fixes] == [
+        ('f1', 4.0, 'site-audit'), ('f2', 1.5, 'site-audit')]
+    assert fixes[0]['lift_value'] == 120 and fixes[0]['min_diff'] == 1
+    assert warehouse.top_fixes(domain='other.org') == []
+
+    # Missions are matched on their stored domain, so a re-run changes nothing
+    assert ingest(warehouse)['unchanged'] == 3
+    (runs / 'other' / 'data.json').unlink()
+    assert ingest(warehouse)['removed'] == 1
+    assert warehouse.missions('other.org') == []
+
+
+def test_unparseable_and_invalid_sources(tracking_dir, warehouse, schemas, capsys):
+    write_mission(tracking_dir.parent / 'runs', 'broken', {'mission': {}})
+    valid = snapshot(technical_metrics={}, ranking_metrics={})
+    write_snapshot(tracking_dir, 'weekly', 'valid.json', valid)
+    write_snapshot(tracking_dir, 'weekly', 'invalid.json', snapshot())  # no ranking_metrics
+
+    assert ingest(warehouse, validate=False)['failed'] == 1
+    assert 'not ingesting' in capsys.readouterr().out
+
+    stats = ingest(warehouse, rebuild=True, validate=True)
+    assert (stats['added'], stats['invalid']) == (1, 2)
+    assert [row['path'].rsplit('/', 1)[1] for row in warehouse.query("SELECT path FROM sources")] == [
+        'valid.json']
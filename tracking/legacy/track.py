@@ -10,6 +10,7 @@ import argparse
 from pathlib import Path
 from datetime import datetime
 from typing import Dict, Any, Optional
+from snapshot_catalog import SnapshotCatalog, BASELINE_TYPE
 
 # Simple configuration loader without external dependencies
 def load_config(config_path: str = "config/tracking.yml") -> Dict[str, Any]:
@@ -50,6 +51,7 @@ class SimpleReportGenerator:
     def __init__(self):
         self.config = load_config()
         self.tracking_dir = Path("tracking")
+        self.catalog = SnapshotCatalog(self.tracking_dir)
     
     def load_json_file(self, filepath: str) -> Optional[Dict[str, Any]]:
         """Load JSON data file."""
@@ -61,30 +63,16 @@ class SimpleReportGenerator:
     
     def get_latest_snapshot(self, snapshot_type: str = "weekly") -> Optional[Dict[str, Any]]:
         """Get the most recent snapshot."""
-        snapshot_dir = self.tracking_dir / "snapshots" / snapshot_type
-        if not snapshot_dir.exists():
+        self.catalog.ensure_fresh()
+        entry = self.catalog.latest(snapshot_type)
+        if not entry:
             return None
         
-        json_files = list(snapshot_dir.glob("*.json"))
-        if not json_files:
-            return None
-        
-        # Get the most recently modified file
-        latest_file = max(json_files, key=lambda f: f.stat().st_mtime)
-        return self.load_json_file(str(latest_file))
+        return self.load_json_file(str(self.catalog.resolve(entry)))
     
     def get_baseline_data(self) -> Optional[Dict[str, Any]]:
         """Get baseline data."""
-        baseline_dir = self.tracking_dir / "baselines"
-        if not baseline_dir.exists():
-            return None
-        
-        json_files = list(baseline_dir.glob("*.json"))
-        if not json_files:
-            return None
-        
-        latest_file = max(json_files, key=lambda f: f.stat().st_mtime)
-        return self.load_json_file(str(latest_file))
+        return self.get_latest_snapshot(BASELINE_TYPE)
     
     def calculate_change_percent(self, old_val: float, new_val: float) -> float:
         """Calculate percentage change."""
@@ -15,6 +15,12 @@ import subprocess
 from report_engine import ReportEngine
 from report_exports import ReportManager
 from report_types import WeeklyProgressReport, MonthlyExecutiveSummary, BeforeAfterComparison, MarketingCaseStudy
+from retention import RetentionManager
+from warehouse import DEFAULT_BATCH_SIZE
+from schema_validator import BASELINE_SCHEMA, MISSION_SCHEMA, SchemaError, validate_files, print_violations
+from snapshot_catalog import BASELINE_TYPE, SNAPSHOT_TYPES
+from keyword_import import KeywordImporter, KeywordImportError
+from rank_history import RankHistory
 
 class TrackingCLI:
     """Command-line interface for tracking operations."""
@@ -24,9 +30,24 @@ class TrackingCLI:
         self.manager = ReportManager()
         self.tracking_dir = Path("tracking")
     
+    def _validate_inputs(self, snapshot_types: List[str]) -> bool:
+        """Reject malformed snapshots before any report work; True if all valid."""
+        try:
+            invalid = self.engine.validate_snapshots(snapshot_types)
+        except SchemaError as e:
+            print(f"⚠️ Skipping schema validation: {e}")
+            return True
+        if invalid:
+            print_violations(invalid)
+            print("❌ Fix the snapshots above (see tracking/schemas/baseline.schema.json)")
+        return not invalid
+    
     def cmd_report(self, args: argparse.Namespace) -> int:
         """Handle /track report command."""
         try:
+            if not self._validate_inputs([BASELINE_TYPE, 'weekly', 'monthly']):
+                return 1
+            
             print(f"📊 Generating {args.type} report...")
             
             # Generate and export report
@@ -69,6 +90,8 @@ class TrackingCLI:
         """Handle /track compare command."""
         try:
             print(f"🔍 Comparing performance: {args.period}")
+            if not self._validate_inputs([BASELINE_TYPE, args.period]):
+                return 1
             
             # Get comparison data
             current_data = self.engine.get_latest_snapshot(args.period)
@@ -111,6 +134,8 @@ class TrackingCLI:
         """Handle /track roi command."""
         try:
             print("💰 Calculating SEO ROI...")
+            if not self._validate_inputs([BASELINE_TYPE, 'weekly']):
+                return 1
             
             current_data = self.engine.get_latest_snapshot("weekly")
             baseline_data = self.engine.get_baseline_data()
@@ -210,31 +235,158 @@ class TrackingCLI:
             print(f"❌ Error handling baseline: {e}")
             return 1
     
+    def cmd_compact(self, args: argparse.Namespace) -> int:
+        """Handle /track compact command."""
+        try:
+            manager = RetentionManager.from_config(self.engine.config, self.tracking_dir)
+            limits = manager.limits
+            print(f"🗜️ Applying retention policy: daily {limits['daily']} days, "
+                  f"weekly {limits['weekly']} weeks, monthly {limits['monthly']} months")
+            
+            stats = manager.compact(delete=args.delete, dry_run=args.dry_run)
+            
+            if args.dry_run:
+                print(f"Would write {stats['rollups']} rollups and retire {stats['retired']} snapshots")
+            else:
+                action = "deleted" if args.delete else "archived"
+                print(f"✅ Wrote {stats['rollups']} rollups, {action} {stats['retired']} snapshots")
+            return 0
+            
+        except Exception as e:
+            print(f"❌ Error compacting snapshots: {e}")
+            return 1
+    
+    def cmd_ingest(self, args: argparse.Namespace) -> int:
+        """Handle /track ingest command."""
+        try:
+            warehouse = self.engine.warehouse
+            print(f"🏛️ Ingesting tracking data into {warehouse.db_path}...")
+            
+            stats = warehouse.ingest(self.engine.catalog, batch_size=args.batch_size,
+                                     rebuild=args.rebuild, validate=not args.no_validate)
+            
+            print(f"✅ {stats['added']} added, {stats['moved']} moved, {stats['removed']} removed, "
+                  f"{stats['unchanged']} unchanged")
+            if stats['invalid']:
+                print(f"⚠️ {stats['invalid']} files rejected by schema validation")
+            if stats['failed']:
+                print(f"⚠️ {stats['failed']} files could not be ingested")
+            for table, count in warehouse.counts().items():
+                print(f"  {table.title()}: {count:,} rows")
+            return 1 if stats['failed'] or stats['invalid'] else 0
+            
+        except Exception as e:
+            print(f"❌ Error ingesting tracking data: {e}")
+            return 1
+    
+    def cmd_validate(self, args: argparse.Namespace) -> int:
+        """Handle /track validate command."""
+        try:
+            catalog = self.engine.catalog
+            catalog.ensure_fresh()
+            root = self.tracking_dir.parent
+            jobs = [(catalog.resolve(entry), root / BASELINE_SCHEMA)
+                    for snapshot_type in [BASELINE_TYPE] + SNAPSHOT_TYPES
+                    for entry in catalog.last_n(snapshot_type, catalog.count(snapshot_type))]
+            jobs += [(path, root / MISSION_SCHEMA)
+                     for path in sorted(self.engine.warehouse.runs_dir.glob("*/data.json"))]
+            print(f"🔎 Validating {len(jobs)} files...")
+            
+            invalid = validate_files(jobs, args.jobs)
+            print_violations(invalid)
+            
+            if invalid:
+                print(f"❌ {len(invalid)} of {len(jobs)} files have schema violations")
+                return 1
+            print(f"✅ All {len(jobs)} files are valid")
+            return 0
+            
+        except Exception as e:
+            print(f"❌ Error validating tracking data: {e}")
+            return 1
+    
+    def cmd_import_keywords(self, args: argparse.Namespace) -> int:
+        """Handle /track import-keywords command."""
+        try:
+            domain = args.domain or self.engine.config.get('domain', 'example.com')
+            print(f"🔑 Importing keyword export {args.export} for {domain}...")
+            
+            importer = KeywordImporter(self.tracking_dir)
+            result = importer.import_file(args.export, domain, args.period, args.into, args.new)
+            
+            visibility = result['ranking_metrics']['visibility']
+            distribution = result['ranking_metrics']['keyword_distribution']
+            print(f"✅ {result['rows']:,} rows imported into {result['snapshot']}")
+            print(f"  Keywords: {distribution['total_keywords']:,} "
+                  f"(top 3: {distribution['top_3']:,}, top 10: {distribution['top_10']:,}, "
+                  f"top 20: {distribution['top_20']:,})")
+            print(f"  Impressions: {visibility['impressions']:,}  Clicks: {visibility['clicks']:,}  "
+                  f"CTR: {visibility['ctr']:.2f}%  Avg Position: {visibility['average_position']:.1f}")
+            print(f"  Keyword rows: {result['sidecar']}")
+            return 0
+            
+        except (KeywordImportError, OSError) as e:
+            print(f"❌ Error importing keywords: {e}")
+            return 1
+    
+    def cmd_rankings(self, args: argparse.Namespace) -> int:
+        """Handle /track rankings command."""
+        try:
+            domain = args.domain or self.engine.config.get('domain', 'example.com')
+            history = RankHistory(self.tracking_dir, domain)
+            days = history.days()
+            if not days:
+                print(f"❌ No keyword rank history for {domain}")
+                print("Import a GSC/GA4 export with: /track import-keywords <file>")
+                return 1
+            
+            end = history.resolve_day(args.end) if args.end else days[-1]
+            start = history.resolve_day(args.start) if args.start else (days[-2] if len(days) > 1 else None)
+            if end is None:
+                print(f"❌ No rank history on or before {args.end}")
+                return 1
+            
+            print(f"🔑 Keyword Rankings: {domain} ({len(history.keywords()):,} keywords tracked)")
+            print("=" * 50)
+            
+            striking = history.striking_distance(end)
+            print(f"\n🎯 Striking Distance on {end} ({len(striking):,} keywords ranking 11-20):")
+            for row in striking[:args.limit]:
+                print(f"  #{row['position']:<3} {row['keyword']}")
+            
+            if start and start != end:
+                movers = history.movers(start, end, args.limit, max_position=100)
+                print(f"\n📈 Biggest Gains {start} → {end}:")
+                for row in movers['improved']:
+                    print(f"  {row['keyword']}: {row['before']} → {row['after']} ({row['change']:+d})")
+                print(f"\n📉 Biggest Drops {start} → {end}:")
+                for row in movers['declined']:
+                    print(f"  {row['keyword']}: {row['before']} → {row['after']} ({row['change']:+d})")
+                
+                changes = history.new_and_lost(start, end)
+                print(f"\n🆕 New in Top 100: {len(changes['new']):,}   ❌ Lost from Top 100: {len(changes['lost']):,}")
+                for label, rows in (('New', changes['new']), ('Lost', changes['lost'])):
+                    for row in rows[:args.limit]:
+                        print(f"  {label}: #{row['position']} {row['keyword']}")
+            
+            return 0
+            
+        except Exception as e:
+            print(f"❌ Error reading keyword rankings: {e}")
+            return 1
+    
     def _generate_comparison_summary(self, current: Dict[str, Any], 
                                    baseline: Dict[str, Any]) -> Dict[str, Any]:
         """Generate comparison summary metrics."""
-        # Traffic comparison
-        current_traffic = current.get('traffic_metrics', {}).get('organic_traffic', {})
-        baseline_traffic = baseline.get('traffic_metrics', {}).get('organic_traffic', {})
-        
-        sessions_change = self.engine.calculate_change(
-            baseline_traffic.get('sessions', 0),
-            current_traffic.get('sessions', 0)
-        )
-        
-        users_change = self.engine.calculate_change(
-            baseline_traffic.get('users', 0),
-            current_traffic.get('users', 0)
-        )
-        
-        # Technical comparison
-        current_tech = current.get('technical_metrics', {}).get('lighthouse_scores', {})
-        baseline_tech = baseline.get('technical_metrics', {}).get('lighthouse_scores', {})
+        changes = self.engine.compare_snapshots(baseline, current, [
+            'traffic_metrics.organic_traffic.sessions',
+            'traffic_metrics.organic_traffic.users',
+            'technical_metrics.lighthouse_scores.performance'
+        ])
         
-        performance_change = self.engine.calculate_change(
-            baseline_tech.get('performance', 50),
-            current_tech.get('performance', 50)
-        )
+        sessions_change = changes.change('traffic_metrics.organic_traffic.sessions', default=0)
+        users_change = changes.change('traffic_metrics.organic_traffic.users', default=0)
+        performance_change = changes.change('technical_metrics.lighthouse_scores.performance', default=50)
         
         return {
             'sessions': sessions_change,
@@ -317,18 +469,10 @@ class TrackingCLI:
     
     def _get_snapshot_counts(self) -> Dict[str, int]:
         """Get count of snapshots by type."""
-        counts = {}
-        snapshot_dir = self.tracking_dir / "snapshots"
-        
-        if snapshot_dir.exists():
-            for subdir in ['daily', 'weekly', 'monthly', 'mission-based']:
-                subdir_path = snapshot_dir / subdir
-                if subdir_path.exists():
-                    counts[subdir] = len(list(subdir_path.glob("*.json")))
-                else:
-                    counts[subdir] = 0
-        
-        return counts
+        catalog = self.engine.catalog
+        catalog.ensure_fresh()
+        return {subdir: catalog.count(subdir)
+                for subdir in ['daily', 'weekly', 'monthly', 'mission-based']}
     
     def _get_config_summary(self) -> Dict[str, str]:
         """Get configuration summary for display."""
@@ -398,6 +542,44 @@ def create_parser() -> argparse.ArgumentParser:
     baseline_parser.add_argument('--create', action='store_true',
                                 help='Create new baseline')
     
+    # /track compact command
+    compact_parser = subparsers.add_parser('compact', help='Apply the snapshot retention policy')
+    compact_parser.add_argument('--dry-run', action='store_true',
+                               help='Show what would be rolled up and retired')
+    compact_parser.add_argument('--delete', action='store_true',
+                               help='Delete retired snapshots instead of archiving them')
+    
+    # /track ingest command
+    ingest_parser = subparsers.add_parser('ingest', help='Load tracking data into the SQLite warehouse')
+    ingest_parser.add_argument('--batch-size', type=int, default=DEFAULT_BATCH_SIZE,
+                              help='Files written per transaction')
+    ingest_parser.add_argument('--rebuild', action='store_true',
+                              help='Discard the warehouse and ingest everything again')
+    ingest_parser.add_argument('--no-validate', action='store_true',
+                              help='Skip schema validation of new files')
+    
+    # /track import-keywords command
+    keywords_parser = subparsers.add_parser('import-keywords',
+                                           help='Import a GSC/GA4 keyword export into a snapshot')
+    keywords_parser.add_argument('export', help='Export file (.csv, .tsv, .jsonl, optionally .gz)')
+    keywords_parser.add_argument('--domain', help='Domain of the export (default: configured domain)')
+    keywords_parser.add_argument('--period', choices=['daily', 'weekly', 'monthly'],
+                                default='weekly', help='Snapshot series to update')
+    keywords_parser.add_argument('--into', help='Snapshot file to update (default: latest of the period)')
+    keywords_parser.add_argument('--new', action='store_true',
+                                help='Write a new snapshot with only the ranking metrics')
+    
+    # /track rankings command
+    rankings_parser = subparsers.add_parser('rankings', help='Keyword movers, striking distance and new/lost rankings')
+    rankings_parser.add_argument('--domain', help='Domain (default: configured domain)')
+    rankings_parser.add_argument('--start', help='Compare from this date (default: previous import)')
+    rankings_parser.add_argument('--end', help='Compare to this date (default: latest import)')
+    rankings_parser.add_argument('--limit', type=int, default=10, help='Keywords listed per section')
+    
+    # /track validate command
+    validate_parser = subparsers.add_parser('validate', help='Check tracking data against its JSON Schemas')
+    validate_parser.add_argument('--jobs', type=int, help='Worker processes')
+    
     return parser
 
 def main():
@@ -422,6 +604,16 @@ def main():
         return cli.cmd_status(args)
     elif args.command == 'baseline':
         return cli.cmd_baseline(args)
+    elif args.command == 'compact':
+        return cli.cmd_compact(args)
+    elif args.command == 'ingest':
+        return cli.cmd_ingest(args)
+    elif args.command == 'validate':
+        return cli.cmd_validate(args)
+    elif args.command == 'import-keywords':
+        return cli.cmd_import_keywords(args)
+    elif args.command == 'rankings':
+        return cli.cmd_rankings(args)
     else:
         print(f"❌ Unknown command: {args.command}")
         return 1
@@ -0,0 +1,322 @@
+#!/usr/bin/env python3
+"""
+SEO Agent Library - Trend Engine
+Slopes, period changes, trend/status labels and rolling statistics for every metric in one pass.
+"""
+
+import math
+from dataclasses import dataclass
+from typing import Dict, List, Any, Optional, Union
+
+from metric_store import flatten_metrics
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+STABLE_PERCENT = 2.0      # |change| below this is 'stable'
+WARNING_PERCENT = 5.0     # |change| below this is 'good'
+CRITICAL_PERCENT = 15.0   # |change| below this is 'warning', otherwise 'critical'
+STABLE_SLOPE = 0.1        # |slope| per period below this is 'stable'
+ROLLING_WINDOW = 4
+
+# Path segments of metrics where a lower value is better
+LOWER_IS_BETTER = frozenset({
+    'average_position', 'bounce_rate', 'lcp', 'fid', 'cls', 'inp', 'ttfb',
+    'crawl_errors', 'broken_links', 'redirect_chains', 'duplicate_content',
+    'missing_meta', 'schema_errors'
+})
+
+@dataclass
+class MetricChange:
+    """Represents a metric change with percentage and trend."""
+    previous: Union[int, float]
+    current: Union[int, float]
+    change_percent: float
+    change_absolute: Union[int, float]
+    trend: str  # 'up', 'down', 'stable'
+    status: str  # 'good', 'warning', 'critical'
+
+def lower_is_better(metric: str) -> bool:
+    """Whether a decrease of the metric is an improvement."""
+    return any(part in LOWER_IS_BETTER for part in metric.split('.'))
+
+def change_trend(change_percent: float, reverse_trend: bool = False) -> str:
+    if abs(change_percent) < STABLE_PERCENT:
+        return 'stable'
+    if change_percent > 0:
+        return 'down' if reverse_trend else 'up'
+    return 'up' if reverse_trend else 'down'
+
+def change_status(change_percent: float) -> str:
+    if abs(change_percent) < WARNING_PERCENT:
+        return 'good'
+    if abs(change_percent) < CRITICAL_PERCENT:
+        return 'warning'
+    return 'critical'
+
+def slope_direction(slope: float, reverse_trend: bool = False) -> str:
+    if slope != slope or abs(slope) < STABLE_SLOPE:
+        return 'stable'
+    if slope > 0:
+        return 'declining' if reverse_trend else 'improving'
+    return 'improving' if reverse_trend else 'declining'
+
+def calculate_change(previous: Union[int, float], current: Union[int, float],
+                     reverse_trend: bool = False) -> MetricChange:
+    """Calculate one metric change with trend and status."""
+    if previous == 0:
+        change_percent = 100.0 if current > 0 else 0.0
+        change_absolute = current
+    else:
+        change_percent = ((current - previous) / previous) * 100
+        change_absolute = current - previous
+
+    return MetricChange(
+        previous=previous,
+        current=current,
+        change_percent=change_percent,
+        change_absolute=change_absolute,
+        trend=change_trend(change_percent, reverse_trend),
+        status=change_status(change_percent)
+    )
+
+def _lookup(data: Dict[str, Any], metric: str) -> float:
+    value = data
+    for key in metric.split('.'):
+        if not isinstance(value, dict):
+            return math.nan
+        value = value.get(key)
+    if isinstance(value, (int, float)) and not isinstance(value, bool):
+        return float(value)
+    return math.nan
+
+def _number(value: float) -> Union[int, float]:
+    """Snapshot counts stay ints so reports format them as before."""
+    return int(value) if value == value and float(value).is_integer() else value
+
+def _percent_change(previous: float, current: float) -> float:
+    if previous != previous or current != current:
+        return math.nan
+    if previous == 0:
+        return 100.0 if current > 0 else 0.0
+    return (current - previous) / previous * 100
+
+class TrendAnalysis:
+    """
+    Trend statistics of a (periods x metrics) matrix.
+
+    Per-metric results are plain lists indexed like ``metrics``; missing
+    values are NaN. ``MetricChange`` objects are only built by
+    ``change()``, for the metrics a report actually shows.
+    """
+
+    def __init__(self, metrics: List[str], matrix: List[List[float]],
+                 window: int = ROLLING_WINDOW):
+        self.metrics = metrics
+        self.index = {metric: i for i, metric in enumerate(metrics)}
+        self.periods = len(matrix)
+        self.window = window
+        self.reverse = [lower_is_better(metric) for metric in metrics]
+        if np is not None:
+            self._compute_numpy(np.array(matrix, dtype=float).reshape(self.periods, len(metrics)))
+        else:
+            self._compute_python(matrix)
+
+        self.trend = [change_trend(pct, rev) if pct == pct else 'stable'
+                      for pct, rev in zip(self.change_percent, self.reverse)]
+        self.status = [change_status(pct) if pct == pct else 'good'
+                       for pct in self.change_percent]
+        self.direction = [slope_direction(slope, rev)
+                          for slope, rev in zip(self.slope, self.reverse)]
+
+    def _compute_numpy(self, values):
+        periods = self.periods
+        valid = ~np.isnan(values)
+        filled = np.where(valid, values, 0.0)
+        weights = valid.astype(float)
+
+        # Least-squares slope per column over the periods that have a value
+        x = np.arange(periods, dtype=float)[:, None]
+        n = weights.sum(axis=0)
+        sum_x = (weights * x).sum(axis=0)
+        sum_y = filled.sum(axis=0)
+        sum_xy = (filled * x).sum(axis=0)
+        sum_x2 = (weights * x * x).sum(axis=0)
+        denominator = n * sum_x2 - sum_x ** 2
+        with np.errstate(divide='ignore', invalid='ignore'):
+            slope = np.where(denominator > 0, (n * sum_xy - sum_x * sum_y) / denominator, np.nan)
+
+        if periods:
+            current = values[-1]
+            previous = values[-2] if periods > 1 else np.full(values.shape[1], np.nan)
+            first_index = np.where(valid.any(axis=0), valid.argmax(axis=0), 0)
+            first = values[first_index, np.arange(values.shape[1])]
+        else:
+            current = previous = first = np.full(values.shape[1], np.nan)
+
+        def percent(before, after):
+            with np.errstate(divide='ignore', invalid='ignore'):
+                result = (after - before) / before * 100
+            result = np.where(before == 0, np.where(after > 0, 100.0, 0.0), result)
+            return np.where(np.isnan(before) | np.isnan(after), np.nan, result)
+
+        # Trailing windows from cumulative sums; partial windows at the start
+        def trailing(cumulative):
+            padded = np.vstack([np.zeros((1, values.shape[1])), cumulative])
+            start = np.maximum(np.arange(1, periods + 1) - self.window, 0)
+            return padded[1:] - padded[start]
+
+        count = trailing(np.cumsum(weights, axis=0))
+        total = trailing(np.cumsum(filled, axis=0))
+        squares = trailing(np.cumsum(filled * filled, axis=0))
+        with np.errstate(divide='ignore', invalid='ignore'):
+            mean = np.where(count > 0, total / count, np.nan)
+            variance = np.where(count > 0, np.maximum(squares / count - mean * mean, 0.0), np.nan)
+
+        self.values = values.tolist()
+        self.slope = slope.tolist()
+        self.previous = previous.tolist()
+        self.current = current.tolist()
+        self.change_absolute = (current - previous).tolist()
+        self.change_percent = percent(previous, current).tolist()
+        self.total_change_percent = percent(first, current).tolist()
+        self.rolling_mean = mean.tolist()
+        self.rolling_std = np.sqrt(variance).tolist()
+
+    def _compute_python(self, matrix: List[List[float]]):
+        periods, width = self.periods, len(self.metrics)
+        self.values = [list(row) for row in matrix]
+        self.slope, self.previous, self.current = [], [], []
+        self.change_absolute, self.change_percent, self.total_change_percent = [], [], []
+        self.rolling_mean = [[math.nan] * width for _ in range(periods)]
+        self.rolling_std = [[math.nan] * width for _ in range(periods)]
+
+        for column in range(width):
+            series = [row[column] for row in matrix]
+            points = [(x, y) for x, y in enumerate(series) if y == y]
+            n = len(points)
+            sum_x = sum(x for x, _ in points)
+            sum_y = sum(y for _, y in points)
+            sum_xy = sum(x * y for x, y in points)
+            sum_x2 = sum(x * x for x, _ in points)
+            denominator = n * sum_x2 - sum_x ** 2
+            self.slope.append((n * sum_xy - sum_x * sum_y) / denominator
+                              if denominator > 0 else math.nan)
+
+            current = series[-1] if periods else math.nan
+            previous = series[-2] if periods > 1 else math.nan
+            self.current.append(current)
+            self.previous.append(previous)
+            self.change_absolute.append(current - previous)
+            self.change_percent.append(_percent_change(previous, current))
+            self.total_change_percent.append(_percent_change(points[0][1] if points else math.nan,
+                                                             current))
+
+            for row in range(periods):
+                window = [y for y in series[max(0, row + 1 - self.window):row + 1] if y == y]
+                if window:
+                    mean = sum(window) / len(window)
+                    variance = max(sum(y * y for y in window) / len(window) - mean * mean, 0.0)
+                    self.rolling_mean[row][column] = mean
+                    self.rolling_std[row][column] = math.sqrt(variance)
+
+    def change(self, metric: str, reverse_trend: bool = None,
+               default: float = None) -> MetricChange:
+        """
+        Previous-to-current change of one metric.
+
+        Missing values are replaced by ``default`` (or 0); ``reverse_trend``
+        defaults to whether lower is better for the metric.
+        """
+        column = self.index.get(metric)
+        previous = self.previous[column] if column is not None else math.nan
+        current = self.current[column] if column is not None else math.nan
+        if reverse_trend is None:
+            reverse_trend = lower_is_better(metric)
+
+        if previous != previous or current != current or column is None \
+                or reverse_trend != self.reverse[column]:
+            fill = 0 if default is None else default
+            return calculate_change(_number(fill if previous != previous else previous),
+                                    _number(fill if current != current else current),
+                                    reverse_trend)
+
+        return MetricChange(
+            previous=_number(previous),
+            current=_number(current),
+            change_percent=self.change_percent[column],
+            change_absolute=_number(self.change_absolute[column]),
+            trend=self.trend[column],
+            status=self.status[column]
+        )
+
+    def direction_of(self, metric: str) -> str:
+        """'improving', 'declining' or 'stable' over the whole series."""
+        column = self.index.get(metric)
+        return self.direction[column] if column is not None else 'stable'
+
+    def summary(self, metric: str) -> Optional[Dict[str, Any]]:
+        """Statistics of one metric (None values where missing)."""
+        column = self.index.get(metric)
+        if column is None:
+            return None
+        clean = lambda value: None if value != value else value
+        return {
+            'current': clean(self.current[column]),
+            'previous': clean(self.previous[column]),
+            'slope': clean(self.slope[column]),
+            'change_percent': clean(self.change_percent[column]),
+            'total_change_percent': clean(self.total_change_percent[column]),
+            'trend': self.trend[column],
+            'status': self.status[column],
+            'direction': self.direction[column],
+            'rolling_mean': clean(self.rolling_mean[-1][column]) if self.periods else None,
+            'rolling_std': clean(self.rolling_std[-1][column]) if self.periods else None
+        }
+
+    def to_dict(self, metrics: List[str] = None) -> Dict[str, Dict[str, Any]]:
+        return {metric: self.summary(metric) for metric in (metrics or self.metrics)
+                if metric in self.index}
+
+class TrendEngine:
+    """Builds trend analyses from snapshot series or metric store columns."""
+
+    def __init__(self, window: int = ROLLING_WINDOW):
+        self.window = window
+
+    def analyze(self, snapshots: List[Dict[str, Any]],
+                metrics: List[str] = None) -> TrendAnalysis:
+        """
+        Analyze a chronological snapshot series.
+
+        Args:
+            snapshots: Snapshot dicts, oldest first
+            metrics: Dotted metric paths; defaults to every numeric field
+        """
+        if metrics is not None:
+            matrix = [[_lookup(snapshot or {}, metric) for metric in metrics]
+                      for snapshot in snapshots]
+            return TrendAnalysis(list(metrics), matrix, self.window)
+
+        rows = [flatten_metrics(snapshot or {}) for snapshot in snapshots]
+        index: Dict[str, int] = {}
+        for row in rows:
+            for metric in row:
+                index.setdefault(metric, len(index))
+        matrix = []
+        for row in rows:
+            values = [math.nan] * len(index)
+            for metric, value in row.items():
+                values[index[metric]] = float(value)
+            matrix.append(values)
+        return TrendAnalysis(list(index), matrix, self.window)
+
+    def analyze_series(self, series: Dict[str, List[Any]]) -> TrendAnalysis:
+        """Analyze ``MetricStore.query()`` output (None for missing values)."""
+        metrics = [metric for metric in series if metric != 'timestamps']
+        periods = len(series.get('timestamps', []))
+        matrix = [[math.nan if series[metric][row] is None else float(series[metric][row])
+                   for metric in metrics] for row in range(periods)]
+        return TrendAnalysis(metrics, matrix, self.window)
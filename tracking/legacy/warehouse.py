@@ -0,0 +1,469 @@
+#!/usr/bin/env python3
+"""
+SEO Agent Library - Tracking Warehouse
+SQLite warehouse of snapshot metrics, mission scorecards and fixes.
+"""
+
+import hashlib
+import json
+import sqlite3
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, List, Any, Optional, Tuple
+
+from snapshot_catalog import SnapshotCatalog, CatalogEntry, BASELINE_TYPE, SNAPSHOT_TYPES
+from snapshot_metadata import parse_timestamp
+from metric_store import flatten_metrics
+from snapshot_archive import load_snapshot_file, ArchiveError
+from schema_validator import BASELINE_SCHEMA, MISSION_SCHEMA, validate_files, print_violations
+
+WAREHOUSE_VERSION = 2
+WAREHOUSE_FILENAME = "warehouse.db"
+MISSION_DATA_FILENAME = "data.json"
+MISSION_SOURCE_TYPE = "mission"
+DEFAULT_BATCH_SIZE = 500
+
+# (source type, domain, path) identifying one warehouse source
+SourceKey = Tuple[str, str, str]
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS sources (
+    source_id INTEGER PRIMARY KEY,
+    source_type TEXT NOT NULL,
+    domain TEXT NOT NULL,
+    path TEXT NOT NULL,
+    content_hash TEXT NOT NULL,
+    timestamp TEXT NOT NULL,
+    position REAL,
+    ingested_at TEXT NOT NULL,
+    UNIQUE (source_type, domain, path)
+);
+CREATE INDEX IF NOT EXISTS sources_hash ON sources (content_hash);
+
+CREATE TABLE IF NOT EXISTS metrics (
+    source_id INTEGER NOT NULL REFERENCES sources (source_id) ON DELETE CASCADE,
+    domain TEXT NOT NULL,
+    source_type TEXT NOT NULL,
+    position REAL,
+    metric TEXT NOT NULL,
+    value REAL NOT NULL,
+    PRIMARY KEY (source_id, metric)
+);
+CREATE INDEX IF NOT EXISTS metrics_series ON metrics (metric, source_type, domain, position);
+
+CREATE TABLE IF NOT EXISTS missions (
+    source_id INTEGER PRIMARY KEY REFERENCES sources (source_id) ON DELETE CASCADE,
+    run_directory TEXT NOT NULL,
+    name TEXT NOT NULL,
+    mode TEXT,
+    domain TEXT NOT NULL,
+    scope TEXT,
+    pages_assessed INTEGER,
+    position REAL,
+    timestamp TEXT NOT NULL,
+    agents_invoked TEXT,
+    next_suggested_mission TEXT
+);
+CREATE INDEX IF NOT EXISTS missions_domain ON missions (domain, position);
+
+CREATE TABLE IF NOT EXISTS scorecards (
+    source_id INTEGER NOT NULL REFERENCES sources (source_id) ON DELETE CASCADE,
+    domain TEXT NOT NULL,
+    position REAL,
+    scorecard TEXT NOT NULL,
+    dimension TEXT NOT NULL,
+    score INTEGER,
+    status TEXT,
+    PRIMARY KEY (source_id, scorecard, dimension)
+);
+CREATE INDEX IF NOT EXISTS scorecards_domain ON scorecards (domain, scorecard, dimension, position);
+
+CREATE TABLE IF NOT EXISTS fixes (
+    source_id INTEGER NOT NULL REFERENCES sources (source_id) ON DELETE CASCADE,
+    fix_id TEXT NOT NULL,
+    domain TEXT NOT NULL,
+    position REAL,
+    title TEXT,
+    category TEXT,
+    impact INTEGER,
+    effort INTEGER,
+    roi REAL,
+    min_diff INTEGER,
+    owner_agent TEXT,
+    evidence_path TEXT,
+    lift_value REAL,
+    lift_unit TEXT,
+    lift_confidence TEXT,
+    PRIMARY KEY (source_id, fix_id)
+);
+CREATE INDEX IF NOT EXISTS fixes_domain ON fixes (domain, roi);
+CREATE INDEX IF NOT EXISTS fixes_category ON fixes (category, roi);
+"""
+
+class Warehouse:
+    """
+    SQLite warehouse over every tracking data source.
+
+    Baselines and snapshots (via the snapshot catalog, so archive members
+    included) and mission ``runs/*/data.json`` files (AImpactScanner schema)
+    are loaded into indexed ``metrics``, ``missions``, ``scorecards`` and
+    ``fixes`` tables, so cross-domain and cross-period questions become
+    single SQL queries.
+
+    Every source is keyed by its (source type, domain, path), so identical
+    files of different types, domains or periods are separate sources. The
+    sha256 of the content only detects changes. ``ingest()`` is
+    idempotent: unchanged files are skipped without being parsed, a moved
+    file (e.g. packed into an archive) only has its path updated, changed
+    files replace their old rows, and sources that no longer exist are
+    dropped, so the warehouse mirrors the files on disk and can always be
+    rebuilt from them. Writes happen in one transaction per batch.
+    """
+
+    def __init__(self, tracking_dir: Path = None, db_path: Path = None,
+                 runs_dir: Path = None):
+        self.tracking_dir = Path(tracking_dir or "tracking")
+        self.db_path = Path(db_path or self.tracking_dir / WAREHOUSE_FILENAME)
+        self.runs_dir = Path(runs_dir or self.tracking_dir.parent / "runs")
+        self._conn: Optional[sqlite3.Connection] = None
+
+    @property
+    def conn(self) -> sqlite3.Connection:
+        """Open the database on first use, creating the schema if needed."""
+        if self._conn is None:
+            self.db_path.parent.mkdir(parents=True, exist_ok=True)
+            conn = sqlite3.connect(self.db_path)
+            conn.row_factory = sqlite3.Row
+            conn.execute("PRAGMA foreign_keys = ON")
+            conn.execute("PRAGMA journal_mode = WAL")
+            version = conn.execute("PRAGMA user_version").fetchone()[0]
+            if version != WAREHOUSE_VERSION:
+                self._drop_tables(conn)
+                conn.execute(f"PRAGMA user_version = {WAREHOUSE_VERSION}")
+            conn.executescript(SCHEMA)
+            self._conn = conn
+        return self._conn
+
+    @staticmethod
+    def _drop_tables(conn: sqlite3.Connection):
+        for table in ("metrics", "missions", "scorecards", "fixes", "sources"):
+            conn.execute(f"DROP TABLE IF EXISTS {table}")
+
+    def close(self):
+        """Close the database connection."""
+        if self._conn is not None:
+            self._conn.close()
+            self._conn = None
+
+    def _mission_sources(self) -> List[Tuple[str, Path, str]]:
+        """(content hash, path, stored path) of every mission data.json."""
+        sources = []
+        for path in sorted(self.runs_dir.glob(f"*/{MISSION_DATA_FILENAME}")):
+            try:
+                content_hash = hashlib.sha256(path.read_bytes()).hexdigest()
+            except OSError as e:
+                print(f"Warning: skipping unreadable mission data {path}: {e}")
+                continue
+            sources.append((content_hash, path, path.as_posix()))
+        return sources
+
+    def ingest(self, catalog: SnapshotCatalog = None, batch_size: int = DEFAULT_BATCH_SIZE,
+               rebuild: bool = False, validate: bool = True) -> Dict[str, int]:
+        """
+        Bring the warehouse up to date with the tracking files.
+
+        Args:
+            catalog: Snapshot catalog to read (default: one for tracking_dir)
+            batch_size: Sources parsed and written per transaction
+            rebuild: Drop everything and ingest from scratch
+            validate: Check new files against their JSON Schema first and
+                skip (and report) the ones that do not conform
+
+        Returns:
+            Counts of 'added', 'moved', 'removed', 'unchanged', 'invalid'
+            and 'failed' sources
+        """
+        catalog = catalog or SnapshotCatalog(self.tracking_dir)
+        catalog.refresh()
+        conn = self.conn
+
+        if rebuild:
+            with conn:
+                conn.execute("DELETE FROM sources")
+
+        known: Dict[SourceKey, Tuple[int, str]] = {
+            (row['source_type'], row['domain'], row['path']): (row['source_id'], row['content_hash'])
+            for row in conn.execute(
+                "SELECT source_id, source_type, domain, path, content_hash FROM sources")}
+
+        # Current sources with their content hash. A mission's domain is only
+        # known once its data.json is parsed, so missions are matched on the
+        # domain stored by the previous ingest; a changed file is re-parsed.
+        current: Dict[SourceKey, Tuple[str, Any]] = {}
+        for snapshot_type in [BASELINE_TYPE] + SNAPSHOT_TYPES:
+            for entry in catalog.last_n(snapshot_type, catalog.count(snapshot_type)):
+                key = (snapshot_type, entry.domain, catalog.resolve(entry).as_posix())
+                current[key] = (entry.content_hash, entry)
+        mission_domains = {path: domain for source_type, domain, path in known
+                           if source_type == MISSION_SOURCE_TYPE}
+        for content_hash, path, stored_path in self._mission_sources():
+            key = (MISSION_SOURCE_TYPE, mission_domains.get(stored_path, ''), stored_path)
+            current[key] = (content_hash, path)
+
+        stats = {'added': 0, 'moved': 0, 'removed': 0, 'unchanged': 0, 'invalid': 0, 'failed': 0}
+        unchanged = {key for key, (content_hash, _) in current.items()
+                     if key in known and known[key][1] == content_hash}
+        stats['unchanged'] = len(unchanged)
+
+        # Vanished sources whose content reappears under a new path of the
+        # same type and domain were moved: keep their rows, update the path
+        vanished: Dict[Tuple[str, str, str], List[Tuple[int, SourceKey]]] = {}
+        for key, (source_id, content_hash) in known.items():
+            if key not in unchanged:
+                vanished.setdefault((key[0], key[1], content_hash), []).append((source_id, key))
+        moved = []
+        pending = []
+        for key, (content_hash, source) in current.items():
+            if key in unchanged:
+                continue
+            candidates = vanished.get((key[0], key[1], content_hash))
+            if candidates and key not in known:
+                moved.append((key[2], candidates.pop()[0]))
+            else:
+                pending.append((key, content_hash, source))
+        # Changed sources are dropped too and re-added below
+        removed = [item for items in vanished.values() for item in items]
+        with conn:
+            conn.executemany("DELETE FROM sources WHERE source_id = ?",
+                             [(source_id,) for source_id, _ in removed])
+            conn.executemany("UPDATE sources SET path = ? WHERE source_id = ?", moved)
+        stats['moved'] = len(moved)
+        stats['removed'] = sum(1 for _, key in removed if key not in current)
+
+        if validate and pending:
+            root = self.tracking_dir.parent
+            jobs = [(key[2],
+                     root / (BASELINE_SCHEMA if isinstance(source, CatalogEntry) else MISSION_SCHEMA))
+                    for key, _, source in pending]
+            invalid = validate_files(jobs)
+            print_violations(invalid)
+            pending = [item for item in pending if item[0][2] not in invalid]
+            stats['invalid'] = len(invalid)
+        for start in range(0, len(pending), max(1, batch_size)):
+            rows = self._parse_batch(catalog, pending[start:start + batch_size])
+            stats['failed'] += sum(1 for row in rows if row is None)
+            self._write_batch([row for row in rows if row is not None])
+            stats['added'] += sum(1 for row in rows if row is not None)
+
+        return stats
+
+    def _parse_batch(self, catalog: SnapshotCatalog,
+                     batch: List[Tuple[SourceKey, str, Any]]) -> List[Optional[Dict[str, Any]]]:
+        """Parse a batch of sources into table rows (None for unreadable ones)."""
+        ingested_at = datetime.now().isoformat()
+        rows = []
+        for _, content_hash, source in batch:
+            try:
+                if isinstance(source, CatalogEntry):
+                    rows.append(self._snapshot_rows(content_hash, source, catalog.resolve(source),
+                                                    catalog.load(source), ingested_at))
+                else:
+                    rows.append(self._mission_rows(content_hash, source,
+                                                   load_snapshot_file(source), ingested_at))
+            except (OSError, ValueError, KeyError, ArchiveError, AttributeError, TypeError) as e:
+                print(f"Warning: not ingesting {getattr(source, 'path', source)}: {e}")
+                rows.append(None)
+        return rows
+
+    @staticmethod
+    def _snapshot_rows(content_hash: str, entry: CatalogEntry, path: Path,
+                       data: Dict[str, Any], ingested_at: str) -> Dict[str, Any]:
+        source = (entry.snapshot_type, entry.domain, path.as_posix(), content_hash,
+                  entry.timestamp, entry.position, ingested_at)
+        metrics = [(entry.domain, entry.snapshot_type, entry.position, metric, value)
+                   for metric, value in flatten_metrics(data).items()]
+        return {'source': source, 'metrics': metrics}
+
+    @staticmethod
+    def _mission_rows(content_hash: str, path: Path, data: Dict[str, Any],
+                      ingested_at: str) -> Dict[str, Any]:
+        mission = data['mission']
+        site = data['site']
+        domain = str(site['domain'])
+        timestamp = str(mission.get('timestamp', ''))
+        position = parse_timestamp(timestamp)
+
+        rows = {
+            'source': (MISSION_SOURCE_TYPE, domain, path.as_posix(), content_hash,
+                       timestamp, position, ingested_at),
+            'mission': (mission.get('run_directory', path.parent.as_posix()),
+                        mission['name'], mission.get('mode'), domain, site.get('scope'),
+                        site.get('pages_assessed'), position, timestamp,
+                        json.dumps(mission.get('agents_invoked', [])),
+                        data.get('next_suggested_mission')),
+            'scorecards': [],
+            'fixes': [],
+            'metrics': []
+        }
+
+        for scorecard, dimensions in data.get('scorecards', {}).items():
+            for dimension, value in dimensions.items():
+                if isinstance(value, dict):
+                    score, status = value.get('score'), value.get('status')
+                else:
+                    score, status = value, None
+                rows['scorecards'].append((domain, position, scorecard, dimension, score, status))
+
+        for fix in data.get('fixes', []):
+            lift = fix.get('estimated_traffic_lift', {})
+            rows['fixes'].append((str(fix['id']), domain, position, fix.get('title'),
+                                  fix.get('category'), fix.get('impact'), fix.get('effort'),
+                                  fix.get('roi'), int(bool(fix.get('min_diff'))),
+                                  fix.get('owner_agent'), fix.get('evidence_path'),
+                                  lift.get('value'), lift.get('unit'), lift.get('confidence')))
+
+        snapshot = data.get('metrics_snapshot')
+        if isinstance(snapshot, dict):
+            rows['metrics'] = [(domain, MISSION_SOURCE_TYPE, position, metric, value)
+                               for metric, value in flatten_metrics(snapshot).items()]
+        return rows
+
+    def _write_batch(self, rows: List[Dict[str, Any]]):
+        """Insert parsed sources in a single transaction."""
+        if not rows:
+            return
+        with self.conn as conn:
+            for row in rows:
+                source_id = conn.execute(
+                    "INSERT INTO sources (source_type, domain, path, content_hash, timestamp, "
+                    "position, ingested_at) VALUES (?, ?, ?, ?, ?, ?, ?)",
+                    row['source']).lastrowid
+                conn.executemany("INSERT INTO metrics VALUES (?, ?, ?, ?, ?, ?)",
+                                 [(source_id, *m) for m in row['metrics']])
+                if 'mission' in row:
+                    conn.execute("INSERT INTO missions VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                                 (source_id, *row['mission']))
+                conn.executemany("INSERT OR REPLACE INTO scorecards VALUES (?, ?, ?, ?, ?, ?, ?)",
+                                 [(source_id, *sc) for sc in row.get('scorecards', [])])
+                conn.executemany("INSERT OR REPLACE INTO fixes VALUES "
+                                 "(?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                                 [(source_id, *f) for f in row.get('fixes', [])])
+
+    def query(self, sql: str, params: Tuple = ()) -> List[Dict[str, Any]]:
+        """Run a read query and return rows as dicts."""
+        return [dict(row) for row in self.conn.execute(sql, params)]
+
+    def metric_series(self, metric: str, source_type: str = "weekly", domain: str = None,
+                      start: datetime = None, end: datetime = None) -> List[Dict[str, Any]]:
+        """
+        One metric over time, for one domain or all of them.
+
+        Returns:
+            Rows with domain, timestamp, position and value, ordered by domain
+            then time
+        """
+        sql = ("SELECT m.domain, s.timestamp, m.position, m.value FROM metrics m "
+               "JOIN sources s USING (source_id) WHERE m.metric = ? AND m.source_type = ?")
+        params: List[Any] = [metric, source_type]
+        if domain is not None:
+            sql += " AND m.domain = ?"
+            params.append(domain)
+        if start is not None:
+            sql += " AND m.position >= ?"
+            params.append(parse_timestamp(start.isoformat()))
+        if end is not None:
+            sql += " AND m.position <= ?"
+            params.append(parse_timestamp(end.isoformat()))
+        return self.query(sql + " ORDER BY m.domain, m.position", tuple(params))
+
+    def latest_metrics(self, metrics: List[str], source_type: str = "weekly") -> Dict[str, Dict[str, float]]:
+        """Most recent value of each metric for every domain: {domain: {metric: value}}."""
+        placeholders = ", ".join("?" for _ in metrics)
+        rows = self.query(
+            f"SELECT m.domain, m.metric, m.value FROM metrics m "
+            f"JOIN (SELECT domain, MAX(position) AS position FROM sources "
+            f"      WHERE source_type = ? GROUP BY domain) latest "
+            f"ON m.domain = latest.domain AND m.position = latest.position "
+            f"WHERE m.source_type = ? AND m.metric IN ({placeholders}) ORDER BY m.domain",
+            (source_type, source_type, *metrics))
+        result: Dict[str, Dict[str, float]] = {}
+        for row in rows:
+            result.setdefault(row['domain'], {})[row['metric']] = row['value']
+        return result
+
+    def missions(self, domain: str = None, name: str = None) -> List[Dict[str, Any]]:
+        """Mission runs with their scorecard totals, newest first."""
+        sql = ("SELECT mi.*, "
+               "ai.score AS ai_search_readiness, trad.score AS traditional_seo "
+               "FROM missions mi "
+               "LEFT JOIN scorecards ai ON ai.source_id = mi.source_id "
+               "  AND ai.scorecard = 'ai_search_readiness' AND ai.dimension = 'total' "
+               "LEFT JOIN scorecards trad ON trad.source_id = mi.source_id "
+               "  AND trad.scorecard = 'traditional_seo' AND trad.dimension = 'total' "
+               "WHERE 1 = 1")
+        params: List[Any] = []
+        if domain is not None:
+            sql += " AND mi.domain = ?"
+            params.append(domain)
+        if name is not None:
+            sql += " AND mi.name = ?"
+            params.append(name)
+        return self.query(sql + " ORDER BY mi.position DESC", tuple(params))
+
+    def scorecard_history(self, domain: str, scorecard: str = "ai_search_readiness",
+                          dimension: str = "total") -> List[Dict[str, Any]]:
+        """One scorecard dimension across a domain's missions, oldest first."""
+        return self.query(
+            "SELECT s.timestamp, sc.position, sc.score, sc.status FROM scorecards sc "
+            "JOIN sources s USING (source_id) "
+            "WHERE sc.domain = ? AND sc.scorecard = ? AND sc.dimension = ? ORDER BY sc.position",
+            (domain, scorecard, dimension))
+
+    def top_fixes(self, domain: str = None, category: str = None,
+                  limit: int = 10) -> List[Dict[str, Any]]:
+        """Highest-ROI fixes across mission runs, with the run they came from."""
+        sql = ("SELECT f.*, mi.name AS mission, mi.run_directory FROM fixes f "
+               "JOIN missions mi USING (source_id) WHERE 1 = 1")
+        params: List[Any] = []
+        if domain is not None:
+            sql += " AND f.domain = ?"
+            params.append(domain)
+        if category is not None:
+            sql += " AND f.category = ?"
+            params.append(category)
+        sql += " ORDER BY f.roi DESC, f.impact DESC LIMIT ?"
+        params.append(limit)
+        return self.query(sql, tuple(params))
+
+    def counts(self) -> Dict[str, int]:
+        """Row count of every table."""
+        return {table: self.conn.execute(f"SELECT COUNT(*) FROM {table}").fetchone()[0]
+                for table in ("sources", "metrics", "missions", "scorecards", "fixes")}
+
+def main():
+    """Ingest tracking data into the warehouse and show table counts."""
+    import argparse
+
+    parser = argparse.ArgumentParser(description="SEO Agent Tracking Warehouse")
+    parser.add_argument("--tracking-dir", default="tracking", help="Tracking data directory")
+    parser.add_argument("--runs-dir", help="Mission runs directory (default: runs next to tracking)")
+    parser.add_argument("--db", help="Database path (default: <tracking-dir>/warehouse.db)")
+    parser.add_argument("--batch-size", type=int, default=DEFAULT_BATCH_SIZE,
+                        help="Sources written per transaction")
+    parser.add_argument("--rebuild", action="store_true", help="Re-ingest everything")
+    parser.add_argument("--no-validate", action="store_true", help="Skip schema validation")
+    args = parser.parse_args()
+
+    warehouse = Warehouse(Path(args.tracking_dir), args.db and Path(args.db),
+                          args.runs_dir and Path(args.runs_dir))
+    stats = warehouse.ingest(batch_size=args.batch_size, rebuild=args.rebuild,
+                             validate=not args.no_validate)
+    print(f"🏛️ Warehouse {warehouse.db_path}: {stats['added']} added, {stats['moved']} moved, "
+          f"{stats['removed']} removed, {stats['unchanged']} unchanged, "
+          f"{stats['invalid']} invalid, {stats['failed']} failed")
+    for table, count in warehouse.counts().items():
+        print(f"  {table}: {count:,} rows")
+    warehouse.close()
+
+if __name__ == "__main__":
+    main()